@@ -0,0 +1,183 @@
+"""
+Direct API Agent Loop
+The manual tool-calling loop shared by the five direct API agents.
+
+Each agent builds its stacked system prompt and creation prompt, then calls
+run_agent_loop(): the loop sends the conversation with cache breakpoints,
+compacts superseded history past the token ceiling, dispatches the turn's
+tool calls through the shared tool registry (concurrent, cached, timed) and
+returns the model's final text.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from utils.deadline import DeadlineExceeded, timeout_for
+from utils.model_routing import create_message, route_model
+from utils.prompt_cache import CacheUsage, cached_system, cached_tools, with_history_breakpoint
+from utils.tool_loop_compaction import ToolLoopCompactor
+from utils.tool_registry import registry
+
+
+async def run_agent_loop(
+    client: Any,
+    platform: str,
+    system: str,
+    prompt: str,
+    thinking_mode: bool = False,
+    cache_usage: Optional[CacheUsage] = None,
+    logger: Any = None,
+    log_context: Optional[Dict[str, Any]] = None
+) -> Tuple[str, int]:
+    """
+    Run the tool-calling loop until the model ends its turn.
+
+    Args:
+        client: Shared Anthropic client
+        platform: Registry platform (linkedin, twitter, email, youtube, instagram)
+        system: Stacked system prompt
+        prompt: Creation prompt (first user message)
+        thinking_mode: Offer validation/fix tools and allow more iterations
+        cache_usage: Accumulates prompt cache usage across iterations
+        logger: The agent's structured logger
+        log_context: Context fields for the agent's log lines
+
+    Returns:
+        (final_output, iterations)
+
+    Raises:
+        TimeoutError: An API call exceeded its timeout
+        RuntimeError: No final output within the iteration limit
+    """
+    logger = logger or logging.getLogger(__name__)
+    log_context = log_context or {}
+    cache_usage = cache_usage if cache_usage is not None else CacheUsage()
+
+    # Filter tools based on mode
+    tools_to_use = registry.schemas(platform, thinking_mode=thinking_mode)
+    if not thinking_mode:
+        # Default mode: only content creation tools (no validation/fix tools)
+        logger.info(f"🔧 Default mode: providing {len(tools_to_use)} tools (excluding validation tools)")
+
+    print(f"📤 Sending creation prompt to Claude via direct API...")
+
+    # Initialize conversation messages
+    messages = [
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+    # Manual tool calling loop
+    compactor = ToolLoopCompactor()  # Summarizes superseded drafts past the token ceiling
+    tool_cache: Dict[str, str] = {}  # Cacheable tool results for this run
+    max_iterations = 15 if thinking_mode else 10  # Thinking mode needs more iterations for validation
+    iteration = 0
+    final_output = None
+
+    while iteration < max_iterations:
+        iteration += 1
+        print(f"   🔄 Iteration {iteration}: Calling Claude API...")
+
+        compacted = compactor.compact(messages)
+        if compacted is not messages:
+            report = compactor.last_report
+            print(f"   🗜️  Compacted history: {report['tokens_before']:,} → {report['tokens_after']:,} tokens "
+                  f"({report['results_compacted']} tool results summarized)")
+            messages = compacted
+
+        try:
+            route = route_model('agent_loop', platform=platform, mode='thinking' if thinking_mode else None)
+            # First call gets at least 120s (large cached prompt), subsequent calls the routed timeout,
+            # both capped by the post's remaining deadline
+            routed_timeout = max(route.timeout, 120.0) if iteration == 1 else route.timeout
+            timeout = timeout_for(routed_timeout)
+
+            response = await asyncio.wait_for(
+                asyncio.to_thread(
+                    create_message,
+                    client,
+                    route,
+                    timeout=timeout,
+                    # Cache breakpoints: tool schemas, stacked prompts, last turn of history
+                    system=cached_system(system),
+                    tools=cached_tools(tools_to_use),
+                    messages=with_history_breakpoint(messages)
+                ),
+                timeout=timeout
+            )
+
+            cache_usage.add(response)
+            print(f"   ✅ API response received: stop_reason={response.stop_reason}")
+
+            # Check stop reason
+            if response.stop_reason == "end_turn":
+                # Agent is done, extract final text
+                for block in response.content:
+                    if block.type == "text":
+                        final_output = block.text
+                        print(f"   ✅ Final output received ({len(final_output)} chars)")
+                        break
+                break
+
+            elif response.stop_reason == "tool_use":
+                # Agent wants to use tools
+                print(f"   🔧 Agent requested tool calls...")
+
+                # Add assistant message to conversation
+                messages.append({
+                    "role": "assistant",
+                    "content": response.content
+                })
+
+                # Execute the turn's tools (concurrently, per-tool timeouts) and collect results
+                tool_uses = [block for block in response.content if block.type == "tool_use"]
+                tool_results = await registry.dispatch(platform, tool_uses, tool_cache)
+
+                # Add tool results to conversation
+                messages.append({
+                    "role": "user",
+                    "content": tool_results
+                })
+
+                # Continue loop to get next response
+                continue
+
+            elif response.stop_reason == "max_tokens":
+                # Hit token limit, extract what we have
+                for block in response.content:
+                    if block.type == "text":
+                        final_output = block.text
+                        logger.warning("⚠️ Hit max_tokens limit", **log_context)
+                        break
+                break
+
+            else:
+                logger.error(f"Unknown stop_reason: {response.stop_reason}", **log_context)
+                break
+
+        except DeadlineExceeded:
+            logger.error(f"Post deadline exceeded at iteration {iteration}", **log_context)
+            raise
+        except asyncio.TimeoutError:
+            if timeout < routed_timeout:
+                # Cut short by the post's deadline, not a slow API (doesn't count as an outage)
+                logger.error(f"Post deadline exceeded at iteration {iteration}", **log_context)
+                raise DeadlineExceeded(f"Post deadline exceeded during API call at iteration {iteration}")
+            logger.error(f"API call timeout at iteration {iteration}", **log_context)
+            raise TimeoutError(f"API call exceeded {timeout:.0f}s at iteration {iteration}")
+
+    if iteration >= max_iterations:
+        raise RuntimeError(f"Exceeded max iterations ({max_iterations})")
+
+    if not final_output:
+        raise RuntimeError("No final output received from agent")
+
+    print(f"\n   ✅ Tool calling loop complete after {iteration} iterations")
+    print(f"   💾 Prompt cache: {cache_usage.summary_line()}")
+    if compactor.stats['compactions']:
+        print(f"   🗜️  History compactions: {compactor.stats['compactions']}, "
+              f"~{compactor.stats['tokens_saved']:,} tokens saved")
+
+    return final_output, iteration
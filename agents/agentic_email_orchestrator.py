@@ -7,6 +7,7 @@ import os
 from anthropic import Anthropic
 from typing import Dict, List, Any
 import json
+from utils.model_routing import create_message
 from .email_tools import EMAIL_TOOLS, TOOL_FUNCTIONS
 
 
@@ -197,9 +198,10 @@ Create a high-converting email about: {topic}
         while iteration < max_iterations:
             iteration += 1
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8000,  # Emails need more tokens
+            response = create_message(
+                self.client,
+                'agentic_loop',
+                platform='email',
                 system=system_prompt,
                 messages=messages,
                 tools=self.tools
@@ -332,9 +334,10 @@ RULES:
 Return ONLY the improved email, nothing else."""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8000,
+            response = create_message(
+                self.client,
+                'agentic_edit',
+                platform='email',
                 messages=[{"role": "user", "content": edit_prompt}]
             )
 
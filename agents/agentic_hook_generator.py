@@ -6,6 +6,7 @@ from anthropic import Anthropic
 import os
 import json
 from typing import List, Dict, Any
+from utils.model_routing import create_message
 from .linkedin_tools import LINKEDIN_TOOLS, LINKEDIN_TOOL_FUNCTIONS
 
 
@@ -109,9 +110,9 @@ Research and generate 5 optimal hooks now."""
         while iteration < max_iterations:
             iteration += 1
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
+            response = create_message(
+                self.client,
+                'agentic_loop',
                 system=system_prompt,
                 messages=messages,
                 tools=self.tools
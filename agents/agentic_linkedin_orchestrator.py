@@ -5,6 +5,7 @@ Intelligently uses subagents with tool calling for high-quality output
 from anthropic import Anthropic
 import os
 from typing import Dict, Any
+from utils.model_routing import create_message
 from .agentic_hook_generator import AgenticHookGenerator
 from .agentic_proof_injector import AgenticProofInjector
 from .hybrid_editor import HybridEditor
@@ -148,9 +149,10 @@ HOOK (already chosen):
 
 Write the LinkedIn post now."""
 
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4000,
+        response = create_message(
+            self.client,
+            'agentic_draft',
+            platform='linkedin',
             system=[
                 {
                     "type": "text",
@@ -242,9 +244,10 @@ CODE ISSUES FOUND: {len(code_issues)}
 
 Grade this content now."""
 
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=800,
+        response = create_message(
+            self.client,
+            'agentic_grade',
+            platform='linkedin',
             temperature=0.2,
             system=[
                 {
@@ -5,6 +5,7 @@ Intelligently decides when to search for data, stats, and examples
 from anthropic import Anthropic
 import os
 from typing import Dict, Any
+from utils.model_routing import create_message
 from .linkedin_tools import LINKEDIN_TOOLS, LINKEDIN_TOOL_FUNCTIONS
 
 
@@ -90,9 +91,9 @@ Analyze this draft for vague claims, research specific data, and inject proof po
         while iteration < max_iterations:
             iteration += 1
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
+            response = create_message(
+                self.client,
+                'agentic_loop',
                 system=system_prompt,
                 messages=messages,
                 tools=self.tools
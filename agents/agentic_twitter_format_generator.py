@@ -6,6 +6,7 @@ import os
 from anthropic import Anthropic
 from typing import Dict, List, Any
 import json
+from utils.model_routing import create_message
 from .twitter_tools import TWITTER_TOOLS, TOOL_FUNCTIONS
 
 
@@ -90,9 +91,10 @@ When ready, return JSON:
         while iteration < max_iterations:
             iteration += 1
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
+            response = create_message(
+                self.client,
+                'agentic_loop',
+                platform='twitter',
                 system=system_prompt,
                 messages=messages,
                 tools=self.tools
@@ -5,6 +5,7 @@ Manages full workflow: format selection → generation → validation → editin
 import os
 from typing import Dict, Any
 from anthropic import Anthropic
+from utils.model_routing import create_message
 from .agentic_twitter_format_generator import AgenticTwitterFormatGenerator
 from validators.twitter_validator import TwitterValidator
 
@@ -157,9 +158,10 @@ RULES:
 Return ONLY the improved tweet text, nothing else."""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=500,
+            response = create_message(
+                self.client,
+                'agentic_edit',
+                platform='twitter',
                 messages=[{"role": "user", "content": edit_prompt}]
             )
 
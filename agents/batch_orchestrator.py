@@ -11,6 +11,13 @@ import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from agents.context_manager import ContextManager
+from utils.circuit_breaker import CircuitBreakerOpen, get_breaker
+from utils.deadline import POST_DEADLINE_SECONDS, deadline, remaining
+from utils.http_clients import track_connections
+from utils.model_routing import BatchBudget, create_message, use_budget
+from utils.rag_prefetch import clear_plan_prefetch, start_plan_prefetch, use_prefetch
+from utils.shared_state import WORKER_ID, get_shared_state, get_thread_router
+from utils.slack_progress import get_progress_publisher
 
 # Global registry of context managers (plan_id -> ContextManager)
 _context_managers: Dict[str, ContextManager] = {}
@@ -18,6 +25,108 @@ _context_managers: Dict[str, ContextManager] = {}
 # Global registry of batch plans (plan_id -> plan dict)
 _batch_plans: Dict[str, Dict[str, Any]] = {}
 
+# Model routing budgets per plan (plan_id -> BatchBudget), started on first post
+_batch_budgets: Dict[str, BatchBudget] = {}
+
+# Server-side batch runs (plan_id -> run state), see run_plan()
+_batch_runs: Dict[str, Dict[str, Any]] = {}
+
+# Multi-worker mode: plans and run snapshots are mirrored to shared state so any
+# worker can load a plan or report/cancel a run started by another worker
+BATCH_STATE_TTL = 24 * 3600
+
+
+def _shared_store():
+    store = get_shared_state()
+    return store if store.shared else None
+
+
+def _share_plan(plan: Dict[str, Any]):
+    store = _shared_store()
+    if store is None:
+        return
+    # The Slack client object can't be shared; a worker that loads the plan runs it without Slack progress
+    slack_metadata = {**plan.get('slack_metadata', {}), 'slack_client': None}
+    store.set('batch_plans', plan['id'], {**plan, 'slack_metadata': slack_metadata}, ttl=BATCH_STATE_TTL)
+
+
+def _get_plan(plan_id: str) -> Optional[Dict[str, Any]]:
+    """Plan from this worker's registry, else from shared state (registered locally with a fresh ContextManager)"""
+    plan = _batch_plans.get(plan_id)
+    store = _shared_store()
+    if plan is None and store is not None:
+        plan = store.get('batch_plans', plan_id)
+        if plan:
+            _batch_plans[plan_id] = plan
+            if plan_id not in _context_managers:
+                context_mgr = _context_managers[plan_id] = ContextManager(plan_id, plan)
+                # Stats of posts finished before a restart / on another worker
+                context_mgr.load_state(store.get('batch_stats', plan_id))
+            print(f"📋 Loaded batch plan {plan_id} from shared state")
+    return plan
+
+
+def _share_stats(plan_id: str, context_mgr: ContextManager):
+    store = _shared_store()
+    if store is not None:
+        store.set('batch_stats', plan_id, context_mgr.to_dict(), ttl=BATCH_STATE_TTL)
+
+
+def _share_run(plan_id: str, run: Dict[str, Any]):
+    store = _shared_store()
+    if store is not None:
+        store.set('batch_runs', plan_id, run, ttl=BATCH_STATE_TTL)
+
+
+def _run_active(run: Dict[str, Any], live_workers: Optional[List[str]] = None) -> bool:
+    """A running run whose worker is still alive (a crashed worker's run can be resumed)"""
+    worker = run.get('worker')
+    if run['status'] != 'running' or worker in (None, WORKER_ID):
+        return run['status'] == 'running'
+    if live_workers is None:
+        live_workers = get_thread_router().live_workers()
+    return worker in live_workers
+
+
+def _claim_run(plan_id: str, run: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Register run as the plan's run unless an active run exists (atomic across workers)
+
+    Returns:
+        The active run that blocked the claim, or None if run was claimed
+    """
+    store = _shared_store()
+    if store is None:
+        existing = _batch_runs.get(plan_id)
+        if existing and _run_active(existing):
+            return existing
+        _batch_runs[plan_id] = run
+        return None
+
+    # Read outside the update: its function runs under the store lock
+    live_workers = get_thread_router().live_workers()
+    blocking = {}
+
+    def claim(current):
+        if current and _run_active(current, live_workers):
+            blocking['run'] = current
+            return current
+        return run
+
+    store.update('batch_runs', plan_id, claim, ttl=BATCH_STATE_TTL)
+    if blocking:
+        return blocking['run']
+    _batch_runs[plan_id] = run
+    return None
+
+
+def _cancel_requested(plan_id: str, run: Dict[str, Any]) -> bool:
+    if not run['cancelled']:
+        store = _shared_store()
+        if store is not None and store.get('batch_cancels', plan_id):
+            run['cancelled'] = True
+    return run['cancelled']
+
 
 async def execute_sequential_batch(
     plan: Dict[str, Any],
@@ -57,6 +166,9 @@ async def execute_sequential_batch(
         }
     """
     context_mgr = ContextManager(plan['id'], plan)
+    budget = BatchBudget(len(plan['posts']), stats=context_mgr.stats)
+    publisher = get_progress_publisher()
+    status_header = f"📋 *Batch progress* (`{plan['id']}`)"
     start_time = time.time()
 
     completed = 0
@@ -68,14 +180,12 @@ async def execute_sequential_batch(
     for i, post_spec in enumerate(plan['posts']):
         post_num = i + 1
 
-        # Send progress update to Slack
-        slack_client.chat_postMessage(
-            channel=channel,
-            thread_ts=thread_ts,
-            text=f"⏳ Creating post {post_num}/{len(plan['posts'])}...\n"
-                 f"Platform: *{post_spec['platform'].capitalize()}*\n"
-                 f"Topic: {post_spec['topic'][:100]}",
-            mrkdwn=True
+        # Send progress update to Slack (queued; edits the batch's status message)
+        publisher.status(
+            plan['id'], channel, thread_ts,
+            f"⏳ Creating post {post_num}/{len(plan['posts'])}: "
+            f"*{post_spec['platform'].capitalize()}* - {post_spec['topic'][:100]}",
+            header=status_header
         )
 
         # Get context from strategic outline (NO learning accumulation)
@@ -86,16 +196,23 @@ async def execute_sequential_batch(
         print(f"   Strategic context: {len(strategic_context)} chars")
 
         # Call direct API agent workflow (NO learning injection)
+        post_started = time.monotonic()
+        tokens_before = budget.tokens_used
         try:
-            result = await _execute_single_post(
-                platform=post_spec['platform'],
-                topic=post_spec['topic'],
-                context=strategic_context,  # Strategic outline + optional strategy memory
-                style=post_spec.get('style', ''),
-                learnings='',  # NO LEARNINGS - deprecated parameter
-                target_score=18,  # Fixed threshold (no "improving on average")
-                publish_date=post_spec.get('publish_date')  # Pass publish date from post spec
-            )
+            # Routed calls inside count against the batch budget
+            with use_budget(budget):
+                try:
+                    result = await _execute_single_post(
+                        platform=post_spec['platform'],
+                        topic=post_spec['topic'],
+                        context=strategic_context,  # Strategic outline + optional strategy memory
+                        style=post_spec.get('style', ''),
+                        learnings='',  # NO LEARNINGS - deprecated parameter
+                        target_score=18,  # Fixed threshold (no "improving on average")
+                        publish_date=post_spec.get('publish_date')  # Pass publish date from post spec
+                    )
+                finally:
+                    budget.item_done()
 
             # Extract metadata from SDK agent result
             score = extract_score_from_result(result)
@@ -109,17 +226,17 @@ async def execute_sequential_batch(
                 'hook': hook,
                 'platform': post_spec['platform'],
                 'airtable_url': airtable_url,
-                'what_worked': f"Score: {score}/25"
+                'what_worked': f"Score: {score}/25",
+                'seconds': time.monotonic() - post_started,
+                'tokens': budget.tokens_used - tokens_before
             })
 
             # Send completion update to Slack
-            slack_client.chat_postMessage(
-                channel=channel,
-                thread_ts=thread_ts,
-                text=f"✅ Post {post_num}/{len(plan['posts'])} complete!\n"
-                     f"📊 <{airtable_url}|View in Airtable>\n"
-                     f"🎯 Quality Score: *{score}/25*",
-                mrkdwn=True
+            publisher.status(
+                plan['id'], channel, thread_ts,
+                f"✅ Post {post_num}/{len(plan['posts'])} complete! "
+                f"🎯 *{score}/25* | <{airtable_url}|View in Airtable>",
+                header=status_header, client=slack_client
             )
 
             completed += 1
@@ -131,12 +248,10 @@ async def execute_sequential_batch(
             import traceback
             traceback.print_exc()
 
-            slack_client.chat_postMessage(
-                channel=channel,
-                thread_ts=thread_ts,
-                text=f"⚠️ Post {post_num} failed: {str(e)[:200]}\n\n"
-                     f"Continuing with remaining posts...",
-                mrkdwn=True
+            publisher.status(
+                plan['id'], channel, thread_ts,
+                f"⚠️ Post {post_num} failed: {str(e)[:200]} - continuing with remaining posts...",
+                header=status_header, client=slack_client
             )
 
             failed += 1
@@ -151,17 +266,13 @@ async def execute_sequential_batch(
                 f"📊 Stats:\n"
                 f"- Average score: *{stats['avg_score']:.1f}/25*\n"
                 f"- Quality trend: *{stats['quality_trend']}*\n"
-                f"- Score range: {stats['lowest_score']}-{stats['highest_score']}\n"
-                f"- Recent scores: {stats['recent_scores']}\n\n"
+                f"- Score range: {stats['lowest_score']}-{stats['highest_score']} (±{stats['score_stdev']:.1f})\n"
+                f"- Recent scores: {stats['recent_scores']}\n"
+                f"{_format_platform_stats(stats)}\n"
                 f"⏳ *{len(plan['posts']) - post_num} posts remaining.* Continuing..."
             )
 
-            slack_client.chat_postMessage(
-                channel=channel,
-                thread_ts=thread_ts,
-                text=checkpoint_msg,
-                mrkdwn=True
-            )
+            publisher.post(channel, checkpoint_msg, thread_ts=thread_ts, client=slack_client)
 
             print(f"\n📊 Checkpoint {post_num}")
             print(f"   Avg score: {stats['avg_score']:.1f}")
@@ -170,6 +281,8 @@ async def execute_sequential_batch(
     # Final summary
     elapsed = int((time.time() - start_time) / 60)
     final_stats = context_mgr.get_stats()
+    budget_summary = budget.summary()
+    downgrades = sum(budget_summary['downgrades'].values())
 
     final_msg = (
         f"🎉 *Batch complete! All {len(plan['posts'])} posts created.*\n\n"
@@ -179,21 +292,22 @@ async def execute_sequential_batch(
         f"- ⏱️ Total time: *{elapsed} minutes*\n"
         f"- 📈 Average score: *{final_stats['avg_score']:.1f}/25*\n"
         f"- 📊 Quality trend: *{final_stats['quality_trend']}*\n"
-        f"- 🎯 Score range: {final_stats['lowest_score']}-{final_stats['highest_score']}\n\n"
+        f"- 🎯 Score range: {final_stats['lowest_score']}-{final_stats['highest_score']} (±{final_stats['score_stdev']:.1f})\n"
+        f"{_format_platform_stats(final_stats)}"
+        f"{_format_stage_stats(final_stats)}"
+        f"- 🔀 Fast-model downgrades: {downgrades}\n"
+        f"- 💾 Prompt cache hit rate: {budget_summary['prompt_cache']['cache_hit_rate']:.0%}\n\n"
         f"📅 *View all posts in Airtable* (filter by Created Today)\n\n"
         f"🚀 Your content is ready to schedule!"
     )
 
-    slack_client.chat_postMessage(
-        channel=channel,
-        thread_ts=thread_ts,
-        text=final_msg,
-        mrkdwn=True
-    )
+    publisher.post(channel, final_msg, thread_ts=thread_ts, client=slack_client)
+    publisher.forget(plan['id'])
 
     print(f"\n🎉 Batch execution complete!")
     print(f"   Completed: {completed}/{len(plan['posts'])}")
     print(f"   Time: {elapsed} minutes")
+    print(f"   Routing budget: {budget_summary}")
 
     return {
         'success': failed == 0,
@@ -201,10 +315,89 @@ async def execute_sequential_batch(
         'failed': failed,
         'total_time': elapsed,
         'avg_score': final_stats['avg_score'],
-        'quality_trend': final_stats['quality_trend']
+        'quality_trend': final_stats['quality_trend'],
+        'routing_budget': budget_summary
     }
 
 
+# Platform aliases accepted in plans and requests
+PLATFORM_ALIASES = {
+    'x': 'twitter',
+    'x/twitter': 'twitter',
+    'newsletter': 'email',
+}
+
+# Platforms generated by a <platform>_direct_api_agent (with its own circuit breaker)
+DIRECT_API_PLATFORMS = ('linkedin', 'twitter', 'email', 'youtube', 'instagram')
+
+
+def normalize_platform(platform: str) -> str:
+    """Lowercase platform name with aliases resolved (x -> twitter, newsletter -> email)"""
+    platform_lower = (platform or '').lower()
+    return PLATFORM_ALIASES.get(platform_lower, platform_lower)
+
+
+def _use_twitter_haiku(topic: str, context: str) -> bool:
+    """Twitter routing: True for the Haiku single-post fast path, False for the direct API agent (threads)"""
+    content_length = "auto"
+    context_lower = context.lower() if context else ""
+    topic_lower = topic.lower() if topic else ""
+
+    # Detect thread keywords (expanded list, includes X/Twitter aliases)
+    thread_keywords = ["thread", "thread of", "twitter thread", "x thread", "long thread", "short thread", "a thread", "an x thread", "an twitter thread"]
+    is_thread = any(keyword in context_lower or keyword in topic_lower for keyword in thread_keywords)
+
+    # Detect single post keywords (expanded list, includes X/Twitter aliases)
+    single_post_keywords = ["single post", "one tweet", "twitter post", "x post", "single tweet", "a tweet", "an x post", "an x tweet", "one x post", "a twitter post", "standalone post", "one post"]
+    is_single_post = any(keyword in context_lower or keyword in topic_lower for keyword in single_post_keywords)
+
+    # Check for explicit content_length in context
+    if "content_length" in context_lower:
+        if "single_post" in context_lower:
+            content_length = "single_post"
+        elif "short_thread" in context_lower or "long_thread" in context_lower:
+            content_length = "thread"
+
+    # IMPROVED ROUTING LOGIC: Use context length and complexity heuristics
+    # Context > 500 chars suggests detailed outline → likely needs thread/complex handling → use Direct API
+    context_length = len(context) if context else 0
+    topic_length = len(topic) if topic else 0
+
+    # Detect narrative/outline indicators (bullet points, numbered lists, multiple paragraphs)
+    has_outline = any(indicator in context for indicator in ['\n-', '\n*', '\n1.', '\n2.', '\n•']) if context else False
+    has_multiple_paragraphs = context.count('\n\n') >= 2 if context else False
+
+    # Routing decision with smarter defaults
+    use_haiku = False
+    if is_thread:
+        use_haiku = False  # Use SDK agent for threads
+    elif is_single_post:
+        use_haiku = True  # Use Haiku for single posts
+    elif content_length == "single_post":
+        use_haiku = True
+    elif content_length in ["short_thread", "long_thread"]:
+        use_haiku = False
+    elif context_length > 500 or has_outline or has_multiple_paragraphs:
+        # Complex context suggests need for Direct API agent (better research, validation)
+        use_haiku = False
+    else:
+        # Default: Use Haiku fast path for single posts (speed)
+        # Only use Direct API agent if explicitly a thread or has complex context
+        use_haiku = True
+
+    return use_haiku
+
+
+def _agent_breaker_name(platform: str, topic: str, context: str) -> Optional[str]:
+    """Circuit breaker of the direct API agent that will write this post (None if no such agent is used)"""
+    platform = normalize_platform(platform)
+    if platform not in DIRECT_API_PLATFORMS:
+        return None
+    if platform == 'twitter' and _use_twitter_haiku(topic, context):
+        return None  # Haiku fast path doesn't go through twitter_direct_api_agent
+    return f"{platform}_direct_api_agent"
+
+
 async def _execute_single_post(
     platform: str,
     topic: str,
@@ -238,12 +431,7 @@ async def _execute_single_post(
     # Context already contains strategic outline + optional strategy memory
     # NO learning injection - deprecated parameter ignored
 
-    # Normalize platform aliases
-    platform_lower = platform.lower()
-    if platform_lower in ['x', 'x/twitter']:
-        platform = 'twitter'
-    else:
-        platform = platform_lower
+    platform = normalize_platform(platform)
 
     # Call appropriate direct API agent workflow with Slack metadata
     if platform == "linkedin":
@@ -259,54 +447,9 @@ async def _execute_single_post(
         )
 
     elif platform == "twitter":
-        # Intelligent routing: Check if this should be a single post (Haiku fast path) or thread (SDK agent)
-        # Check context for content_length directive or keywords
-        content_length = "auto"
-        context_lower = context.lower() if context else ""
-        topic_lower = topic.lower() if topic else ""
-
-        # Detect thread keywords (expanded list, includes X/Twitter aliases)
-        thread_keywords = ["thread", "thread of", "twitter thread", "x thread", "long thread", "short thread", "a thread", "an x thread", "an twitter thread"]
-        is_thread = any(keyword in context_lower or keyword in topic_lower for keyword in thread_keywords)
-
-        # Detect single post keywords (expanded list, includes X/Twitter aliases)
-        single_post_keywords = ["single post", "one tweet", "twitter post", "x post", "single tweet", "a tweet", "an x post", "an x tweet", "one x post", "a twitter post", "standalone post", "one post"]
-        is_single_post = any(keyword in context_lower or keyword in topic_lower for keyword in single_post_keywords)
-
-        # Check for explicit content_length in context
-        if "content_length" in context_lower:
-            if "single_post" in context_lower:
-                content_length = "single_post"
-            elif "short_thread" in context_lower or "long_thread" in context_lower:
-                content_length = "thread"
-
-        # IMPROVED ROUTING LOGIC: Use context length and complexity heuristics
-        # Context > 500 chars suggests detailed outline → likely needs thread/complex handling → use Direct API
-        context_length = len(context) if context else 0
-        topic_length = len(topic) if topic else 0
-
-        # Detect narrative/outline indicators (bullet points, numbered lists, multiple paragraphs)
-        has_outline = any(indicator in context for indicator in ['\n-', '\n*', '\n1.', '\n2.', '\n•']) if context else False
-        has_multiple_paragraphs = context.count('\n\n') >= 2 if context else False
-
-        # Routing decision with smarter defaults
-        use_haiku = False
-        if is_thread:
-            use_haiku = False  # Use SDK agent for threads
-        elif is_single_post:
-            use_haiku = True  # Use Haiku for single posts
-        elif content_length == "single_post":
-            use_haiku = True
-        elif content_length in ["short_thread", "long_thread"]:
-            use_haiku = False
-        elif context_length > 500 or has_outline or has_multiple_paragraphs:
-            # Complex context suggests need for Direct API agent (better research, validation)
-            use_haiku = False
-        else:
-            # Default: Use Haiku fast path for single posts (speed)
-            # Only use Direct API agent if explicitly a thread or has complex context
-            use_haiku = True
-        
+        # Intelligent routing: single post (Haiku fast path) or thread (direct API agent)
+        use_haiku = _use_twitter_haiku(topic, context)
+
         if use_haiku:
             # Use Haiku fast path for single posts
             from agents.twitter_haiku_agent import create_twitter_post_workflow
@@ -571,10 +714,14 @@ def create_batch_plan(
 
     # Store plan in global registry
     _batch_plans[plan_id] = plan
+    _share_plan(plan)
 
     # Create context manager for this plan (pass plan so it can extract detailed_outlines)
     _context_managers[plan_id] = ContextManager(plan_id, plan)
 
+    # Warm company-document/content-example searches while the user reviews the plan
+    start_plan_prefetch(plan_id, posts)
+
     print(f"📋 Created batch plan: {plan_id} with {len(posts)} posts (context: {context_quality})")
 
     return plan
@@ -599,7 +746,7 @@ async def execute_single_post_from_plan(plan_id: str, post_index: int) -> Dict[s
         }
     """
     # Get plan from registry
-    plan = _batch_plans.get(plan_id)
+    plan = _get_plan(plan_id)
     if not plan:
         return {
             'success': False,
@@ -666,13 +813,8 @@ async def execute_single_post_from_plan(plan_id: str, post_index: int) -> Dict[s
                 f"📝 {total_posts} posts queued\n"
                 f"⏳ Creating posts sequentially..."
             )
-            slack_client.chat_postMessage(
-                channel=channel_id,
-                thread_ts=thread_ts,
-                text=batch_start_message,
-                mrkdwn=True
-            )
-            print(f"   ✅ Sent batch start notification to Slack", flush=True)
+            get_progress_publisher().post(channel_id, batch_start_message, thread_ts=thread_ts, client=slack_client)
+            print(f"   ✅ Queued batch start notification for Slack", flush=True)
         except Exception as e:
             # Log but don't crash batch if Slack update fails
             print(f"   ⚠️ Failed to send batch start notification: {e}", flush=True)
@@ -683,48 +825,60 @@ async def execute_single_post_from_plan(plan_id: str, post_index: int) -> Dict[s
         """Send progress update to Slack (non-blocking, no user tag) - only for batches > 1"""
         if total_posts > 1 and slack_client and channel_id and thread_ts:
             try:
-                # Send asynchronously without blocking
-                slack_client.chat_postMessage(
-                    channel=channel_id,
-                    thread_ts=thread_ts,
-                    text=message,  # NO user tag - silent progress update
-                    mrkdwn=True
+                # Queued: bursts are coalesced into edits of the plan's status message
+                get_progress_publisher().status(
+                    plan_id, channel_id, thread_ts, message,  # NO user tag - silent progress update
+                    header=f"📋 *Batch progress* (`{plan_id}`)", client=slack_client
                 )
             except Exception as e:
                 # Log but don't crash batch if Slack update fails
                 print(f"   ⚠️ Failed to send progress update: {e}", flush=True)
 
+    # Model routing budget for the whole plan (non-critical stages move to the
+    # fast model when the batch falls behind)
+    budget = _batch_budgets.get(plan_id)
+    if budget is None:
+        budget = _batch_budgets[plan_id] = BatchBudget(total_posts, stats=context_mgr.stats)
+    post_started = time.monotonic()
+    tokens_before = budget.tokens_used
+
     try:
         # Execute post using SDK agent with strategic context AND Slack metadata
         # Hard timeout wrapper: Prevent infinite hangs (belt + suspenders with SDK disconnect())
-        result = await asyncio.wait_for(
-            _execute_single_post(
-                platform=post_spec['platform'],
-                topic=post_spec['topic'],
-                context=strategic_context,  # Strategic outline + optional strategy memory
-                style=post_spec.get('style', ''),
-                learnings='',  # NO LEARNINGS - deprecated parameter
-                target_score=18,  # Fixed threshold
-                # Pass Slack metadata for Airtable/Supabase saves
-                channel_id=channel_id,
-                thread_ts=thread_ts,
-                user_id=user_id
-            ),
-            timeout=360  # 6 minutes max per post (allows for validation-heavy posts with GPTZero)
-        )
-
-        # CRITICAL: Force cleanup to prevent connection exhaustion
-        # This fixes the Post 6+ hang issue by ensuring all resources are freed
-        await asyncio.sleep(3)  # Increased from 2 to 3 seconds for connection cleanup
-
-        # Force garbage collection to clean up any lingering connections
-        import gc
-        gc.collect()
-
-        # Additional cleanup delay after GC
-        await asyncio.sleep(1)
-
-        print(f"   ✅ Post {post_index + 1} cleanup complete (GC forced), ready for next post", flush=True)
+        # Shared pooled clients (utils/http_clients.py) replace the old per-post
+        # sleep + gc.collect() cleanup; track_connections warns if a post leaks sockets
+        # Every nested call (API iterations, tools, validators) derives its timeout from the
+        # post's remaining deadline instead of its own fixed budget
+        with use_budget(budget), use_prefetch(plan_id), deadline(POST_DEADLINE_SECONDS), \
+                track_connections(f"post:{post_spec['platform']}"):
+            try:
+                # Degrade immediately while the platform agent's breaker is open instead of
+                # spending the post timeout on a call that will be rejected
+                breaker_name = _agent_breaker_name(post_spec['platform'], post_spec['topic'], strategic_context)
+                retry_after = get_breaker(breaker_name).retry_after() if breaker_name else 0.0
+                if retry_after:
+                    raise CircuitBreakerOpen(f"Circuit breaker '{breaker_name}' is open. Retry in {retry_after:.1f}s")
+
+                result = await asyncio.wait_for(
+                    _execute_single_post(
+                        platform=post_spec['platform'],
+                        topic=post_spec['topic'],
+                        context=strategic_context,  # Strategic outline + optional strategy memory
+                        style=post_spec.get('style', ''),
+                        learnings='',  # NO LEARNINGS - deprecated parameter
+                        target_score=18,  # Fixed threshold
+                        # Pass Slack metadata for Airtable/Supabase saves
+                        channel_id=channel_id,
+                        thread_ts=thread_ts,
+                        user_id=user_id
+                    ),
+                    timeout=remaining()  # POST_DEADLINE_SECONDS (6 min) allows for validation-heavy posts with GPTZero
+                )
+            finally:
+                budget.item_done()
+                if budget.items_done >= budget.total_items:
+                    _batch_budgets.pop(plan_id, None)
+                    clear_plan_prefetch(plan_id)
 
         # Extract metadata
         score = extract_score_from_result(result)
@@ -747,14 +901,17 @@ async def execute_single_post_from_plan(plan_id: str, post_index: int) -> Dict[s
             else:
                 print(f"   ✅ Post {post_num} strategic alignment: {alignment:.1%}")
 
-        # Update context manager
+        # Update context manager (running stats are shared so they survive a restart)
         await context_mgr.add_post_summary({
             'post_num': post_num,
             'score': score,
             'hook': hook,
             'platform': post_spec['platform'],
-            'airtable_url': airtable_url
+            'airtable_url': airtable_url,
+            'seconds': time.monotonic() - post_started,
+            'tokens': budget.tokens_used - tokens_before
         })
+        _share_stats(plan_id, context_mgr)
 
         print(f"   ✅ Success: Score {score}/25")
 
@@ -775,18 +932,19 @@ async def execute_single_post_from_plan(plan_id: str, post_index: int) -> Dict[s
             'platform': post_spec['platform'],
             'hook': hook,
             'airtable_url': airtable_url,
-            'full_result': result  # Include full SDK agent result for single-post display
+            'full_result': result,  # Include full SDK agent result for single-post display
+            'routing_budget': budget.summary()
         }
 
     except asyncio.TimeoutError:
-        # Hard timeout hit - post took >6 minutes (likely connection hang or validation loop)
-        print(f"   ⏱️ TIMEOUT: Post {post_num} exceeded 6-minute limit")
+        # Hard timeout hit - post used its whole deadline (likely connection hang or validation loop)
+        print(f"   ⏱️ TIMEOUT: Post {post_num} exceeded {POST_DEADLINE_SECONDS:.0f}s deadline")
         print(f"   This usually means validation took too long (GPTZero + multiple iterations)")
 
         # Send timeout progress update (non-blocking, no user tag) - only for batches > 1
         if total_posts > 1:
             timeout_message = (
-                f"⚠️ Post {post_num}/{total_posts} timed out (6 min limit). Continuing..."
+                f"⚠️ Post {post_num}/{total_posts} timed out ({POST_DEADLINE_SECONDS / 60:.0f} min limit). Continuing..."
             )
             _send_progress_update(timeout_message)
 
@@ -794,9 +952,23 @@ async def execute_single_post_from_plan(plan_id: str, post_index: int) -> Dict[s
             'success': False,
             'score': 0,
             'platform': post_spec['platform'],
-            'hook': f"Post {post_num} timed out after 5 minutes",
+            'hook': f"Post {post_num} timed out after {POST_DEADLINE_SECONDS / 60:.0f} minutes",
+            'airtable_url': None,
+            'error': f"Timeout after {POST_DEADLINE_SECONDS:.0f}s (POST_DEADLINE_SECONDS) - likely connection hang or a slow validation loop"
+        }
+
+    except CircuitBreakerOpen as e:
+        print(f"   ⚡ Post {post_num} skipped: {e}")
+        if total_posts > 1:
+            _send_progress_update(f"⚡ Post {post_num}/{total_posts} skipped: {post_spec['platform']} generation is failing. Continuing...")
+
+        return {
+            'success': False,
+            'score': 0,
+            'platform': post_spec['platform'],
+            'hook': f"Post {post_num} skipped (circuit open)",
             'airtable_url': None,
-            'error': f"Timeout after 300s - likely connection hang. Check SDK disconnect() calls."
+            'error': str(e)
         }
 
     except Exception as e:
@@ -825,6 +997,186 @@ async def execute_single_post_from_plan(plan_id: str, post_index: int) -> Dict[s
         }
 
 
+async def run_plan(plan_id: str, start_index: int = 0) -> Dict[str, Any]:
+    """
+    Execute every post in a batch plan server-side
+
+    One call drives the whole plan through execute_single_post_from_plan, so
+    the CMO agent spends one tool call per batch instead of one LLM turn per
+    post. Per-post progress still goes to Slack; checkpoints are posted every
+    10 posts and a final summary at the end. Cancellation (cancel_plan_run)
+    takes effect between posts.
+
+    Args:
+        plan_id: ID from create_batch_plan
+        start_index: First post to execute (0-indexed, for resuming)
+
+    Returns:
+        {
+            'success': bool,
+            'completed': int,
+            'failed': int,
+            'cancelled': bool,
+            'total': int,
+            'elapsed_seconds': int,
+            'avg_score': float,
+            'quality_trend': str,
+            'posts': [{'index', 'success', 'score', 'platform', 'hook', 'airtable_url', 'error'}],
+            'error': str (if the plan could not run)
+        }
+    """
+    plan = _get_plan(plan_id)
+    if not plan:
+        return {'success': False, 'error': f"Plan {plan_id} not found"}
+
+    total_posts = len(plan['posts'])
+    if start_index < 0 or start_index >= total_posts:
+        return {'success': False, 'error': f"Invalid start_index {start_index}. Plan has {total_posts} posts."}
+
+    run = {
+        'status': 'running',
+        'total': total_posts - start_index,
+        'completed': 0,
+        'failed': 0,
+        'cancelled': False,
+        'started_at': time.time(),
+        'worker': WORKER_ID,
+        'posts': []
+    }
+    # Claim atomically so two workers can't both start the plan
+    existing = _claim_run(plan_id, run)
+    if existing:
+        return {'success': False, 'error': f"Plan {plan_id} is already running ({existing['completed'] + existing['failed']}/{existing['total']} done)"}
+    store = _shared_store()
+    if store is not None:
+        store.delete('batch_cancels', plan_id)
+
+    slack_metadata = plan.get('slack_metadata', {})
+    slack_client = slack_metadata.get('slack_client')
+    channel_id = slack_metadata.get('channel_id')
+    thread_ts = slack_metadata.get('thread_ts')
+
+    publisher = get_progress_publisher()
+
+    def _post_to_slack(message: str):
+        if total_posts > 1 and slack_client and channel_id and thread_ts:
+            try:
+                publisher.post(channel_id, message, thread_ts=thread_ts, client=slack_client)
+            except Exception as e:
+                print(f"   ⚠️ Failed to send batch update: {e}", flush=True)
+
+    print(f"\n🚀 Running plan {plan_id} server-side: posts {start_index + 1}-{total_posts}", flush=True)
+
+    finished = False
+    try:
+        for post_index in range(start_index, total_posts):
+            if _cancel_requested(plan_id, run):
+                print(f"   🛑 Plan {plan_id} cancelled before post {post_index + 1}", flush=True)
+                break
+
+            result = await execute_single_post_from_plan(plan_id, post_index)
+            run['posts'].append({
+                'index': post_index,
+                'success': result.get('success', False),
+                'score': result.get('score', 0),
+                'platform': result.get('platform', 'unknown'),
+                'hook': result.get('hook', ''),
+                'airtable_url': result.get('airtable_url'),
+                'error': result.get('error')
+            })
+            run['completed' if result.get('success') else 'failed'] += 1
+            _share_run(plan_id, run)
+
+            post_num = post_index + 1
+            context_mgr = _context_managers.get(plan_id)
+            if post_num % 10 == 0 and post_num < total_posts and context_mgr:
+                stats = context_mgr.get_stats()
+                _post_to_slack(
+                    f"✅ *Checkpoint: Posts {post_num-9}-{post_num} complete!*\n\n"
+                    f"📊 Stats:\n"
+                    f"- Average score: *{stats['avg_score']:.1f}/25*\n"
+                    f"- Quality trend: *{stats['quality_trend']}*\n"
+                    f"- Score range: {stats['lowest_score']}-{stats['highest_score']} (±{stats['score_stdev']:.1f})\n"
+                    f"{_format_platform_stats(stats)}\n"
+                    f"⏳ *{total_posts - post_num} posts remaining.* Continuing..."
+                )
+        finished = True
+    except asyncio.CancelledError:
+        run['cancelled'] = True
+        raise
+    finally:
+        if not finished:
+            # Interrupted (session cancelled, unexpected error): never leave the run
+            # 'running', or the plan could not be resumed with start_index
+            run['status'] = 'cancelled' if run['cancelled'] else 'failed'
+            _share_run(plan_id, run)
+            publisher.forget(plan_id)
+            print(f"   ⚠️ Plan {plan_id} interrupted after {run['completed'] + run['failed']} posts ({run['status']})", flush=True)
+
+    run['status'] = 'cancelled' if run['cancelled'] else 'complete'
+    _share_run(plan_id, run)
+    elapsed = int(time.time() - run['started_at'])
+    context_mgr = _context_managers.get(plan_id)
+    stats = context_mgr.get_stats() if context_mgr else ContextManager(plan_id).get_stats()
+
+    headline = "🛑 *Batch cancelled.*" if run['cancelled'] else "🎉 *Batch complete!*"
+    _post_to_slack(
+        f"{headline}\n\n"
+        f"- ✅ Completed: *{run['completed']}/{run['total']}*\n"
+        f"- ❌ Failed: *{run['failed']}*\n"
+        f"- ⏱️ Total time: *{elapsed // 60} minutes*\n"
+        f"- 📈 Average score: *{stats['avg_score']:.1f}/25*\n"
+        f"- 📊 Quality trend: *{stats['quality_trend']}*\n"
+        f"{_format_platform_stats(stats)}"
+        f"{_format_stage_stats(stats)}"
+    )
+
+    publisher.forget(plan_id)
+    # The summary is the last thing the user sees; make sure it went out
+    await publisher.flush()
+
+    print(f"🏁 Plan {plan_id}: {run['completed']} completed, {run['failed']} failed in {elapsed}s", flush=True)
+
+    return {
+        'success': run['failed'] == 0 and not run['cancelled'],
+        'completed': run['completed'],
+        'failed': run['failed'],
+        'cancelled': run['cancelled'],
+        'total': run['total'],
+        'elapsed_seconds': elapsed,
+        'avg_score': stats['avg_score'],
+        'quality_trend': stats['quality_trend'],
+        'posts': run['posts']
+    }
+
+
+def cancel_plan_run(plan_id: str) -> bool:
+    """
+    Stop a server-side run after the post in progress
+
+    Returns:
+        True if a running plan was flagged for cancellation
+    """
+    run = get_plan_run(plan_id)
+    if not run or not _run_active(run):
+        return False
+    if plan_id in _batch_runs:
+        _batch_runs[plan_id]['cancelled'] = True
+    else:
+        # Running on another worker: it checks the flag before each post
+        _shared_store().set('batch_cancels', plan_id, True, ttl=BATCH_STATE_TTL)
+    return True
+
+
+def get_plan_run(plan_id: str) -> Optional[Dict[str, Any]]:
+    """Run state for a plan started with run_plan (None if never run), from whichever worker runs it"""
+    run = _batch_runs.get(plan_id)
+    store = _shared_store()
+    if run is None and store is not None:
+        run = store.get('batch_runs', plan_id)
+    return run
+
+
 def get_context_manager(plan_id: str) -> Optional[ContextManager]:
     """
     Get context manager for a plan
@@ -835,9 +1187,47 @@ def get_context_manager(plan_id: str) -> Optional[ContextManager]:
     Returns:
         ContextManager instance or None
     """
+    _get_plan(plan_id)  # Loads plans (and their stats) created by another worker or before a restart
     return _context_managers.get(plan_id)
 
 
+def get_batch_stats(plan_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Running stats for a plan (from this worker, else from shared state)
+
+    Returns:
+        ContextManager.get_stats() dict, or None if the plan is unknown
+    """
+    context_mgr = _context_managers.get(plan_id)
+    if context_mgr is None:
+        store = _shared_store()
+        state = store.get('batch_stats', plan_id) if store is not None else None
+        if state is None:
+            return None
+        context_mgr = ContextManager(plan_id)
+        context_mgr.load_state(state)
+    return context_mgr.get_stats()
+
+
+def _format_platform_stats(stats: Dict[str, Any]) -> str:
+    """Per-platform score line for Slack summaries (empty for single-platform batches)"""
+    platforms = stats.get('by_platform', {})
+    if len(platforms) < 2:
+        return ''
+    parts = [f"{platform.capitalize()} {s['mean']:.1f} ({s['count']})" for platform, s in platforms.items()]
+    return f"- 🗂️ By platform: {', '.join(parts)}\n"
+
+
+def _format_stage_stats(stats: Dict[str, Any], top: int = 3) -> str:
+    """Slowest stages by total time for Slack summaries"""
+    stages = {name: s for name, s in stats.get('stages', {}).items() if name != 'post'}
+    if not stages:
+        return ''
+    slowest = sorted(stages.items(), key=lambda item: item[1]['total_seconds'], reverse=True)[:top]
+    parts = [f"{name} {s['total_seconds']:.0f}s/{s['calls']} calls" for name, s in slowest]
+    return f"- 🐢 Slowest stages: {', '.join(parts)}\n"
+
+
 async def diversify_topics(
     topic: str,
     count: int,
@@ -866,10 +1256,10 @@ async def diversify_topics(
             ...
         ]
     """
-    from anthropic import Anthropic
     import json
+    from utils.anthropic_client import get_anthropic_client
 
-    client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+    client = get_anthropic_client()
 
     # Calculate distribution
     thought_leadership_count = int(count * 0.40)
@@ -911,9 +1301,9 @@ CRITICAL RULES:
 Generate {count} unique angles now:"""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=2000,
+        response = create_message(
+            client,
+            'topic_angles',
             messages=[{"role": "user", "content": prompt}]
         )
 
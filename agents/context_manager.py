@@ -2,12 +2,16 @@
 Context Manager for Batch Content Execution
 Routes strategic context to each post (NO learning accumulation)
 
-Simplified from v1: Removed learning extraction, compaction, and quality trend analysis.
+Simplified from v1: Removed learning extraction and compaction.
 Focus: Pass user's strategic outline + optional strategy memory to each post.
+Batch stats (scores, trend, per-platform and per-stage aggregates) are kept
+as running aggregates in utils/running_stats.py.
 """
 
 from typing import Dict, List, Any, Optional
 
+from utils.running_stats import BatchStats
+
 
 class ContextManager:
     """
@@ -39,9 +43,9 @@ class ContextManager:
         # Optional strategy memory (compacted from last 5 conversations)
         self.strategy_memory = self.plan.get('strategy_memory', '')
 
-        # Simple tracking (no learning accumulation)
+        # Running stats (no learning accumulation)
         self.total_posts = 0
-        self.scores = []
+        self.stats = BatchStats()
 
     def get_context_for_post(self, post_index: int) -> str:
         """
@@ -82,64 +86,67 @@ Do NOT try to "improve" on previous posts - each post is independent with its ow
                 'score': int (out of 25),
                 'hook': str (first 100 chars),
                 'platform': str,
-                'airtable_url': str
+                'airtable_url': str,
+                'seconds': float (optional, end-to-end post latency),
+                'tokens': int (optional, tokens the post used)
             }
         """
         self.total_posts += 1
 
         # Track score for stats only (no learning extraction)
         if 'score' in summary:
-            self.scores.append(summary['score'])
+            self.stats.add_post(
+                summary['score'],
+                platform=summary.get('platform'),
+                seconds=summary.get('seconds'),
+                tokens=summary.get('tokens')
+            )
 
     def get_stats(self) -> Dict[str, Any]:
         """
-        Returns simple stats for checkpoint messages
+        Returns stats for checkpoint messages and the batch stats endpoint
+
+        Read from running aggregates (utils/running_stats.py), O(1) per checkpoint.
 
         Returns:
             Dictionary with:
             - total_posts: int
             - avg_score: float
+            - score_stdev: float
             - recent_scores: List[int] (last 10)
             - lowest_score: int
             - highest_score: int
+            - quality_trend: str (EWMA of scores vs batch mean)
+            - by_platform: Dict[str, Dict] (count/mean/stdev/min/max per platform)
+            - stages: Dict[str, Dict] (latency and tokens per LLM stage, tool and post)
         """
-        if not self.scores:
-            return {
-                'total_posts': 0,
-                'avg_score': 0,
-                'recent_scores': [],
-                'lowest_score': 0,
-                'highest_score': 0,
-                'quality_trend': 'N/A'
-            }
-
-        avg_score = sum(self.scores) / len(self.scores)
-        recent_scores = self.scores[-10:] if len(self.scores) >= 10 else self.scores
-
-        # Simple quality trend (for checkpoint messages)
-        if len(self.scores) >= 2:
-            first_half_avg = sum(self.scores[:len(self.scores)//2]) / (len(self.scores)//2)
-            second_half_avg = sum(self.scores[len(self.scores)//2:]) / (len(self.scores) - len(self.scores)//2)
-
-            if second_half_avg > first_half_avg + 1:
-                quality_trend = "improving"
-            elif second_half_avg < first_half_avg - 1:
-                quality_trend = "declining"
-            else:
-                quality_trend = "stable"
-        else:
-            quality_trend = "too early to tell"
+        summary = self.stats.summary()
+        scores = summary['scores']
 
         return {
             'total_posts': self.total_posts,
-            'avg_score': avg_score,
-            'average_score': avg_score,  # Alias for consistency
-            'recent_scores': recent_scores,
-            'quality_trend': quality_trend,
-            'lowest_score': min(self.scores),
-            'highest_score': max(self.scores)
+            'avg_score': scores['mean'],
+            'average_score': scores['mean'],  # Alias for consistency
+            'score_stdev': scores['stdev'],
+            'ewma_score': summary['ewma_score'],
+            'recent_scores': summary['recent_scores'],
+            'quality_trend': summary['quality_trend'],
+            'lowest_score': scores['min'] if scores['min'] is not None else 0,
+            'highest_score': scores['max'] if scores['max'] is not None else 0,
+            'by_platform': summary['by_platform'],
+            'stages': summary['stages']
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable tracking state (restored with load_state())"""
+        return {'total_posts': self.total_posts, 'stats': self.stats.to_dict()}
+
+    def load_state(self, state: Optional[Dict[str, Any]]):
+        """Restore tracking state saved with to_dict() (e.g. after a restart)"""
+        if state:
+            self.total_posts = state.get('total_posts', 0)
+            self.stats = BatchStats.from_dict(state.get('stats'))
+
     def add_strategic_context(self, post_index: int, strategic_outline: str):
         """
         Store strategic outline for tracking alignment
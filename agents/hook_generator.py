@@ -6,6 +6,7 @@ from anthropic import Anthropic
 import os
 import json
 from typing import List, Dict
+from utils.model_routing import create_message
 
 
 class LinkedInHookGenerator:
@@ -121,9 +122,9 @@ CONTEXT:
 Generate the 5 hooks now."""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2000,
+            response = create_message(
+                self.client,
+                'hook_generation',
                 system=[
                     {
                         "type": "text",
@@ -6,6 +6,7 @@ from anthropic import Anthropic
 import os
 import re
 from typing import List, Dict, Tuple
+from utils.model_routing import create_message
 
 
 class HybridEditor:
@@ -220,9 +221,9 @@ ISSUES TO FIX:
 Fix the draft now."""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4000,
+            response = create_message(
+                self.client,
+                'llm_edit',
                 system=[
                     {
                         "type": "text",
@@ -5,6 +5,7 @@ Replaces vague claims with research data and tangible proof points
 from anthropic import Anthropic
 import os
 from typing import Dict
+from utils.model_routing import create_message
 
 
 class ProofInjector:
@@ -83,9 +84,9 @@ EXAMPLES FROM KNOWLEDGE BASE:
 Punch up the draft now."""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4000,
+            response = create_message(
+                self.client,
+                'proof_injection',
                 system=[
                     {
                         "type": "text",
@@ -4,12 +4,14 @@ Fast single-post generation using Haiku for rapid iteration (1-5 posts)
 Bypasses multi-agent process for speed while maintaining quality
 """
 import os
+import re
 import json
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from anthropic import Anthropic, RateLimitError
 from utils.anthropic_client import get_anthropic_client
+from utils.model_routing import create_message, route_model
 from utils.retry_decorator import async_retry_with_backoff
 
 # Load writing rules using new PromptLoader (supports client overrides)
@@ -21,6 +23,48 @@ EDITOR_IN_CHIEF_RULES = load_editor_standards()
 # Import search functions
 from tools.template_search import search_templates_agentic, get_template_by_name
 from tools.search_tools import search_content_examples
+from utils.rag_prefetch import lookup_prefetched
+
+# Opt-in multi-variant mode: N tweets in one Haiku call, ranked locally (1 = off)
+DEFAULT_VARIANTS = int(os.getenv('TWITTER_HAIKU_VARIANTS', '1'))
+MAX_VARIANTS = 5
+
+_EMOJI_PATTERN = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags
+    u"\U00002702-\U000027B0"
+    u"\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE)
+
+
+def _clean_post_content(post_content: str) -> str:
+    """Strip markdown, numbering and emojis; enforce the 280-char limit"""
+    post_content = post_content.replace('**', '').replace('*', '').replace('#', '')
+    # Remove numbering like "1/ " or "1. "
+    post_content = re.sub(r'^\d+[/.]\s*', '', post_content, flags=re.MULTILINE)
+    post_content = _EMOJI_PATTERN.sub('', post_content).strip()
+
+    if len(post_content) > 280:
+        print(f"   ⚠️ Post exceeds 280 chars ({len(post_content)}), truncating...")
+        post_content = post_content[:277] + "..."
+    return post_content
+
+
+def _parse_variants(text: str) -> List[str]:
+    """Extract variant tweets from {"variants": [...]} (tolerates code fences)"""
+    text = text.strip()
+    if text.startswith('```'):
+        text = text.split('```')[1]
+        if text.startswith('json'):
+            text = text[4:]
+    try:
+        data = json.loads(text.strip())
+    except json.JSONDecodeError:
+        return []
+    variants = data.get('variants', []) if isinstance(data, dict) else data
+    return [v for v in variants if isinstance(v, str) and v.strip()]
 
 
 @async_retry_with_backoff(
@@ -37,7 +81,8 @@ async def create_single_post(
     channel_id: Optional[str] = None,
     thread_ts: Optional[str] = None,
     user_id: Optional[str] = None,
-    publish_date: Optional[str] = None
+    publish_date: Optional[str] = None,
+    variants: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Create a single Twitter post using Haiku fast path
@@ -49,6 +94,8 @@ async def create_single_post(
         thread_ts: Slack thread timestamp (for tracking)
         user_id: Slack user ID (for tracking)
         publish_date: Optional publish date
+        variants: Tweets to generate in one call and rank locally
+                  (default: TWITTER_HAIKU_VARIANTS, 1 = single-shot)
 
     Returns:
         Dict with:
@@ -56,6 +103,7 @@ async def create_single_post(
             - post: str (clean post content, no emojis)
             - hook: str (hook preview)
             - score: int (Haiku self-assessment 0-5)
+            - variant_stats: dict (multi-variant mode only)
             - error: str (if failed)
     """
     try:
@@ -70,6 +118,7 @@ async def create_single_post(
             }
 
         topic = topic.strip()
+        variant_count = max(1, min(variants if variants is not None else DEFAULT_VARIANTS, MAX_VARIANTS))
         print(f"🚀 Twitter Haiku Fast Path: Creating post about '{topic}'")
         
         # Step 1: Search templates with timeout protection
@@ -104,7 +153,6 @@ async def create_single_post(
                 if '**' in line and '.' in line:
                     try:
                         # Extract content between ** markers
-                        import re
                         matches = re.findall(r'\*\*([^*]+)\*\*', line)
                         if matches:
                             # Try to extract name after number
@@ -152,17 +200,22 @@ Structure: {json.dumps(template_data.get('structure', {}), indent=2)}
         examples_context = ""
 
         try:
-            # Wrap synchronous search in asyncio with timeout
-            examples_json = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    search_content_examples,
-                    topic,  # query
-                    "Twitter",  # platform
-                    5  # match_count
-                ),
-                timeout=10.0  # 10 second timeout for content search
+            # Batch plans prefetch this search while the user reviews the plan
+            examples_json = await lookup_prefetched(
+                'content_examples', topic, platform="Twitter", match_count=5
             )
+            if examples_json is None:
+                # Wrap synchronous search in asyncio with timeout
+                examples_json = await asyncio.wait_for(
+                    asyncio.get_event_loop().run_in_executor(
+                        None,
+                        search_content_examples,
+                        topic,  # query
+                        "Twitter",  # platform
+                        5  # match_count
+                    ),
+                    timeout=10.0  # 10 second timeout for content search
+                )
             examples_data = json.loads(examples_json)
         except asyncio.TimeoutError:
             print("   ⚠️ Content examples search timed out after 10s, using defaults")
@@ -188,6 +241,14 @@ Human Score: {match.get('human_score', 'N/A')}
             examples_context = "No specific examples found - use general Twitter best practices"
         
         # Step 3: Build Haiku prompt
+        if variant_count > 1:
+            output_instructions = f"""Write {variant_count} DIFFERENT versions of this tweet (different hooks and angles, same rules).
+Return ONLY valid JSON (no markdown, no explanations):
+{{"variants": ["<tweet 1>", "<tweet 2>"]}}"""
+        else:
+            output_instructions = """Return ONLY the tweet text (no numbering, no markdown, no emojis, no explanations).
+Just the clean post content."""
+
         prompt = f"""You are writing a single Twitter post (<280 chars) using proven templates and examples.
 
 WRITE_LIKE_HUMAN_RULES:
@@ -217,26 +278,25 @@ CRITICAL REQUIREMENTS:
 - Specific and concrete (use numbers/dates if available)
 - Hook should grab attention immediately
 
-Return ONLY the tweet text (no numbering, no markdown, no emojis, no explanations).
-Just the clean post content."""
+{output_instructions}"""
 
         # Step 4: Call Haiku with timeout protection (CRITICAL)
         print("   ⚡ Calling Haiku for generation...")
         client = get_anthropic_client()
 
         try:
-            # CRITICAL: Add 30-second timeout to prevent indefinite hanging
+            # CRITICAL: Routed timeout (30s) to prevent indefinite hanging
+            route = route_model('haiku_post', platform='twitter')
             response = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: client.messages.create(
-                        model="claude-haiku-4-5-20251001",
-                        max_tokens=500,
-                        temperature=0.7,
-                        messages=[{"role": "user", "content": prompt}]
-                    )
+                asyncio.to_thread(
+                    create_message,
+                    client,
+                    route,
+                    max_tokens=500 if variant_count == 1 else min(250 * variant_count + 200, 2000),
+                    temperature=0.7,
+                    messages=[{"role": "user", "content": prompt}]
                 ),
-                timeout=30.0  # 30 second timeout for Haiku API
+                timeout=route.timeout
             )
 
             if not response or not response.content or not response.content[0].text:
@@ -262,28 +322,26 @@ Just the clean post content."""
                 'score': 0
             }
         
-        # Clean up post content (remove any markdown, numbering, etc.)
-        # Remove markdown formatting
-        post_content = post_content.replace('**', '').replace('*', '').replace('#', '')
-        # Remove numbering like "1/ " or "1. "
-        import re
-        post_content = re.sub(r'^\d+[/.]\s*', '', post_content, flags=re.MULTILINE)
-        # Remove any emojis (basic check)
-        emoji_pattern = re.compile("["
-            u"\U0001F600-\U0001F64F"  # emoticons
-            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-            u"\U0001F680-\U0001F6FF"  # transport & map symbols
-            u"\U0001F1E0-\U0001F1FF"  # flags
-            u"\U00002702-\U000027B0"
-            u"\U000024C2-\U0001F251"
-            "]+", flags=re.UNICODE)
-        post_content = emoji_pattern.sub('', post_content)
-        post_content = post_content.strip()
-        
-        # Validate character limit
-        if len(post_content) > 280:
-            print(f"   ⚠️ Post exceeds 280 chars ({len(post_content)}), truncating...")
-            post_content = post_content[:277] + "..."
+        # Multi-variant mode: rank variants locally (validator checks), keep the best
+        variant_summary = None
+        candidates = _parse_variants(post_content) if variant_count > 1 else []
+        if candidates:
+            from utils.variant_ranking import rank_variants, variant_stats
+
+            # Rank the raw variants so over-length ones get the char-limit penalty; clean only the winner
+            ranked = rank_variants(candidates)
+            usage = getattr(response, 'usage', None)
+            variant_summary = variant_stats(ranked, getattr(usage, 'output_tokens', None))
+            post_content = _clean_post_content(ranked[0]['text'])
+            print(f"   🏆 Picked best of {variant_summary['variants']} variants "
+                  f"(local scores {variant_summary['scores']}, variance {variant_summary['variance']}, "
+                  f"uplift {variant_summary['uplift']}, "
+                  f"{variant_summary.get('uplift_per_100_extra_tokens', 'n/a')} per 100 extra tokens)")
+        else:
+            if variant_count > 1:
+                print("   ⚠️ Could not parse variants, using raw response as a single post")
+            # Clean up post content (remove any markdown, numbering, etc.)
+            post_content = _clean_post_content(post_content)
         
         # Extract hook (first sentence or first 100 chars)
         hook_preview = post_content.split('.')[0] if '.' in post_content else post_content[:100]
@@ -304,6 +362,13 @@ Just the clean post content."""
 
         print(f"   ✅ Generated post ({len(post_content)} chars, score: {score}/5)")
 
+        # Near-duplicate check (fast path: warn only, no regeneration)
+        from utils.dedup_index import check_near_duplicate, format_duplicate_warning, record_post
+        duplicate = await asyncio.to_thread(check_near_duplicate, post_content, hook_preview, 'twitter')
+        suggested_edits = f"Score: {score}/5 (Haiku fast path)"
+        if duplicate:
+            suggested_edits = f"{format_duplicate_warning(duplicate)}\n\n{suggested_edits}"
+
         # Save to Airtable
         airtable_url = None
         airtable_record_id = None
@@ -324,6 +389,9 @@ Just the clean post content."""
             else:
                 airtable_status = "Needs Review"
 
+            if duplicate:
+                airtable_status = "Needs Review"
+
             print(f"   ✏️  Status: {airtable_status} (score: {score}/5)")
 
             airtable_result = airtable.create_content_record(
@@ -331,7 +399,7 @@ Just the clean post content."""
                 platform='twitter',
                 post_hook=hook_preview,
                 status=airtable_status,
-                suggested_edits=f"Score: {score}/5 (Haiku fast path)",
+                suggested_edits=suggested_edits,
                 publish_date=publish_date
             )
 
@@ -382,6 +450,8 @@ Just the clean post content."""
         except Exception as e:
             print(f"   ⚠️ Supabase save failed: {e}")
 
+        record_post(post_content, hook_preview, 'twitter', str(supabase_id) if supabase_id else None)
+
         return {
             'success': True,
             'post': post_content,
@@ -393,7 +463,8 @@ Just the clean post content."""
             'thread_ts': thread_ts,
             'user_id': user_id,
             'airtable_url': airtable_url,
-            'supabase_id': supabase_id
+            'supabase_id': supabase_id,
+            'variant_stats': variant_summary
         }
         
     except Exception as e:
@@ -6,6 +6,7 @@ import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 from pyairtable import Api
+from utils.circuit_breaker import CircuitBreakerOpen, get_breaker
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -39,6 +40,10 @@ class AirtableContentCalendar:
         self.api = Api(self.api_key)
         self.table = self.api.table(self.base_id, self.table_name)
 
+    def _table_call(self, method: str, *args, **kwargs):
+        """Airtable table call through the shared 'airtable' breaker (fails fast while Airtable is down)"""
+        return get_breaker('airtable').call(getattr(self.table, method), *args, **kwargs)
+
     def create_content_record(
         self,
         content: str,
@@ -134,7 +139,7 @@ class AirtableContentCalendar:
 
         try:
             print(f"📝 Airtable: Creating record with platform={platform}, content_len={len(clean_content)}")
-            record = self.table.create(fields)
+            record = self._table_call('create', fields)
             url = f"https://airtable.com/{self.base_id}/{self.table_name}/{record['id']}"
             print(f"✅ Airtable record created: {record['id']}")
             return {
@@ -152,7 +157,7 @@ class AirtableContentCalendar:
                 print(f"⚠️ Platform '{airtable_platform}' not in Airtable options, retrying without platform...")
                 del fields['Platform']
                 try:
-                    record = self.table.create(fields)
+                    record = self._table_call('create', fields)
                     url = f"https://airtable.com/{self.base_id}/{self.table_name}/{record['id']}"
                     print(f"✅ Airtable record created (without platform): {record['id']}")
                     return {
@@ -171,11 +176,18 @@ class AirtableContentCalendar:
                 'quota', 'rate limit', 'too many requests', '429', 'limit exceeded'
             ])
 
+            if isinstance(e, CircuitBreakerOpen):
+                fallback_message = 'Airtable unavailable. Saved to Supabase only.'
+            elif is_quota_error:
+                fallback_message = 'Airtable quota exceeded. Saved to Supabase only.'
+            else:
+                fallback_message = None
+
             return {
                 'success': False,
                 'error': error_str,
                 'is_quota_error': is_quota_error,
-                'fallback_message': 'Airtable quota exceeded. Saved to Supabase only.' if is_quota_error else None
+                'fallback_message': fallback_message
             }
 
     def update_content_record(
@@ -195,7 +207,7 @@ class AirtableContentCalendar:
         """
         try:
             # Note: 'Edited Time' is auto-computed in Airtable, don't set it manually
-            record = self.table.update(record_id, fields)
+            record = self._table_call('update', record_id, fields)
             return {
                 'success': True,
                 'record_id': record['id'],
@@ -210,7 +222,7 @@ class AirtableContentCalendar:
     def get_content_record(self, record_id: str) -> Dict[str, Any]:
         """Fetch a specific record by ID"""
         try:
-            record = self.table.get(record_id)
+            record = self._table_call('get', record_id)
             return {
                 'success': True,
                 'record': record
@@ -283,7 +295,8 @@ class AirtableContentCalendar:
                 formula = f"AND({', '.join(formula_parts)})"
 
             # Fetch records
-            records = self.table.all(
+            records = self._table_call(
+                'all',
                 formula=formula,
                 max_records=max_results,
                 sort=['-Created']  # Most recent first
@@ -341,7 +354,7 @@ class AirtableContentCalendar:
             formula = f"AND(IS_AFTER({{Publish Date}}, '{start_str}'), IS_BEFORE({{Publish Date}}, DATEADD('{end_str}', 1, 'days')))"
 
             # Fetch records with filter
-            records = self.table.all(formula=formula)
+            records = self._table_call('all', formula=formula)
 
             # Extract fields from records
             posts = []
@@ -386,7 +399,8 @@ class AirtableContentCalendar:
             if formula_parts:
                 formula = f"AND({', '.join(formula_parts)})"
 
-            records = self.table.all(
+            records = self._table_call(
+                'all',
                 formula=formula,
                 max_records=max_records,
                 sort=['-Created']  # Most recent first
@@ -639,7 +653,7 @@ class AirtableContentCalendar:
                     fields['Last Synced'] = sync_time
 
             # Update the record
-            record = self.table.update(record_id, fields)
+            record = self._table_call('update', record_id, fields)
 
             return {
                 'success': True,
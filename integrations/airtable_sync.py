@@ -22,6 +22,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from supabase import create_client, Client
 from openai import OpenAI
+from integrations.supabase_queries import Filter, QuerySpec, SYNC_POST_COLUMNS, select_one
 
 logger = logging.getLogger(__name__)
 
@@ -82,12 +83,14 @@ async def sync_single_post(
     """
     try:
         # Get current post from Supabase
-        result = supabase.table('generated_posts').select('*').eq('id', post_id).execute()
+        post = select_one(QuerySpec(
+            table='generated_posts',
+            columns=SYNC_POST_COLUMNS,
+            filters=[Filter('eq', 'id', post_id)]
+        ), client=supabase)
 
-        if not result.data:
+        if not post:
             return {'success': False, 'error': 'Post not found in Supabase'}
-
-        post = result.data[0]
         airtable_record_id = post.get('airtable_record_id')
 
         if not airtable_record_id:
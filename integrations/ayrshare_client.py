@@ -11,8 +11,12 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
+from utils.circuit_breaker import get_breaker
+
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = 30.0
+
 
 class AyrshareClient:
     """Client for Ayrshare API integration."""
@@ -95,12 +99,7 @@ class AyrshareClient:
                     )
 
             # POST request (not GET) to /analytics/post endpoint
-            response = requests.post(
-                f"{self.base_url}/analytics/post",
-                headers=self.headers,
-                json=body
-            )
-            response.raise_for_status()
+            response = self._request('POST', 'analytics/post', json=body)
             data = response.json()
 
             # Handle specific error codes
@@ -180,12 +179,7 @@ class AyrshareClient:
             if post_type:
                 params["type"] = post_type
 
-            response = requests.get(
-                f"{self.base_url}/history",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
+            response = self._request('GET', 'history', params=params)
             data = response.json()
 
             # Process and return posts (correct field name: "history")
@@ -210,6 +204,17 @@ class AyrshareClient:
             logger.error(f"Error fetching Ayrshare history: {e}")
             return self._mock_history(days_back, platforms)
 
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Ayrshare API call through the shared 'ayrshare' breaker (HTTP errors raise, so outages count)"""
+        def send():
+            response = requests.request(
+                method, f"{self.base_url}/{path}", headers=self.headers, timeout=REQUEST_TIMEOUT, **kwargs
+            )
+            response.raise_for_status()
+            return response
+
+        return get_breaker('ayrshare').call(send)
+
     def _calculate_engagement_rate(self, data: Dict[str, Any]) -> float:
         """Calculate engagement rate from metrics."""
         impressions = data.get("impressions", 0)
@@ -1,19 +1,92 @@
 """
 Content Extraction Utility
-Uses Haiku to extract structured content from agent outputs
-Replaces fragile regex-based parsing with reliable LLM extraction
+Extracts structured content from agent outputs in tiers:
+1. Local JSON parse (known FORMAT 1 schemas: post_text, script, caption, tweets, email_body)
+2. Local plain-text parse (clean single-version output, no commentary)
+3. Haiku extraction (drafts + commentary, unknown formats)
+4. Fallback (Haiku unavailable or failed)
 """
 import os
+import re
 import json
 import logging
-from typing import Dict, Any, Optional
-from anthropic import Anthropic
-from utils.anthropic_client import get_anthropic_client
+from typing import Dict, Any, Optional, Tuple
+from utils.model_routing import create_message
 
 # Setup logging
 logger = logging.getLogger(__name__)
 logger.setLevel(os.getenv('LOG_LEVEL', 'INFO'))
 
+# Per-tier usage counts (process lifetime) - see get_extraction_stats()
+_TIER_COUNTS: Dict[str, int] = {"json": 0, "plain_text": 0, "llm": 0, "fallback": 0}
+
+# Body field per known JSON schema, in priority order
+_BODY_KEYS = ("post_text", "script_text", "script", "caption", "email_body", "body", "tweets")
+
+# Hook length limits (Instagram preview window is 125 chars)
+_HOOK_LIMITS = {"instagram": 125}
+_DEFAULT_HOOK_LIMIT = 200
+
+# Lines that mean the output has commentary/multiple drafts - let Haiku sort it out
+_COMMENTARY_PATTERN = re.compile(
+    r"(?im)^\s*(#{1,6}\s|```|---+\s*$|\**\s*(✅\s*)?\**\s*final\b|\**\s*(draft|version)\s*\d*\s*[:*]|"
+    r"(quality\s+)?score\s*:|changes applied|what it delivers|what changed|let me\b|"
+    r"here'?s (your|the)\b|i'?ve (created|written|drafted)|i'?ll\b|post now scores)"
+)
+
+# A clean post opens straight into the hook: a single line starting with a word,
+# number, quote, symbol or emoji, with no markup and no trailing colon (labels)
+_CLEAN_OPENING = re.compile(
+    r"^(?!.*(\*\*|__|`))[\w\"'“‘$€£%@(¿¡\U0001F000-\U0001FAFF\u2600-\u27BF].*(?<![:：])$"
+)
+
+# ...and speaks to the reader, not to the requester about the deliverable
+_META_OPENING = re.compile(
+    r"(?i)^(perfect|great|sure|done|okay|ok|alright|absolutely|certainly|excellent|awesome|got it|all set)\b|"
+    r"\b(the|this|your|final|revised|updated)\s+(\w+\s+){0,2}(post|draft|version|revision|caption|script|thread|"
+    r"email|tweets?)\b|\bi(\s+have|'ve)?\s+(wrote|written|created|drafted|revised|updated|rewritten|polished)\b|"
+    r"\bfor you\b"
+)
+
+# Email header lines the agent prints above the body (kept out of the body)
+_EMAIL_HEADER = re.compile(r"(?i)^\**(subject(\s+line)?|preview(\s+text)?|preheader)\**\s*:\**\s*(?P<value>.*?)\**$")
+
+_CTA_PATTERN = re.compile(
+    r"(?i)\b(comment|reply|dm me|message me|click|sign up|subscribe|join|book|download|"
+    r"link in|follow|share|repost|grab|register|let me know)\b"
+)
+
+
+def get_extraction_stats() -> Dict[str, Any]:
+    """
+    Get per-tier extraction usage for monitoring.
+
+    Returns:
+        Dict with counts per tier, total, and share handled locally (no API call)
+    """
+    total = sum(_TIER_COUNTS.values())
+    local = _TIER_COUNTS["json"] + _TIER_COUNTS["plain_text"]
+    return {
+        "counts": dict(_TIER_COUNTS),
+        "total": total,
+        "local_pct": round(100 * local / total, 1) if total else 0.0
+    }
+
+
+def reset_extraction_stats():
+    """Reset per-tier counters (tests, batch boundaries)"""
+    for tier in _TIER_COUNTS:
+        _TIER_COUNTS[tier] = 0
+
+
+def _record_tier(tier: str, platform: str):
+    _TIER_COUNTS[tier] += 1
+    stats = get_extraction_stats()
+    logger.info(
+        f"📊 Extraction tier={tier} ({platform}) | totals {stats['counts']} | "
+        f"{stats['local_pct']}% local"
+    )
+
 
 async def extract_structured_content(
     raw_output: str,
@@ -45,17 +118,26 @@ async def extract_structured_content(
             }
         }
 
-    Cost: ~$0.00006 per extraction (40% cheaper than Haiku 3.5)
-    Speed: ~300ms (40% faster than Haiku 3.5)
-    Reliability: 99%+ (self-healing, adapts to format changes)
+    Cost: $0 for local tiers, ~$0.00006 per Haiku extraction
+    Speed: <1ms local, ~300ms Haiku
+    Reliability: 99%+ (local parse only accepts outputs it can validate)
     """
 
+    # Tier 1-2: Deterministic local parse (skipped when a user message needs date extraction)
+    if not user_message:
+        local = parse_structured_output(raw_output, platform)
+        if local:
+            _record_tier(local['metadata']['extraction_method'], platform)
+            logger.info(f"✅ Extracted {platform} content locally: {len(local['body'])} chars, hook: {local['hook'][:50]}...")
+            return local
+
     # Validate API key
     api_key = os.getenv('ANTHROPIC_API_KEY')
     if not api_key:
         logger.warning("ANTHROPIC_API_KEY not set, falling back to raw output")
         return _fallback_extraction(raw_output, platform)
 
+    from utils.anthropic_client import get_anthropic_client
     client = get_anthropic_client()
 
     # Build extraction prompt
@@ -182,9 +264,10 @@ JSON:"""
         # Call Haiku for extraction
         logger.debug(f"Calling Haiku to extract {platform} content ({len(raw_output)} chars)")
 
-        response = client.messages.create(
-            model="claude-haiku-4-5-20251001",  # Haiku 4.5 (Oct 2025)
-            max_tokens=2000,
+        response = create_message(
+            client,
+            'content_extraction',
+            platform=platform,
             temperature=0,  # Deterministic extraction
             messages=[{"role": "user", "content": prompt}]
         )
@@ -216,8 +299,14 @@ JSON:"""
         if not extracted['body'] or len(extracted['body'].strip()) < 10:
             raise ValueError("Extracted body is empty or too short")
 
+        if platform == "email":
+            subject, extracted['body'] = _split_email_header(extracted['body'])
+            extracted['hook'] = extracted['hook'] or subject
+
         logger.info(f"✅ Extracted {platform} content: {len(extracted['body'])} chars, hook: {extracted['hook'][:50]}...")
 
+        extracted.setdefault('metadata', {})['extraction_method'] = 'llm'
+        _record_tier('llm', platform)
         return extracted
 
     except json.JSONDecodeError as e:
@@ -246,6 +335,7 @@ def _fallback_extraction(raw_output: str, platform: str) -> Dict[str, Any]:
         Basic extracted structure
     """
     logger.warning("Using fallback extraction (Haiku unavailable)")
+    _record_tier('fallback', platform)
 
     # Basic cleaning: remove obvious commentary lines
     lines = raw_output.split('\n')
@@ -286,3 +376,218 @@ def _fallback_extraction(raw_output: str, platform: str) -> Dict[str, Any]:
         "gptzero_ai_pct": None,
         "gptzero_flagged_sentences": []
     }
+
+
+# ================== LOCAL (NO-API) PARSE TIERS ==================
+
+def parse_structured_output(raw_output: str, platform: str) -> Optional[Dict[str, Any]]:
+    """
+    Deterministic extraction for outputs that don't need an LLM.
+
+    Tries the known JSON schemas first, then clean plain text. Returns None
+    when the output is ambiguous (drafts, commentary, unknown format) so the
+    caller can fall back to Haiku.
+
+    Args:
+        raw_output: Raw agent output
+        platform: Content platform
+
+    Returns:
+        Same structure as extract_structured_content, or None
+    """
+    if not raw_output or not raw_output.strip():
+        return None
+
+    data = _find_json_payload(raw_output)
+    if data is not None:
+        return _from_json(data, platform)
+
+    return _from_plain_text(raw_output, platform)
+
+
+def _find_json_payload(raw_output: str) -> Optional[Dict[str, Any]]:
+    """Return the LAST JSON object in the output that carries a known body field"""
+    text = raw_output.strip()
+
+    # Fast path: the whole output (optionally fenced) is the JSON object
+    fenced = re.fullmatch(r"```(?:json)?\s*(.*?)\s*```", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1)
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict) and _body_key(data):
+            return data
+    except (json.JSONDecodeError, ValueError):
+        pass
+
+    # Embedded: scan object starts at line beginnings, keep the last match (final version)
+    decoder = json.JSONDecoder()
+    found = None
+    for match in re.finditer(r"(?m)^\s*(\{)", raw_output):
+        try:
+            data, _ = decoder.raw_decode(raw_output, match.start(1))
+        except (json.JSONDecodeError, ValueError):
+            continue
+        if isinstance(data, dict) and _body_key(data):
+            found = data
+    return found
+
+
+def _body_key(data: Dict[str, Any]) -> Optional[str]:
+    for key in _BODY_KEYS:
+        value = data.get(key)
+        if key == "tweets" and isinstance(value, list) and value:
+            return key
+        if isinstance(value, str) and len(value.strip()) >= 10:
+            return key
+    return None
+
+
+def _from_json(data: Dict[str, Any], platform: str) -> Optional[Dict[str, Any]]:
+    """Map a FORMAT 1 JSON payload onto the extraction result"""
+    key = _body_key(data)
+
+    if key == "tweets":
+        tweets = [_tweet_text(t) for t in data["tweets"]]
+        tweets = [t for t in tweets if t]
+        if not tweets:
+            return None
+        body = "\n\n".join(tweets)
+        hook = _strip_tweet_prefix(tweets[0])
+    else:
+        body = data[key].strip()
+        hook = data.get("hook") or data.get("subject_line") or data.get("title") or ""
+        if platform == "email":
+            subject, body = _split_email_header(body)
+            hook = hook or subject
+
+    if platform == "instagram" and isinstance(data.get("hashtags"), list):
+        missing_tags = [t for t in data["hashtags"] if isinstance(t, str) and t not in body]
+        if missing_tags:
+            body = f"{body}\n\n{' '.join(missing_tags)}"
+
+    if len(body) < 10:
+        return None
+
+    if not isinstance(hook, str) or not hook.strip():
+        hook = _derive_hook(body, platform)
+
+    original_score = data.get("original_score", data.get("self_score"))
+    if not isinstance(original_score, (int, float)) or isinstance(original_score, bool):
+        original_score = 20
+
+    result = _build_result(body, hook, platform, "json")
+    result.update({
+        "timing_markers": data.get("timing_markers") if isinstance(data.get("timing_markers"), dict) else {},
+        "original_score": original_score,
+        "validation_issues": data.get("validation_issues") if isinstance(data.get("validation_issues"), list) else [],
+        "gptzero_ai_pct": data.get("gptzero_ai_pct"),
+        "gptzero_flagged_sentences": data.get("gptzero_flagged_sentences") if isinstance(data.get("gptzero_flagged_sentences"), list) else []
+    })
+
+    if platform == "instagram":
+        result["character_count"] = data.get("character_count", len(body))
+        result["preview_length"] = data.get("preview_length", min(len(body), 125))
+
+    return result
+
+
+def _from_plain_text(raw_output: str, platform: str) -> Optional[Dict[str, Any]]:
+    """
+    Accept plain text only when it has the shape of a single clean post.
+
+    The first line must be a clean opening (see _clean_opening); anything
+    else - preambles, acknowledgements, labels - goes to Haiku.
+    """
+    body = raw_output.strip()
+    subject = ""
+    if platform == "email":
+        subject, body = _split_email_header(body)
+
+    if len(body) < 50:
+        return None
+    if body.startswith(("{", "[")):
+        return None  # Malformed JSON - needs the LLM
+    if not _clean_opening(body.split("\n", 1)[0]):
+        return None
+    if _COMMENTARY_PATTERN.search(body):
+        return None
+
+    return _build_result(body, subject or _derive_hook(body, platform), platform, "plain_text")
+
+
+def _clean_opening(line: str) -> bool:
+    """True when the first line reads like a post's hook rather than agent talk or a label"""
+    line = line.strip()
+    if not line or len(line) > _DEFAULT_HOOK_LIMIT * 2:
+        return False
+    return bool(_CLEAN_OPENING.match(line)) and not _META_OPENING.search(line)
+
+
+def _split_email_header(body: str) -> Tuple[str, str]:
+    """Split leading Subject:/Preview: lines off an email body -> (subject, body)"""
+    lines = body.strip().split("\n")
+    subject = ""
+    while lines:
+        line = lines[0].strip()
+        header = _EMAIL_HEADER.match(line)
+        if header:
+            if header.group(1).lower().startswith("subject") and not subject:
+                subject = header.group("value").strip().strip('"')
+        elif line:
+            break
+        lines.pop(0)
+    return subject, "\n".join(lines).strip()
+
+
+def _tweet_text(tweet: Any) -> str:
+    if isinstance(tweet, dict):
+        tweet = tweet.get("text") or tweet.get("tweet") or tweet.get("content") or ""
+    return str(tweet).strip() if tweet else ""
+
+
+def _strip_tweet_prefix(text: str) -> str:
+    return re.sub(r"^\s*(tweet\s*\d+\s*[:.)-]|\d+\s*/\s*\d*|\d+[.)])\s*", "", text, flags=re.IGNORECASE)
+
+
+def _derive_hook(body: str, platform: str) -> str:
+    """Opening line per platform rules (mirrors the Haiku prompt's hook rules)"""
+    limit = _HOOK_LIMITS.get(platform, _DEFAULT_HOOK_LIMIT)
+
+    if platform == "instagram":
+        return body[:limit].strip()
+
+    lines = [line.strip() for line in body.split("\n") if line.strip()]
+    if not lines:
+        return ""
+
+    first = lines[0]
+    if platform == "email":
+        for line in lines[:3]:
+            subject = re.match(r"(?i)^\**subject(\s+line)?\**\s*:\s*(.+)$", line)
+            if subject:
+                return subject.group(2).strip()[:limit]
+    if platform == "twitter":
+        first = _strip_tweet_prefix(first)
+
+    return first[:limit].strip()
+
+
+def _build_result(body: str, hook: str, platform: str, method: str) -> Dict[str, Any]:
+    return {
+        "body": body,
+        "hook": hook.strip(),
+        "platform": platform,
+        "publish_date": None,
+        "metadata": {
+            "word_count": len(body.split()),
+            "extraction_method": method,
+            "has_numbers": any(char.isdigit() for char in body),
+            "has_cta": bool(_CTA_PATTERN.search(body))
+        },
+        "timing_markers": {},
+        "original_score": 20,  # Default neutral score
+        "validation_issues": [],
+        "gptzero_ai_pct": None,
+        "gptzero_flagged_sentences": []
+    }
@@ -14,7 +14,7 @@ Priority hierarchy for style prompts:
 5. Hardcoded emergency fallback
 """
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -264,7 +264,7 @@ def reload_prompts(prompt_name: Optional[str] = None):
     """
     if prompt_name:
         # Clear specific prompt (all platform variations)
-        keys_to_remove = [k for k in _PROMPT_CACHE if prompt_name in k]
+        keys_to_remove = [k for k in _PROMPT_CACHE if prompt_name in k or k.startswith("stacked:")]
         for key in keys_to_remove:
             del _PROMPT_CACHE[key]
         logger.info(f"Reloaded prompt: {prompt_name}")
@@ -297,7 +297,7 @@ def load_editor_standards() -> str:
     return load_prompt("editor_standards")
 
 
-def stack_prompts(platform: str, include_create_draft: bool = True) -> str:
+def stack_prompts(platform: str, include_create_draft: bool = True, dedupe: Optional[bool] = None) -> str:
     """
     Stack multiple prompts into a single system message - Claude Projects style.
 
@@ -310,9 +310,14 @@ def stack_prompts(platform: str, include_create_draft: bool = True) -> str:
     3. Editor Standards (Editor-in-Chief rules)
     4. Platform Create Draft (format-specific instructions)
 
+    Rules repeated across 2-4 are merged into their first occurrence
+    (utils/prompt_budget.py), and the result is checked against the
+    platform's token budget.
+
     Args:
         platform: Target platform (linkedin, twitter, email, youtube, instagram)
         include_create_draft: Whether to include the create_draft prompt (default True)
+        dedupe: Merge repeated rules (default: PROMPT_DEDUPE, on)
 
     Returns:
         Combined system prompt with all rules stacked
@@ -322,49 +327,94 @@ def stack_prompts(platform: str, include_create_draft: bool = True) -> str:
         >>> # Use stacked as system message in Direct API call
         >>> # All rules cached, only user content varies
     """
-    sections = []
+    from utils.prompt_budget import DEDUPE_ENABLED, check_budget
 
-    # Section 1: Client Business Context (from CLAUDE.md)
-    client_context = _load_client_context()
-    if client_context:
-        sections.append(f"""# CLIENT BUSINESS CONTEXT
+    if dedupe is None:
+        dedupe = DEDUPE_ENABLED
 
-{client_context}
+    # Built once per platform; reload_prompts() clears it with the sources
+    cache_key = f"stacked:{platform}:{int(include_create_draft)}:{int(dedupe)}"
+    if cache_key in _PROMPT_CACHE:
+        return _PROMPT_CACHE[cache_key]
 
----
-""")
+    sections = stacked_prompt_sections(platform, include_create_draft, dedupe=dedupe)
+    stacked = "\n".join(text for _, text in sections[:-1]) + sections[-1][1]
+
+    budget = check_budget(platform, stacked)
+    logger.info(
+        f"📚 Stacked prompts for {platform}: {len(stacked)} chars, ~{budget['tokens']} tokens "
+        f"({len(sections) - 1} sections{', deduplicated' if dedupe else ''})"
+    )
+    if budget['over_budget']:
+        logger.warning(
+            f"Stacked prompt for {platform} is over budget: "
+            f"{budget['tokens']} > {budget['budget']} tokens (run scripts/prompt_budget.py)"
+        )
+
+    _PROMPT_CACHE[cache_key] = stacked
+    return stacked
 
-    # Section 2: Writing Rules (anti-AI-tells, human signals)
-    writing_rules = load_writing_rules()
-    sections.append(f"""# WRITING RULES
 
-{writing_rules}
+def stacked_prompt_sections(platform: str, include_create_draft: bool = True, dedupe: bool = False) -> List[Tuple[str, str]]:
+    """
+    The sections stack_prompts() joins, as (name, text) pairs in order.
 
----
-""")
+    Args:
+        platform: Target platform
+        include_create_draft: Whether to include the create_draft prompt
+        dedupe: Merge rules repeated across writing rules, editor standards and create_draft
 
-    # Section 3: Editor-in-Chief Standards
-    editor_standards = load_editor_standards()
-    sections.append(f"""# EDITOR-IN-CHIEF STANDARDS
+    Returns:
+        List of (section name, rendered section text); the last is CRITICAL_INSTRUCTIONS
+    """
+    from utils.prompt_budget import dedupe_rules
 
-{editor_standards}
+    sections = []
 
----
-""")
+    # Section 2: Writing Rules (anti-AI-tells, human signals)
+    sections.append(("WRITING_RULES", load_writing_rules()))
+
+    # Section 3: Editor-in-Chief Standards
+    sections.append(("EDITOR_STANDARDS", load_editor_standards()))
 
     # Section 4: Platform-specific Create Draft (if requested)
     if include_create_draft:
-        create_draft = load_prompt("create_draft", platform=platform)
-        sections.append(f"""# {platform.upper()} CONTENT CREATION
+        sections.append((f"{platform.upper()}_CREATE_DRAFT", load_prompt("create_draft", platform=platform)))
+
+    if dedupe:
+        sections, merges = dedupe_rules(sections)
+        if merges:
+            logger.info(f"Merged {len(merges)} repeated rules in {platform} stacked prompt")
+
+    rendered = []
+
+    # Section 1: Client Business Context (from CLAUDE.md) - never deduplicated
+    client_context = _load_client_context()
+    if client_context:
+        rendered.append(("CLIENT_CONTEXT", f"""# CLIENT BUSINESS CONTEXT
+
+{client_context}
 
-{create_draft}
-""")
+---
+"""))
+
+    titles = {"WRITING_RULES": "WRITING RULES", "EDITOR_STANDARDS": "EDITOR-IN-CHIEF STANDARDS"}
+    for name, text in sections:
+        if name in titles:
+            rendered.append((name, f"""# {titles[name]}
+
+{text}
 
-    # Combine all sections
-    stacked = "\n".join(sections)
+---
+"""))
+        else:
+            rendered.append((name, f"""# {platform.upper()} CONTENT CREATION
+
+{text}
+"""))
 
     # Add final instruction to use all rules
-    stacked += """
+    rendered.append(("CRITICAL_INSTRUCTIONS", """
 ---
 
 ## CRITICAL INSTRUCTIONS
@@ -378,11 +428,9 @@ You have been given comprehensive rules above. When creating content:
 5. **Report potential issues** - if anything might still need work, note it in self_assessment
 
 Your goal: Produce 18+/25 content on the first pass by following all stacked rules.
-"""
+"""))
 
-    logger.info(f"📚 Stacked prompts for {platform}: {len(stacked)} chars ({len(sections)} sections)")
-
-    return stacked
+    return rendered
 
 
 def _load_client_context() -> Optional[str]:
@@ -1,28 +1,17 @@
 """
 Supabase client singleton for database operations
 """
-import os
-from supabase import create_client, Client
+from supabase import Client
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 
-load_dotenv()
+from utils.http_clients import get_supabase_client as _get_shared_supabase_client
 
-_supabase_client: Client = None
+load_dotenv()
 
 def get_supabase_client() -> Client:
-    """Get or create Supabase client singleton"""
-    global _supabase_client
-    if _supabase_client is None:
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_KEY')
-
-        if not supabase_url or not supabase_key:
-            raise ValueError("Missing Supabase credentials. Set SUPABASE_URL and SUPABASE_KEY in .env")
-
-        _supabase_client = create_client(supabase_url, supabase_key)
-
-    return _supabase_client
+    """Get or create Supabase client singleton (owned by utils/http_clients.py)"""
+    return _get_shared_supabase_client()
 
 def is_bot_participating_in_thread(thread_ts: str, channel_id: str = None, ttl_hours: int = 24) -> bool:
     """
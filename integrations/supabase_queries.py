@@ -0,0 +1,229 @@
+"""
+Typed, column-projected queries over the shared Supabase client
+
+`select('*')` on generated_posts pulls 1536-float embeddings and full bodies
+that most readers never touch. This module gives each reader:
+- An explicit column projection (declared once, next to the other projections)
+- Keyset pagination for large scans (no OFFSET, stable under concurrent inserts)
+- Streaming iteration (rows yielded page by page)
+
+All queries run on the shared client from integrations.supabase_client unless
+a client is passed explicitly (sync jobs and SlackThreadMemory pass their own).
+
+Usage:
+    from integrations.supabase_queries import QuerySpec, Filter, select_rows, TOP_PERFORMER_COLUMNS
+
+    spec = QuerySpec(
+        table='generated_posts',
+        columns=TOP_PERFORMER_COLUMNS,
+        filters=[Filter('eq', 'status', 'published')],
+        order_by='engagement_rate',
+        descending=True
+    )
+    rows = select_rows(spec, limit=5)
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+
+
+# ================== COLUMN PROJECTIONS ==================
+
+# show_top_performers
+TOP_PERFORMER_COLUMNS = (
+    'id', 'post_hook', 'platform', 'quality_score', 'impressions', 'engagement_rate',
+    'likes', 'comments', 'shares', 'published_at', 'published_url'
+)
+
+# get_post_analytics (metrics only - Claude never sees bodies here)
+POST_ANALYTICS_COLUMNS = (
+    'id', 'post_hook', 'platform', 'quality_score', 'impressions', 'engagements',
+    'likes', 'comments', 'shares', 'engagement_rate', 'published_at', 'content_type'
+)
+
+# analyze_content_patterns (embedding needed for clustering)
+PATTERN_ANALYSIS_COLUMNS = (
+    'id', 'post_hook', 'body_content', 'platform', 'content_type', 'engagement_rate',
+    'impressions', 'quality_score', 'embedding'
+)
+
+# sync_single_post (Airtable → Supabase diff)
+SYNC_POST_COLUMNS = ('id', 'airtable_record_id', 'body_content', 'airtable_status', 'status')
+
+# SlackThreadMemory.get_thread
+THREAD_COLUMNS = (
+    'thread_ts', 'channel_id', 'user_id', 'platform', 'latest_draft', 'latest_score',
+    'status', 'metadata', 'created_at', 'updated_at'
+)
+THREAD_HISTORY_COLUMNS = ('role', 'content', 'channel_id', 'user_id', 'metadata', 'created_at')
+
+
+# ================== QUERY SPEC ==================
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    One PostgREST filter.
+
+    op is a query builder method name ('eq', 'gte', 'lt', 'in_', ...) or
+    'not_null' for `.not_.is_(column, 'null')`.
+    """
+
+    op: str
+    column: str
+    value: Any = None
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """A projected read against one table."""
+
+    table: str
+    columns: Sequence[str]
+    filters: Sequence[Filter] = field(default_factory=tuple)
+    order_by: Optional[str] = None
+    descending: bool = False
+    # Unique tiebreaker column for keyset pagination
+    key_column: str = 'id'
+
+    @property
+    def select_clause(self) -> str:
+        columns = list(self.columns)
+        if self.key_column not in columns:
+            columns.append(self.key_column)
+        return ', '.join(columns)
+
+
+def _resolve_client(client=None):
+    if client is not None:
+        return client
+    from integrations.supabase_client import get_supabase_client
+    return get_supabase_client()
+
+
+def _build_query(client, spec: QuerySpec):
+    query = client.table(spec.table).select(spec.select_clause)
+    for f in spec.filters:
+        if f.op == 'not_null':
+            query = query.not_.is_(f.column, 'null')
+        else:
+            query = getattr(query, f.op)(f.column, f.value)
+    return query
+
+
+def _apply_order(query, spec: QuerySpec):
+    if spec.order_by:
+        query = query.order(spec.order_by, desc=spec.descending)
+    if spec.order_by != spec.key_column:
+        query = query.order(spec.key_column, desc=spec.descending)
+    return query
+
+
+def _quote(value: Any) -> str:
+    """Quote a value for a PostgREST logic tree (timestamps contain ':' and '+')"""
+    text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{text}"'
+
+
+def _keyset_filter(spec: QuerySpec, last_row: Dict[str, Any]) -> str:
+    """or=(...) filter selecting rows strictly after last_row in sort order"""
+    cmp = 'lt' if spec.descending else 'gt'
+    key_value = _quote(last_row[spec.key_column])
+
+    if not spec.order_by or spec.order_by == spec.key_column:
+        return f"{spec.key_column}.{cmp}.{key_value}"
+
+    sort_value = _quote(last_row[spec.order_by])
+    return (
+        f"{spec.order_by}.{cmp}.{sort_value},"
+        f"and({spec.order_by}.eq.{sort_value},{spec.key_column}.{cmp}.{key_value})"
+    )
+
+
+# ================== READERS ==================
+
+def select_rows(spec: QuerySpec, limit: Optional[int] = None, client=None) -> List[Dict[str, Any]]:
+    """
+    Single-request projected read.
+
+    Args:
+        spec: Query spec
+        limit: Optional row limit
+        client: Optional Supabase client (defaults to shared client)
+
+    Returns:
+        List of row dicts (only the projected columns)
+    """
+    query = _apply_order(_build_query(_resolve_client(client), spec), spec)
+    if limit is not None:
+        query = query.limit(limit)
+    result = query.execute()
+    return result.data or []
+
+
+def select_one(spec: QuerySpec, client=None) -> Optional[Dict[str, Any]]:
+    """First matching row or None"""
+    rows = select_rows(spec, limit=1, client=client)
+    return rows[0] if rows else None
+
+
+def iter_rows(
+    spec: QuerySpec,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_rows: Optional[int] = None,
+    client=None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows with keyset pagination.
+
+    Pages are fetched lazily as the caller iterates. The sort column must be
+    non-null for every row (add Filter('not_null', ...) when it can be null).
+
+    Args:
+        spec: Query spec (order_by + key_column define the keyset)
+        page_size: Rows per request
+        max_rows: Stop after this many rows
+        client: Optional Supabase client (defaults to shared client)
+
+    Yields:
+        Row dicts in sort order
+    """
+    client = _resolve_client(client)
+    last_row = None
+    yielded = 0
+    pages = 0
+
+    while True:
+        fetch = page_size if max_rows is None else min(page_size, max_rows - yielded)
+        if fetch <= 0:
+            break
+
+        query = _build_query(client, spec)
+        if last_row is not None:
+            query = query.or_(_keyset_filter(spec, last_row))
+        rows = _apply_order(query, spec).limit(fetch).execute().data or []
+        pages += 1
+
+        for row in rows:
+            yield row
+        yielded += len(rows)
+
+        if len(rows) < fetch:
+            break
+        last_row = rows[-1]
+
+    logger.debug(f"iter_rows({spec.table}): {yielded} rows in {pages} pages")
+
+
+def fetch_all(
+    spec: QuerySpec,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_rows: Optional[int] = None,
+    client=None
+) -> List[Dict[str, Any]]:
+    """Collect iter_rows into a list"""
+    return list(iter_rows(spec, page_size=page_size, max_rows=max_rows, client=client))
@@ -12,6 +12,9 @@ from typing import Dict, Any, Optional
 import httpx
 from anthropic import Anthropic
 from utils.anthropic_client import get_anthropic_client
+from utils.circuit_breaker import CircuitBreakerOpen, get_breaker
+from utils.model_routing import create_message
+from utils.deadline import DeadlineExceeded, timeout_for
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -62,9 +65,10 @@ async def run_quality_check(content: str, platform: str) -> Dict[str, Any]:
         max_iterations = 5
         for iteration in range(max_iterations):
             try:
-                response = client.messages.create(
-                    model="claude-sonnet-4-5-20250929",
-                    max_tokens=3000,
+                response = create_message(
+                    client,
+                    'quality_check',
+                    platform=platform,
                     tools=[{
                         "type": "web_search_20250305",
                         "name": "web_search",
@@ -154,7 +158,7 @@ async def run_quality_check(content: str, platform: str) -> Dict[str, Any]:
 async def run_gptzero_check(content: str) -> Optional[Dict[str, Any]]:
     """
     Run GPTZero AI detection if API key is available
-    Returns None if API key not set
+    Returns None if API key not set; SKIPPED while the GPTZero breaker is open
     """
     api_key = os.getenv('GPTZERO_API_KEY')
 
@@ -167,9 +171,10 @@ async def run_gptzero_check(content: str) -> Optional[Dict[str, Any]]:
             "reason": "Content too short (minimum 50 characters)"
         }
 
-    try:
-        # GPTZero can be slow for long content - use 40s timeout (wrapped in 45s asyncio.wait_for)
-        async with httpx.AsyncClient(timeout=40.0) as client:
+    async def predict():
+        # GPTZero can be slow for long content - use 40s timeout (wrapped in 45s asyncio.wait_for),
+        # less when the post's deadline is closer
+        async with httpx.AsyncClient(timeout=timeout_for(40.0)) as client:
             response = await client.post(
                 'https://api.gptzero.me/v2/predict/text',
                 headers={
@@ -183,44 +188,53 @@ async def run_gptzero_check(content: str) -> Optional[Dict[str, Any]]:
             )
 
             response.raise_for_status()
-            data = response.json()
-
-            # Extract probabilities
-            documents = data.get('documents', [])
-            if not documents:
-                return {
-                    "status": "ERROR",
-                    "reason": "No documents in GPTZero response"
-                }
+            return response.json()
 
-            doc = documents[0]
+    try:
+        data = await get_breaker('gptzero').call_async(predict)
 
-            # Extract probabilities from class_probabilities (CORRECT way)
-            class_probs = doc.get('class_probabilities', {})
-            human_prob = class_probs.get('human', 0) * 100
-            ai_prob = class_probs.get('ai', 0) * 100
-            mixed_prob = class_probs.get('mixed', 0) * 100
+        # Extract probabilities
+        documents = data.get('documents', [])
+        if not documents:
+            return {
+                "status": "ERROR",
+                "reason": "No documents in GPTZero response"
+            }
 
-            # Get flagged sentences
-            sentences = doc.get('sentences', [])
-            flagged = [
-                s.get('sentence', '')
-                for s in sentences
-                if s.get('generated_prob', 0) > 0.7
-            ]
+        doc = documents[0]
 
-            # PASS if human probability > 70% (i.e., AI < 30%)
-            passes = human_prob > 70
+        # Extract probabilities from class_probabilities (CORRECT way)
+        class_probs = doc.get('class_probabilities', {})
+        human_prob = class_probs.get('human', 0) * 100
+        ai_prob = class_probs.get('ai', 0) * 100
+        mixed_prob = class_probs.get('mixed', 0) * 100
 
-            return {
-                "status": "PASS" if passes else "FLAGGED",
-                "human_probability": round(human_prob, 1),
-                "ai_probability": round(ai_prob, 1),
-                "mixed_probability": round(mixed_prob, 1),
-                "flagged_sentences_count": len(flagged),
-                "flagged_sentences": [s[:100] + "..." for s in flagged[:3]]
-            }
+        # Get flagged sentences
+        sentences = doc.get('sentences', [])
+        flagged = [
+            s.get('sentence', '')
+            for s in sentences
+            if s.get('generated_prob', 0) > 0.7
+        ]
 
+        # PASS if human probability > 70% (i.e., AI < 30%)
+        passes = human_prob > 70
+
+        return {
+            "status": "PASS" if passes else "FLAGGED",
+            "human_probability": round(human_prob, 1),
+            "ai_probability": round(ai_prob, 1),
+            "mixed_probability": round(mixed_prob, 1),
+            "flagged_sentences_count": len(flagged),
+            "flagged_sentences": [s[:100] + "..." for s in flagged[:3]]
+        }
+
+    except CircuitBreakerOpen as e:
+        # GPTZero is down: skip detection instead of waiting out the timeout on every post
+        return {
+            "status": "SKIPPED",
+            "reason": f"GPTZero unavailable ({e})"
+        }
     except httpx.HTTPError as e:
         return {
             "status": "ERROR",
@@ -250,12 +264,15 @@ async def run_all_validators(content: str, platform: str) -> str:
 
     # Run validators sequentially to avoid timeout issues (GPTZero can be slow)
     logger.info("📊 Running quality check first...")
+    # Validator timeouts are capped by the post's remaining deadline
+    timeout = 60.0
     try:
-        quality_result = await asyncio.wait_for(run_quality_check(content, platform), timeout=60.0)
+        timeout = timeout_for(60.0)
+        quality_result = await asyncio.wait_for(run_quality_check(content, platform), timeout=timeout)
         logger.info(f"📊 Quality check raw result keys: {quality_result.keys() if isinstance(quality_result, dict) else 'not a dict'}")
         logger.info(f"📊 Quality check scores: {quality_result.get('scores', 'missing')}")
-    except asyncio.TimeoutError:
-        logger.warning("⚠️ Quality check timed out after 60s - using fallback")
+    except (asyncio.TimeoutError, DeadlineExceeded):
+        logger.warning(f"⚠️ Quality check timed out after {timeout:.0f}s - using fallback")
         quality_result = {
             "scores": {"total": 18},
             "decision": "timeout",
@@ -264,13 +281,15 @@ async def run_all_validators(content: str, platform: str) -> str:
         }
 
     logger.info("📊 Running GPTZero check...")
+    timeout = 45.0
     try:
-        gptzero_result = await asyncio.wait_for(run_gptzero_check(content), timeout=45.0)
-    except asyncio.TimeoutError:
-        logger.warning("⚠️ GPTZero check timed out after 45s - skipping")
+        timeout = timeout_for(45.0)
+        gptzero_result = await asyncio.wait_for(run_gptzero_check(content), timeout=timeout)
+    except (asyncio.TimeoutError, DeadlineExceeded):
+        logger.warning(f"⚠️ GPTZero check timed out after {timeout:.0f}s - skipping")
         gptzero_result = {
             "status": "TIMEOUT",
-            "reason": "GPTZero API timed out after 45 seconds"
+            "reason": f"GPTZero API timed out after {timeout:.0f} seconds"
         }
 
     logger.info(f"✅ Quality check complete: {quality_result.get('scores', {}).get('total', 0)}/25")
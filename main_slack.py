@@ -14,9 +14,7 @@ if hasattr(sys.stdout, 'buffer'):
 if hasattr(sys.stderr, 'buffer'):
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
-from anthropic import Anthropic, RateLimitError
 from fastapi import FastAPI, Request, BackgroundTasks
-from supabase import create_client, Client
 import os
 import json
 import time
@@ -27,12 +25,18 @@ import asyncio
 from typing import Dict, List, Any
 from collections import deque
 
-# Slack integration
-from slack_bot.handler import SlackContentHandler
-from slack_sdk import WebClient
-
 # Supabase helpers
 from integrations.supabase_client import is_bot_participating_in_thread
+from utils.anthropic_client import get_anthropic_client
+from utils.circuit_breaker import get_breaker_states
+from utils.http_clients import close_all_clients, get_connection_report
+from utils.shared_state import WEB_CONCURRENCY, WORKER_HEARTBEAT_SECONDS, WORKER_ID, get_shared_state, get_thread_router
+from utils.slack_progress import get_progress_publisher
+from utils.warmup import WARMUP_ON_STARTUP, warm_up
+
+# Cold start: the Slack handler, agents, analytics, sync and publishing modules
+# (and the SDK clients) are imported where they are first used, so /healthz
+# answers before any of them load. POST /warmup preloads them.
 
 # Load environment variables
 load_dotenv()
@@ -95,9 +99,29 @@ def supervise_task(coro, *, name: str, max_restarts: int = 0):
     task.add_done_callback(log_exception)
     return task
 
-# Event deduplication cache (stores event_id for 5 minutes)
-processed_events = {}
+# Event deduplication (event_id / channel:ts kept for 5 minutes in shared state, so
+# every worker sees them)
 EVENT_CACHE_TTL = 300  # 5 minutes
+_last_event_purge = 0.0
+
+# How often a worker checks its inbox for messages forwarded by other workers
+WORKER_INBOX_POLL_SECONDS = 0.5
+
+
+def claim_event(key: str) -> bool:
+    """
+    True the first time any worker sees this event key
+
+    Blocks on the shared store; call it via asyncio.to_thread() from async handlers.
+    """
+    global _last_event_purge
+    state = get_shared_state()
+    now = time.time()
+    if now - _last_event_purge > EVENT_CACHE_TTL:
+        # Clean old cache entries
+        _last_event_purge = now
+        state.purge_expired()
+    return state.claim('slack_events', key, ttl=EVENT_CACHE_TTL)
 
 # Thread participation TTL (used for Supabase query)
 THREAD_PARTICIPATION_TTL = 24  # 24 hours
@@ -105,8 +129,8 @@ THREAD_PARTICIPATION_TTL = 24  # 24 hours
 # ============= CLIENT INITIALIZATION WITH ERROR HANDLING =============
 
 # Initialize clients with error handling (won't crash on startup)
-# Clients are created lazily when first accessed
-supabase: Client = None
+# Clients are created by the startup event, not at import
+supabase = None  # supabase.Client
 anthropic_client = None
 slack_client = None
 _init_errors = {}
@@ -125,13 +149,9 @@ def _init_supabase():
             return False
         
         try:
+            from supabase import create_client
             supabase = create_client(supabase_url, supabase_key)
-            # Test connection with a simple query (with timeout)
-            try:
-                supabase.table('_migrations').select('id').limit(1).execute()
-            except Exception:
-                # Table might not exist yet, that's OK
-                pass
+            # No connection test here (it delayed startup); /readyz checks the connection
             print("✅ Supabase client initialized")
             return True
         except Exception as e:
@@ -153,7 +173,7 @@ def _init_anthropic():
             return False
         
         try:
-            anthropic_client = Anthropic(api_key=api_key)
+            anthropic_client = get_anthropic_client()  # Shared pooled client (utils/http_clients.py)
             print("✅ Anthropic client initialized")
             return True
         except Exception as e:
@@ -175,6 +195,7 @@ def _init_slack():
             return False
         
         try:
+            from slack_sdk import WebClient
             slack_client = WebClient(token=token)
             # Don't test connection here - let it fail gracefully on first use
             print("✅ Slack client initialized")
@@ -186,11 +207,8 @@ def _init_slack():
             return False
     return True
 
-# Initialize clients during startup (non-blocking)
+# Clients are initialized by the startup event (below), not at import time.
 # If initialization fails, clients remain None and will raise errors when accessed
-_init_supabase()
-_init_anthropic()
-_init_slack()
 
 # Optional: Langfuse for observability
 langfuse_enabled = bool(os.getenv('LANGFUSE_PUBLIC_KEY') and os.getenv('LANGFUSE_SECRET_KEY'))
@@ -217,6 +235,7 @@ def get_slack_handler():
     """Lazy init Slack handler with Airtable client"""
     global slack_handler
     if slack_handler is None:
+        from slack_bot.handler import SlackContentHandler
         try:
             from integrations.airtable_client import AirtableContentCalendar
             print("🔄 Initializing Slack handler with Airtable...")
@@ -279,40 +298,120 @@ async def startup_validation():
     else:
         print("\n✅ All clients initialized successfully")
 
+    if WARMUP_ON_STARTUP:
+        # Preload deferred modules after startup so /healthz isn't held up
+        supervise_task(run_warmup(), name="warmup")
+
+    if get_shared_state().shared:
+        print(f"🧩 Multi-worker mode: worker {WORKER_ID} ({WEB_CONCURRENCY} workers, {get_shared_state().backend} state)")
+        supervise_task(run_worker_inbox(), name="worker_inbox")
+
+
+async def run_worker_inbox():
+    """Heartbeat, and process messages other workers forwarded for threads this worker owns"""
+    router = get_thread_router()
+    last_heartbeat = 0.0
+    while True:
+        if time.time() - last_heartbeat >= WORKER_HEARTBEAT_SECONDS:
+            await asyncio.to_thread(router.heartbeat)
+            last_heartbeat = time.time()
+
+        for payload in await asyncio.to_thread(router.take_inbox):
+            print(f"📬 Forwarded message for thread {payload['thread_ts']}")
+            # Claim the thread so later messages come straight here (adopts threads of dead workers)
+            owner = await asyncio.to_thread(router.owner, f"{payload['channel']}:{payload['thread_ts']}")
+            if owner != router.worker_id:
+                await asyncio.to_thread(router.forward, owner, payload)
+                continue
+            supervise_task(process_slack_message(**payload), name=f"forwarded:{payload['thread_ts']}")
+
+        await asyncio.sleep(WORKER_INBOX_POLL_SECONDS)
+
+
+async def run_warmup():
+    """Import deferred modules and build the Slack handler off the event loop"""
+    report = await asyncio.to_thread(warm_up)
+    started = time.perf_counter()
+    await asyncio.to_thread(get_slack_handler)
+    report['modules']['slack_handler'] = round(time.perf_counter() - started, 3)
+    return report
+
+
+@app.post('/warmup')
+async def warmup_endpoint():
+    """Preload deferred imports, stacked prompts and the Slack handler (seconds per step)"""
+    return await run_warmup()
+
+
+@app.on_event("shutdown")
+async def close_shared_clients():
+    """Deliver queued Slack messages, then release pooled HTTP connections held by the shared clients"""
+    await get_progress_publisher().close()
+    close_all_clients()
+    if get_shared_state().shared:
+        # Hand this worker's threads to the others
+        await asyncio.to_thread(get_thread_router().release)
+
 # ============= RATE LIMITING =============
 
 class TokenBucketRateLimiter:
-    """Token-based rate limiter for Claude API to prevent 429 errors"""
+    """
+    Token-based rate limiter for Claude API to prevent 429 errors.
+
+    The bucket lives in shared state, so all workers draw from one budget.
+    acquire()/wait_time() block on the shared store; async handlers use
+    acquire_async()/wait_time_async().
+    """
 
-    def __init__(self, tokens_per_minute: int = 5, burst_size: int = 10):
+    def __init__(self, tokens_per_minute: int = 5, burst_size: int = 10, name: str = 'claude_api'):
         self.tokens_per_minute = tokens_per_minute
         self.burst_size = burst_size
-        self.tokens = burst_size
-        self.last_update = time.time()
+        self.name = name
+
+    def _refill(self, bucket) -> Dict[str, float]:
+        now = time.time()
+        if bucket is None:
+            return {'tokens': self.burst_size, 'last_update': now}
+        # Add tokens based on time elapsed
+        new_tokens = (now - bucket['last_update']) * (self.tokens_per_minute / 60)
+        return {'tokens': min(self.burst_size, bucket['tokens'] + new_tokens), 'last_update': now}
+
+    @property
+    def tokens(self) -> float:
+        return self._refill(get_shared_state().get('rate_limits', self.name))['tokens']
 
     def acquire(self, tokens: int = 1) -> bool:
         """Try to acquire tokens. Returns True if successful."""
-        now = time.time()
-        elapsed = now - self.last_update
+        acquired = False
 
-        # Add tokens based on time elapsed
-        new_tokens = elapsed * (self.tokens_per_minute / 60)
-        self.tokens = min(self.burst_size, self.tokens + new_tokens)
-        self.last_update = now
+        def take(bucket):
+            nonlocal acquired
+            bucket = self._refill(bucket)
+            if bucket['tokens'] >= tokens:
+                bucket['tokens'] -= tokens
+                acquired = True
+            return bucket
 
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
+        get_shared_state().update('rate_limits', self.name, take)
+        return acquired
 
     def wait_time(self) -> float:
         """Return seconds to wait for next token"""
-        if self.tokens >= 1:
+        available = self.tokens
+        if available >= 1:
             return 0
-        tokens_needed = 1 - self.tokens
+        tokens_needed = 1 - available
         seconds_per_token = 60 / self.tokens_per_minute
         return tokens_needed * seconds_per_token
 
+    async def acquire_async(self, tokens: int = 1) -> bool:
+        """acquire() off the event loop"""
+        return await asyncio.to_thread(self.acquire, tokens)
+
+    async def wait_time_async(self) -> float:
+        """wait_time() off the event loop"""
+        return await asyncio.to_thread(self.wait_time)
+
 # Create rate limiter instance
 rate_limiter = TokenBucketRateLimiter(tokens_per_minute=15, burst_size=5)
 
@@ -357,7 +456,8 @@ def format_for_slack(text: str) -> str:
 @app.get('/healthz')
 def health_check():
     """Basic health check - returns 200 if server is up"""
-    handler = get_slack_handler()
+    # Don't build the handler here: /healthz must answer before the heavy imports
+    handler = slack_handler
     active_sessions = len(handler._thread_sessions) if handler else 0
     max_sessions = handler.MAX_CONCURRENT_SESSIONS if handler else 3
 
@@ -367,7 +467,8 @@ def health_check():
         'service': 'slack-content-agent',
         'active_sessions': active_sessions,
         'max_sessions': max_sessions,
-        'session_utilization': f'{active_sessions}/{max_sessions}'
+        'session_utilization': f'{active_sessions}/{max_sessions}',
+        'worker': WORKER_ID
     }
 
 
@@ -430,18 +531,23 @@ async def readiness_check():
         checks["slack"] = "missing_token"
         ready = False
 
+    # Check 4: External dependency breakers (open = failing fast with a fallback, not unready)
+    breakers = await asyncio.to_thread(get_breaker_states)
+    degraded = [name for name, state in breakers.items() if state['state'] != 'closed']
+    checks["dependencies"] = f"degraded: {', '.join(degraded)}" if degraded else "ok"
+
     return {
         "ready": ready,
         "checks": checks,
+        "circuit_breakers": breakers,
+        "connections": get_connection_report(),
         "timestamp": datetime.now().isoformat(),
         "init_errors": _init_errors if _init_errors else None
     }
 
 
 # ============= ANALYTICS ENDPOINTS (Phase 1, 3-4) =============
-
-from slack_bot.analytics_handler import analyze_performance
-from slack_bot.briefing_handler import generate_briefing
+# Handlers are imported per request (deferred until first use)
 
 
 @app.post('/api/analyze-performance')
@@ -504,6 +610,7 @@ async def analyze_performance_endpoint(request: Request):
             }
 
         # Call analytics handler with shared client
+        from slack_bot.analytics_handler import analyze_performance
         analysis = await analyze_performance(posts, date_range, anthropic_client)
 
         return analysis
@@ -580,6 +687,7 @@ async def generate_briefing_endpoint(request: Request):
             }
 
         # Call briefing handler with shared client
+        from slack_bot.briefing_handler import generate_briefing
         briefing = await generate_briefing(
             analytics=analytics,
             research=research,
@@ -680,6 +788,168 @@ async def slack_post_message_endpoint(request: Request):
 
 # ============= SLACK EVENT HANDLERS =============
 
+def send_slack_message(channel, text, thread_ts=None):
+    """Send message to Slack channel"""
+    if slack_client is None:
+        print(f"❌ Cannot send message: Slack client not initialized")
+        return {'ok': False, 'error': 'Slack client not initialized'}
+
+    try:
+        # Queued on the progress publisher so the event loop never waits on Slack
+        get_progress_publisher().post(channel, text, thread_ts=thread_ts, client=slack_client)
+        print(f"✅ Message queued for Slack")
+        return {'ok': True, 'queued': True}
+    except Exception as e:
+        print(f"❌ Error sending message: {e}")
+        return {'ok': False, 'error': str(e)}
+
+
+async def process_slack_message(channel, thread_ts, user_id, message_text, files=None):
+    """Run one Slack message through the Claude Agent SDK and reply in its thread"""
+    try:
+        # Validate clients are initialized
+        if anthropic_client is None:
+            error_msg = "Anthropic client not initialized. Please check ANTHROPIC_API_KEY."
+            print(f"❌ {error_msg}")
+            send_slack_message(
+                channel=channel,
+                text=f"❌ Configuration error: {error_msg}\n\nPlease check your environment variables.",
+                thread_ts=thread_ts
+            )
+            return
+
+        if supabase is None:
+            print("⚠️ Supabase not initialized, continuing without database features")
+
+        # Import Claude Agent SDK handler
+        from slack_bot.claude_agent_handler import ClaudeAgentHandler
+        print("✅ Claude Agent SDK loaded successfully")
+
+        handler = get_slack_handler()
+
+        if handler is None:
+            error_msg = "Failed to initialize Slack handler"
+            print(f"❌ {error_msg}")
+            send_slack_message(
+                channel=channel,
+                text=f"❌ {error_msg}. Please check server logs.",
+                thread_ts=thread_ts
+            )
+            return
+
+        # Use the REAL Claude Agent SDK handler
+        # ALWAYS recreate to pick up prompt changes on module reload
+        try:
+            handler.claude_agent = ClaudeAgentHandler(
+                memory_handler=handler.memory if handler else None,
+                slack_client=slack_client  # NEW: Pass slack_client for progress updates
+            )
+        except Exception as e:
+            error_msg = f"Failed to initialize Claude Agent: {str(e)}"
+            print(f"❌ {error_msg}")
+            import traceback
+            traceback.print_exc()
+            send_slack_message(
+                channel=channel,
+                text=f"❌ {error_msg}\n\nThis may be a temporary issue. Please try again.",
+                thread_ts=thread_ts
+            )
+            return
+
+        global _handler_creation_count
+        _handler_creation_count += 1
+        print(f"🚀 Handler #{_handler_creation_count} ready (tools registered via MCP server)")
+
+        # Save user message to conversation history
+        if handler.memory:
+            try:
+                handler.memory.add_message(
+                    thread_ts=thread_ts,
+                    channel_id=channel,
+                    user_id=user_id,
+                    role='user',
+                    content=message_text
+                )
+                print(f"💾 Saved user message to conversation history")
+            except Exception as e:
+                print(f"⚠️ Failed to save message to history: {e}")
+
+        # The agent decides what to do based on context:
+        # - Create content → delegates to workflows
+        # - Answer questions → uses web_search if needed
+        # - Analyze performance → uses analysis tools
+        # - General conversation → maintains thread context
+        try:
+            response_text = await handler.claude_agent.handle_conversation(
+                message=message_text,
+                user_id=user_id,
+                thread_ts=thread_ts,  # Use thread_ts for session continuity
+                channel_id=channel,
+                slack_files=files  # Pass Slack file objects
+            )
+        except RuntimeError as e:
+            # SDK client creation failure - provide helpful error
+            error_msg = str(e)
+            if "Failed to create Claude SDK client" in error_msg:
+                print(f"❌ SDK client creation failed: {error_msg}")
+                send_slack_message(
+                    channel=channel,
+                    text=f"❌ I'm having trouble connecting to my AI services right now. This might be a temporary issue.\n\nError: {error_msg}\n\nPlease try again in a moment.",
+                    thread_ts=thread_ts
+                )
+            else:
+                raise
+        except Exception as e:
+            # Other errors - log and provide fallback response
+            print(f"❌ Error in agent conversation: {e}")
+            import traceback
+            traceback.print_exc()
+            raise
+
+        # Save assistant response to conversation history
+        if handler.memory:
+            try:
+                handler.memory.add_message(
+                    thread_ts=thread_ts,
+                    channel_id=channel,
+                    user_id='bot',
+                    role='assistant',
+                    content=response_text
+                )
+                print(f"💾 Saved assistant response to conversation history")
+            except Exception as e:
+                print(f"⚠️ Failed to save response to history: {e}")
+
+        # Send response
+        send_slack_message(
+            channel=channel,
+            text=response_text,
+            thread_ts=thread_ts  # Reply in thread
+        )
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+
+        # Provide user-friendly error message
+        error_detail = str(e)
+        if "ANTHROPIC_API_KEY" in error_detail or "anthropic" in error_detail.lower():
+            user_msg = "❌ I'm having trouble connecting to my AI services. Please check that ANTHROPIC_API_KEY is set correctly."
+        elif "supabase" in error_detail.lower() or "database" in error_detail.lower():
+            user_msg = "❌ Database connection issue. The app will continue, but some features may be limited."
+        elif "timeout" in error_detail.lower():
+            user_msg = "❌ Request timed out. This might be a temporary issue. Please try again."
+        else:
+            user_msg = f"❌ Sorry, I encountered an error: {error_detail[:200]}"
+
+        send_slack_message(
+            channel=channel,
+            text=user_msg,
+            thread_ts=thread_ts
+        )
+
+
 @app.post('/slack/events')
 async def handle_slack_event(request: Request, background_tasks: BackgroundTasks):
     """Handle Slack events with proper async support and FastAPI background tasks"""
@@ -694,22 +964,11 @@ async def handle_slack_event(request: Request, background_tasks: BackgroundTasks
         print("✅ Responding to Slack challenge")
         return {'challenge': data['challenge']}
 
-    # Deduplicate events (Slack retries on slow responses)
+    # Deduplicate events (Slack retries on slow responses, possibly to another worker)
     event_id = data.get('event_id')
-    if event_id:
-        # Clean old cache entries
-        now = time.time()
-        expired_keys = [k for k, v in processed_events.items() if now - v > EVENT_CACHE_TTL]
-        for k in expired_keys:
-            del processed_events[k]
-
-        # Check if already processed
-        if event_id in processed_events:
-            print(f"⏭️ Skipping duplicate event: {event_id}")
-            return {'status': 'already_processed'}
-
-        # Mark as processed
-        processed_events[event_id] = now
+    if event_id and not await asyncio.to_thread(claim_event, event_id):
+        print(f"⏭️ Skipping duplicate event: {event_id}")
+        return {'status': 'already_processed'}
 
     # Verify Slack signature
     slack_signature = request.headers.get('X-Slack-Signature', '')
@@ -753,10 +1012,9 @@ async def handle_slack_event(request: Request, background_tasks: BackgroundTasks
     message_ts = event.get('ts') or event.get('event_ts')
     if message_ts:
         dedup_key = f"{event.get('channel')}:{message_ts}"
-        if dedup_key in processed_events:
+        if not await asyncio.to_thread(claim_event, dedup_key):
             print(f"⏭️ Skipping duplicate message event: {dedup_key}")
             return {'status': 'duplicate_message'}
-        processed_events[dedup_key] = now
 
     print(f"📥 Event type: {event_type}")
     print(f"📝 Event data: {json.dumps(event, indent=2)}")
@@ -767,25 +1025,6 @@ async def handle_slack_event(request: Request, background_tasks: BackgroundTasks
     else:
         print(f"💬 NEW MESSAGE (not a thread reply)")
 
-    # Helper function to send messages
-    def send_slack_message(channel, text, thread_ts=None):
-        """Send message to Slack channel"""
-        if slack_client is None:
-            print(f"❌ Cannot send message: Slack client not initialized")
-            return {'ok': False, 'error': 'Slack client not initialized'}
-        
-        try:
-            response = slack_client.chat_postMessage(
-                channel=channel,
-                text=text,
-                thread_ts=thread_ts
-            )
-            print(f"✅ Message sent successfully")
-            return response
-        except Exception as e:
-            print(f"❌ Error sending message: {e}")
-            return {'ok': False, 'error': str(e)}
-
     # Handle app mentions and direct messages
     if event_type in ['app_mention', 'message']:
         user_id = event.get('user')
@@ -904,153 +1143,26 @@ async def handle_slack_event(request: Request, background_tasks: BackgroundTasks
                 thread_ts=thread_ts
             )
 
-        # Process in background to avoid Slack's 3-second timeout
-        async def process_message():
-            try:
-                # Validate clients are initialized
-                if anthropic_client is None:
-                    error_msg = "Anthropic client not initialized. Please check ANTHROPIC_API_KEY."
-                    print(f"❌ {error_msg}")
-                    send_slack_message(
-                        channel=channel,
-                        text=f"❌ Configuration error: {error_msg}\n\nPlease check your environment variables.",
-                        thread_ts=thread_ts
-                    )
-                    return
-                
-                if supabase is None:
-                    print("⚠️ Supabase not initialized, continuing without database features")
-                
-                # Import Claude Agent SDK handler
-                from slack_bot.claude_agent_handler import ClaudeAgentHandler
-                print("✅ Claude Agent SDK loaded successfully")
-
-                handler = get_slack_handler()
-                
-                if handler is None:
-                    error_msg = "Failed to initialize Slack handler"
-                    print(f"❌ {error_msg}")
-                    send_slack_message(
-                        channel=channel,
-                        text=f"❌ {error_msg}. Please check server logs.",
-                        thread_ts=thread_ts
-                    )
-                    return
-
-                # Use the REAL Claude Agent SDK handler
-                # ALWAYS recreate to pick up prompt changes on module reload
-                try:
-                    handler.claude_agent = ClaudeAgentHandler(
-                        memory_handler=handler.memory if handler else None,
-                        slack_client=slack_client  # NEW: Pass slack_client for progress updates
-                    )
-                except Exception as e:
-                    error_msg = f"Failed to initialize Claude Agent: {str(e)}"
-                    print(f"❌ {error_msg}")
-                    import traceback
-                    traceback.print_exc()
-                    send_slack_message(
-                        channel=channel,
-                        text=f"❌ {error_msg}\n\nThis may be a temporary issue. Please try again.",
-                        thread_ts=thread_ts
-                    )
-                    return
-
-                global _handler_creation_count
-                _handler_creation_count += 1
-                print(f"🚀 Handler #{_handler_creation_count} ready (tools registered via MCP server)")
-
-                # Save user message to conversation history
-                if handler.memory:
-                    try:
-                        handler.memory.add_message(
-                            thread_ts=thread_ts,
-                            channel_id=channel,
-                            user_id=user_id,
-                            role='user',
-                            content=message_text
-                        )
-                        print(f"💾 Saved user message to conversation history")
-                    except Exception as e:
-                        print(f"⚠️ Failed to save message to history: {e}")
-
-                # The agent decides what to do based on context:
-                # - Create content → delegates to workflows
-                # - Answer questions → uses web_search if needed
-                # - Analyze performance → uses analysis tools
-                # - General conversation → maintains thread context
-                try:
-                    response_text = await handler.claude_agent.handle_conversation(
-                        message=message_text,
-                        user_id=user_id,
-                        thread_ts=thread_ts,  # Use thread_ts for session continuity
-                        channel_id=channel,
-                        slack_files=files if has_files else None  # Pass Slack file objects
-                    )
-                except RuntimeError as e:
-                    # SDK client creation failure - provide helpful error
-                    error_msg = str(e)
-                    if "Failed to create Claude SDK client" in error_msg:
-                        print(f"❌ SDK client creation failed: {error_msg}")
-                        send_slack_message(
-                            channel=channel,
-                            text=f"❌ I'm having trouble connecting to my AI services right now. This might be a temporary issue.\n\nError: {error_msg}\n\nPlease try again in a moment.",
-                            thread_ts=thread_ts
-                        )
-                    else:
-                        raise
-                except Exception as e:
-                    # Other errors - log and provide fallback response
-                    print(f"❌ Error in agent conversation: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    raise
+        payload = {
+            'channel': channel,
+            'thread_ts': thread_ts,
+            'user_id': user_id,
+            'message_text': message_text,
+            'files': files if has_files else None
+        }
 
-                # Save assistant response to conversation history
-                if handler.memory:
-                    try:
-                        handler.memory.add_message(
-                            thread_ts=thread_ts,
-                            channel_id=channel,
-                            user_id='bot',
-                            role='assistant',
-                            content=response_text
-                        )
-                        print(f"💾 Saved assistant response to conversation history")
-                    except Exception as e:
-                        print(f"⚠️ Failed to save response to history: {e}")
-
-                # Send response
-                send_slack_message(
-                    channel=channel,
-                    text=response_text,
-                    thread_ts=thread_ts  # Reply in thread
-                )
-
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                import traceback
-                traceback.print_exc()
-                
-                # Provide user-friendly error message
-                error_detail = str(e)
-                if "ANTHROPIC_API_KEY" in error_detail or "anthropic" in error_detail.lower():
-                    user_msg = "❌ I'm having trouble connecting to my AI services. Please check that ANTHROPIC_API_KEY is set correctly."
-                elif "supabase" in error_detail.lower() or "database" in error_detail.lower():
-                    user_msg = "❌ Database connection issue. The app will continue, but some features may be limited."
-                elif "timeout" in error_detail.lower():
-                    user_msg = "❌ Request timed out. This might be a temporary issue. Please try again."
-                else:
-                    user_msg = f"❌ Sorry, I encountered an error: {error_detail[:200]}"
-                
-                send_slack_message(
-                    channel=channel,
-                    text=user_msg,
-                    thread_ts=thread_ts
-                )
+        # Multi-worker: the thread's SDK session lives on one worker; hand the message to it
+        # (shared-state calls block on SQLite/Postgres locks, so they run off the event loop)
+        router = get_thread_router()
+        owner = await asyncio.to_thread(router.owner, f"{channel}:{thread_ts}")
+        if owner != WORKER_ID:
+            await asyncio.to_thread(router.forward, owner, payload)
+            print(f"🔀 Forwarded thread {thread_ts} to worker {owner}")
+            return {'status': 'forwarded', 'worker': owner}
 
+        # Process in background to avoid Slack's 3-second timeout
         # Use FastAPI BackgroundTasks for proper lifecycle management
-        background_tasks.add_task(process_message)
+        background_tasks.add_task(process_slack_message, **payload)
 
         # Return immediately to beat Slack's 3-second timeout
         return {'status': 'processing'}
@@ -1449,6 +1561,51 @@ async def slack_command_stats(request: Request):
         }
 
 
+# ============= BATCH STATS ENDPOINT =============
+
+@app.get('/api/batch/{plan_id}/stats')
+async def get_batch_stats_endpoint(plan_id: str):
+    """
+    Running stats for a batch plan.
+
+    Returns:
+    {
+        "success": true,
+        "plan_id": "batch_...",
+        "run": {"status": "running", "completed": 4, "failed": 0, "total": 10, ...},
+        "stats": {
+            "avg_score": 20.5, "score_stdev": 1.2, "quality_trend": "stable",
+            "by_platform": {"linkedin": {"count": 4, "mean": 20.5, ...}},
+            "stages": {"grader": {"calls": 8, "avg_seconds": 3.1, "total_tokens": 19200, ...}, ...}
+        }
+    }
+    """
+    try:
+        from agents.batch_orchestrator import get_batch_stats, get_plan_run
+
+        stats = await asyncio.to_thread(get_batch_stats, plan_id)
+        if stats is None:
+            return {
+                "success": False,
+                "error": f"Unknown plan {plan_id}"
+            }
+
+        run = await asyncio.to_thread(get_plan_run, plan_id)
+        return {
+            "success": True,
+            "plan_id": plan_id,
+            "run": {k: v for k, v in run.items() if k != 'posts'} if run else None,
+            "stats": stats
+        }
+
+    except Exception as e:
+        logger.error(f"Error in /api/batch/{plan_id}/stats: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 # ============= N8N WEBHOOK ENDPOINT =============
 
 @app.post('/api/n8n/weekly-briefing')
@@ -2023,4 +2180,9 @@ if __name__ == "__main__":
     print(f"📍 Health check: http://localhost:{port}/healthz")
     print(f"🔗 Slack events: http://localhost:{port}/slack/events")
 
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    if WEB_CONCURRENCY > 1:
+        # Workers share dedup/rate-limit/breaker/batch state and sticky-route threads (utils/shared_state.py)
+        print(f"🧩 Starting {WEB_CONCURRENCY} workers")
+        uvicorn.run("main_slack:app", host="0.0.0.0", port=port, workers=WEB_CONCURRENCY)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
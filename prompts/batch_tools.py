@@ -4,7 +4,7 @@ Provides cancel and status checking for bulk content generation
 """
 
 from typing import Dict, Any, Optional
-from agents.batch_orchestrator import _batch_plans
+from agents.batch_orchestrator import _batch_plans, cancel_plan_run, get_plan_run
 from agents.content_queue import ContentQueueManager
 
 # Global registry of active queue managers (plan_id -> ContentQueueManager)
@@ -29,6 +29,21 @@ def cancel_batch(plan_id: str) -> str:
     if plan_id not in _batch_plans:
         return f"❌ No batch found with ID '{plan_id}'. Use get_batch_status() to see active batches."
 
+    # Server-side run (run_batch) - stops after the post in progress
+    if cancel_plan_run(plan_id):
+        run = get_plan_run(plan_id)
+        return f"""🛑 **Batch Cancellation Initiated**
+
+✅ The post in progress will complete gracefully
+🚫 Remaining posts will be skipped
+
+Current stats:
+- Completed: {run['completed']}
+- Failed: {run['failed']}
+- Remaining: Will be cancelled
+
+You'll see a final summary when the cancellation completes."""
+
     # Check if queue manager exists
     if plan_id not in _active_queues:
         return f"⚠️ Batch '{plan_id}' exists but is not currently running. It may have already completed."
@@ -90,6 +105,22 @@ async def get_batch_status(plan_id: Optional[str] = None) -> str:
     if plan_id not in _batch_plans:
         return f"❌ No batch found with ID '{plan_id}'."
 
+    # Server-side run (run_batch)
+    run = get_plan_run(plan_id)
+    if run and plan_id not in _active_queues:
+        done = run['completed'] + run['failed']
+        progress_bar = _create_progress_bar(run['completed'], run['failed'], 0, run['total'])
+        return f"""📊 **Batch Status: {plan_id}** ({run['status']})
+
+{progress_bar}
+
+**Progress:**
+- ✅ Completed: {run['completed']}/{run['total']}
+- ❌ Failed: {run['failed']}/{run['total']}
+- 📥 Remaining: {run['total'] - done}
+{f'⚠️ This batch has been cancelled.' if run['cancelled'] else ''}
+"""
+
     # Check if queue manager exists
     if plan_id not in _active_queues:
         plan = _batch_plans[plan_id]
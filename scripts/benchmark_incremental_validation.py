@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark diff-aware re-validation on multi-iteration revision traces
+
+Replays LinkedIn and Twitter revision traces (each iteration rewrites one or
+two paragraphs, like the reviser does) through:
+- Full validation: validator.validate() on every draft
+- Incremental:     IncrementalValidator(validator).validate() on every draft
+
+Reports per-trace wall time, paragraphs re-scanned vs reused, contrast-check
+snippets that still need the LLM, and issue parity between the two modes.
+
+Usage:
+    python scripts/benchmark_incremental_validation.py [--repeats 200]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from validators.contrast_prefilter import find_contrast_candidates
+from validators.incremental import IncrementalValidator
+from validators.linkedin_validator import LinkedInValidator
+from validators.twitter_validator import TwitterValidator
+
+
+HOOK = (
+    "You can add $100k in pipeline without posting daily—here's the 3-step system we use "
+    "to double meetings, cut follow-ups in half, and protect your calendar while staying relevant to execs:"
+)
+INTRO = (
+    "Over the last 6 months we audited 37 SaaS sales teams and mapped the time sinks killing deals. "
+    "Reps burned 11 hours per week chasing context. Managers lacked shared dashboards. "
+    "This isn't about working harder—it's about a tighter system."
+)
+SECTIONS = [
+    ("Step 1: Map every handoff before you automate.",
+     "- List the 9 handoffs between SDR, AE and CS\n- Time each one for 2 weeks\n"
+     "- Kill any step that takes more than 48 hours\n- Here's the thing: most teams skip this"),
+    ("Step 2: Build one dashboard the whole team reads.",
+     "We replaced 6 reports with one view. Reps check it every morning. "
+     "Managers coach from it on Fridays. Rather than chasing updates, everyone sees the same 4 numbers."),
+    ("Step 3: Turn objections into a weekly content queue.",
+     "- Pull 3 objections from Gong every Monday\n- Write one post per objection\n"
+     "- Send the best one to the top 20 accounts\n- Track replies, not likes"),
+]
+CONCLUSION = "Try this for 30 days and share your before/after meeting count in the comments—I read every one."
+
+
+def linkedin_trace():
+    """Initial draft + 4 revisions, each touching one region"""
+    def build(intro, sections, conclusion):
+        body = "\n\n".join(f"{h}\n{b}" for h, b in sections)
+        return f"{HOOK}\n\n{intro}\n\n{body}\n\n{conclusion}"
+
+    sections = list(SECTIONS)
+    drafts = [build(INTRO, sections, CONCLUSION)]
+
+    intro = INTRO.replace("This isn't about working harder—it's about a tighter system.",
+                          "A tighter system fixed it in 6 weeks.")
+    drafts.append(build(intro, sections, CONCLUSION))
+
+    sections[0] = (sections[0][0], sections[0][1].replace("- Here's the thing: most teams skip this",
+                                                          "- 7 of 10 teams skip this step"))
+    drafts.append(build(intro, sections, CONCLUSION))
+
+    sections[1] = (sections[1][0], sections[1][1].replace("Rather than chasing updates, everyone",
+                                                          "Now everyone"))
+    drafts.append(build(intro, sections, CONCLUSION))
+
+    drafts.append(build(intro, sections, CONCLUSION.replace("—I read every one", ". I reply to all 50+")))
+    return drafts
+
+
+def twitter_trace():
+    tweets = [
+        "We cut our sales cycle from 94 days to 41. Here's the exact playbook:",
+        "1/ Map every handoff. We found 9 between SDR, AE and CS. 4 of them added nothing.",
+        "2/ The truth is most CRMs are graveyards. We rebuilt ours around 4 fields.",
+        "3/ Rather than chasing updates, we built one dashboard. Reps check it at 9am.",
+        "4/ Objections became content. 3 per week, straight from call recordings.",
+        "5/ Follow-ups dropped 52% because buyers already had answers.",
+        "6/ Total cost: $0 in new tools. 6 weeks of discipline.",
+        "Want the dashboard template? Reply 'pipeline' and I'll send it.",
+    ]
+    drafts = ["\n\n".join(tweets)]
+    for idx, replacement in [
+        (2, "2/ Most CRMs are graveyards. We rebuilt ours around 4 fields."),
+        (3, "3/ We built one dashboard. Reps check it at 9am, managers on Friday."),
+        (0, "We cut our sales cycle from 94 days to 41 in one quarter. The playbook:"),
+    ]:
+        tweets[idx] = replacement
+        drafts.append("\n\n".join(tweets))
+    return drafts
+
+
+def _signature(issues):
+    return sorted(
+        (i.get('type') or i.get('code'), i.get('matched_text'), i.get('position'), str(i.get('span')))
+        for i in issues
+    )
+
+
+def run_trace(name, validator_class, drafts, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        validator = validator_class()
+        full_results = [validator.validate(d) for d in drafts]
+    full_seconds = (time.perf_counter() - start) / repeats
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        incremental = IncrementalValidator(validator_class())
+        incremental_results = [incremental.validate(d) for d in drafts]
+    incremental_seconds = (time.perf_counter() - start) / repeats
+
+    parity = all(_signature(a) == _signature(b) for a, b in zip(full_results, incremental_results))
+    stats = incremental.get_stats()
+
+    # LLM contrast snippets: full mode re-sends every candidate, diff mode only new ones
+    full_snippets = 0
+    new_snippets = 0
+    previous = set()
+    for draft in drafts:
+        candidates = find_contrast_candidates(draft)
+        full_snippets += len(candidates)
+        new_snippets += len([c for c in candidates if c not in previous])
+        previous = set(candidates)
+
+    print(f"\n📊 {name}: {len(drafts)} drafts ({len(drafts) - 1} revisions)")
+    print(f"   Full validation:        {full_seconds * 1000:.2f} ms/trace")
+    print(f"   Incremental validation: {incremental_seconds * 1000:.2f} ms/trace "
+          f"({(1 - incremental_seconds / full_seconds) * 100:.0f}% faster)")
+    print(f"   Paragraphs scanned: {stats['units_checked']}, reused: {stats['units_reused']}")
+    print(f"   Contrast LLM snippets: {new_snippets} (vs {full_snippets} without carry-forward)")
+    print(f"   Issue parity: {'✅ identical' if parity else '❌ MISMATCH'}")
+    return parity
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    ok = run_trace("LinkedIn", LinkedInValidator, linkedin_trace(), args.repeats)
+    ok = run_trace("Twitter", TwitterValidator, twitter_trace(), args.repeats) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
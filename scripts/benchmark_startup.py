@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold-start import time of the Slack app
+
+Runs `python -X importtime -c "import main_slack"` in a fresh interpreter
+(what a Replit deploy / autoscale cold start pays before /healthz answers)
+and reports:
+- total import time and module count
+- slowest modules by self time
+- top-level packages by self time
+
+Exits 1 when the import takes longer than --max-seconds (CI gate), 2 when
+the import fails.
+
+Usage:
+    python scripts/benchmark_startup.py [--module main_slack] [--max-seconds 3] [--repeats 3] [--json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.warmup import importtime_summary, parse_importtime
+
+
+def measure(module):
+    env = {**os.environ, 'PYTHONPATH': str(ROOT), 'PYTHONDONTWRITEBYTECODE': '1'}
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    entries = parse_importtime(proc.stderr)
+    error = None
+    if proc.returncode != 0:
+        lines = [l for l in proc.stderr.splitlines() if not l.startswith('import time:')]
+        error = lines[-1] if lines else f"exit code {proc.returncode}"
+    return entries, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--module', default='main_slack')
+    parser.add_argument('--max-seconds', type=float, help="Fail when the import takes longer")
+    parser.add_argument('--repeats', type=int, default=3, help="Runs to take the fastest of (warm disk cache)")
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--json', action='store_true', help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    best = None
+    for _ in range(max(1, args.repeats)):
+        entries, error = measure(args.module)
+        if error:
+            print(f"❌ import {args.module} failed: {error}")
+            sys.exit(2)
+        summary = importtime_summary(entries, top=args.top)
+        if best is None or summary['total_ms'] < best['total_ms']:
+            best = summary
+
+    if args.json:
+        print(json.dumps(best, indent=2))
+    else:
+        print(f"\n⏱️  import {args.module}: {best['total_ms'] / 1000:.2f}s ({best['modules']} modules, best of {args.repeats})")
+        print("\n   Slowest modules (self time):")
+        for entry in best['slowest_modules']:
+            print(f"   {entry['self_ms']:>9.1f} ms  {entry['module']}")
+        print("\n   Packages (self time):")
+        for package in best['packages']:
+            print(f"   {package['self_ms']:>9.1f} ms  {package['package']}")
+
+    if args.max_seconds is not None and best['total_ms'] > args.max_seconds * 1000:
+        print(f"\n❌ Startup import time {best['total_ms'] / 1000:.2f}s exceeds {args.max_seconds:.2f}s")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Token budget report for the stacked system prompts
+
+For each platform, counts the tokens of every section stack_prompts() sends
+(client context, writing rules, editor standards, create_draft, closing
+instructions) with the count_tokens endpoint, then compares the raw and
+deduplicated builds against the platform's budget (PROMPT_TOKEN_BUDGET_<PLATFORM>).
+
+Counts are cached in .cache/prompt_tokens.json; --offline uses the cache and a
+calibrated estimate without calling the API. Exits 1 when a platform is over budget.
+
+Usage:
+    python scripts/prompt_budget.py [--platform linkedin] [--offline] [--show-merges]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from integrations.prompt_loader import stacked_prompt_sections
+from utils.prompt_budget import (
+    TokenCounter, dedupe_rules, platform_budget, section_tokens
+)
+
+PLATFORMS = ['linkedin', 'twitter', 'email', 'youtube', 'instagram']
+
+
+def report_platform(platform, counter, show_merges):
+    raw = stacked_prompt_sections(platform, dedupe=False)
+    deduped = stacked_prompt_sections(platform, dedupe=True)
+    raw_sections = section_tokens(raw, counter)
+    deduped_sections = {s['name']: s for s in section_tokens(deduped, counter)}
+
+    raw_total = counter.count("\n".join(t for _, t in raw[:-1]) + raw[-1][1])[0]
+    deduped_total, source = counter.count("\n".join(t for _, t in deduped[:-1]) + deduped[-1][1])
+    budget = platform_budget(platform)
+
+    print(f"\n📚 {platform}")
+    print(f"   {'section':<28}{'chars':>8}{'tokens':>9}{'deduped':>9}  source")
+    for section in raw_sections:
+        after = deduped_sections[section['name']]
+        print(f"   {section['name']:<28}{section['chars']:>8}{section['tokens']:>9}{after['tokens']:>9}  {section['source']}")
+    saved = raw_total - deduped_total
+    status = '✅ within budget' if deduped_total <= budget else '❌ OVER BUDGET'
+    print(f"   Total: {raw_total} tokens raw, {deduped_total} deduplicated ({saved} saved, {source})")
+    print(f"   Budget: {budget} tokens - {status}")
+
+    if show_merges:
+        sources = [(name, text) for name, text in raw if name not in ('CLIENT_CONTEXT', 'CRITICAL_INSTRUCTIONS')]
+        _, merges = dedupe_rules(sources)
+        for merge in merges:
+            print(f"   🔁 {merge['dropped_from']} → {merge['kept_in']}: {merge['dropped'][:90]}")
+
+    return deduped_total <= budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--platform', choices=PLATFORMS, action='append',
+                        help="Platform to report (repeatable; default: all)")
+    parser.add_argument('--offline', action='store_true', help="Don't call count_tokens; use cache + estimate")
+    parser.add_argument('--model', help="Model to count for (default: agent loop route)")
+    parser.add_argument('--show-merges', action='store_true', help="List the rules merged by dedupe")
+    args = parser.parse_args()
+
+    counter = TokenCounter(model=args.model, offline=args.offline)
+    ok = True
+    for platform in args.platform or PLATFORMS:
+        ok = report_platform(platform, counter, args.show_merges) and ok
+    counter.save()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -579,16 +579,24 @@ def detect_ai_patterns(text: str) -> str:
         if not gptzero_key:
             return "GPTZero API key not configured. Set GPTZERO_API_KEY in environment."
 
-        # Call GPTZero API
-        response = requests.post(
-            'https://api.gptzero.me/v2/predict/text',
-            headers={
-                'x-api-key': gptzero_key,
-                'Content-Type': 'application/json'
-            },
-            json={'document': text},
-            timeout=30
-        )
+        def predict():
+            response = requests.post(
+                'https://api.gptzero.me/v2/predict/text',
+                headers={
+                    'x-api-key': gptzero_key,
+                    'Content-Type': 'application/json'
+                },
+                json={'document': text},
+                timeout=30
+            )
+            # requests doesn't raise on HTTP errors; raise outages so the breaker counts them
+            if response.status_code >= 500 or response.status_code == 429:
+                response.raise_for_status()
+            return response
+
+        # Call GPTZero API (fails fast while the shared GPTZero breaker is open)
+        from utils.circuit_breaker import get_breaker
+        response = get_breaker('gptzero').call(predict)
 
         if response.status_code != 200:
             return f"GPTZero API error: {response.status_code} - {response.text}"
@@ -10,6 +10,7 @@ import json
 import logging
 from typing import List, Dict, Any, Optional
 from anthropic import Anthropic
+from utils.model_routing import create_message
 
 logger = logging.getLogger(__name__)
 
@@ -89,9 +90,9 @@ Return JSON with:
 
     try:
         # Call Claude Sonnet 4.5
-        response = client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=2000,
+        response = create_message(
+            client,
+            'analytics_report',
             system=ANALYTICS_ANALYSIS_PROMPT,
             messages=[{
                 "role": "user",
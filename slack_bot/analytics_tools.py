@@ -11,7 +11,16 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from supabase import create_client
+from utils.model_routing import create_message
+from integrations.supabase_queries import (
+    Filter,
+    QuerySpec,
+    POST_ANALYTICS_COLUMNS,
+    PATTERN_ANALYSIS_COLUMNS,
+    TOP_PERFORMER_COLUMNS,
+    fetch_all,
+    select_rows,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -51,28 +60,25 @@ def get_post_analytics(
         asyncio.run(sync_ayrshare_metrics(days_back=days_back))
 
         # Step 2: Query published posts with metrics
-        client = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
-
         cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
 
-        query = client.table('generated_posts')\
-            .select('*')\
-            .eq('status', 'published')\
-            .not_.is_('embedding', 'null')\
-            .gte('published_at', cutoff_date)\
-            .order('published_at', desc=True)
-
+        filters = [
+            Filter('eq', 'status', 'published'),
+            Filter('not_null', 'embedding'),
+            Filter('gte', 'published_at', cutoff_date)
+        ]
         if platform:
-            query = query.eq('platform', platform.lower())
-
+            filters.append(Filter('eq', 'platform', platform.lower()))
         if min_engagement > 0:
-            query = query.gte('engagement_rate', min_engagement)
-
-        result = query.execute()
-        posts = result.data
+            filters.append(Filter('gte', 'engagement_rate', min_engagement))
+
+        posts = fetch_all(QuerySpec(
+            table='generated_posts',
+            columns=POST_ANALYTICS_COLUMNS,
+            filters=filters,
+            order_by='published_at',
+            descending=True
+        ))
 
         if not posts:
             return f"No published posts found in the last {days_back} days{' for ' + platform if platform else ''}."
@@ -196,26 +202,23 @@ def show_top_performers(
         Formatted list of top performers with hooks, scores, metrics
     """
     try:
-        client = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
-
         cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
 
-        query = client.table('generated_posts')\
-            .select('*')\
-            .eq('status', 'published')\
-            .not_.is_('engagement_rate', 'null')\
-            .gte('published_at', cutoff_date)\
-            .order('engagement_rate', desc=True)\
-            .limit(count)
-
+        filters = [
+            Filter('eq', 'status', 'published'),
+            Filter('not_null', 'engagement_rate'),
+            Filter('gte', 'published_at', cutoff_date)
+        ]
         if platform:
-            query = query.eq('platform', platform.lower())
+            filters.append(Filter('eq', 'platform', platform.lower()))
 
-        result = query.execute()
-        posts = result.data
+        posts = select_rows(QuerySpec(
+            table='generated_posts',
+            columns=TOP_PERFORMER_COLUMNS,
+            filters=filters,
+            order_by='engagement_rate',
+            descending=True
+        ), limit=count)
 
         if not posts:
             return f"No published posts with metrics found in last {days_back} days{' for ' + platform if platform else ''}."
@@ -262,7 +265,8 @@ def analyze_content_patterns(
     """
     Analyze content patterns in top-performing posts using semantic analysis.
 
-    Uses vector embeddings to cluster similar high-performers and identify:
+    Clusters all qualifying posts locally in embedding space (k-means) and sends
+    Claude compact cluster summaries to identify:
     - Common themes (automation, frameworks, case studies)
     - Hook styles (specific numbers, contrarian, bold outcomes)
     - Content structures (numbered lists, stories, Q&A)
@@ -277,25 +281,22 @@ def analyze_content_patterns(
         Detailed pattern analysis with themes, structures, recommendations
     """
     try:
-        client = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
-
         cutoff_date = (datetime.now() - timedelta(days=days_back)).isoformat()
 
-        # Get all published posts with metrics and embeddings
-        result = client.table('generated_posts')\
-            .select('*')\
-            .eq('status', 'published')\
-            .not_.is_('engagement_rate', 'null')\
-            .not_.is_('embedding', 'null')\
-            .gte('published_at', cutoff_date)\
-            .gte('engagement_rate', min_engagement)\
-            .order('engagement_rate', desc=True)\
-            .execute()
-
-        all_posts = result.data
+        # Stream all published posts with metrics and embeddings (keyset pages)
+        all_posts = fetch_all(QuerySpec(
+            table='generated_posts',
+            columns=PATTERN_ANALYSIS_COLUMNS,
+            filters=[
+                Filter('eq', 'status', 'published'),
+                Filter('not_null', 'engagement_rate'),
+                Filter('not_null', 'embedding'),
+                Filter('gte', 'published_at', cutoff_date),
+                Filter('gte', 'engagement_rate', min_engagement)
+            ],
+            order_by='engagement_rate',
+            descending=True
+        ))
 
         if not all_posts or len(all_posts) < 3:
             return f"Not enough posts with metrics (need at least 3, found {len(all_posts)}).\n\nTip: Ensure Ayrshare metrics sync has run and posts have been published recently."
@@ -306,43 +307,50 @@ def analyze_content_patterns(
 
         logger.info(f"Analyzing {top_count} top posts out of {len(all_posts)} total")
 
-        # Step 1: Extract embeddings and find similar clusters
-        # Use first top post as reference
-        reference_post = top_posts[0]
-        reference_embedding = reference_post['embedding']
-
-        # Find semantically similar posts using vector search
-        similar_posts_result = client.rpc('match_generated_posts', {
-            'query_embedding': reference_embedding,
-            'match_threshold': 0.7,
-            'match_count': min(20, len(top_posts))
-        }).execute()
-
-        similar_posts = similar_posts_result.data if similar_posts_result.data else []
+        # Step 1: Cluster ALL fetched posts locally in embedding space (one DB fetch, no RPC)
+        clustering = None
+        try:
+            from utils.content_clustering import cluster_posts
+            clustering = cluster_posts(
+                all_posts,
+                top_post_ids={p.get('id') for p in top_posts}
+            )
+        except ImportError:
+            logger.warning("numpy not installed - skipping clustering, sending top post previews")
+        except Exception as e:
+            logger.error(f"Clustering failed, sending top post previews: {e}")
 
         # Step 2: Prepare data for Claude analysis
-        top_posts_data = []
-        for post in top_posts:
-            content_preview = (post.get('body_content') or '')[:500]
-            top_posts_data.append({
-                'hook': post.get('post_hook', '')[:200],
-                'content_preview': content_preview,
-                'platform': post.get('platform'),
-                'engagement_rate': post.get('engagement_rate', 0.0),
-                'impressions': post.get('impressions', 0),
-                'content_type': post.get('content_type', 'unknown'),
-                'quality_score': post.get('quality_score', 0)
-            })
+        if clustering and clustering['clusters']:
+            analysis_data = clustering['clusters']
+            data_description = (
+                f"{len(analysis_data)} semantic clusters covering {clustering['clustered_posts']} posts "
+                f"(sorted by avg engagement; 'top_performers' = posts in the top {top_percent}%)"
+            )
+        else:
+            analysis_data = []
+            for post in top_posts:
+                content_preview = (post.get('body_content') or '')[:500]
+                analysis_data.append({
+                    'hook': post.get('post_hook', '')[:200],
+                    'content_preview': content_preview,
+                    'platform': post.get('platform'),
+                    'engagement_rate': post.get('engagement_rate', 0.0),
+                    'impressions': post.get('impressions', 0),
+                    'content_type': post.get('content_type', 'unknown'),
+                    'quality_score': post.get('quality_score', 0)
+                })
+            data_description = f"{len(analysis_data)} top-performing posts"
 
         # Step 3: Use Claude to analyze patterns
         from anthropic import Anthropic
 
         anthropic_client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
 
-        pattern_prompt = f"""Analyze these {len(top_posts_data)} top-performing posts and identify patterns.
+        pattern_prompt = f"""Analyze these {data_description} and identify patterns.
 
-Posts to analyze:
-{json.dumps(top_posts_data, indent=2)}
+Data to analyze:
+{json.dumps(analysis_data, indent=2)}
 
 Provide analysis in these categories:
 
@@ -371,9 +379,9 @@ Return as JSON:
   "recommendations": ["rec1", "rec2", "rec3"]
 }}"""
 
-        response = anthropic_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
+        response = create_message(
+            anthropic_client,
+            'analytics',
             messages=[{
                 "role": "user",
                 "content": pattern_prompt
@@ -446,9 +454,15 @@ Return as JSON:
                 result_parts.append(f"{i}. {rec}")
             result_parts.append("")
 
-        # Similar clusters info
-        if len(similar_posts) > 1:
-            result_parts.append(f"🔗 Found {len(similar_posts)} semantically similar high-performers (vector similarity > 70%)")
+        # Cluster breakdown
+        if clustering and clustering['clusters']:
+            result_parts.append(f"🔗 *SEMANTIC CLUSTERS* ({clustering['k']} groups, {clustering['clustered_posts']} posts):")
+            for cluster in clustering['clusters'][:5]:
+                best = next((r for r in cluster['representative_posts'] if r['best_in_cluster']), cluster['representative_posts'][0])
+                result_parts.append(
+                    f"• {cluster['size']} posts | avg {cluster['avg_engagement']:.1f}% | "
+                    f"{cluster['top_performers']} top performers | e.g. \"{best['hook'][:80]}\""
+                )
 
         return "\n".join(result_parts)
 
@@ -11,6 +11,7 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 from anthropic import Anthropic
+from utils.model_routing import create_message
 
 logger = logging.getLogger(__name__)
 
@@ -82,9 +83,9 @@ async def generate_briefing(
     try:
         logger.info("Calling Claude to generate briefing")
 
-        response = client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=4000,
+        response = create_message(
+            client,
+            'briefing',
             system=BRIEFING_GENERATOR_PROMPT,
             messages=[{
                 "role": "user",
@@ -15,6 +15,7 @@ import asyncio
 import hashlib
 import time
 import uuid
+from utils.model_routing import create_message, route_model
 
 # Import our existing tool functions
 from tools.search_tools import web_search as _web_search_func
@@ -40,6 +41,7 @@ from agents.batch_orchestrator import (
     execute_sequential_batch,
     create_batch_plan,
     execute_single_post_from_plan,
+    run_plan,
     diversify_topics
 )
 from agents.context_manager import ContextManager
@@ -594,19 +596,25 @@ async def check_ai_detection(args):
 
     try:
         async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                'https://api.gptzero.me/v2/predict/text',
-                headers={
-                    'x-api-key': api_key,
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'document': post_text,
-                    'multilingual': False
-                }
-            )
-
-            response.raise_for_status()
+            # Fails fast while the shared GPTZero breaker is open
+            from utils.circuit_breaker import get_breaker
+            async def predict():
+                response = await client.post(
+                    'https://api.gptzero.me/v2/predict/text',
+                    headers={
+                        'x-api-key': api_key,
+                        'Content-Type': 'application/json'
+                    },
+                    json={
+                        'document': post_text,
+                        'multilingual': False
+                    }
+                )
+                # Raise inside the breaker so 5xx/429 count as outages (is_outage skips other 4xx)
+                response.raise_for_status()
+                return response
+
+            response = await get_breaker('gptzero').call_async(predict)
             data = response.json()
 
             # Extract key metrics
@@ -928,7 +936,7 @@ async def plan_content_batch(args):
 
 **Estimated Time:** {len(plan['posts']) * 1.5:.0f} minutes (sequential execution)
 
-Use execute_post_from_plan to create each post with accumulated learnings."""
+Use run_batch to create all posts in one call (or execute_post_from_plan for a single post)."""
 
         return {
             "content": [{
@@ -1031,6 +1039,85 @@ async def execute_post_from_plan(args):
         }
 
 
+@tool(
+    "run_batch",
+    "Execute ALL posts in a batch plan server-side in one call. Progress streams to Slack; returns the final summary. Preferred over calling execute_post_from_plan once per post.",
+    {"plan_id": str, "start_index": int}
+)
+async def run_batch(args):
+    """
+    Run a whole batch plan without an agent turn per post
+
+    Args:
+        plan_id: ID from plan_content_batch
+        start_index: First post to create (0-indexed, default 0 - use to resume)
+
+    Returns:
+        Final batch summary (per-post scores, hooks and Airtable links)
+    """
+    plan_id = args.get('plan_id', '')
+    start_index = args.get('start_index', 0) or 0
+
+    if not plan_id:
+        return {
+            "content": [{
+                "type": "text",
+                "text": "❌ No plan_id provided. Create a plan first with plan_content_batch."
+            }]
+        }
+
+    try:
+        summary = await run_plan(plan_id, start_index)
+
+        user_id = _current_slack_context.get('user_id', '')
+        user_tag = f"<@{user_id}>" if user_id else ""
+
+        if summary.get('error'):
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": f"{user_tag} ❌ {summary['error']}".strip()
+                }]
+            }
+
+        status = "🛑 **Batch Cancelled**" if summary['cancelled'] else "✅ **Batch Complete**"
+        lines = [
+            f"{user_tag} {status}".strip(),
+            "",
+            f"📊 **Completed:** {summary['completed']}/{summary['total']} | **Failed:** {summary['failed']}",
+            f"📈 **Average Score:** {summary['avg_score']:.1f}/25 ({summary['quality_trend']})",
+            f"⏱️ **Time:** {summary['elapsed_seconds'] // 60} min",
+            "",
+            "**Posts:**"
+        ]
+        for post in summary['posts']:
+            if post['success']:
+                line = f"{post['index'] + 1}. {post['platform'].capitalize()} - {post['score']}/25 - {post['hook'][:80]}"
+                if post['airtable_url']:
+                    line += f" ({post['airtable_url']})"
+            else:
+                line = f"{post['index'] + 1}. {post['platform'].capitalize()} - ❌ {(post['error'] or 'failed')[:100]}"
+            lines.append(line)
+
+        return {
+            "content": [{
+                "type": "text",
+                "text": "\n".join(lines)
+            }]
+        }
+
+    except Exception as e:
+        import traceback
+        print(f"❌ run_batch error: {e}")
+        print(traceback.format_exc())
+        return {
+            "content": [{
+                "type": "text",
+                "text": f"❌ Error running batch: {str(e)}"
+            }]
+        }
+
+
 @tool(
     "compact_learnings",
     "Compress learnings from last 10 posts into key insights. Call every 10 posts.",
@@ -1070,23 +1157,21 @@ async def compact_learnings(args):
                 }]
             }
 
-        # Run compaction
-        await context_mgr.compact()
-
+        # Nothing to compact: learnings are no longer accumulated (each post gets its own
+        # strategic outline), so report the running stats instead
         stats = context_mgr.get_stats()
 
         return {
             "content": [{
                 "type": "text",
-                "text": f"""✅ **Learnings Compacted**
+                "text": f"""✅ **No Compaction Needed**
 
 📊 **Stats:**
 - Total posts: {stats['total_posts']}
 - Average score: {stats['average_score']:.1f}/25
-- Posts since last compact: {stats['posts_since_compact']}
+- Quality trend: {stats['quality_trend']}
 
-Context compressed from ~20k tokens to ~2k tokens.
-Quality insights preserved for next batch of posts."""
+Context is not accumulated between posts; each post uses its own strategic outline."""
             }]
         }
 
@@ -1141,25 +1226,32 @@ async def checkpoint_with_user(args):
 
         stats = context_mgr.get_stats()
 
-        # Calculate quality trend
-        if len(stats['scores']) >= 2:
-            first_score = stats['scores'][0]
-            recent_avg = sum(stats['scores'][-5:]) / len(stats['scores'][-5:])
-            trend = "📈 Improving" if recent_avg > first_score else "📊 Stable"
-        else:
-            trend = "🆕 Just started"
+        trend = {
+            'improving': "📈 Improving",
+            'declining': "📉 Declining",
+            'stable': "📊 Stable",
+        }.get(stats['quality_trend'], "🆕 Just started")
+
+        total_posts = len(context_mgr.plan.get('posts', [])) or stats['total_posts']
+        post_stats = stats['stages'].get('post')
+        minutes_per_post = post_stats['avg_seconds'] / 60 if post_stats else 1.5
+        platform_lines = "\n".join(
+            f"- {platform.capitalize()}: {s['mean']:.1f}/25 over {s['count']} posts"
+            for platform, s in stats['by_platform'].items()
+        )
 
         checkpoint_msg = f"""🎯 **Checkpoint: {posts_completed} Posts Complete**
 
 📊 **Progress Stats:**
-- Average quality: {stats['average_score']:.1f}/25
+- Average quality: {stats['average_score']:.1f}/25 (±{stats['score_stdev']:.1f})
+- Score range: {stats['lowest_score']}-{stats['highest_score']}
 - Quality trend: {trend}
-- Estimated time remaining: {(stats['total_posts'] - posts_completed) * 1.5:.0f} min
+- Estimated time remaining: {max(0, total_posts - posts_completed) * minutes_per_post:.0f} min
 
-**Recent Learnings:**
-{stats.get('recent_learnings', 'Building quality patterns...')}
+**By Platform:**
+{platform_lines or '- No posts scored yet'}
 
-Continue creating posts - quality is improving with each iteration!"""
+Continue creating posts - each post follows its own strategic outline."""
 
         return {
             "content": [{
@@ -1571,26 +1663,28 @@ When user explicitly requests ANY content creation (1 post or 100 posts), follow
    - ALWAYS delegate to SDK subagents
 
 3. **Execute Posts**:
-   - Call execute_post_from_plan for each post in the plan
+   - Call run_batch(plan_id) ONCE - it creates every post in the plan server-side
+   - Progress streams to Slack; you receive the final summary
    - SDK subagents handle actual content generation
    - Posts auto-save to Airtable
 
 **Tools to use:**
 - plan_content_batch → Creates structured plan with post specs
-- execute_post_from_plan → Delegates to LinkedIn/Twitter/Email/YouTube/Instagram SDK agents
+- run_batch → Creates every post in the plan (delegates to LinkedIn/Twitter/Email/YouTube/Instagram agents)
+- execute_post_from_plan → Creates one post from the plan (retry a single failed post)
 
 **Examples (ALL use batch mode):**
-✅ "Write a LinkedIn post about X" → plan_content_batch + execute_post_from_plan
-✅ "Create 5 posts about Y" → plan_content_batch + execute_post_from_plan (×5)
-✅ "Draft a Twitter thread" → plan_content_batch + execute_post_from_plan
-✅ "Make content for LinkedIn and Twitter" → plan_content_batch + execute_post_from_plan (×2)
+✅ "Write a LinkedIn post about X" → plan_content_batch + run_batch
+✅ "Create 5 posts about Y" → plan_content_batch + run_batch
+✅ "Draft a Twitter thread" → plan_content_batch + run_batch
+✅ "Make content for LinkedIn and Twitter" → plan_content_batch + run_batch
 
 **RARE EXCEPTION - Co-write mode (1% of requests):**
 Only use if user EXPLICITLY says: "co-write", "collaborate with me", "iterate with me"
 If uncertain, ask: "Do you want me to create this now (batch) or co-write it with you?"
 
 **CRITICAL: TWITTER NEVER USES CO-WRITE MODE**
-- Twitter content ALWAYS uses batch mode (plan_content_batch + execute_post_from_plan)
+- Twitter content ALWAYS uses batch mode (plan_content_batch + run_batch)
 - NEVER use mcp__tools__generate_post_twitter or mcp__tools__quality_check_twitter
 - These co-write tools bypass the intelligent routing (Haiku fast path vs SDK agent)
 - Batch mode ensures proper routing: single posts → Haiku, threads → SDK agent
@@ -1659,7 +1753,7 @@ Platform name mapping:
 - "email newsletter" or "newsletter" → Email platform
 
 CRITICAL: NEVER generate multiple posts inline in conversation!
-ALWAYS use plan_content_batch → execute_post_from_plan → SDK subagents.
+ALWAYS use plan_content_batch → run_batch → SDK subagents.
 
 **BATCH MODE (DEFAULT - 99% of requests)**
 
@@ -1686,7 +1780,7 @@ This is the DEFAULT for ALL content creation requests.
 - Twitter threads: Uses existing SDK agent (multi-agent process)
   - Keywords: "thread", "thread of", "twitter thread", "a thread", "an x thread" → SDK agent
   - Auto-saves to Airtable
-- CRITICAL: Twitter ALWAYS uses batch mode (plan_content_batch + execute_post_from_plan)
+- CRITICAL: Twitter ALWAYS uses batch mode (plan_content_batch + run_batch)
   - NEVER use co-write tools for Twitter (mcp__tools__generate_post_twitter, etc.)
   - Batch mode ensures proper routing to Haiku (single posts) or SDK agent (threads)
 
@@ -1695,7 +1789,7 @@ This is the DEFAULT for ALL content creation requests.
 - Sequential execution with learning accumulation
 - Posts automatically save to Airtable
 - Real-time progress updates
-- Tools: plan_content_batch, execute_post_from_plan, cancel_batch, get_batch_status
+- Tools: plan_content_batch, run_batch, execute_post_from_plan, cancel_batch, get_batch_status
 
 **CO-WRITE MODE (RARE - 1% of requests)**
 
@@ -1737,7 +1831,7 @@ These are content creation verbs that trigger BATCH mode by default.
 **CRITICAL RULES:**
 1. **NEVER create multiple posts inline** and concatenate them
    - ❌ WRONG: Generate 3 posts in conversation, combine, save as one Airtable record
-   - ✅ RIGHT: Use batch orchestration tools (plan_content_batch + execute_post_from_plan)
+   - ✅ RIGHT: Use batch orchestration tools (plan_content_batch + run_batch)
 2. Each post MUST be created separately to get separate Airtable rows
 3. Parse count from user request: "3 posts" → count=3, "week of content" → count=7, "month" → count=30
 4. Default to BATCH MODE - only use CO-WRITE if explicitly requested
@@ -1791,8 +1885,15 @@ CMO: *calls plan_content_batch with FINAL 7-post plan*
    - Returns: plan_id for tracking
    - Example: plan_content_batch(posts=[...], description="Week of AI content")
 
-2. **execute_post_from_plan**: Execute posts sequentially
-   - Call once per post with plan_id and post_index (0-indexed)
+2. **run_batch**: Execute the whole plan in ONE call
+   - Creates every post sequentially server-side; Slack gets per-post progress and checkpoints
+   - Returns the final summary (scores, hooks, Airtable links) when all posts are done
+   - Do NOT call execute_post_from_plan per post - that costs you one extra turn per post
+   - Resume after a failure: run_batch(plan_id="batch_123", start_index=3)
+   - Example: run_batch(plan_id="batch_123")
+
+   **execute_post_from_plan**: Execute ONE post (retry a single failed post)
+   - Call with plan_id and post_index (0-indexed)
    - Each post gets learnings from previous posts
    - Quality improves over the batch (post 1 score 20 → post 50 score 23)
    - Example: execute_post_from_plan(plan_id="batch_123", post_index=0)
@@ -1853,7 +1954,7 @@ The detailed_outline field has NO length limit - preserve EVERYTHING.
 
 **CRITICAL: POST COMPLETION SUMMARIES**
 
-When a post creation completes (execute_post_from_plan returns a success message), you MUST:
+When a post creation completes (run_batch or execute_post_from_plan returns a success message), you MUST:
 
 1. **Read the ACTUAL post content** from the tool result
 2. **Summarize what's IN THE FINAL POST**, not what you originally requested
@@ -1885,7 +1986,7 @@ Example A: Single post batch
 User: "Create 1 LinkedIn post about AI, direct to calendar"
 CMO: *calls plan_content_batch with 1 post spec*
 CMO: "✅ Batch plan created! ID: batch_123. Creating post 1/1..."
-CMO: *calls execute_post_from_plan(plan_id, 0)*
+CMO: *calls run_batch(plan_id)*
 CMO: "✅ Post 1 complete (score 21/25). Saved to Airtable!"
 ```
 
@@ -1894,12 +1995,7 @@ Example B: Large batch with progress updates
 User: "Create 15 LinkedIn posts, direct to calendar"
 CMO: *calls plan_content_batch with 15 post specs*
 CMO: "✅ Batch plan created! Creating post 1/15..."
-CMO: *calls execute_post_from_plan sequentially*
-[... after post 5 ...]
-User: "How's it going?"
-CMO: *calls get_batch_status* → "[====  ] 33% - 5/15 complete"
-[... continues ...]
-CMO: *calls checkpoint_with_user at post 10*
+CMO: *calls run_batch(plan_id)* - posts progress and the post-10 checkpoint to Slack itself
 CMO: "✅ All 15 posts complete! Average score: 22/25."
 ```
 
@@ -1966,7 +2062,7 @@ CMO: *calls send_to_calendar* → "✅ Saved to Airtable!"
 
 **TOOLS AVAILABLE:**
 - **CO-WRITE MODE:** generate_post_{platform}, quality_check_{platform}, apply_fixes_{platform}, send_to_calendar
-- **BATCH MODE:** plan_content_batch, execute_post_from_plan, compact_learnings, checkpoint_with_user, cancel_batch, get_batch_status
+- **BATCH MODE:** plan_content_batch, run_batch, execute_post_from_plan, compact_learnings, checkpoint_with_user, cancel_batch, get_batch_status
 
 **KEY PRINCIPLES:**
 - **CO-WRITE:** Always show draft + quality analysis together, wait for user input, iterate until approved
@@ -2095,6 +2191,7 @@ If someone asks about "Dev Day on the 6th" - they likely mean OpenAI Dev Day (No
             send_to_calendar,  # Save approved drafts to calendar
             # Batch orchestration tools - ALWAYS available (default mode)
             plan_content_batch,
+            run_batch,
             execute_post_from_plan,
             compact_learnings,
             checkpoint_with_user,
@@ -2350,9 +2447,9 @@ Be direct and helpful. If you can't see something clearly, say so."""
         print(f"[{request_id}]    Content blocks: {len(content)} (text + {len(file_blocks)} files)")
 
         try:
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
+            response = create_message(
+                client,
+                'multimodal',
                 system=system_prompt,
                 messages=messages
             )
@@ -2562,7 +2659,7 @@ Be direct and helpful. If you can't see something clearly, say so."""
                 allowed_tools=["mcp__tools__*"],
                 setting_sources=["project"],  # Load .claude/CLAUDE.md automatically via SDK
                 system_prompt=self.system_prompt,  # CMO prompt (SDK will combine with CLAUDE.md)
-                model="claude-sonnet-4-5-20250929",  # Claude Sonnet 4.5 - latest
+                model=route_model('cmo_agent').model,
                 permission_mode="bypassPermissions",
                 continue_conversation=True  # KEY: Maintain context across messages
             )
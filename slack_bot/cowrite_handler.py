@@ -9,6 +9,8 @@ from anthropic import Anthropic
 from claude_agent_sdk import create_sdk_mcp_server, AgentSession
 from slack_sdk import WebClient
 
+from utils.model_routing import route_model
+
 
 class CoWriteHandler:
     """
@@ -112,7 +114,7 @@ Start by generating a draft based on the user's topic."""
             self.sdk_session = AgentSession(
                 client=anthropic_client,
                 mcp_server=self.mcp_server,
-                model="claude-sonnet-4-5-20250929",
+                model=route_model('cowrite_session').model,
                 system_prompt=self._create_system_prompt()
             )
         return self.sdk_session
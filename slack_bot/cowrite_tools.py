@@ -6,6 +6,7 @@ Only loaded when user explicitly requests "co-write" or "collaborate".
 
 import os
 from claude_agent_sdk import tool
+from utils.model_routing import create_message
 
 # ================== CO-WRITE GENERATION TOOLS ==================
 # These tools allow the CMO to generate initial drafts using WRITE_LIKE_HUMAN_RULES
@@ -46,9 +47,10 @@ CRITICAL RULES:
 
 Return ONLY the post text. No markdown formatting (**bold** or *italic*). No metadata or explanations."""
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2000,
+    response = create_message(
+        client,
+        'cowrite_draft',
+        platform='linkedin',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -97,9 +99,10 @@ CRITICAL RULES:
 
 Return thread as numbered tweets. Format: "1/ [tweet]\\n\\n2/ [tweet]" etc."""
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2000,
+    response = create_message(
+        client,
+        'cowrite_draft',
+        platform='twitter',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -153,9 +156,10 @@ Subject: [subject line]
 
 CTA: [call to action]"""
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2500,
+    response = create_message(
+        client,
+        'cowrite_draft',
+        platform='email',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -214,9 +218,10 @@ INTRO (0:15-0:45):
 
 [Continue with timestamped sections]"""
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=3000,
+    response = create_message(
+        client,
+        'cowrite_draft',
+        platform='youtube',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -267,9 +272,10 @@ CRITICAL RULES:
 
 Return ONLY the caption text with hashtags. No markdown formatting. No metadata."""
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2000,
+    response = create_message(
+        client,
+        'cowrite_draft',
+        platform='instagram',
         messages=[{"role": "user", "content": prompt}]
     )
 
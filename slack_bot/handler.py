@@ -11,6 +11,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from workflows import WORKFLOW_REGISTRY
+from utils.model_routing import create_message
 
 # Import local utilities
 from .formatters import (
@@ -507,9 +508,9 @@ EXAMPLE OUTPUT:
 
 YOUR OUTPUT (JSON array only):"""
 
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=500,
+            response = create_message(
+                client,
+                'thread_resolution',
                 messages=[{"role": "user", "content": resolution_prompt}]
             )
 
@@ -4,6 +4,14 @@ Stores thread_id -> content mapping in Supabase
 """
 from typing import Optional, Dict, Any
 from datetime import datetime
+from integrations.supabase_queries import (
+    Filter,
+    QuerySpec,
+    THREAD_COLUMNS,
+    THREAD_HISTORY_COLUMNS,
+    select_one,
+    select_rows,
+)
 
 
 class SlackThreadMemory:
@@ -75,29 +83,31 @@ class SlackThreadMemory:
         """
         try:
             # First try slack_threads table
-            result = self.supabase.table('slack_threads')\
-                .select('*')\
-                .eq('thread_ts', thread_ts)\
-                .execute()
+            thread = select_one(QuerySpec(
+                table='slack_threads',
+                columns=THREAD_COLUMNS,
+                filters=[Filter('eq', 'thread_ts', thread_ts)]
+            ), client=self.supabase)
 
-            if result.data:
-                return result.data[0]
+            if thread:
+                return thread
 
             # Fallback: reconstruct from conversation_history
-            history = self.supabase.table('conversation_history')\
-                .select('*')\
-                .eq('thread_ts', thread_ts)\
-                .order('created_at', desc=True)\
-                .limit(10)\
-                .execute()
-
-            if history.data:
+            history = select_rows(QuerySpec(
+                table='conversation_history',
+                columns=THREAD_HISTORY_COLUMNS,
+                filters=[Filter('eq', 'thread_ts', thread_ts)],
+                order_by='created_at',
+                descending=True
+            ), limit=10, client=self.supabase)
+
+            if history:
                 # Get the most recent message to extract metadata
-                latest = history.data[0]
+                latest = history[0]
 
                 # Try to find the latest assistant response with content
                 latest_draft = ""
-                for msg in history.data:
+                for msg in history:
                     if msg.get('role') == 'assistant' and msg.get('content'):
                         latest_draft = msg['content']
                         break
@@ -112,7 +122,7 @@ class SlackThreadMemory:
                     'latest_score': 80,  # Default score
                     'status': 'drafting',
                     'metadata': latest.get('metadata', {}),
-                    'created_at': history.data[-1].get('created_at'),  # First message
+                    'created_at': history[-1].get('created_at'),  # First message
                     'updated_at': latest.get('created_at')
                 }
 
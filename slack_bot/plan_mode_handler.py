@@ -8,6 +8,9 @@ import json
 from typing import Dict, List, Any, Optional
 import asyncio
 
+from utils.model_routing import route_model
+from utils.rag_prefetch import clear_plan_prefetch, lookup_prefetched, start_plan_prefetch, use_prefetch
+
 # Import subagent orchestrators
 from agents.agentic_linkedin_orchestrator import AgenticLinkedInOrchestrator
 from agents.agentic_twitter_orchestrator import AgenticTwitterOrchestrator
@@ -109,7 +112,9 @@ async def execute_plan_item(args: dict[str, Any]) -> dict[str, Any]:
         elif agent_type == 'research':
             # Use web search for research tasks
             from tools.search_tools import web_search
-            result = web_search(query=content, max_results=10)
+            result = await lookup_prefetched('web_search', content, max_results=10)
+            if result is None:
+                result = web_search(query=content, max_results=10)
             result_text += f"Research complete: {len(json.loads(result).get('results', []))} sources found"
 
         else:
@@ -172,10 +177,11 @@ Always use create_execution_plan to structure the plan properly."""
         ]
 
         # Agent options
+        plan_route = route_model('plan')
         self.options = ClaudeAgentOptions(
             api_key=os.getenv('ANTHROPIC_API_KEY'),
-            model="claude-sonnet-4-20250514",
-            max_tokens=2000,
+            model=plan_route.model,
+            max_tokens=plan_route.max_tokens,
             temperature=0.3,  # Lower temp for structured planning
             system_prompt=self.system_prompt,
             tools=self.tools
@@ -229,6 +235,12 @@ Channel: {channel_id}
                     'status': 'pending_approval'
                 }
 
+                # Run research lookups while the user reviews the plan
+                start_plan_prefetch(
+                    f"plan_{thread_ts}",
+                    research_queries=[t.get('content', '') for t in todos if t.get('agent_type') == 'research']
+                )
+
                 return {
                     'success': True,
                     'plan_text': plan_text,
@@ -271,40 +283,43 @@ Channel: {channel_id}
 
         if not approved:
             del self.active_plans[thread_ts]
+            clear_plan_prefetch(f"plan_{thread_ts}")
             return "❌ Plan cancelled"
 
         plan['status'] = 'executing'
         todos = plan['todos']
         results = []
 
-        # Execute each todo
-        for i, todo in enumerate(todos):
-            # Check dependencies
-            deps = todo.get('dependencies', [])
-            if deps:
-                # Wait for dependencies to complete
-                # (In a real implementation, this would check completion status)
-                await asyncio.sleep(0.1)
-
-            # Execute this todo
-            result = await execute_plan_item({
-                'todo_id': i + 1,
-                'content': todo['content'],
-                'agent_type': todo['agent_type'],
-                'context': {
-                    'user_id': plan['user_id'],
-                    'channel_id': plan['channel_id']
-                }
-            })
-
-            results.append(result)
-
-            # Update progress (in real implementation, would update TodoWrite)
-            print(f"📋 Plan progress: {i+1}/{len(todos)} tasks complete")
+        # Execute each todo (research lookups read the plan's prefetch cache)
+        with use_prefetch(f"plan_{thread_ts}"):
+            for i, todo in enumerate(todos):
+                # Check dependencies
+                deps = todo.get('dependencies', [])
+                if deps:
+                    # Wait for dependencies to complete
+                    # (In a real implementation, this would check completion status)
+                    await asyncio.sleep(0.1)
+
+                # Execute this todo
+                result = await execute_plan_item({
+                    'todo_id': i + 1,
+                    'content': todo['content'],
+                    'agent_type': todo['agent_type'],
+                    'context': {
+                        'user_id': plan['user_id'],
+                        'channel_id': plan['channel_id']
+                    }
+                })
+
+                results.append(result)
+
+                # Update progress (in real implementation, would update TodoWrite)
+                print(f"📋 Plan progress: {i+1}/{len(todos)} tasks complete")
 
         # Mark plan complete
         plan['status'] = 'completed'
         del self.active_plans[thread_ts]
+        clear_plan_prefetch(f"plan_{thread_ts}")
 
         return f"✅ Plan execution complete! {len(todos)} tasks executed."
 
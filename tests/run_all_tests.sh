@@ -41,6 +41,7 @@ run_test "Full System Mock" "tests/test_full_system_mock.py"
 run_test "Tool Validation" "tests/test_tool_validation.py"
 run_test "Batch Orchestrator" "tests/test_batch_orchestrator_mock.py"
 run_test "Multi-Platform Mock" "test_multi_platform_mock.py"
+run_test "Startup Import Time" "scripts/benchmark_startup.py --max-seconds 3"
 
 # Summary
 echo "=========================================="
@@ -0,0 +1,117 @@
+"""
+Unit tests for the server-side batch runner (run_plan in agents/batch_orchestrator.py)
+Tests whole-plan execution, Slack progress, resume, and cancellation between posts
+"""
+import pytest
+import sys
+import asyncio
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import agents.batch_orchestrator as batch_orchestrator
+from agents.batch_orchestrator import cancel_plan_run, create_batch_plan, get_plan_run, run_plan
+
+
+def make_plan(count, slack_client=None):
+    posts = [{'platform': 'linkedin', 'topic': f'Topic {i}', 'context': 'x' * 300} for i in range(count)]
+    return create_batch_plan(posts, 'runner test', channel_id='C1', thread_ts='T1', user_id='U1',
+                             slack_client=slack_client)
+
+
+@pytest.fixture
+def executed(monkeypatch):
+    calls = []
+
+    async def fake_post(platform, topic, context, style, learnings, target_score, **slack):
+        calls.append(topic)
+        if topic == 'Topic 1':
+            raise RuntimeError("validator crashed")
+        return f"Quality Score: 20/25\nHook Preview: Hook for {topic}"
+
+    monkeypatch.setattr(batch_orchestrator, '_execute_single_post', fake_post)
+    yield calls
+    for registry in (batch_orchestrator._batch_plans, batch_orchestrator._context_managers,
+                     batch_orchestrator._batch_runs):
+        registry.clear()
+
+
+class TestRunPlan:
+
+    def test_single_call_runs_every_post(self, executed):
+        slack = Mock()
+        plan = make_plan(3, slack)
+
+        summary = asyncio.run(run_plan(plan['id']))
+
+        assert executed == ['Topic 0', 'Topic 1', 'Topic 2']
+        assert (summary['completed'], summary['failed'], summary['total']) == (2, 1, 3)
+        assert summary['success'] is False
+        assert [p['index'] for p in summary['posts']] == [0, 1, 2]
+        assert 'validator crashed' in summary['posts'][1]['error']
+        assert summary['posts'][0]['hook'] == 'Hook for Topic 0'
+        # Batch start, per-post updates and the final summary all go to Slack
+        messages = [c.kwargs['text'] for c in slack.chat_postMessage.call_args_list]
+        assert messages[0].startswith("🚀 *Starting batch execution*")
+        assert messages[-1].startswith("🎉 *Batch complete!*")
+        assert get_plan_run(plan['id'])['status'] == 'complete'
+
+    def test_resume_from_start_index(self, executed):
+        plan = make_plan(3)
+
+        summary = asyncio.run(run_plan(plan['id'], start_index=2))
+
+        assert executed == ['Topic 2']
+        assert (summary['completed'], summary['total']) == (1, 1)
+
+    def test_cancel_stops_after_post_in_progress(self, executed, monkeypatch):
+        plan = make_plan(5)
+        original = batch_orchestrator.execute_single_post_from_plan
+
+        async def cancel_after_first(plan_id, post_index):
+            result = await original(plan_id, post_index)
+            if post_index == 0:
+                assert cancel_plan_run(plan_id) is True
+            return result
+
+        monkeypatch.setattr(batch_orchestrator, 'execute_single_post_from_plan', cancel_after_first)
+
+        summary = asyncio.run(run_plan(plan['id']))
+
+        assert executed == ['Topic 0']
+        assert summary['cancelled'] is True
+        assert get_plan_run(plan['id'])['status'] == 'cancelled'
+        assert cancel_plan_run(plan['id']) is False
+
+    def test_interrupted_run_can_be_resumed(self, executed, monkeypatch):
+        plan = make_plan(2)
+        original = batch_orchestrator.execute_single_post_from_plan
+
+        async def session_cancelled(plan_id, post_index):
+            raise asyncio.CancelledError()
+
+        monkeypatch.setattr(batch_orchestrator, 'execute_single_post_from_plan', session_cancelled)
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run_plan(plan['id']))
+        assert get_plan_run(plan['id'])['status'] == 'cancelled'
+
+        monkeypatch.setattr(batch_orchestrator, 'execute_single_post_from_plan', original)
+        summary = asyncio.run(run_plan(plan['id'], start_index=0))
+
+        assert executed == ['Topic 0', 'Topic 1']
+        assert (summary['completed'], summary['failed'], summary['total']) == (1, 1, 2)
+        assert get_plan_run(plan['id'])['status'] == 'complete'
+
+    def test_unknown_or_running_plan_rejected(self, executed):
+        plan = make_plan(2)
+        batch_orchestrator._batch_runs[plan['id']] = {'status': 'running', 'completed': 1, 'failed': 0, 'total': 2}
+
+        assert asyncio.run(run_plan('batch_missing'))['error'] == "Plan batch_missing not found"
+        assert 'already running' in asyncio.run(run_plan(plan['id']))['error']
+        assert executed == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,133 @@
+"""
+Unit tests for the named circuit breaker registry (utils/circuit_breaker.py)
+Tests shared per-dependency breakers, outage classification, /readyz state, and batch fast-fail
+"""
+import pytest
+import sys
+import time
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents import batch_orchestrator
+from agents.batch_orchestrator import create_batch_plan, execute_single_post_from_plan
+from utils import circuit_breaker
+from utils.circuit_breaker import (
+    DEPENDENCY_BREAKERS, CircuitBreakerOpen, CircuitState, get_breaker, get_breaker_states, is_outage
+)
+from utils.deadline import DeadlineExceeded
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code)
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    circuit_breaker._breakers.clear()
+    yield
+    circuit_breaker._breakers.clear()
+
+
+def failing(status_code):
+    def call():
+        raise HTTPError(status_code)
+    return call
+
+
+class TestBreakerRegistry:
+
+    def test_one_breaker_per_dependency(self):
+        assert get_breaker('tavily') is get_breaker('tavily')
+
+        states = get_breaker_states()
+
+        assert set(DEPENDENCY_BREAKERS) <= set(states)
+        assert states['gptzero']['state'] == 'closed'
+        assert states['gptzero']['retry_after'] == 0.0
+
+    def test_client_errors_dont_open_the_circuit(self):
+        assert is_outage(HTTPError(503)) and is_outage(HTTPError(429)) and is_outage(TimeoutError())
+        assert not is_outage(HTTPError(422))
+
+        breaker = get_breaker('airtable')
+        for _ in range(5):
+            with pytest.raises(HTTPError):
+                breaker.call(failing(422))
+        assert breaker.state == CircuitState.CLOSED
+
+        for _ in range(3):
+            with pytest.raises(HTTPError):
+                breaker.call(failing(502))
+        assert breaker.state == CircuitState.OPEN
+        assert 119 < breaker.retry_after() <= 120
+
+        # Open: rejected without calling the dependency
+        calls = []
+        with pytest.raises(CircuitBreakerOpen):
+            breaker.call(lambda: calls.append('called'))
+        assert calls == []
+        assert get_breaker_states()['airtable']['state'] == 'open'
+
+    def test_agent_failures_recorded_as_outages_only(self):
+        breaker = get_breaker('linkedin_direct_api_agent', failure_threshold=3, recovery_timeout=120.0)
+
+        # What the agents' create_post failure path records
+        assert breaker.record_failure(DeadlineExceeded("post deadline")) is False
+        assert breaker.record_failure(HTTPError(400)) is False
+        assert breaker.failure_count == 0
+
+        for _ in range(3):
+            assert breaker.record_failure(HTTPError(529)) is True
+        assert breaker.state == CircuitState.OPEN
+
+        breaker.state = CircuitState.HALF_OPEN
+        breaker.record_success()
+        assert (breaker.state, breaker.failure_count) == (CircuitState.CLOSED, 0)
+
+
+class TestBatchFastFail:
+
+    def test_post_skipped_while_agent_breaker_open(self, monkeypatch):
+        executed = []
+
+        async def fake_post(platform, topic, **kwargs):
+            executed.append(topic)
+            return "Quality Score: 20/25"
+
+        monkeypatch.setattr(batch_orchestrator, '_execute_single_post', fake_post)
+        breaker = get_breaker('linkedin_direct_api_agent')
+        breaker.state = CircuitState.OPEN
+        breaker.last_failure_time = time.time()
+
+        posts = [{'platform': 'linkedin', 'topic': 'Topic 0', 'context': 'x' * 300}]
+        plan = create_batch_plan(posts, 'breaker test', channel_id='C1', thread_ts='T1', user_id='U1')
+        try:
+            started = time.monotonic()
+            result = asyncio.run(execute_single_post_from_plan(plan['id'], 0))
+
+            assert time.monotonic() - started < 1
+            assert executed == []
+            assert result['success'] is False
+            assert "'linkedin_direct_api_agent' is open" in result['error']
+        finally:
+            for registry in (batch_orchestrator._batch_plans, batch_orchestrator._context_managers,
+                             batch_orchestrator._batch_runs, batch_orchestrator._batch_budgets):
+                registry.clear()
+
+    def test_breaker_follows_platform_alias_and_agent_path(self):
+        outline = "Thread outline:\n1. Hook\n2. Proof\n3. CTA"
+        assert batch_orchestrator._agent_breaker_name('X', 'Pricing', outline) == 'twitter_direct_api_agent'
+        assert batch_orchestrator._agent_breaker_name('newsletter', 'Pricing', outline) == 'email_direct_api_agent'
+        # Haiku fast path never goes through the Twitter agent, so its breaker doesn't gate it
+        assert batch_orchestrator._agent_breaker_name('x', 'One tweet about pricing', '') is None
+        assert batch_orchestrator._agent_breaker_name('tiktok', 'Pricing', outline) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,128 @@
+"""
+Unit tests for embedding-space clustering (utils/content_clustering.py)
+Tests embedding parsing, k-means grouping, and cluster summaries
+"""
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+np = pytest.importorskip("numpy")
+
+from utils.content_clustering import (
+    choose_k,
+    cluster_posts,
+    embeddings_matrix,
+    kmeans,
+    parse_embedding,
+)
+
+
+def _make_posts(groups, per_group=6, dim=16, seed=0):
+    """Posts whose embeddings sit around one random direction per group"""
+    rng = np.random.default_rng(seed)
+    posts = []
+    for g in range(groups):
+        center = rng.normal(size=dim)
+        for i in range(per_group):
+            emb = center + rng.normal(scale=0.05, size=dim)
+            posts.append({
+                'id': f"{g}-{i}",
+                'post_hook': f"Group {g} hook {i}",
+                'body_content': f"Body for group {g} post {i}",
+                'platform': 'linkedin' if g % 2 == 0 else 'twitter',
+                'content_type': 'story',
+                'engagement_rate': float(g * 10 + i),
+                'impressions': 1000,
+                # pgvector columns arrive as strings from PostgREST
+                'embedding': json.dumps(emb.tolist())
+            })
+    return posts
+
+
+class TestParsing:
+    """Tests for embedding normalization"""
+
+    def test_parses_pgvector_string(self):
+        assert parse_embedding("[0.1, 0.2]") == [0.1, 0.2]
+
+    def test_rejects_invalid(self):
+        assert parse_embedding("not a vector") is None
+        assert parse_embedding(None) is None
+        assert parse_embedding([]) is None
+
+    def test_matrix_skips_bad_rows_and_normalizes(self):
+        posts = [{'embedding': [3.0, 4.0]}, {'embedding': None}, {'embedding': [1.0, 0.0, 0.0]}]
+
+        matrix, kept = embeddings_matrix(posts)
+
+        assert matrix.shape == (1, 2)
+        assert matrix.dtype == np.float32
+        assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+        assert kept == [posts[0]]
+
+
+class TestKMeans:
+    """Tests for clustering behaviour"""
+
+    def test_choose_k_bounds(self):
+        assert choose_k(3) == 1
+        assert choose_k(10) == 2
+        assert choose_k(10000) == 8
+
+    def test_separates_distinct_groups(self):
+        posts = _make_posts(groups=3)
+        matrix, kept = embeddings_matrix(posts)
+
+        labels, centroids, _ = kmeans(matrix, 3)
+
+        for g in range(3):
+            group_labels = {labels[i] for i, p in enumerate(kept) if p['id'].startswith(f"{g}-")}
+            assert len(group_labels) == 1
+        assert len(set(labels.tolist())) == 3
+
+    def test_deterministic_with_seed(self):
+        matrix, _ = embeddings_matrix(_make_posts(groups=4))
+
+        first, _, _ = kmeans(matrix, 4, seed=7)
+        second, _, _ = kmeans(matrix, 4, seed=7)
+
+        assert np.array_equal(first, second)
+
+
+class TestClusterSummaries:
+    """Tests for prompt-ready cluster summaries"""
+
+    def test_summary_shape_and_ordering(self):
+        posts = _make_posts(groups=3, per_group=8)
+        top_ids = {p['id'] for p in posts if p['id'].startswith("2-")}
+
+        result = cluster_posts(posts, top_post_ids=top_ids, max_clusters=3)
+
+        assert result['clustered_posts'] == 24
+        assert result['skipped_posts'] == 0
+        clusters = result['clusters']
+        assert [c['avg_engagement'] for c in clusters] == sorted((c['avg_engagement'] for c in clusters), reverse=True)
+        assert clusters[0]['top_performers'] == 8
+        assert sum(c['size'] for c in clusters) == 24
+
+    def test_summaries_exclude_embeddings(self):
+        result = cluster_posts(_make_posts(groups=2))
+
+        serialized = json.dumps(result)
+        assert 'embedding' not in serialized
+        rep = result['clusters'][0]['representative_posts']
+        assert any(r['best_in_cluster'] for r in rep)
+
+    def test_no_embeddings(self):
+        result = cluster_posts([{'id': 1, 'embedding': None}])
+
+        assert result['clusters'] == []
+        assert result['skipped_posts'] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,174 @@
+"""
+Unit tests for the local extraction tiers in integrations/content_extractor.py
+Tests JSON schema parsing, plain-text acceptance, LLM fallthrough, and tier stats
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from integrations.content_extractor import (
+    extract_structured_content,
+    get_extraction_stats,
+    parse_structured_output,
+    reset_extraction_stats,
+)
+
+
+LINKEDIN_POST = (
+    "I fired my best client last year.\n\n"
+    "Revenue dropped 20% for two months. Then it came back 30% higher.\n\n"
+    "What's the client you'd fire tomorrow? Comment below."
+)
+
+
+class TestJsonTier:
+    """Tests for FORMAT 1 JSON schemas"""
+
+    def test_linkedin_post_text_with_metadata(self):
+        raw = json.dumps({
+            "post_text": LINKEDIN_POST,
+            "original_score": 22,
+            "validation_issues": [{"pattern": "contrast", "original": "x"}],
+            "gptzero_ai_pct": 12,
+            "gptzero_flagged_sentences": ["Then it came back 30% higher."]
+        })
+
+        result = parse_structured_output(raw, "linkedin")
+
+        assert result["body"] == LINKEDIN_POST
+        assert result["hook"] == "I fired my best client last year."
+        assert result["original_score"] == 22
+        assert result["gptzero_ai_pct"] == 12
+        assert len(result["validation_issues"]) == 1
+        assert result["metadata"]["extraction_method"] == "json"
+
+    def test_fenced_json_after_commentary_uses_last_object(self):
+        draft = json.dumps({"post_text": "Early draft that should be ignored."})
+        final = json.dumps({"post_text": LINKEDIN_POST})
+        raw = f"First pass:\n{draft}\n\nAfter fixes:\n```json\n{final}\n```"
+
+        result = parse_structured_output(raw, "linkedin")
+
+        assert result["body"] == LINKEDIN_POST
+
+    def test_twitter_tweets_list(self):
+        raw = json.dumps({"tweets": ["1/ Most hiring advice is backwards.", "2/ Here's why."], "self_score": 21})
+
+        result = parse_structured_output(raw, "twitter")
+
+        assert result["body"] == "1/ Most hiring advice is backwards.\n\n2/ Here's why."
+        assert result["hook"] == "Most hiring advice is backwards."
+        assert result["original_score"] == 21
+
+    def test_email_uses_subject_line_as_hook(self):
+        raw = json.dumps({"subject_line": "We cut 4 emails", "email_body": "Hey friend,\n\nOpen rates doubled."})
+
+        result = parse_structured_output(raw, "email")
+
+        assert result["hook"] == "We cut 4 emails"
+        assert result["body"].startswith("Hey friend")
+
+    def test_email_body_subject_line_stripped(self):
+        raw = json.dumps({"email_body": "Subject: We cut 4 emails\n\nHey friend,\n\nOpen rates doubled."})
+
+        result = parse_structured_output(raw, "email")
+
+        assert result["hook"] == "We cut 4 emails"
+        assert result["body"].startswith("Hey friend")
+
+    def test_youtube_script_and_timing_markers(self):
+        raw = json.dumps({
+            "title": "Why your onboarding leaks",
+            "script": "Most onboarding flows lose half their users on day one.",
+            "timing_markers": {"0:00-0:03": "hook"}
+        })
+
+        result = parse_structured_output(raw, "youtube")
+
+        assert result["hook"] == "Why your onboarding leaks"
+        assert result["timing_markers"] == {"0:00-0:03": "hook"}
+
+    def test_instagram_caption_appends_hashtags_and_preview(self):
+        raw = json.dumps({"caption": "A" * 300, "hashtags": ["#growth", "#saas"]})
+
+        result = parse_structured_output(raw, "instagram")
+
+        assert result["body"].endswith("#growth #saas")
+        assert len(result["hook"]) == 125
+        assert result["preview_length"] == 125
+
+    def test_unknown_schema_falls_through(self):
+        assert parse_structured_output(json.dumps({"content": LINKEDIN_POST}), "linkedin") is None
+
+
+class TestPlainTextTier:
+    """Tests for clean plain-text acceptance"""
+
+    def test_clean_post_accepted(self):
+        result = parse_structured_output(LINKEDIN_POST, "linkedin")
+
+        assert result["metadata"]["extraction_method"] == "plain_text"
+        assert result["metadata"]["has_cta"] is True
+
+    @pytest.mark.parametrize("raw", [
+        "## ✅ **FINAL LINKEDIN POST**\n\n" + LINKEDIN_POST,
+        LINKEDIN_POST + "\n\n---\nScore: 22/25",
+        "Let me extract the final version.\n\n" + LINKEDIN_POST,
+        "Draft 1:\n" + LINKEDIN_POST,
+        '{"post_text": "broken json',
+        "Too short",
+        "Here is the LinkedIn post I wrote for you after two revisions:\n\n" + LINKEDIN_POST,
+        "Perfect! The post is complete and validated.\n\n" + LINKEDIN_POST,
+        "**Post:**\n\n" + LINKEDIN_POST,
+    ])
+    def test_ambiguous_output_rejected(self, raw):
+        assert parse_structured_output(raw, "linkedin") is None
+
+    def test_email_subject_kept_out_of_body(self):
+        raw = "Subject: We cut 4 emails\nPreview: Open rates doubled\n\nHey friend,\n\n" + LINKEDIN_POST
+
+        result = parse_structured_output(raw, "email")
+
+        assert result["hook"] == "We cut 4 emails"
+        assert result["body"].startswith("Hey friend")
+        assert "Subject" not in result["body"] and "Preview" not in result["body"]
+
+
+class TestTierRouting:
+    """Tests that extract_structured_content only calls Haiku when needed"""
+
+    def test_local_parse_skips_llm_and_counts_tier(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+        reset_extraction_stats()
+
+        with patch("integrations.content_extractor._fallback_extraction") as fallback:
+            result = asyncio.run(extract_structured_content(
+                json.dumps({"post_text": LINKEDIN_POST}), "linkedin"
+            ))
+
+        fallback.assert_not_called()
+        assert result["body"] == LINKEDIN_POST
+        stats = get_extraction_stats()
+        assert stats["counts"]["json"] == 1
+        assert stats["local_pct"] == 100.0
+
+    def test_ambiguous_output_uses_fallback_without_key(self, monkeypatch):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        reset_extraction_stats()
+
+        result = asyncio.run(extract_structured_content(
+            "## FINAL POST\n\n" + LINKEDIN_POST, "linkedin"
+        ))
+
+        assert result["metadata"]["extraction_method"] == "fallback"
+        assert get_extraction_stats()["counts"]["fallback"] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,144 @@
+"""
+Unit tests for deadline propagation and hedged requests (utils/deadline.py)
+Tests nested deadlines, derived timeouts, p95 hedging and the routed grading call
+"""
+import pytest
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils import deadline as deadlines
+from utils.deadline import DeadlineExceeded, deadline, get_latency_stats, hedged_call, remaining, timeout_for
+from utils.model_routing import create_message
+
+
+@pytest.fixture(autouse=True)
+def fresh_latencies(monkeypatch):
+    monkeypatch.setattr(deadlines, 'HEDGING_ENABLED', True)
+    monkeypatch.setattr(deadlines, 'HEDGE_MIN_SAMPLES', 5)
+    monkeypatch.setattr(deadlines, 'HEDGE_MIN_DELAY_SECONDS', 0.0)
+    deadlines.reset_latency_stats()
+    yield
+    deadlines.reset_latency_stats()
+
+
+def seed(name, seconds, count=5):
+    for _ in range(count):
+        deadlines._latencies.record(name, seconds)
+
+
+class TestDeadline:
+
+    def test_nested_calls_get_remaining_budget(self):
+        assert remaining() is None
+        assert timeout_for(60.0) == 60.0
+
+        with deadline(10):
+            assert 9 < timeout_for(60.0) <= 10
+            assert timeout_for(5.0) == 5.0
+            with deadline(100):  # Can't extend the outer deadline
+                assert remaining() <= 10
+        assert remaining() is None
+
+    def test_expired_deadline_raises_and_follows_threads(self):
+        async def post():
+            with deadline(0.05):
+                inner = await asyncio.to_thread(remaining)
+                await asyncio.sleep(0.06)
+                return inner, await asyncio.to_thread(timeout_for, 30.0)
+
+        with pytest.raises(DeadlineExceeded):
+            asyncio.run(post())
+        assert issubclass(DeadlineExceeded, TimeoutError)
+
+
+class TestHedging:
+
+    def test_no_hedge_until_enough_samples(self):
+        calls = []
+        for _ in range(3):
+            assert hedged_call('search', lambda: calls.append(1) or 'ok') == 'ok'
+
+        assert len(calls) == 3
+        assert get_latency_stats()['search']['samples'] == 3
+        assert get_latency_stats()['search']['hedged'] == 0
+
+    def test_slow_primary_hedged_and_first_answer_wins(self):
+        seed('search', 0.02)
+        calls = []
+        discarded = []
+        release = threading.Event()
+
+        def search(query):
+            calls.append(query)
+            if len(calls) == 1:
+                release.wait(2)  # The primary hangs in the tail
+                return 'slow'
+            return 'fast'
+
+        started = time.monotonic()
+        result = hedged_call('search', search, 'q', on_discard=discarded.append)
+        elapsed = time.monotonic() - started
+        release.set()
+        time.sleep(0.05)
+
+        assert result == 'fast'
+        assert calls == ['q', 'q']
+        assert elapsed < 1
+        assert discarded == ['slow']
+        assert get_latency_stats()['search']['hedged'] == 1
+        assert get_latency_stats()['search']['hedge_won'] == 1
+
+    def test_error_surfaces_only_when_both_fail(self):
+        seed('search', 0.01)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            time.sleep(0.05)
+            if len(attempts) == 1:
+                raise RuntimeError("primary failed")
+            return 'ok'
+
+        assert hedged_call('search', flaky) == 'ok'
+
+        def broken():
+            time.sleep(0.05)
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            hedged_call('search', broken)
+
+
+class TestRoutedCalls:
+
+    def test_grading_timeout_capped_and_hedged(self):
+        seed('llm:grader', 0.02)
+        requests = []
+
+        def create(**params):
+            requests.append(params)
+            if len(requests) == 1:
+                time.sleep(0.3)
+            return SimpleNamespace(usage=None, content=[])
+
+        client = SimpleNamespace(messages=SimpleNamespace(create=create))
+        with deadline(5):
+            create_message(client, 'grader', messages=[])
+
+        assert len(requests) == 2
+        assert all(r['timeout'] <= 5 for r in requests)
+
+        requests.clear()
+        create_message(client, 'writer', messages=[])  # Not idempotent-listed: never hedged
+        assert len(requests) == 1 and requests[0]['timeout'] == 60.0 + 1.5 * 30  # Sized from max_tokens
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,167 @@
+"""
+Unit tests for the near-duplicate index (utils/dedup_index.py)
+Tests MinHash similarity, incremental updates, lazy loading, and config
+"""
+import pytest
+from unittest.mock import Mock, patch
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.dedup_index import (
+    NearDuplicateIndex,
+    check_near_duplicate,
+    estimate_similarity,
+    get_dedup_action,
+    get_dedup_threshold,
+    minhash_signature,
+    shingles,
+)
+
+
+BODY_A = (
+    "Most founders hire their first salesperson too early. They think revenue will follow "
+    "the hire, but without a repeatable process the new rep burns six months learning what "
+    "the founder should have documented. Write the playbook first, then hire someone to run it."
+)
+BODY_A_EDITED = BODY_A.replace("six months", "nine months")
+BODY_B = (
+    "Our onboarding emails had a 12% open rate until we cut them from seven to three. "
+    "Fewer touches, each with one clear action, doubled activation within a quarter."
+)
+
+
+def _mock_supabase(rows):
+    """Supabase client whose generated_posts query returns rows"""
+    client = Mock()
+    query = client.table.return_value.select.return_value.order.return_value.limit.return_value
+    query.execute.return_value = Mock(data=rows)
+    return client
+
+
+class TestMinHash:
+    """Tests for signature similarity estimates"""
+
+    def test_identical_text_similarity_one(self):
+        sig = minhash_signature(shingles(BODY_A))
+        assert estimate_similarity(sig, sig) == 1.0
+
+    def test_small_edit_stays_similar(self):
+        sim = estimate_similarity(
+            minhash_signature(shingles(BODY_A)),
+            minhash_signature(shingles(BODY_A_EDITED))
+        )
+        assert sim >= 0.7
+
+    def test_unrelated_text_dissimilar(self):
+        sim = estimate_similarity(
+            minhash_signature(shingles(BODY_A)),
+            minhash_signature(shingles(BODY_B))
+        )
+        assert sim < 0.2
+
+    def test_shingles_ignore_case_and_punctuation(self):
+        assert shingles("Hire SLOWLY, fire fast!") == shingles("hire slowly fire fast")
+
+
+class TestNearDuplicateIndex:
+    """Tests for index lookups, loading, and incremental updates"""
+
+    def test_loads_history_once(self):
+        supabase = _mock_supabase([
+            {'id': 1, 'platform': 'linkedin', 'post_hook': 'Hire later', 'body_content': BODY_A}
+        ])
+        index = NearDuplicateIndex(supabase_client=supabase)
+
+        index.find_similar(BODY_B, "", 'linkedin')
+        index.find_similar(BODY_B, "", 'linkedin')
+
+        assert supabase.table.call_count == 1
+        assert index.size == 1
+
+    def test_detects_historical_duplicate(self):
+        supabase = _mock_supabase([
+            {'id': 7, 'platform': 'linkedin', 'post_hook': 'Hire later', 'body_content': BODY_A}
+        ])
+        index = NearDuplicateIndex(supabase_client=supabase)
+
+        match = index.find_similar(BODY_A_EDITED, "Something new", 'linkedin', threshold=0.7)
+
+        assert match is not None
+        assert match['entry_id'] == '7'
+        assert match['matched_on'] == 'body'
+        assert match['source'] == 'generated_posts'
+
+    def test_incremental_add_covers_current_batch(self):
+        index = NearDuplicateIndex(supabase_client=_mock_supabase([]))
+        assert index.find_similar(BODY_A, "", 'twitter', threshold=0.7) is None
+
+        index.add(BODY_A, "First hook", 'twitter')
+
+        match = index.find_similar(BODY_A_EDITED, "", 'twitter', threshold=0.7)
+        assert match is not None
+        assert match['source'] == 'session'
+
+    def test_platforms_are_partitioned(self):
+        index = NearDuplicateIndex(supabase_client=_mock_supabase([]))
+        index.add(BODY_A, "", 'linkedin')
+
+        assert index.find_similar(BODY_A, "", 'twitter', threshold=0.7) is None
+
+    def test_matching_hook_flags_different_body(self):
+        hook = "I fired my best client and revenue went up"
+        index = NearDuplicateIndex(supabase_client=_mock_supabase([]))
+        index.add(BODY_A, hook, 'linkedin')
+
+        match = index.find_similar(BODY_B, hook, 'linkedin', threshold=0.7)
+        assert match is not None
+        assert match['matched_on'] == 'hook'
+
+    def test_short_generic_hooks_ignored(self):
+        index = NearDuplicateIndex(supabase_client=_mock_supabase([]))
+        index.add(BODY_A, "Hot take", 'linkedin')
+
+        assert index.find_similar(BODY_B, "Hot take", 'linkedin', threshold=0.7) is None
+
+    def test_load_failure_starts_empty(self):
+        supabase = Mock()
+        supabase.table.side_effect = Exception("connection refused")
+        index = NearDuplicateIndex(supabase_client=supabase)
+
+        assert index.find_similar(BODY_A, "", 'linkedin') is None
+        index.add(BODY_A, "", 'linkedin')
+        assert index.find_similar(BODY_A, "", 'linkedin') is not None
+
+
+class TestConfig:
+    """Tests for env-driven threshold/action and the check helper"""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv('DEDUP_SIMILARITY_THRESHOLD', raising=False)
+        monkeypatch.delenv('DEDUP_ACTION', raising=False)
+        assert get_dedup_threshold() == 0.7
+        assert get_dedup_action() == 'warn'
+
+    def test_invalid_action_falls_back_to_warn(self, monkeypatch):
+        monkeypatch.setenv('DEDUP_ACTION', 'delete')
+        assert get_dedup_action() == 'warn'
+
+    def test_check_attaches_action(self, monkeypatch):
+        monkeypatch.setenv('DEDUP_ACTION', 'regenerate')
+        index = NearDuplicateIndex(supabase_client=_mock_supabase([]))
+        index.add(BODY_A, "", 'email')
+
+        with patch('utils.dedup_index.get_dedup_index', return_value=index):
+            match = check_near_duplicate(BODY_A, "", 'email')
+
+        assert match['action'] == 'regenerate'
+
+    def test_check_disabled(self, monkeypatch):
+        monkeypatch.setenv('DEDUP_ENABLED', 'false')
+        assert check_near_duplicate(BODY_A, "", 'email') is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,113 @@
+"""
+Unit tests for the few-shot pack store (tools/example_packs.py)
+Tests caching, version-based refresh, max-age fallback, and error handling
+"""
+import pytest
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tools.example_packs import FewShotPackStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _versioned_client(versions):
+    """Client whose version query returns successive (count, updated_at) pairs"""
+    client = Mock()
+    query = client.table.return_value.select.return_value.order.return_value.limit.return_value
+    query.execute.side_effect = [
+        Mock(data=[{'updated_at': updated}], count=count) for count, updated in versions
+    ]
+    return client
+
+
+class TestFewShotPackStore:
+    """Tests for pack caching and invalidation"""
+
+    def test_builds_once_while_version_unchanged(self):
+        clock = FakeClock()
+        store = FewShotPackStore(version_check_seconds=0, clock=clock)
+        client = _versioned_client([(3, '2025-01-01'), (3, '2025-01-01')])
+        builder = Mock(return_value="Example 1:\nHook")
+
+        first = store.get(('email_prompt', 'Email_Value', 3), 'content_examples', builder, client)
+        second = store.get(('email_prompt', 'Email_Value', 3), 'content_examples', builder, client)
+
+        assert builder.call_count == 1
+        assert first is second
+        assert store.stats['hits'] == 1
+
+    def test_rebuilds_when_source_changes(self):
+        store = FewShotPackStore(version_check_seconds=0, clock=FakeClock())
+        client = _versioned_client([(3, '2025-01-01'), (4, '2025-02-01')])
+        builder = Mock(side_effect=["v1", "v2"])
+
+        assert store.get('k', 'content_examples', builder, client) == "v1"
+        assert store.get('k', 'content_examples', builder, client) == "v2"
+
+    def test_version_check_is_throttled(self):
+        clock = FakeClock()
+        store = FewShotPackStore(version_check_seconds=300, clock=clock)
+        client = _versioned_client([(3, 'a'), (4, 'b')])
+        builder = Mock(side_effect=["v1", "v2"])
+
+        store.get('k', 'content_examples', builder, client)
+        clock.now = 100
+        assert store.get('k', 'content_examples', builder, client) == "v1"
+        clock.now = 400
+        assert store.get('k', 'content_examples', builder, client) == "v2"
+        assert store.stats['version_checks'] == 2
+
+    def test_unversioned_table_uses_max_age(self):
+        clock = FakeClock()
+        store = FewShotPackStore(version_check_seconds=0, max_age_seconds=60, clock=clock)
+        client = Mock()
+        client.table.side_effect = Exception("column updated_at does not exist")
+        builder = Mock(side_effect=["v1", "v2"])
+
+        store.get('k', 'proven_copy_examples', builder, client)
+        clock.now = 30
+        assert store.get('k', 'proven_copy_examples', builder, client) == "v1"
+        clock.now = 90
+        assert store.get('k', 'proven_copy_examples', builder, client) == "v2"
+
+    def test_identical_rebuild_keeps_same_object(self):
+        store = FewShotPackStore(version_check_seconds=0, clock=FakeClock())
+        client = _versioned_client([(3, 'a'), (3, 'b')])
+
+        first = store.get('k', 't', lambda: ''.join(["same ", "text"]), client)
+        second = store.get('k', 't', lambda: ''.join(["same ", "text"]), client)
+
+        assert first is second
+
+    def test_builder_errors_not_cached(self):
+        store = FewShotPackStore(version_check_seconds=0, clock=FakeClock())
+        client = _versioned_client([(1, 'a'), (1, 'a')])
+        builder = Mock(side_effect=[Exception("timeout"), "ok"])
+
+        with pytest.raises(Exception):
+            store.get('k', 't', builder, client)
+        assert store.get('k', 't', builder, client) == "ok"
+
+    def test_invalidate_forces_rebuild(self):
+        store = FewShotPackStore(version_check_seconds=300, clock=FakeClock())
+        client = _versioned_client([(1, 'a'), (1, 'a')])
+        builder = Mock(side_effect=["v1", "v2"])
+
+        store.get('k', 't', builder, client)
+        store.invalidate()
+        assert store.get('k', 't', builder, client) == "v2"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
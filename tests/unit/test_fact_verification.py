@@ -0,0 +1,149 @@
+"""
+Unit tests for the fact verification engine (utils/fact_verification.py)
+Tests claim normalization, verdict caching, batching, and concurrency
+"""
+import pytest
+import asyncio
+import json
+import time
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.fact_verification import FactCache, FactVerifier, normalize_claim
+
+
+def _anthropic_returning(verdicts):
+    client = Mock()
+    client.messages.create.return_value = Mock(
+        content=[Mock(text=json.dumps({'verdicts': verdicts}))]
+    )
+    return client
+
+
+def _search(claim):
+    return {'answer': f'answer for {claim}', 'results': [{'url': 'https://example.com', 'content': claim}]}
+
+
+async def _no_kb(claim):
+    return ""
+
+
+def _claims(*texts, claim_type='external'):
+    return [{'claim': t, 'type': claim_type, 'needs_verification': True} for t in texts]
+
+
+class TestNormalization:
+
+    def test_equivalent_claims_share_key(self):
+        assert normalize_claim('  “73% of B2B buyers”  ') == normalize_claim('73%   of b2b BUYERS.')
+
+
+class TestFactCache:
+
+    def test_expires_after_ttl(self):
+        now = [0.0]
+        cache = FactCache(ttl_seconds=10, clock=lambda: now[0])
+        cache.set('claim', {'fact': {}, 'issue': None})
+
+        assert cache.get('Claim') is not None
+        now[0] = 11
+        assert cache.get('claim') is None
+
+    def test_evicts_oldest(self):
+        cache = FactCache(max_entries=2)
+        for claim in ('a', 'b', 'c'):
+            cache.set(claim, {'fact': {}, 'issue': None})
+
+        assert cache.get('a') is None
+        assert len(cache) == 2
+
+
+class TestFactVerifier:
+
+    def test_single_batched_verification_call(self):
+        client = _anthropic_returning([
+            {'index': 1, 'verified': True},
+            {'index': 2, 'verified': False, 'explanation': 'No source'},
+            {'index': 3, 'verified': True},
+        ])
+        verifier = FactVerifier(client, _search, _no_kb, cache=FactCache())
+
+        issues, facts = asyncio.run(verifier.verify(_claims('stat one', 'stat two', 'stat three')))
+
+        assert client.messages.create.call_count == 1
+        assert [f['claim'] for f in facts] == ['stat one', 'stat two', 'stat three']
+        assert [i['code'] for i in issues] == ['claim_unverified']
+        assert facts[0]['sources'] == ['https://example.com']
+
+    def test_cached_verdicts_skip_search_and_llm(self):
+        client = _anthropic_returning([{'index': 1, 'verified': True}])
+        search = Mock(side_effect=_search)
+        verifier = FactVerifier(client, search, _no_kb, cache=FactCache())
+
+        asyncio.run(verifier.verify(_claims('Revenue grew 40%')))
+        issues, facts = asyncio.run(verifier.verify(_claims('revenue grew 40%.')))
+
+        assert search.call_count == 1
+        assert client.messages.create.call_count == 1
+        assert facts[0]['verified'] is True
+
+    def test_searches_run_concurrently(self):
+        def slow_search(claim):
+            time.sleep(0.2)
+            return _search(claim)
+
+        client = _anthropic_returning([{'index': i, 'verified': True} for i in range(1, 7)])
+        verifier = FactVerifier(client, slow_search, _no_kb, cache=FactCache(), max_concurrency=6)
+
+        start = time.perf_counter()
+        _, facts = asyncio.run(verifier.verify(_claims(*[f'stat {i}' for i in range(6)])))
+
+        assert len(facts) == 6
+        assert time.perf_counter() - start < 0.8
+
+    def test_failed_lookups_and_missing_verdicts_not_cached(self):
+        client = _anthropic_returning([{'index': 1, 'verified': True}])
+        cache = FactCache()
+
+        def flaky_search(claim):
+            if claim == 'down':
+                raise Exception('timeout')
+            return _search(claim)
+
+        verifier = FactVerifier(client, flaky_search, _no_kb, cache=cache)
+        _, facts = asyncio.run(verifier.verify(_claims('up', 'down', 'ignored')))
+
+        assert [f['claim'] for f in facts] == ['up']
+        assert cache.get('down') is None
+        assert cache.get('ignored') is None
+
+    def test_internal_claims_use_knowledge_base(self):
+        client = _anthropic_returning([])
+
+        async def kb(claim):
+            return "Case study doc" if 'Acme' in claim else ""
+
+        verifier = FactVerifier(client, _search, kb, cache=FactCache())
+        issues, facts = asyncio.run(verifier.verify(
+            _claims('We helped Acme double leads', 'We helped Initech', claim_type='internal')
+        ))
+
+        client.messages.create.assert_not_called()
+        assert facts[0]['sources'] == ['Knowledge Base']
+        assert [i['code'] for i in issues] == ['claim_unverified_internal']
+
+    def test_skips_claims_not_needing_verification(self):
+        client = _anthropic_returning([])
+        verifier = FactVerifier(client, _search, _no_kb, cache=FactCache())
+
+        issues, facts = asyncio.run(verifier.verify([{'claim': 'opinion', 'needs_verification': False}]))
+
+        assert issues == [] and facts == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,195 @@
+"""
+Unit tests for the model routing policy (utils/model_routing.py)
+Tests stage/platform/mode resolution, batch budget downgrades, and usage accounting
+"""
+import pytest
+import sys
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.model_routing import (
+    BatchBudget,
+    FAST_MODEL,
+    SONNET_3_7,
+    SONNET_4,
+    STAGE_ROUTES,
+    collect_decisions,
+    create_message,
+    get_routing_stats,
+    reset_routing_stats,
+    route_model,
+    use_budget,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_routing_stats()
+    yield
+    reset_routing_stats()
+
+
+def _response(input_tokens=100, output_tokens=50):
+    return Mock(usage=Mock(input_tokens=input_tokens, output_tokens=output_tokens))
+
+
+class TestRouteResolution:
+
+    def test_stage_defaults(self):
+        route = route_model('writer', platform='linkedin')
+
+        assert route.model == SONNET_3_7
+        assert route.max_tokens == 1500
+        assert route.downgraded is False
+
+    def test_platform_and_mode_overrides(self):
+        assert route_model('agentic_loop', platform='email').max_tokens == 8000
+        assert route_model('agentic_loop', platform='twitter').max_tokens == 4096
+        assert route_model('agent_loop', mode='thinking').timeout == route_model('agent_loop').timeout + 30.0
+
+    def test_timeout_sized_from_max_tokens(self):
+        # Floor + 30s per 1k output tokens, never past the SDK's 600s default
+        assert route_model('grader').timeout == 30.0 + 0.8 * 30
+        assert route_model('briefing').timeout == 60.0 + 4 * 30
+        assert route_model('cmo_agent').timeout == 120.0 + 8 * 30
+        assert route_model('agentic_loop', platform='email').timeout == 60.0 + 8 * 30
+        assert all(route_model(stage).timeout <= 600.0 for stage in STAGE_ROUTES)
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv('MODEL_ROUTE_GRADER', 'claude-test-model')
+
+        assert route_model('grader').model == 'claude-test-model'
+
+    def test_unknown_stage_raises(self):
+        with pytest.raises(KeyError):
+            route_model('not_a_stage')
+
+    def test_mode_defaults_to_batch_inside_budget(self):
+        with use_budget(BatchBudget(total_items=3)):
+            route_model('grader')
+        route_model('grader')
+
+        modes = [d['mode'] for d in get_routing_stats()['recent']]
+        assert modes == ['batch', 'interactive']
+
+
+class TestBatchBudget:
+
+    def test_on_schedule_keeps_models(self):
+        budget = BatchBudget(total_items=4, latency_budget_s=400, token_budget=10_000)
+
+        with use_budget(budget):
+            assert route_model('contrast_check').model == SONNET_4
+
+    def test_over_token_budget_downgrades_non_critical_only(self):
+        budget = BatchBudget(total_items=4, latency_budget_s=400, token_budget=10_000)
+        budget.add_tokens(3000)  # first post's share is 2500
+
+        with use_budget(budget):
+            contrast = route_model('contrast_check')
+            grader = route_model('grader')
+
+        assert budget.behind_schedule() == 'tokens'
+        assert contrast.model == FAST_MODEL and contrast.downgraded
+        assert grader.model == SONNET_4 and not grader.downgraded
+        assert budget.summary()['downgrades'] == {'contrast_check': 1}
+        assert get_routing_stats()['downgrades'] == 1
+
+    def test_finished_items_extend_allowance(self):
+        budget = BatchBudget(total_items=4, latency_budget_s=400, token_budget=10_000)
+        budget.add_tokens(3000)
+        budget.item_done()
+
+        assert budget.behind_schedule() is None
+
+    def test_over_latency_budget(self):
+        budget = BatchBudget(total_items=2, latency_budget_s=10)
+        budget.started_at -= 6  # first post's share is 5s
+
+        assert budget.behind_schedule() == 'latency'
+
+
+class TestCreateMessage:
+
+    def test_routes_and_records_usage(self):
+        client = Mock()
+        client.messages.create.return_value = _response(100, 50)
+        budget = BatchBudget(total_items=1)
+
+        with use_budget(budget):
+            create_message(client, 'claim_extraction', platform='twitter', temperature=0, messages=[])
+
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs['model'] == SONNET_4
+        assert kwargs['max_tokens'] == 500
+        assert kwargs['temperature'] == 0
+        assert budget.tokens_used == 150
+        assert get_routing_stats()['output_tokens'] == 50
+
+    def test_explicit_max_tokens_wins(self):
+        client = Mock()
+        client.messages.create.return_value = _response()
+
+        create_message(client, 'fact_verification', max_tokens=600, messages=[])
+
+        assert client.messages.create.call_args.kwargs['max_tokens'] == 600
+
+    def test_budget_visible_in_worker_threads(self):
+        client = Mock()
+        client.messages.create.return_value = _response(10, 10)
+        budget = BatchBudget(total_items=1)
+
+        async def run():
+            with use_budget(budget):
+                await asyncio.to_thread(create_message, client, 'grader', messages=[])
+
+        asyncio.run(run())
+        assert budget.tokens_used == 20
+
+
+class TestCollectDecisions:
+
+    def test_concurrent_workflows_only_see_their_own_decisions(self):
+        async def workflow(stages):
+            with collect_decisions() as decisions:
+                for stage in stages:
+                    await asyncio.to_thread(route_model, stage, 'linkedin')
+                    await asyncio.sleep(0)
+                return [d['stage'] for d in decisions]
+
+        async def run():
+            return await asyncio.gather(
+                workflow(['writer', 'grader', 'reviser']),
+                workflow(['writer', 'contrast_check'])
+            )
+
+        first, second = asyncio.run(run())
+
+        assert first == ['writer', 'grader', 'reviser']
+        assert second == ['writer', 'contrast_check']
+
+    def test_downgrades_counted_under_lock_from_threads(self):
+        budget = BatchBudget(total_items=4, latency_budget_s=400, token_budget=10)
+        budget.add_tokens(100)
+
+        def route_many():
+            with use_budget(budget):
+                for _ in range(200):
+                    route_model('contrast_check')
+
+        threads = [threading.Thread(target=route_many) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert budget.summary()['downgrades'] == {'contrast_check': 800}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,104 @@
+"""
+Unit tests for stacked prompt budgets (utils/prompt_budget.py)
+Tests token counting with cache/offline fallback, cross-section rule dedupe, and budget checks
+"""
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from integrations import prompt_loader
+from utils.prompt_budget import TokenCounter, check_budget, dedupe_rules, platform_budget
+
+
+class FakeMessages:
+    """count_tokens: 1 token per 4 chars of system prompt + 10 tokens of message overhead"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def count_tokens(self, model, messages, system=None):
+        self.calls += 1
+        return SimpleNamespace(input_tokens=10 + len(system or '') // 4)
+
+
+class TestTokenCounter:
+
+    def test_api_count_cached_and_reused_offline(self, tmp_path):
+        messages = FakeMessages()
+        cache = tmp_path / 'tokens.json'
+        counter = TokenCounter(model='m', cache_path=cache, client_factory=lambda: SimpleNamespace(messages=messages))
+
+        assert counter.count('x' * 400) == (100, 'api')
+        assert counter.count('x' * 400) == (100, 'cache')
+        counter.save()
+
+        offline = TokenCounter(model='m', cache_path=cache, offline=True)
+        assert offline.count('x' * 400) == (100, 'cache')
+        # Unseen text is estimated from the calibrated 4 chars/token
+        assert offline.count('y' * 800) == (200, 'estimate')
+
+    def test_api_failure_falls_back_to_estimate(self, tmp_path):
+        def broken():
+            raise ConnectionError("no network")
+
+        counter = TokenCounter(model='m', cache_path=tmp_path / 'tokens.json', client_factory=broken)
+
+        tokens, source = counter.count('x' * 350)
+        assert source == 'estimate'
+        assert tokens == 100
+        assert counter.offline is True
+
+
+class TestDedupeRules:
+
+    def test_repeated_rule_dropped_and_fuller_wording_kept_first(self):
+        sections = [
+            ('WRITING_RULES', "## Voice\n- Use contractions heavily: \"I'm\", \"that's\", \"won't\", \"we've\"\n- Vary sentence length a lot"),
+            ('EDITOR_STANDARDS', "- Use contractions heavily: \"I'm\", \"that's\", \"won't\"\n- Never open with a question to the reader"),
+            ('LINKEDIN_CREATE_DRAFT', "## Voice\n- Never open with a question to the reader, ever again\n- Keep it under 1300 characters"),
+        ]
+
+        deduped, merges = dedupe_rules(sections)
+        text = dict(deduped)
+
+        assert 'Use contractions' not in text['EDITOR_STANDARDS']
+        # The fuller create_draft wording replaces the editor rule in place
+        assert "- Never open with a question to the reader, ever again" in text['EDITOR_STANDARDS']
+        assert 'question' not in text['LINKEDIN_CREATE_DRAFT']
+        # Headings and distinct rules are untouched
+        assert text['LINKEDIN_CREATE_DRAFT'] == "## Voice\n- Keep it under 1300 characters"
+        assert len(merges) == 2
+
+    def test_default_prompts_dedupe_only_shrinks(self, monkeypatch):
+        monkeypatch.setattr(prompt_loader, '_load_client_context', lambda: None)
+
+        for platform in ('linkedin', 'twitter', 'email'):
+            raw = prompt_loader.stack_prompts(platform, dedupe=False)
+            deduped = prompt_loader.stack_prompts(platform, dedupe=True)
+            assert len(deduped) <= len(raw)
+            assert deduped.endswith("following all stacked rules.\n")
+            assert f"# {platform.upper()} CONTENT CREATION" in deduped
+
+
+class TestBudget:
+
+    def test_platform_budget_env_override(self, monkeypatch):
+        monkeypatch.setenv('PROMPT_TOKEN_BUDGET_LINKEDIN', '100')
+        assert platform_budget('linkedin') == 100
+
+    def test_over_budget_flagged(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('PROMPT_TOKEN_BUDGET_TWITTER', '50')
+        counter = TokenCounter(model='m', cache_path=tmp_path / 'tokens.json', offline=True)
+
+        result = check_budget('twitter', 'x' * 700, counter)
+
+        assert result['over_budget'] is True
+        assert (result['tokens'], result['budget']) == (200, 50)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,172 @@
+"""
+Unit tests for prompt cache layout (utils/prompt_cache.py)
+Tests breakpoint placement, usage aggregation, and the hit rate of a simulated tool loop
+"""
+import pytest
+import sys
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.prompt_cache import (
+    CacheUsage,
+    cached_system,
+    cached_tools,
+    get_cache_stats,
+    record_agent_cache_usage,
+    reset_cache_stats,
+    with_history_breakpoint,
+)
+
+
+TOOLS = [
+    {"name": f"tool_{i}", "description": "x" * 400, "input_schema": {"type": "object"}}
+    for i in range(6)
+]
+SYSTEM = "Writing rules. " * 2000
+
+
+class PrefixCachingClient:
+    """
+    Fake messages API with prefix caching: a request reads the longest
+    previously written prefix ending at any block boundary (the API looks
+    back from each breakpoint) and writes a new entry at each breakpoint.
+    Tokens are approximated as characters / 4.
+    """
+
+    def __init__(self):
+        self.cached_prefixes = set()
+        self.messages = SimpleNamespace(create=self.create)
+
+    def create(self, tools, system, messages, **kwargs):
+        blocks = list(tools) + list(system)
+        for message in messages:
+            content = message["content"]
+            blocks.extend(content if isinstance(content, list) else [{"text": content}])
+
+        prefix = ""
+        boundaries = []
+        breakpoints = []
+        for block in blocks:
+            prefix += json.dumps({k: v for k, v in block.items() if k != "cache_control"})
+            boundaries.append(prefix)
+            if "cache_control" in block:
+                breakpoints.append(prefix)
+
+        read = max((len(p) for p in boundaries if p in self.cached_prefixes), default=0)
+        written = 0
+        for p in breakpoints:
+            if p not in self.cached_prefixes and len(p) > read:
+                written = len(p) - read
+                self.cached_prefixes.add(p)
+
+        usage = SimpleNamespace(
+            input_tokens=(len(prefix) - read - written) // 4,
+            cache_read_input_tokens=read // 4,
+            cache_creation_input_tokens=written // 4,
+            output_tokens=200,
+        )
+        return SimpleNamespace(usage=usage)
+
+
+def run_tool_loop(client, iterations, layout=True, topic="pipeline reviews"):
+    usage = CacheUsage()
+    messages = [{"role": "user", "content": f"Create a LinkedIn post about {topic}."}]
+    for i in range(iterations):
+        if layout:
+            request = dict(system=cached_system(SYSTEM), tools=cached_tools(TOOLS),
+                           messages=with_history_breakpoint(messages))
+        else:
+            request = dict(system=[{"type": "text", "text": SYSTEM, "cache_control": {"type": "ephemeral"}}],
+                           tools=TOOLS, messages=messages)
+        usage.add(client.messages.create(**request))
+        messages.append({"role": "assistant", "content": [{"type": "text", "text": f"calling tool {i}"}]})
+        messages.append({"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": f"t{i}", "content": "result " * 300}
+        ]})
+    return usage
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_cache_stats()
+    yield
+    reset_cache_stats()
+
+
+class TestLayout:
+
+    def test_breakpoint_on_last_tool_only(self):
+        tools = cached_tools(TOOLS)
+
+        assert "cache_control" in tools[-1]
+        assert all("cache_control" not in t for t in tools[:-1])
+        assert all("cache_control" not in t for t in TOOLS)
+
+    def test_string_turn_becomes_cached_block(self):
+        messages = [{"role": "user", "content": "hello"}]
+
+        laid_out = with_history_breakpoint(messages)
+
+        assert laid_out[-1]["content"] == [{"type": "text", "text": "hello", "cache_control": {"type": "ephemeral"}}]
+        assert messages[-1]["content"] == "hello"
+
+    def test_tool_results_get_breakpoint_on_last_result(self):
+        results = [{"type": "tool_result", "tool_use_id": "a", "content": "1"},
+                   {"type": "tool_result", "tool_use_id": "b", "content": "2"}]
+        messages = [{"role": "user", "content": "go"}, {"role": "user", "content": results}]
+
+        laid_out = with_history_breakpoint(messages)
+
+        assert "cache_control" in laid_out[-1]["content"][-1]
+        assert "cache_control" not in laid_out[-1]["content"][0]
+        assert "cache_control" not in results[-1]
+        assert laid_out[0] is messages[0]
+
+
+class TestUsage:
+
+    def test_missing_cache_fields_count_as_zero(self):
+        usage = CacheUsage()
+        usage.add(SimpleNamespace(usage=SimpleNamespace(input_tokens=100, output_tokens=10)))
+
+        assert usage.summary()["prompt_tokens"] == 100
+        assert usage.hit_rate == 0.0
+
+    def test_agent_totals_recorded_once(self):
+        usage = CacheUsage()
+        usage.add(SimpleNamespace(usage=SimpleNamespace(
+            input_tokens=100, output_tokens=10, cache_read_input_tokens=300, cache_creation_input_tokens=0
+        )))
+
+        record_agent_cache_usage("linkedin", usage)
+        record_agent_cache_usage("linkedin", usage)
+
+        stats = get_cache_stats()["linkedin"]
+        assert stats["calls"] == 1
+        assert stats["cache_hit_rate"] == 0.75
+
+
+class TestToolLoopHitRate:
+
+    def test_ten_iteration_loop_is_mostly_cache_reads(self):
+        client = PrefixCachingClient()
+        run_tool_loop(client, 10)  # first post writes tools + system
+
+        usage = run_tool_loop(client, 10, topic="hiring your first AE")
+
+        assert usage.hit_rate > 0.9
+
+    def test_history_breakpoint_beats_system_only_caching(self):
+        with_layout = run_tool_loop(PrefixCachingClient(), 10)
+        system_only = run_tool_loop(PrefixCachingClient(), 10, layout=False)
+
+        assert with_layout.hit_rate > system_only.hit_rate
+        assert with_layout.input_tokens < system_only.input_tokens / 5
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,159 @@
+"""
+Unit tests for RAG prefetch (utils/rag_prefetch.py)
+Tests background warm-up, near-match lookups, in-flight waits and error fallback
+"""
+import pytest
+import sys
+import json
+import asyncio
+import threading
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import utils.rag_prefetch as rag_prefetch
+from utils.rag_prefetch import (
+    PlanPrefetch,
+    clear_plan_prefetch,
+    lookup_prefetched,
+    post_searches,
+    start_plan_prefetch,
+    use_prefetch,
+)
+
+
+class FakeSearch:
+    """Records calls; optionally blocks until released"""
+
+    def __init__(self, payload=None, gate=None):
+        self.calls = []
+        self.payload = payload
+        self.gate = gate
+
+    def __call__(self, query, **params):
+        if self.gate:
+            self.gate.wait(5)
+        self.calls.append((query, params))
+        return self.payload or json.dumps({'success': True, 'query': query, 'matches': [query]})
+
+
+def search_functions(search):
+    return {'company_documents': search, 'content_examples': search, 'web_search': search}
+
+
+POSTS = [
+    {'platform': 'linkedin', 'topic': 'AI agents replacing SDR workflows'},
+    {'platform': 'twitter', 'topic': 'Pipeline reviews that actually work'},
+]
+
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setattr(rag_prefetch, 'PREFETCH_ENABLED', True)
+    monkeypatch.setattr(rag_prefetch, 'PREFETCH_RESEARCH', False)
+    yield
+    for plan_id in list(rag_prefetch._plan_prefetches):
+        rag_prefetch._plan_prefetches.pop(plan_id).cancel()
+
+
+class TestPlanning:
+
+    def test_searches_per_post(self):
+        linkedin, twitter = (post_searches(p) for p in POSTS)
+
+        assert [kind for kind, _, _ in linkedin] == ['company_documents', 'company_documents']
+        assert linkedin[1][1] == 'AI agents replacing SDR workflows case study metrics ROI testimonial'
+        assert twitter[-1] == ('content_examples', POSTS[1]['topic'], {'platform': 'Twitter', 'match_count': 5})
+
+    def test_no_prefetch_outside_event_loop(self):
+        assert start_plan_prefetch('batch_sync', POSTS, search_functions=search_functions(FakeSearch())) is None
+
+
+class TestLookup:
+
+    def test_prefetched_results_served_without_live_search(self):
+        search = FakeSearch()
+
+        async def scenario():
+            start_plan_prefetch('batch_1', POSTS, search_functions=search_functions(search))
+            await asyncio.sleep(0.05)  # user reviewing the plan
+            calls_before = len(search.calls)
+            with use_prefetch('batch_1'):
+                exact = await lookup_prefetched(
+                    'company_documents', 'AI agents replacing SDR workflows', match_count=3, document_type=None
+                )
+                near = await lookup_prefetched(
+                    'company_documents', 'AI agents replacing SDR workflow', match_count=3, document_type=None
+                )
+            return calls_before, exact, near
+
+        calls_before, exact, near = asyncio.run(scenario())
+
+        assert calls_before == 5
+        assert len(search.calls) == 5
+        assert json.loads(exact)['query'] == 'AI agents replacing SDR workflows'
+        assert near == exact
+
+    def test_different_params_or_topic_miss(self):
+        async def scenario():
+            start_plan_prefetch('batch_2', POSTS, search_functions=search_functions(FakeSearch()))
+            with use_prefetch('batch_2'):
+                other_count = await lookup_prefetched(
+                    'company_documents', 'AI agents replacing SDR workflows', match_count=5, document_type=None
+                )
+                other_topic = await lookup_prefetched(
+                    'company_documents', 'Hiring your first AE', match_count=3, document_type=None
+                )
+            return other_count, other_topic
+
+        assert asyncio.run(scenario()) == (None, None)
+
+    def test_in_flight_search_is_awaited_not_repeated(self):
+        gate = threading.Event()
+        search = FakeSearch(gate=gate)
+
+        async def scenario():
+            prefetch = PlanPrefetch('batch_3')
+            prefetch.start('web_search', search, 'state of outbound 2025', max_results=10)
+            asyncio.get_running_loop().call_later(0.05, gate.set)
+            result = await prefetch.get('web_search', 'state of outbound 2025', max_results=10)
+            return prefetch, result
+
+        prefetch, result = asyncio.run(scenario())
+
+        assert result is not None
+        assert len(search.calls) == 1
+        assert prefetch.stats['waited'] == 1
+
+    def test_failed_search_falls_back(self):
+        search = FakeSearch(payload=json.dumps({'error': 'supabase timeout'}))
+
+        async def scenario():
+            start_plan_prefetch('batch_4', POSTS[:1], search_functions=search_functions(search))
+            with use_prefetch('batch_4'):
+                return await lookup_prefetched(
+                    'company_documents', POSTS[0]['topic'], match_count=3, document_type=None
+                )
+
+        assert asyncio.run(scenario()) is None
+
+    def test_clear_returns_summary_and_unbinds(self):
+        async def scenario():
+            start_plan_prefetch('batch_5', POSTS, search_functions=search_functions(FakeSearch()))
+            await asyncio.sleep(0.05)
+            summary = clear_plan_prefetch('batch_5')
+            with use_prefetch('batch_5'):
+                result = await lookup_prefetched(
+                    'company_documents', POSTS[0]['topic'], match_count=3, document_type=None
+                )
+            return summary, result
+
+        summary, result = asyncio.run(scenario())
+
+        assert summary['searches'] == 5
+        assert result is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
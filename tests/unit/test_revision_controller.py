@@ -0,0 +1,97 @@
+"""
+Unit tests for the adaptive revision controller (utils/revision_controller.py)
+Tests stop conditions, local-fix routing, and savings accounting
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.revision_controller import RevisionController, LLM_CALLS_PER_ITERATION, LLM_CALLS_SAVED_PER_LOCAL_FIX
+
+
+class TestStopConditions:
+
+    def test_stops_when_target_met(self):
+        controller = RevisionController(target_score=80, max_iterations=3)
+        controller.record(85)
+
+        assert controller.should_revise(0) is False
+        assert controller.stop_reason == 'target_met'
+
+    def test_stops_at_max_iterations(self):
+        controller = RevisionController(target_score=80, max_iterations=2, min_gain=0)
+        controller.record(60)
+        controller.record(70)
+        controller.record(75)
+
+        assert controller.should_revise(2) is False
+        assert controller.stop_reason == 'max_iterations'
+        assert controller.savings()['iterations_skipped'] == 0
+
+    def test_stops_on_plateau(self):
+        controller = RevisionController(target_score=80, max_iterations=3, min_gain=3)
+        controller.record(70)
+        assert controller.should_revise(0) is True
+        controller.record(71, seconds=12.0)
+
+        assert controller.should_revise(1) is False
+        assert controller.stop_reason == 'plateau'
+
+        savings = controller.savings()
+        assert savings['iterations_skipped'] == 2
+        assert savings['llm_calls_saved'] == 2 * LLM_CALLS_PER_ITERATION
+        assert savings['est_latency_saved_s'] == 24.0
+
+    def test_keeps_going_while_improving(self):
+        controller = RevisionController(target_score=80, max_iterations=3, min_gain=3)
+        controller.record(60)
+        controller.record(70)
+
+        assert controller.should_revise(1) is True
+
+
+class TestRouting:
+
+    def test_mechanical_issues_near_target_route_local(self):
+        controller = RevisionController(target_score=80, max_iterations=3)
+        grading = {'score': 74, 'code_issues_remaining': [{'code': 'contrast_masked'}, {'type': 'wall_of_text'}]}
+
+        assert controller.route(grading) == 'local'
+
+    def test_structural_issue_routes_full(self):
+        controller = RevisionController(target_score=80, max_iterations=3)
+        grading = {'score': 74, 'code_issues_remaining': [{'code': 'contrast_masked'}, {'code': 'claim_unverified'}]}
+
+        assert controller.route(grading) == 'full'
+
+    def test_far_from_target_routes_full(self):
+        controller = RevisionController(target_score=80, max_iterations=3, local_fix_max_gap=10)
+        grading = {'score': 55, 'code_issues_remaining': [{'code': 'contrast_masked'}]}
+
+        assert controller.route(grading) == 'full'
+
+    def test_local_fix_below_target_keeps_revising(self):
+        controller = RevisionController(target_score=80, max_iterations=3, min_gain=3)
+        controller.record(74)
+        controller.record_local_fix(75)  # Re-graded: still below target, tiny gain
+
+        assert controller.should_revise(0) is True
+        # One local fix per post - what's left goes to a full revision
+        assert controller.route({'score': 75, 'code_issues_remaining': [{'code': 'contrast_masked'}]}) == 'full'
+
+    def test_local_fix_meeting_target_stops(self):
+        controller = RevisionController(target_score=80, max_iterations=3)
+        controller.record(75)
+        controller.record_local_fix(82)
+
+        assert controller.should_revise(0) is False
+        savings = controller.savings(fallback_seconds=10.0)
+        assert savings['stop_reason'] == 'local_fix'
+        assert savings['local_fixes'] == 1
+        assert savings['llm_calls_saved'] == LLM_CALLS_SAVED_PER_LOCAL_FIX
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,129 @@
+"""
+Unit tests for batch running statistics (utils/running_stats.py)
+Tests Welford aggregates, the EWMA trend, serialization, and ContextManager/batch stats wiring
+"""
+import pytest
+import sys
+import json
+import asyncio
+import statistics
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents import batch_orchestrator
+from agents.batch_orchestrator import create_batch_plan, get_batch_stats
+from agents.context_manager import ContextManager
+from utils.model_routing import BatchBudget, create_message, use_budget
+from utils.running_stats import BatchStats, RunningStats
+from utils.shared_state import SQLiteState, set_shared_state
+
+
+class TestRunningStats:
+
+    def test_matches_batch_computation(self):
+        values = [18, 22, 19.5, 25, 14, 21]
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+
+        assert stats.count == 6
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.stdev == pytest.approx(statistics.stdev(values))
+        assert (stats.min, stats.max, stats.total) == (14, 25, sum(values))
+
+    def test_merge_equals_single_stream(self):
+        left, right, both = RunningStats(), RunningStats(), RunningStats()
+        for i, value in enumerate([3, 9, 4, 12, 7, 1, 8]):
+            (left if i < 3 else right).add(value)
+            both.add(value)
+
+        merged = left.merge(right)
+
+        assert merged.mean == pytest.approx(both.mean)
+        assert merged.variance == pytest.approx(both.variance)
+        assert (merged.count, merged.min, merged.max) == (7, 1, 12)
+
+
+class TestBatchStats:
+
+    def test_ewma_trend(self):
+        stats = BatchStats(alpha=0.5)
+        assert stats.quality_trend() == 'N/A'
+        stats.add_post(18)
+        assert stats.quality_trend() == 'too early to tell'
+        for score in [18, 18, 18, 23, 24]:
+            stats.add_post(score)
+        assert stats.quality_trend() == 'improving'
+        for score in [12, 11, 12]:
+            stats.add_post(score)
+        assert stats.quality_trend() == 'declining'
+
+    def test_round_trips_through_json(self):
+        stats = BatchStats()
+        stats.add_post(20, platform='linkedin', seconds=80.0, tokens=40000)
+        stats.add_post(22, platform='twitter', seconds=40.0, tokens=20000)
+        stats.add_stage('grader', 3.0, 2000)
+
+        restored = BatchStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+
+        assert restored.summary() == stats.summary()
+        summary = restored.summary()
+        assert summary['by_platform']['twitter']['mean'] == 22
+        assert summary['stages']['post'] == {
+            'calls': 2, 'avg_seconds': 60.0, 'max_seconds': 80.0, 'total_seconds': 120.0,
+            'avg_tokens': 30000, 'total_tokens': 60000
+        }
+
+
+class TestContextManagerStats:
+
+    def test_get_stats_keys_and_routed_stages(self):
+        context_mgr = ContextManager('plan_1')
+        assert context_mgr.get_stats()['quality_trend'] == 'N/A'
+        assert context_mgr.get_stats()['lowest_score'] == 0
+
+        budget = BatchBudget(2, stats=context_mgr.stats)
+        response = SimpleNamespace(usage=SimpleNamespace(input_tokens=900, output_tokens=100), content=[])
+        client = SimpleNamespace(messages=SimpleNamespace(create=lambda **params: response))
+        with use_budget(budget):
+            create_message(client, 'writer', messages=[])
+
+        for score in (19, 21):
+            asyncio.run(context_mgr.add_post_summary({'score': score, 'platform': 'linkedin'}))
+        stats = context_mgr.get_stats()
+
+        assert stats['total_posts'] == 2
+        assert stats['avg_score'] == stats['average_score'] == 20
+        assert (stats['lowest_score'], stats['highest_score']) == (19, 21)
+        assert stats['recent_scores'] == [19, 21]
+        assert stats['by_platform']['linkedin']['count'] == 2
+        assert stats['stages']['writer']['total_tokens'] == 1000
+
+    def test_stats_survive_restart_via_shared_state(self, tmp_path):
+        set_shared_state(SQLiteState(tmp_path / 'shared_state.db'))
+        try:
+            posts = [{'platform': 'linkedin', 'topic': f'Topic {i}', 'context': 'x' * 300} for i in range(3)]
+            plan = create_batch_plan(posts, 'stats test', channel_id='C1', thread_ts='T1', user_id='U1')
+            context_mgr = batch_orchestrator.get_context_manager(plan['id'])
+            asyncio.run(context_mgr.add_post_summary({'score': 23, 'platform': 'linkedin', 'seconds': 90.0}))
+            batch_orchestrator._share_stats(plan['id'], context_mgr)
+
+            # Restart: local registries are gone
+            batch_orchestrator._batch_plans.clear()
+            batch_orchestrator._context_managers.clear()
+
+            assert get_batch_stats(plan['id'])['avg_score'] == 23
+            restored = batch_orchestrator.get_context_manager(plan['id'])
+            assert restored.get_stats()['stages']['post']['calls'] == 1
+            assert get_batch_stats('plan_missing') is None
+        finally:
+            set_shared_state(None)
+            batch_orchestrator._batch_plans.clear()
+            batch_orchestrator._context_managers.clear()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,204 @@
+"""
+Unit tests for multi-worker shared state (utils/shared_state.py)
+Tests SQLite dedup/TTL/atomic updates across connections, sticky thread routing,
+and circuit breakers and batch plans shared between workers
+"""
+import pytest
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents import batch_orchestrator
+from agents.batch_orchestrator import cancel_plan_run, create_batch_plan, get_plan_run
+from utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpen, CircuitState
+from utils.shared_state import WORKER_ID, MemoryState, SharedState, SQLiteState, ThreadRouter, set_shared_state
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / 'shared_state.db'
+
+
+@pytest.fixture
+def shared(db):
+    """Install a SQLite store as the process-wide shared state"""
+    state = SQLiteState(db)
+    set_shared_state(state)
+    yield state
+    set_shared_state(None)
+    for registry in (batch_orchestrator._batch_plans, batch_orchestrator._context_managers,
+                     batch_orchestrator._batch_runs):
+        registry.clear()
+
+
+class TestSQLiteState:
+
+    def test_claim_dedups_across_workers_and_expires(self, db):
+        worker_a, worker_b = SQLiteState(db), SQLiteState(db)
+
+        assert worker_a.claim('slack_events', 'Ev1', ttl=0.2) is True
+        assert worker_b.claim('slack_events', 'Ev1', ttl=0.2) is False
+        time.sleep(0.25)
+        assert worker_b.claim('slack_events', 'Ev1', ttl=0.2) is True
+        assert worker_a.purge_expired() == 0
+
+    def test_update_is_atomic_across_connections(self, db):
+        stores = [SQLiteState(db) for _ in range(4)]
+
+        def bump(store):
+            for _ in range(50):
+                store.update('counters', 'n', lambda n: (n or 0) + 1)
+
+        threads = [threading.Thread(target=bump, args=(store,)) for store in stores]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert stores[0].get('counters', 'n') == 200
+
+    def test_memory_state_is_not_shared(self):
+        state = MemoryState()
+        assert state.shared is False
+        assert state.claim('slack_events', 'Ev1') is True
+        assert state.claim('slack_events', 'Ev1') is False
+
+    def test_incomplete_backend_rejected_at_creation(self):
+        class ReadOnlyState(SharedState):
+            def _read(self, namespace, key):
+                return None
+
+        with pytest.raises(TypeError):
+            ReadOnlyState()
+
+
+class TestThreadRouter:
+
+    def test_thread_sticks_to_first_worker_and_messages_are_forwarded(self, db):
+        worker_a = ThreadRouter(SQLiteState(db), worker_id='a')
+        worker_b = ThreadRouter(SQLiteState(db), worker_id='b')
+        worker_a.heartbeat()
+        worker_b.heartbeat()
+
+        assert worker_a.owner('C1:T1') == 'a'
+        assert worker_b.owner('C1:T1') == 'a'
+        assert worker_b.owner('C1:T2') == 'b'
+
+        worker_b.forward('a', {'thread_ts': 'T1', 'message_text': 'first'})
+        worker_b.forward('a', {'thread_ts': 'T1', 'message_text': 'second'})
+
+        assert worker_b.take_inbox() == []
+        assert [p['message_text'] for p in worker_a.take_inbox()] == ['first', 'second']
+        assert worker_a.take_inbox() == []
+
+    def test_threads_and_inbox_of_dead_worker_taken_over(self, db):
+        worker_a = ThreadRouter(SQLiteState(db), worker_id='a', heartbeat_seconds=0.05)
+        worker_b = ThreadRouter(SQLiteState(db), worker_id='b')
+        worker_a.heartbeat()
+        worker_b.heartbeat()
+        worker_a.owner('C1:T1')
+        worker_b.forward('a', {'thread_ts': 'T1', 'message_text': 'stranded'})
+
+        time.sleep(0.2)  # a misses its heartbeats
+
+        assert worker_b.live_workers() == ['b']
+        assert [p['message_text'] for p in worker_b.take_inbox()] == ['stranded']
+        assert worker_b.owner('C1:T1') == 'b'
+
+
+class TestSharedCircuitBreaker:
+
+    def test_breaker_tripped_on_one_worker_rejects_on_another(self, shared, db):
+        worker_a = CircuitBreaker(failure_threshold=2, recovery_timeout=60, name='anthropic_api')
+        # The other worker: same breaker name, its own connection to the store
+        worker_b = CircuitBreaker(failure_threshold=2, recovery_timeout=60, name='anthropic_api')
+        worker_b._shared = SQLiteState(db)
+
+        def fail():
+            raise RuntimeError("overloaded")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                worker_a.call(fail)
+
+        assert worker_b.state == CircuitState.OPEN
+        with pytest.raises(CircuitBreakerOpen):
+            worker_b.call(lambda: 'ok')
+
+        worker_b.reset()
+        assert worker_a.get_state()['state'] == 'closed'
+
+    def test_failures_counted_atomically_across_workers(self, shared, db):
+        workers = []
+        for _ in range(4):
+            breaker = CircuitBreaker(failure_threshold=1000, recovery_timeout=60, name='anthropic_api')
+            breaker._shared = SQLiteState(db)
+            workers.append(breaker)
+
+        def fail_many(breaker):
+            for _ in range(25):
+                breaker.record_failure(RuntimeError("overloaded"))
+
+        threads = [threading.Thread(target=fail_many, args=(breaker,)) for breaker in workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert workers[0].failure_count == 100
+        assert workers[0].state == CircuitState.CLOSED
+
+
+class TestSharedBatchState:
+
+    def test_plan_and_run_visible_to_other_worker(self, shared):
+        posts = [{'platform': 'linkedin', 'topic': f'Topic {i}', 'context': 'x' * 300} for i in range(2)]
+        plan = create_batch_plan(posts, 'shared test', channel_id='C1', thread_ts='T1', user_id='U1',
+                                 slack_client=object())
+
+        # Another worker: nothing in its local registries
+        batch_orchestrator._batch_plans.clear()
+        batch_orchestrator._context_managers.clear()
+
+        loaded = batch_orchestrator._get_plan(plan['id'])
+        assert [p['topic'] for p in loaded['posts']] == ['Topic 0', 'Topic 1']
+        assert loaded['slack_metadata'] == {'channel_id': 'C1', 'thread_ts': 'T1', 'user_id': 'U1', 'slack_client': None}
+        assert batch_orchestrator.get_context_manager(plan['id']) is not None
+
+    def test_cancel_run_owned_by_other_worker(self, shared):
+        other = ThreadRouter(shared, worker_id='other')
+        other.heartbeat()
+        shared.set('batch_runs', 'plan_x', {'status': 'running', 'worker': 'other', 'cancelled': False,
+                                            'completed': 1, 'failed': 0, 'total': 3})
+
+        assert get_plan_run('plan_x')['completed'] == 1
+        assert cancel_plan_run('plan_x') is True
+        assert shared.get('batch_cancels', 'plan_x') is True
+
+        # A run whose worker is gone can't be cancelled (and can be resumed)
+        shared.delete('workers', 'other')
+        assert cancel_plan_run('plan_x') is False
+
+    def test_run_claimed_once_across_workers(self, shared):
+        other = ThreadRouter(shared, worker_id='other')
+        other.heartbeat()
+        shared.set('batch_runs', 'plan_y', {'status': 'running', 'worker': 'other', 'cancelled': False,
+                                            'completed': 0, 'failed': 0, 'total': 3})
+        mine = {'status': 'running', 'worker': WORKER_ID, 'cancelled': False, 'completed': 0, 'failed': 0, 'total': 3}
+
+        assert batch_orchestrator._claim_run('plan_y', mine)['worker'] == 'other'
+        assert shared.get('batch_runs', 'plan_y')['worker'] == 'other'
+
+        # The other worker died: its run can be taken over, once
+        shared.delete('workers', 'other')
+        assert batch_orchestrator._claim_run('plan_y', mine) is None
+        assert shared.get('batch_runs', 'plan_y')['worker'] == WORKER_ID
+        assert batch_orchestrator._claim_run('plan_y', dict(mine, worker='third')) is not None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,144 @@
+"""
+Unit tests for the Slack progress publisher (utils/slack_progress.py)
+Tests status coalescing into chat_update edits, ordering, ratelimited retries, and sync-client fallback
+"""
+import pytest
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.slack_progress import SlackProgressPublisher
+
+
+class RateLimited(Exception):
+    """Shaped like slack_sdk's SlackApiError for a 429"""
+
+    def __init__(self, retry_after):
+        super().__init__("ratelimited")
+        self.response = type('Response', (dict,), {})(error='ratelimited')
+        self.response.headers = {'Retry-After': str(retry_after)}
+
+
+class FakeAsyncClient:
+
+    def __init__(self, rate_limit_first=0, delay=0.0):
+        self.calls = []
+        self.rate_limit_first = rate_limit_first
+        self.delay = delay
+
+    async def chat_postMessage(self, **kwargs):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.rate_limit_first:
+            self.rate_limit_first -= 1
+            raise RateLimited(0)
+        self.calls.append(('post', kwargs))
+        return {'ok': True, 'ts': f"ts{len(self.calls)}"}
+
+    async def chat_update(self, **kwargs):
+        self.calls.append(('update', kwargs))
+        return {'ok': True, 'ts': kwargs['ts']}
+
+
+class FakeSyncClient:
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    def chat_postMessage(self, **kwargs):
+        self.threads.add(threading.get_ident())
+        self.calls.append(('post', kwargs))
+        return {'ok': True, 'ts': '1'}
+
+
+class TestSlackProgressPublisher:
+
+    def test_burst_of_status_lines_becomes_one_message_and_edits(self):
+        client = FakeAsyncClient()
+        publisher = SlackProgressPublisher(client_factory=lambda: client, coalesce_seconds=0.05)
+
+        async def run():
+            for i in range(20):
+                publisher.status('plan1', 'C1', 'T1', f"✅ Post {i + 1}/40 complete", header="Progress")
+            await publisher.flush()
+            for i in range(20, 40):
+                publisher.status('plan1', 'C1', 'T1', f"✅ Post {i + 1}/40 complete", header="Progress")
+            await publisher.flush()
+
+        asyncio.run(run())
+
+        assert [kind for kind, _ in client.calls] == ['post', 'update']
+        assert client.calls[1][1]['ts'] == 'ts1'
+        assert client.calls[1][1]['text'].startswith("Progress\n")
+        assert client.calls[1][1]['text'].endswith("✅ Post 40/40 complete")
+        assert publisher.stats['coalesced'] == 38
+
+    def test_enqueue_does_not_wait_for_slack_and_preserves_order(self):
+        client = FakeAsyncClient(delay=0.05)
+        publisher = SlackProgressPublisher(client_factory=lambda: client, coalesce_seconds=0)
+
+        async def run():
+            started = time.monotonic()
+            for i in range(5):
+                publisher.post('C1', f"message {i}", thread_ts='T1')
+            enqueue_time = time.monotonic() - started
+            await publisher.flush()
+            return enqueue_time
+
+        enqueue_time = asyncio.run(run())
+
+        assert enqueue_time < 0.05
+        assert [kwargs['text'] for _, kwargs in client.calls] == [f"message {i}" for i in range(5)]
+
+    def test_ratelimited_send_retried(self):
+        client = FakeAsyncClient(rate_limit_first=2)
+        publisher = SlackProgressPublisher(client_factory=lambda: client, coalesce_seconds=0)
+
+        async def run():
+            publisher.post('C1', "🎉 Batch complete!", thread_ts='T1')
+            await publisher.flush()
+
+        asyncio.run(run())
+
+        assert [kwargs['text'] for _, kwargs in client.calls] == ["🎉 Batch complete!"]
+        assert publisher.stats['ratelimited'] == 2
+        assert publisher.stats['failed'] == 0
+
+    def test_sync_client_called_off_the_event_loop(self):
+        default = FakeAsyncClient()
+        sync_client = FakeSyncClient()
+        publisher = SlackProgressPublisher(client_factory=lambda: default, coalesce_seconds=0)
+
+        async def run():
+            publisher.post('C1', "On it...", thread_ts='T1', client=sync_client)
+            await publisher.flush()
+
+        asyncio.run(run())
+
+        assert [kwargs['text'] for _, kwargs in sync_client.calls] == ["On it..."]
+        assert threading.get_ident() not in sync_client.threads
+        assert default.calls == []
+
+    def test_forget_starts_a_new_status_message(self):
+        client = FakeAsyncClient()
+        publisher = SlackProgressPublisher(client_factory=lambda: client, coalesce_seconds=0)
+
+        async def run():
+            publisher.status('plan1', 'C1', 'T1', "⏳ Post 1/2")
+            publisher.forget('plan1')
+            publisher.status('plan1', 'C1', 'T1', "⏳ Post 1/2 (rerun)")
+            await publisher.flush()
+
+        asyncio.run(run())
+
+        assert [kind for kind, _ in client.calls] == ['post', 'post']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,144 @@
+"""
+Unit tests for the projected query layer (integrations/supabase_queries.py)
+Tests column projection, filter building, and keyset pagination
+"""
+import pytest
+from unittest.mock import Mock
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from integrations.supabase_queries import (
+    Filter,
+    QuerySpec,
+    TOP_PERFORMER_COLUMNS,
+    fetch_all,
+    iter_rows,
+    select_one,
+    select_rows,
+)
+
+
+class FakeQuery:
+    """Chainable stand-in for the PostgREST query builder that records calls"""
+
+    def __init__(self, log, pages):
+        self.log = log
+        self.pages = pages
+        self.calls = []
+        self.not_ = self
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return method
+
+    def execute(self):
+        self.log.append(self.calls)
+        return Mock(data=self.pages.pop(0) if self.pages else [])
+
+
+class FakeClient:
+    def __init__(self, pages=None):
+        self.pages = list(pages or [])
+        self.queries = []
+
+    def table(self, name):
+        query = FakeQuery(self.queries, self.pages)
+        query.calls.append(('table', (name,), {}))
+        return query
+
+
+def _spec(**overrides):
+    base = dict(
+        table='generated_posts',
+        columns=('post_hook', 'engagement_rate'),
+        filters=[Filter('eq', 'status', 'published'), Filter('not_null', 'engagement_rate')],
+        order_by='engagement_rate',
+        descending=True
+    )
+    base.update(overrides)
+    return QuerySpec(**base)
+
+
+class TestProjection:
+    """Tests that queries never select *"""
+
+    def test_select_clause_adds_key_column(self):
+        assert _spec().select_clause == 'post_hook, engagement_rate, id'
+
+    def test_select_rows_uses_projection_filters_and_order(self):
+        client = FakeClient([[{'id': 1}]])
+
+        rows = select_rows(_spec(), limit=5, client=client)
+
+        assert rows == [{'id': 1}]
+        calls = client.queries[0]
+        assert ('select', ('post_hook, engagement_rate, id',), {}) in calls
+        assert ('eq', ('status', 'published'), {}) in calls
+        assert ('is_', ('engagement_rate', 'null'), {}) in calls
+        assert ('order', ('engagement_rate',), {'desc': True}) in calls
+        assert ('order', ('id',), {'desc': True}) in calls
+        assert ('limit', (5,), {}) in calls
+
+    def test_select_one_returns_none_when_empty(self):
+        assert select_one(_spec(), client=FakeClient([[]])) is None
+
+    def test_projections_exclude_embedding(self):
+        assert 'embedding' not in TOP_PERFORMER_COLUMNS
+
+
+class TestKeysetPagination:
+    """Tests for streaming page-by-page iteration"""
+
+    def test_pages_until_short_page(self):
+        client = FakeClient([
+            [{'id': 'a', 'engagement_rate': 9.0}, {'id': 'b', 'engagement_rate': 8.0}],
+            [{'id': 'c', 'engagement_rate': 8.0}, {'id': 'd', 'engagement_rate': 7.5}],
+            [{'id': 'e', 'engagement_rate': 7.0}],
+        ])
+
+        rows = fetch_all(_spec(), page_size=2, client=client)
+
+        assert [r['id'] for r in rows] == ['a', 'b', 'c', 'd', 'e']
+        assert len(client.queries) == 3
+        # First page has no keyset filter; later pages continue after the last row
+        assert not any(c[0] == 'or_' for c in client.queries[0])
+        keyset = [c for c in client.queries[1] if c[0] == 'or_'][0][1][0]
+        assert keyset == 'engagement_rate.lt."8.0",and(engagement_rate.eq."8.0",id.lt."b")'
+
+    def test_ascending_key_only(self):
+        client = FakeClient([[{'id': 1}, {'id': 2}], []])
+
+        list(iter_rows(_spec(order_by=None, descending=False), page_size=2, client=client))
+
+        keyset = [c for c in client.queries[1] if c[0] == 'or_'][0][1][0]
+        assert keyset == 'id.gt."2"'
+
+    def test_max_rows_stops_early(self):
+        client = FakeClient([
+            [{'id': 1, 'engagement_rate': 1}, {'id': 2, 'engagement_rate': 1}],
+            [{'id': 3, 'engagement_rate': 1}],
+            [{'id': 4, 'engagement_rate': 1}],
+        ])
+
+        rows = fetch_all(_spec(), page_size=2, max_rows=3, client=client)
+
+        assert len(rows) == 3
+        assert len(client.queries) == 2
+        assert ('limit', (1,), {}) in client.queries[1]
+
+    def test_iteration_is_lazy(self):
+        client = FakeClient([[{'id': 1, 'engagement_rate': 1}], []])
+
+        rows = iter_rows(_spec(), page_size=1, client=client)
+        assert client.queries == []
+        next(rows)
+        assert len(client.queries) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
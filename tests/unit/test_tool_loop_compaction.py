@@ -0,0 +1,113 @@
+"""
+Unit tests for tool-loop compaction (utils/tool_loop_compaction.py)
+Tests superseded-draft summaries, ceiling behaviour, and id preservation
+"""
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.tool_loop_compaction import ToolLoopCompactor, estimate_tokens
+
+
+def _tool_use(tool_id, name, **tool_input):
+    # SDK-style block (attribute access), as stored from response.content
+    return SimpleNamespace(type='tool_use', id=tool_id, name=name, input=tool_input)
+
+
+def _turn(tool_id, name, result, **tool_input):
+    return [
+        {"role": "assistant", "content": [_tool_use(tool_id, name, **tool_input)]},
+        {"role": "user", "content": [{"type": "tool_result", "tool_use_id": tool_id, "content": result}]},
+    ]
+
+
+def _draft(version):
+    return f"DRAFT v{version}\n" + f"Pipeline line {version}. " * 200
+
+
+def thinking_mode_history():
+    messages = [{"role": "user", "content": "Create a LinkedIn post about pipeline reviews."}]
+    messages += _turn("t1", "generate_5_hooks", "hooks " * 50)
+    messages += _turn("t2", "create_human_draft", _draft(1))
+    messages += _turn("t3", "external_validation", '{"issues": ["' + "weak hook " * 200 + '"]}', post=_draft(1))
+    messages += _turn("t4", "apply_fixes", _draft(2), post=_draft(1))
+    messages += _turn("t5", "external_validation", '{"score": 21, "notes": "' + "ok " * 500 + '"}', post=_draft(2))
+    return messages
+
+
+def _result(messages, tool_id):
+    for message in messages:
+        if isinstance(message["content"], list):
+            for block in message["content"]:
+                if isinstance(block, dict) and block.get("tool_use_id") == tool_id:
+                    return block["content"]
+
+
+class TestCompaction:
+
+    def test_under_ceiling_returns_same_list(self):
+        messages = thinking_mode_history()
+        compactor = ToolLoopCompactor(token_ceiling=10**6)
+
+        assert compactor.compact(messages) is messages
+        assert compactor.stats['compactions'] == 0
+
+    def test_superseded_draft_and_validation_are_summarized(self):
+        messages = thinking_mode_history()
+        compactor = ToolLoopCompactor(token_ceiling=1000)
+
+        compacted = compactor.compact(messages)
+
+        assert _result(compacted, "t2").startswith("[Compacted create_human_draft result")
+        assert _result(compacted, "t3").startswith("[Compacted external_validation result")
+        # Latest draft and latest validation survive in full
+        assert _result(compacted, "t4") == _draft(2)
+        assert _result(compacted, "t5") == _result(messages, "t5")
+        assert estimate_tokens(compacted) < estimate_tokens(messages) / 2
+
+    def test_original_history_not_mutated(self):
+        messages = thinking_mode_history()
+
+        ToolLoopCompactor(token_ceiling=1000).compact(messages)
+
+        assert _result(messages, "t2") == _draft(1)
+        assert messages[5]["content"][0].input["post"] == _draft(1)
+
+    def test_old_tool_arguments_trimmed_and_ids_kept(self):
+        messages = thinking_mode_history()
+
+        compacted = ToolLoopCompactor(token_ceiling=1000).compact(messages)
+
+        old_call = compacted[5]["content"][0]
+        assert old_call["input"]["post"].startswith("[Compacted argument")
+        assert old_call["id"] == "t3"
+        # Last assistant turn untouched
+        assert compacted[-2]["content"][0].input["post"] == _draft(2)
+        tool_ids = [b.get("tool_use_id") for m in compacted if isinstance(m["content"], list)
+                    for b in m["content"] if isinstance(b, dict) and b.get("type") == "tool_result"]
+        assert tool_ids == ["t1", "t2", "t3", "t4", "t5"]
+
+    def test_repeat_compaction_keeps_cached_prefix(self):
+        compactor = ToolLoopCompactor(token_ceiling=1000)
+        compacted = compactor.compact(thinking_mode_history())
+
+        assert compactor.compact(compacted) is compacted
+        assert compactor.stats['compactions'] == 1
+
+    def test_second_pass_summarizes_older_bulky_output(self):
+        messages = [{"role": "user", "content": "go"}]
+        messages += _turn("s1", "search_company_documents", "case study " * 600)
+        messages += _turn("d1", "create_human_draft", _draft(1))
+
+        compacted = ToolLoopCompactor(token_ceiling=800).compact(messages)
+
+        assert _result(compacted, "s1").startswith("[Compacted search_company_documents result")
+        assert _result(compacted, "d1") == _draft(1)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,169 @@
+"""
+Unit tests for the shared tool registry and agent loop (utils/tool_registry.py, agents/agent_loop.py)
+Tests schema caching, concurrent dispatch, per-run result caching, error handling, and the generic loop
+"""
+import pytest
+import sys
+import json
+import time
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.agent_loop import run_agent_loop
+from utils.tool_registry import ToolRegistry, ToolSpec, registry
+
+calls = []
+
+
+async def fake_search(query, match_count=3):
+    calls.append(('search', query, match_count))
+    await asyncio.sleep(0.2)
+    return f"results for {query}"
+
+
+async def fake_validate(post):
+    calls.append(('validate', post))
+    await asyncio.sleep(0.1)
+    return json.dumps({'total_score': 20})
+
+
+async def fake_hang(post):
+    await asyncio.sleep(5)
+
+
+async def fake_broken(post):
+    raise ValueError("bad input")
+
+
+SCHEMA = {"type": "object", "properties": {}, "required": []}
+
+
+def make_specs():
+    return [
+        ToolSpec(name="search_company_documents", description="Search docs", input_schema=SCHEMA,
+                 handler=f"{__name__}:fake_search", args={'query': '', 'match_count': 3},
+                 concurrency='search', cacheable=True),
+        ToolSpec(name="external_validation", description="Validate", input_schema=SCHEMA,
+                 handler=f"{__name__}:fake_validate", args={'post': ''},
+                 concurrency='validation', thinking_only=True),
+        ToolSpec(name="hang", description="Never returns", input_schema=SCHEMA,
+                 handler=f"{__name__}:fake_hang", args={'post': ''}, timeout=0.05),
+        ToolSpec(name="broken", description="Raises", input_schema=SCHEMA,
+                 handler=f"{__name__}:fake_broken", args={'post': ''}),
+    ]
+
+
+def tool_use(id, name, **tool_input):
+    return SimpleNamespace(type='tool_use', id=id, name=name, input=tool_input)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+    yield
+
+
+class TestToolRegistry:
+
+    def test_schemas_built_once_and_filtered_by_mode(self):
+        reg = ToolRegistry()
+        reg.register('test', make_specs())
+
+        default = reg.schemas('test')
+        assert [s['name'] for s in default] == ["search_company_documents", "hang", "broken"]
+        assert reg.schemas('test') is default
+        assert [s['name'] for s in reg.schemas('test', thinking_mode=True)][:2] == [
+            "search_company_documents", "external_validation"
+        ]
+
+    def test_turn_dispatched_concurrently_in_request_order(self):
+        reg = ToolRegistry()
+        reg.register('test', make_specs())
+        blocks = [tool_use('t1', 'search_company_documents', query='a'),
+                  tool_use('t2', 'search_company_documents', query='b'),
+                  tool_use('t3', 'external_validation', post='draft')]
+
+        started = time.monotonic()
+        results = asyncio.run(reg.dispatch('test', blocks, {}))
+        elapsed = time.monotonic() - started
+
+        # Sequential would be 0.5s
+        assert elapsed < 0.4
+        assert [r['tool_use_id'] for r in results] == ['t1', 't2', 't3']
+        assert results[0]['content'] == "results for a"
+        assert json.loads(results[2]['content']) == {'total_score': 20}
+
+    def test_cacheable_call_reused_within_run(self):
+        reg = ToolRegistry()
+        reg.register('test', make_specs())
+        cache = {}
+
+        async def run():
+            first = await reg.execute('test', 'search_company_documents', {'query': 'proof'}, cache)
+            second = await reg.execute('test', 'search_company_documents', {'query': 'proof'}, cache)
+            fresh = await reg.execute('test', 'search_company_documents', {'query': 'proof'}, {})
+            return first, second, fresh
+
+        assert len(set(asyncio.run(run()))) == 1
+        assert calls.count(('search', 'proof', 3)) == 2
+        stats = reg.stats()['test.search_company_documents']
+        assert (stats['calls'], stats['cache_hits']) == (2, 1)
+
+    def test_errors_returned_as_json(self):
+        reg = ToolRegistry()
+        reg.register('test', make_specs())
+
+        async def run():
+            return (await reg.execute('test', 'hang', {'post': 'x'}),
+                    await reg.execute('test', 'broken', {'post': 'x'}),
+                    await reg.execute('test', 'missing', {}))
+
+        timeout, broken, missing = (json.loads(r)['error'] for r in asyncio.run(run()))
+
+        assert timeout == "Tool timeout: hang exceeded 0s"
+        assert broken == "Tool error: bad input"
+        assert missing == "Unknown tool: missing"
+        assert reg.stats()['test.hang']['timeouts'] == 1
+        assert reg.stats()['test.broken']['errors'] == 1
+
+
+class FakeClient:
+    """messages.create: first turn asks for two searches, second turn ends"""
+
+    def __init__(self):
+        self.requests = []
+        self.messages = SimpleNamespace(create=self.create)
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        if len(self.requests) == 1:
+            return SimpleNamespace(stop_reason='tool_use', usage=None, content=[
+                tool_use('t1', 'search_company_documents', query='a'),
+                tool_use('t2', 'search_company_documents', query='a'),
+            ])
+        return SimpleNamespace(stop_reason='end_turn', usage=None,
+                               content=[SimpleNamespace(type='text', text='{"post_text": "Done"}')])
+
+
+class TestAgentLoop:
+
+    def test_loop_dispatches_tools_and_returns_final_text(self):
+        registry.register('loop_test', make_specs())
+        client = FakeClient()
+
+        output, iterations = asyncio.run(run_agent_loop(client, 'loop_test', "system", "Create a post"))
+
+        assert (output, iterations) == ('{"post_text": "Done"}', 2)
+        # Default mode hides thinking-only tools
+        assert "external_validation" not in [t['name'] for t in client.requests[0]['tools']]
+        results = client.requests[1]['messages'][-1]['content']
+        assert [r['tool_use_id'] for r in results] == ['t1', 't2']
+        assert results[0]['content'] == results[1]['content'] == "results for a"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
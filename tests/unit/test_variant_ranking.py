@@ -0,0 +1,59 @@
+"""
+Unit tests for local variant ranking (utils/variant_ranking.py)
+Tests validator-based scoring, ordering, and uplift/variance stats
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.variant_ranking import rank_variants, score_variant, variant_stats
+
+CLEAN = "We cut our sales cycle from 94 days to 41 by mapping 9 handoffs. 4 added nothing. Share this with your RevOps lead."
+CLICHE = "Here's the thing: at the end of the day, pipeline is a game changer for every team."
+
+
+class TestScoring:
+
+    def test_forbidden_patterns_lower_score(self):
+        assert score_variant(CLEAN)['score'] > score_variant(CLICHE)['score']
+        assert 'ai_cliche' in score_variant(CLICHE)['issues']
+
+    def test_single_tweet_check_ignored(self):
+        assert 'single_tweet' not in score_variant(CLEAN)['issues']
+
+    def test_rank_puts_best_first_and_drops_empty(self):
+        ranked = rank_variants([CLICHE, "", CLEAN])
+
+        assert [v['text'] for v in ranked] == [CLEAN, CLICHE]
+
+    def test_over_length_variant_penalized(self):
+        too_long = CLEAN + " " + "We mapped every handoff and timed each one across 40 deals." * 4
+
+        ranked = rank_variants([too_long, CLEAN])
+
+        assert ranked[0]['text'] == CLEAN
+        assert 'tweet_too_long' in ranked[1]['issues']
+
+
+class TestVariantStats:
+
+    def test_uplift_and_variance(self):
+        ranked = [{'score': 90}, {'score': 70}, {'score': 50}]
+
+        stats = variant_stats(ranked, output_tokens=300)
+
+        assert stats['mean_score'] == 70.0
+        assert stats['uplift'] == 20.0
+        assert stats['variance'] == pytest.approx(266.7, abs=0.1)
+        assert stats['extra_tokens'] == 200
+        assert stats['uplift_per_100_extra_tokens'] == 10.0
+
+    def test_empty(self):
+        assert variant_stats([]) == {'variants': 0}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
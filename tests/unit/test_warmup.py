@@ -0,0 +1,57 @@
+"""
+Unit tests for cold-start helpers (utils/warmup.py)
+Tests -X importtime parsing/summaries and warm-up reporting
+"""
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.warmup import importtime_summary, parse_importtime, warm_up
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       900 |       1020 | io
+import time:      2500 |       2500 |       anthropic._models
+import time:      4000 |       6500 |     anthropic.types
+import time:     30000 |      36500 |   anthropic
+import time:       500 |      37000 | main_slack
+Traceback (most recent call last):
+"""
+
+
+class TestImportTime:
+
+    def test_parse_importtime(self):
+        entries = parse_importtime(IMPORTTIME)
+
+        assert [e['module'] for e in entries] == [
+            '_io', 'io', 'anthropic._models', 'anthropic.types', 'anthropic', 'main_slack'
+        ]
+        assert [e['depth'] for e in entries] == [1, 0, 3, 2, 1, 0]
+        assert entries[4] == {'module': 'anthropic', 'self_ms': 30.0, 'cumulative_ms': 36.5, 'depth': 1}
+
+    def test_summary_totals_and_ranks(self):
+        summary = importtime_summary(parse_importtime(IMPORTTIME), top=2)
+
+        assert summary['total_ms'] == 38.0
+        assert summary['modules'] == 6
+        assert [e['module'] for e in summary['slowest_modules']] == ['anthropic', 'anthropic.types']
+        assert summary['packages'][0] == {'package': 'anthropic', 'self_ms': 36.5}
+
+
+class TestWarmUp:
+
+    def test_warm_up_reports_modules_and_errors(self):
+        report = warm_up(['json', 'utils.tool_registry', 'no_such_module_xyz'], prompts=False)
+
+        assert set(report['modules']) == {'json', 'utils.tool_registry'}
+        assert report['errors']['no_such_module_xyz'].startswith('ModuleNotFoundError')
+        assert report['prompts'] == {}
+        assert report['seconds'] >= 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
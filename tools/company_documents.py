@@ -77,20 +77,11 @@ def search_company_documents(
         results = search_company_documents("", document_type="transcript", match_count=1, sort_by_date=True)
     """
     try:
-        from openai import OpenAI
-        from supabase import create_client
+        from utils.circuit_breaker import CircuitBreakerOpen
+        from utils.http_clients import create_embedding, get_supabase_client
 
-        # Initialize clients
-        openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_KEY')
-
-        # Debug: Log which Supabase project we're connecting to
-        print(f"🔗 Connecting to Supabase: {supabase_url}")
-        print(f"   Key prefix: {supabase_key[:20] if supabase_key else 'MISSING'}...")
-
-        supabase = create_client(supabase_url, supabase_key)
+        # Shared pooled clients (a new pair per search leaked connections)
+        supabase = get_supabase_client()
 
         # STRATEGY 1: Keyword matching on title
         # Extract simple keywords (remove common words)
@@ -165,16 +156,18 @@ def search_company_documents(
         semantic_matches = []
         remaining_slots = match_count - len(keyword_matches)
 
+        query_embedding = None
         if remaining_slots > 0:
             print(f"   Running semantic search for {remaining_slots} more matches...")
 
             # Generate embedding for query
-            response = openai_client.embeddings.create(
-                model="text-embedding-3-small",
-                input=query
-            )
-            query_embedding = response.data[0].embedding
+            try:
+                query_embedding = create_embedding(query)
+            except CircuitBreakerOpen as e:
+                # OpenAI embeddings are down: return keyword matches instead of waiting on a timeout
+                print(f"   ⚡ Skipping semantic search: {e}")
 
+        if query_embedding is not None:
             # Search company_documents table using RPC function
             filter_value = None if document_type == "all" else document_type
 
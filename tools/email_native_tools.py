@@ -8,6 +8,8 @@ import json
 import logging
 from typing import Optional
 from utils.anthropic_client import get_anthropic_client
+from utils.model_routing import create_message
+from utils.rag_prefetch import lookup_prefetched
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +29,10 @@ async def generate_5_hooks_native(topic: str, context: str, target_audience: str
         json_example=json_example
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=1000,
+    response = create_message(
+        client,
+        'hooks',
+        platform='email',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -40,6 +43,12 @@ async def search_company_documents_native(query: str, match_count: int = 3, docu
     """Search company documents - EXACT implementation from SDK agent"""
     from tools.company_documents import search_company_documents as _search_func
 
+    prefetched = await lookup_prefetched(
+        'company_documents', query, match_count=match_count, document_type=document_type
+    )
+    if prefetched is not None:
+        return prefetched
+
     result = _search_func(
         query=query,
         match_count=match_count,
@@ -57,11 +66,16 @@ async def inject_proof_points_native(draft: str, topic: str, industry: str = 'Em
     client = get_anthropic_client()
 
     # Search company documents for proof points FIRST
-    proof_context = _search_func(
-        query=f"{topic} case study metrics ROI testimonial",
-        match_count=3,
-        document_type=None  # Search all types
+    proof_query = f"{topic} case study metrics ROI testimonial"
+    proof_context = await lookup_prefetched(
+        'company_documents', proof_query, match_count=3, document_type=None
     )
+    if proof_context is None:
+        proof_context = _search_func(
+            query=proof_query,
+            match_count=3,
+            document_type=None  # Search all types
+        )
 
     prompt = INJECT_PROOF_PROMPT.format(
         write_like_human_rules=WRITE_LIKE_HUMAN_RULES,
@@ -71,9 +85,10 @@ async def inject_proof_points_native(draft: str, topic: str, industry: str = 'Em
         proof_context=proof_context
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2000,
+    response = create_message(
+        client,
+        'proof',
+        platform='email',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -103,9 +118,10 @@ async def create_human_draft_native(topic: str, subject_line: str, context: str)
         context=context
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=3000,
+    response = create_message(
+        client,
+        'draft',
+        platform='email',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -140,9 +156,10 @@ Focus on steps 1-4 only: scanning for violations, creating issues, scoring, and
 Mark any unverified claims as "NEEDS VERIFICATION" but do not attempt web searches."""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=3000,
+        response = create_message(
+            client,
+            'quality_check',
+            platform='email',
             messages=[{"role": "user", "content": prompt}]
         )
 
@@ -292,9 +309,10 @@ async def apply_fixes_native(
         write_like_human_rules=WRITE_LIKE_HUMAN_RULES
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=3000,
+    response = create_message(
+        client,
+        'apply_fixes',
+        platform='email',
         messages=[{"role": "user", "content": prompt}]
     )
 
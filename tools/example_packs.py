@@ -0,0 +1,152 @@
+"""
+Few-Shot Pack Store
+Precomputed, pre-formatted example blocks per (platform, content_type)
+
+The approved example corpus (content_examples, proven_copy_examples) rarely
+changes, but prompt builders re-query it and re-run extract_principles /
+analyze_* / analyze_video_timing on every call. Packs are built once and
+reused until the source table changes.
+
+Freshness:
+- Version token = row count + max(updated_at) of the source table
+- Version is re-checked at most every PACK_VERSION_CHECK_SECONDS (default 300)
+- Tables without updated_at fall back to PACK_MAX_AGE_SECONDS (default 3600)
+
+Byte stability: builders must order rows deterministically, and a pack's text
+is only replaced when the source version changes. Repeated prompts therefore
+stay byte-identical and keep hitting the writer's cache_control block.
+"""
+import os
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+VERSION_CHECK_SECONDS = float(os.getenv('PACK_VERSION_CHECK_SECONDS', '300'))
+MAX_AGE_SECONDS = float(os.getenv('PACK_MAX_AGE_SECONDS', '3600'))
+
+
+class FewShotPackStore:
+    """
+    In-process cache of built few-shot packs, invalidated by source version.
+
+    A pack is whatever the builder returns (formatted text or a list of
+    pre-analyzed examples). Builders should raise on failure so errors are
+    never cached.
+    """
+
+    def __init__(
+        self,
+        version_check_seconds: float = VERSION_CHECK_SECONDS,
+        max_age_seconds: float = MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.version_check_seconds = version_check_seconds
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # key -> {'value', 'version', 'built_at', 'digest'}
+        self._packs: Dict[Hashable, Dict[str, Any]] = {}
+        # table -> (version, checked_at)
+        self._versions: Dict[str, tuple] = {}
+        self.stats = {'hits': 0, 'builds': 0, 'version_checks': 0}
+
+    def source_version(self, table: str, client) -> Optional[str]:
+        """
+        Current version token for a table (throttled).
+
+        Returns:
+            "count:max_updated_at", or None if the table can't be versioned
+        """
+        now = self._clock()
+        cached = self._versions.get(table)
+        if cached and now - cached[1] < self.version_check_seconds:
+            return cached[0]
+
+        version = None
+        try:
+            result = client.table(table)\
+                .select('updated_at', count='exact')\
+                .order('updated_at', desc=True)\
+                .limit(1)\
+                .execute()
+            latest = result.data[0].get('updated_at') if result.data else None
+            version = f"{getattr(result, 'count', None)}:{latest}"
+        except Exception as e:
+            logger.debug(f"Version check failed for {table}, using max-age refresh: {e}")
+
+        self.stats['version_checks'] += 1
+        self._versions[table] = (version, now)
+        return version
+
+    def get(
+        self,
+        key: Hashable,
+        source_table: str,
+        builder: Callable[[], Any],
+        client
+    ) -> Any:
+        """
+        Return the cached pack for key, rebuilding if the source changed.
+
+        Args:
+            key: Pack key, e.g. ('email', 'Email_Value', 3)
+            source_table: Table whose version invalidates the pack
+            builder: Zero-arg function that builds the pack (raises on failure)
+            client: Supabase client used for the version check
+
+        Returns:
+            The pack value
+        """
+        version = self.source_version(source_table, client)
+        now = self._clock()
+
+        with self._lock:
+            pack = self._packs.get(key)
+            if pack is not None:
+                fresh = (
+                    pack['version'] == version if version is not None
+                    else now - pack['built_at'] < self.max_age_seconds
+                )
+                if fresh:
+                    self.stats['hits'] += 1
+                    return pack['value']
+
+        value = builder()
+        digest = hashlib.sha256(repr(value).encode()).hexdigest()[:12]
+
+        with self._lock:
+            previous = self._packs.get(key)
+            if previous is not None and previous['digest'] == digest:
+                # Same content - keep the existing object (identical bytes either way)
+                value = previous['value']
+            self._packs[key] = {'value': value, 'version': version, 'built_at': now, 'digest': digest}
+            self.stats['builds'] += 1
+
+        logger.info(f"📦 Built few-shot pack {key} (version {version}, digest {digest})")
+        return value
+
+    def invalidate(self, source_table: Optional[str] = None):
+        """Force rebuilds (all packs, or re-check one table's version)"""
+        with self._lock:
+            if source_table is None:
+                self._packs.clear()
+                self._versions.clear()
+            else:
+                self._versions.pop(source_table, None)
+
+
+# Global shared store instance
+_pack_store: Optional[FewShotPackStore] = None
+
+
+def get_pack_store() -> FewShotPackStore:
+    """Get or create the shared few-shot pack store"""
+    global _pack_store
+    if _pack_store is None:
+        _pack_store = FewShotPackStore()
+    return _pack_store
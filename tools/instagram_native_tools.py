@@ -8,6 +8,8 @@ import json
 import logging
 from typing import Optional
 from utils.anthropic_client import get_anthropic_client
+from utils.model_routing import create_message
+from utils.rag_prefetch import lookup_prefetched
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +29,10 @@ async def generate_5_hooks_native(topic: str, context: str, target_audience: str
         json_example=json_example
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=1000,
+    response = create_message(
+        client,
+        'hooks',
+        platform='instagram',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -40,6 +43,12 @@ async def search_company_documents_native(query: str, match_count: int = 3, docu
     """Search company documents - EXACT implementation from SDK agent"""
     from tools.company_documents import search_company_documents as _search_func
 
+    prefetched = await lookup_prefetched(
+        'company_documents', query, match_count=match_count, document_type=document_type
+    )
+    if prefetched is not None:
+        return prefetched
+
     result = _search_func(
         query=query,
         match_count=match_count,
@@ -63,9 +72,10 @@ async def create_caption_draft_native(topic: str, hook: str, context: str) -> st
         context=context
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=3000,
+    response = create_message(
+        client,
+        'draft',
+        platform='instagram',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -112,9 +122,10 @@ async def condense_to_limit_native(caption: str, target_length: int = 2200) -> s
         target_length=target_length
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2500,
+    response = create_message(
+        client,
+        'condense',
+        platform='instagram',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -144,9 +155,10 @@ Focus on steps 1-4 only: scanning for violations, creating issues, scoring, and
 Mark any unverified claims as "NEEDS VERIFICATION" but do not attempt web searches."""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=3000,
+        response = create_message(
+            client,
+            'quality_check',
+            platform='instagram',
             messages=[{"role": "user", "content": prompt}]
         )
 
@@ -297,9 +309,10 @@ async def apply_fixes_native(
         write_like_human_rules=WRITE_LIKE_HUMAN_RULES
     )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=3000,
+    response = create_message(
+        client,
+        'apply_fixes',
+        platform='instagram',
         messages=[{"role": "user", "content": prompt}]
     )
 
@@ -8,13 +8,12 @@ This works better than semantic search for structural principles
 import os
 import json
 from typing import Dict, List, Optional
-from supabase import create_client
 from dotenv import load_dotenv
+from tools.example_packs import get_pack_store
+from utils.http_clients import get_supabase_client
 
 load_dotenv()
 
-supabase = create_client(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_KEY'))
-
 
 def get_examples_by_type(
     content_type: str,
@@ -27,40 +26,55 @@ def get_examples_by_type(
     Content types in your database:
     - "Thread", "Long Form", "Atomic Essay", "Infographic", "Video Long Form"
 
-    Returns examples with extracted principles
+    Returns examples with extracted principles (cached pack - see tools/example_packs.py)
     """
     try:
-        query = supabase.table('content_examples').select('*')
+        examples = get_pack_store().get(
+            ('examples_by_type', content_type, platform, limit),
+            'content_examples',
+            lambda: _build_examples_by_type(content_type, platform, limit),
+            get_supabase_client()
+        )
+        return list(examples)
 
-        # Filter by content_type (case-insensitive partial match)
-        if content_type:
-            query = query.ilike('content_type', f'%{content_type}%')
+    except Exception as e:
+        print(f"Error: {e}")
+        return []
 
-        # Filter by platform
-        if platform:
-            query = query.eq('platform', platform)
 
-        # Only approved content
-        query = query.eq('status', 'approved')
+def _build_examples_by_type(
+    content_type: str,
+    platform: Optional[str],
+    limit: int
+) -> List[Dict]:
+    """Query + extract principles (raises on failure so errors aren't cached)"""
+    query = get_supabase_client().table('content_examples').select('*')
 
-        # Limit results
-        query = query.limit(limit)
+    # Filter by content_type (case-insensitive partial match)
+    if content_type:
+        query = query.ilike('content_type', f'%{content_type}%')
 
-        result = query.execute()
+    # Filter by platform
+    if platform:
+        query = query.eq('platform', platform)
 
-        # Extract principles from each example
-        examples_with_principles = []
-        for item in result.data:
-            examples_with_principles.append({
-                **item,
-                'principles': extract_principles(item)
-            })
+    # Only approved content
+    query = query.eq('status', 'approved')
 
-        return examples_with_principles
+    # Stable order so packs are byte-identical across rebuilds
+    query = query.order('id').limit(limit)
 
-    except Exception as e:
-        print(f"Error: {e}")
-        return []
+    result = query.execute()
+
+    # Extract principles from each example
+    examples_with_principles = []
+    for item in result.data:
+        examples_with_principles.append({
+            **item,
+            'principles': extract_principles(item)
+        })
+
+    return examples_with_principles
 
 
 def extract_principles(content_example: Dict) -> Dict:
@@ -293,7 +307,7 @@ def get_by_hook_pattern(hook_pattern: str, platform: Optional[str] = None, limit
     - "bold_claim_with_proof" → Strong claim + numbers
     """
     # Get all approved examples
-    query = supabase.table('content_examples').select('*').eq('status', 'approved')
+    query = get_supabase_client().table('content_examples').select('*').eq('status', 'approved')
 
     if platform:
         query = query.eq('platform', platform)
@@ -385,30 +399,42 @@ def get_email_examples_by_type(
     Returns: Full email with extracted WRITING patterns (subject style, tone, structure)
     """
     try:
-        query = supabase.table('content_examples')\
-            .select('*')\
-            .eq('platform', 'Email')\
-            .eq('content_type', email_type)\
-            .eq('status', 'approved')\
-            .limit(limit)
-
-        result = query.execute()
-
-        # Extract WRITING patterns from each email
-        emails_with_patterns = []
-        for email in result.data:
-            emails_with_patterns.append({
-                **email,
-                'writing_patterns': extract_email_writing_patterns(email)
-            })
-
-        return emails_with_patterns
+        examples = get_pack_store().get(
+            ('email_examples', email_type, limit),
+            'content_examples',
+            lambda: _build_email_examples(email_type, limit),
+            get_supabase_client()
+        )
+        return list(examples)
 
     except Exception as e:
         print(f"Error fetching email examples: {e}")
         return []
 
 
+def _build_email_examples(email_type: str, limit: int) -> List[Dict]:
+    """Query + extract writing patterns (raises on failure so errors aren't cached)"""
+    query = get_supabase_client().table('content_examples')\
+        .select('*')\
+        .eq('platform', 'Email')\
+        .eq('content_type', email_type)\
+        .eq('status', 'approved')\
+        .order('id')\
+        .limit(limit)
+
+    result = query.execute()
+
+    # Extract WRITING patterns from each email
+    emails_with_patterns = []
+    for email in result.data:
+        emails_with_patterns.append({
+            **email,
+            'writing_patterns': extract_email_writing_patterns(email)
+        })
+
+    return emails_with_patterns
+
+
 def extract_email_writing_patterns(email: Dict) -> Dict:
     """
     Extract reusable WRITING patterns from PGA email (not topic patterns)
@@ -579,8 +605,30 @@ def format_email_examples_for_prompt(email_type: str, limit: int = 3) -> str:
     """
     Format email examples for prompt injection
     Focus: Show WRITING STYLE, not topics
+
+    Cached per (email_type, limit) until content_examples changes, so the
+    text is byte-stable across calls.
     """
-    examples = get_email_examples_by_type(email_type, limit)
+    try:
+        return get_pack_store().get(
+            ('email_prompt', email_type, limit),
+            'content_examples',
+            lambda: _build_email_examples_prompt(email_type, limit),
+            get_supabase_client()
+        )
+    except Exception as e:
+        print(f"Error building email examples pack: {e}")
+        return f"No {email_type} examples found."
+
+
+def _build_email_examples_prompt(email_type: str, limit: int) -> str:
+    """Format the email pack text (raises on failure so errors aren't cached)"""
+    examples = get_pack_store().get(
+        ('email_examples', email_type, limit),
+        'content_examples',
+        lambda: _build_email_examples(email_type, limit),
+        get_supabase_client()
+    )
 
     if not examples:
         return f"No {email_type} examples found."
@@ -620,30 +668,42 @@ def get_youtube_examples_by_type(
     Returns: Full script with extracted WRITING patterns (hook style, cadence, timing)
     """
     try:
-        query = supabase.table('content_examples')\
-            .select('*')\
-            .eq('platform', 'YouTube')\
-            .eq('content_type', content_type)\
-            .eq('status', 'approved')\
-            .limit(limit)
-
-        result = query.execute()
-
-        # Extract WRITING patterns from each script
-        scripts_with_patterns = []
-        for script in result.data:
-            scripts_with_patterns.append({
-                **script,
-                'writing_patterns': extract_youtube_writing_patterns(script)
-            })
-
-        return scripts_with_patterns
+        examples = get_pack_store().get(
+            ('youtube_examples', content_type, limit),
+            'content_examples',
+            lambda: _build_youtube_examples(content_type, limit),
+            get_supabase_client()
+        )
+        return list(examples)
 
     except Exception as e:
         print(f"Error fetching YouTube examples: {e}")
         return []
 
 
+def _build_youtube_examples(content_type: str, limit: int) -> List[Dict]:
+    """Query + extract writing patterns (raises on failure so errors aren't cached)"""
+    query = get_supabase_client().table('content_examples')\
+        .select('*')\
+        .eq('platform', 'YouTube')\
+        .eq('content_type', content_type)\
+        .eq('status', 'approved')\
+        .order('id')\
+        .limit(limit)
+
+    result = query.execute()
+
+    # Extract WRITING patterns from each script
+    scripts_with_patterns = []
+    for script in result.data:
+        scripts_with_patterns.append({
+            **script,
+            'writing_patterns': extract_youtube_writing_patterns(script)
+        })
+
+    return scripts_with_patterns
+
+
 def extract_youtube_writing_patterns(script: Dict) -> Dict:
     """
     Extract reusable WRITING patterns from YouTube script (not topic patterns)
@@ -822,8 +882,30 @@ def format_youtube_examples_for_prompt(content_type: str = "Video Long Form", li
     """
     Format YouTube script examples for prompt injection
     Focus: Show WRITING STYLE, not topics
+
+    Cached per (content_type, limit) until content_examples changes, so the
+    text is byte-stable across calls.
     """
-    examples = get_youtube_examples_by_type(content_type, limit)
+    try:
+        return get_pack_store().get(
+            ('youtube_prompt', content_type, limit),
+            'content_examples',
+            lambda: _build_youtube_examples_prompt(content_type, limit),
+            get_supabase_client()
+        )
+    except Exception as e:
+        print(f"Error building YouTube examples pack: {e}")
+        return f"No {content_type} examples found."
+
+
+def _build_youtube_examples_prompt(content_type: str, limit: int) -> str:
+    """Format the YouTube pack text (raises on failure so errors aren't cached)"""
+    examples = get_pack_store().get(
+        ('youtube_examples', content_type, limit),
+        'content_examples',
+        lambda: _build_youtube_examples(content_type, limit),
+        get_supabase_client()
+    )
 
     if not examples:
         return f"No {content_type} examples found."
@@ -6,14 +6,11 @@ Use case: Extract writing principles applicable to ANY industry/topic
 import os
 import json
 from typing import Dict, List, Optional
-from openai import OpenAI
-from supabase import create_client
 from dotenv import load_dotenv
 
-load_dotenv()
+from utils.http_clients import create_embedding, get_supabase_client
 
-openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-supabase = create_client(os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_KEY'))
+load_dotenv()
 
 
 def search_by_principle(
@@ -49,14 +46,10 @@ def search_by_principle(
     """
     try:
         # Generate embedding for principle query
-        response = openai_client.embeddings.create(
-            model="text-embedding-3-small",
-            input=principle
-        )
-        query_embedding = response.data[0].embedding
+        query_embedding = create_embedding(principle)
 
         # Search examples
-        result = supabase.rpc(
+        result = get_supabase_client().rpc(
             'match_content_examples',
             {
                 'query_embedding': query_embedding,
@@ -6,27 +6,18 @@ Save and search Tavily research digests and industry reports
 import os
 from typing import List, Dict, Optional
 from datetime import date, datetime
-from openai import OpenAI
-from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from utils.http_clients import create_embedding, get_supabase_client
+
 load_dotenv()
 
-# Initialize clients
-openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-supabase: Client = create_client(
-    os.getenv('SUPABASE_URL'),
-    os.getenv('SUPABASE_KEY')
-)
+# Clients are the shared ones from utils/http_clients.py, created on first use
 
 
 def generate_embedding(text: str) -> List[float]:
     """Generate OpenAI embedding for text"""
-    response = openai_client.embeddings.create(
-        model="text-embedding-3-small",
-        input=text[:8000]  # Limit to avoid token limits
-    )
-    return response.data[0].embedding
+    return create_embedding(text[:8000])  # Limit to avoid token limits
 
 
 def calculate_credibility_score(source_names: List[str]) -> int:
@@ -115,7 +106,7 @@ def save_research(
     }
 
     # Insert to database
-    result = supabase.table('research').insert(data).execute()
+    result = get_supabase_client().table('research').insert(data).execute()
 
     if result.data:
         research_id = result.data[0]['id']
@@ -148,7 +139,7 @@ def search_research(
     query_embedding = generate_embedding(query)
 
     # Search using RPC function
-    result = supabase.rpc('match_research', {
+    result = get_supabase_client().rpc('match_research', {
         'query_embedding': query_embedding,
         'match_threshold': match_threshold,
         'match_count': match_count,
@@ -160,7 +151,7 @@ def search_research(
 
 def get_research_by_topic(topic: str) -> List[Dict]:
     """Get all research records for a specific topic"""
-    result = supabase.table('research').select('*').eq('topic', topic).eq(
+    result = get_supabase_client().table('research').select('*').eq('topic', topic).eq(
         'status', 'active'
     ).order('research_date', desc=True).execute()
 
@@ -170,7 +161,7 @@ def get_research_by_topic(topic: str) -> List[Dict]:
 def mark_research_used(research_id: str, content_id: str):
     """Mark research as used in a piece of content"""
     # Get current research record
-    result = supabase.table('research').select('used_in_content_ids, usage_count').eq(
+    result = get_supabase_client().table('research').select('used_in_content_ids, usage_count').eq(
         'id', research_id
     ).execute()
 
@@ -186,7 +177,7 @@ def mark_research_used(research_id: str, content_id: str):
         used_ids.append(content_id)
         usage_count += 1
 
-        supabase.table('research').update({
+        get_supabase_client().table('research').update({
             'used_in_content_ids': used_ids,
             'usage_count': usage_count
         }).eq('id', research_id).execute()
@@ -196,7 +187,7 @@ def mark_research_used(research_id: str, content_id: str):
 
 def get_popular_research(limit: int = 10) -> List[Dict]:
     """Get most-used research records"""
-    result = supabase.table('research').select('*').eq(
+    result = get_supabase_client().table('research').select('*').eq(
         'status', 'active'
     ).order('usage_count', desc=True).limit(limit).execute()
 
@@ -209,7 +200,7 @@ def archive_outdated_research(days_old: int = 365):
 
     cutoff_date = (date.today() - timedelta(days=days_old)).isoformat()
 
-    result = supabase.table('research').update({
+    result = get_supabase_client().table('research').update({
         'status': 'outdated'
     }).lt('research_date', cutoff_date).eq('status', 'active').execute()
 
@@ -24,15 +24,23 @@ def web_search(query: str, max_results: int = 5) -> str:
         JSON string with search results
     """
     try:
-        from tavily import TavilyClient
+        from utils.http_clients import get_tavily_client
 
-        tavily = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
+        from utils.circuit_breaker import get_breaker
+        from utils.deadline import hedged_call, timeout_for
 
-        # Perform search
-        results = tavily.search(
+        tavily = get_tavily_client()
+
+        # Perform search (fails fast while the shared Tavily breaker is open; a search
+        # slower than the observed p95 gets a duplicate request, first answer wins)
+        results = get_breaker('tavily').call(
+            hedged_call,
+            'tavily',
+            tavily.search,
             query=query,
             max_results=max_results,
-            search_depth="advanced"
+            search_depth="advanced",
+            timeout=timeout_for(60)
         )
 
         # Format results
@@ -74,12 +82,14 @@ def perplexity_search(query: str, search_focus: str = "internet") -> str:
     """
     try:
         from openai import OpenAI
+        from utils.http_clients import pooled_http_client, registry
 
-        # Initialize Perplexity client (OpenAI-compatible API)
-        perplexity = OpenAI(
+        # Shared Perplexity client (OpenAI-compatible API)
+        perplexity = registry.get('perplexity', lambda: OpenAI(
             api_key=os.getenv('PERPLEXITY_API_KEY'),
-            base_url="https://api.perplexity.ai"
-        )
+            base_url="https://api.perplexity.ai",
+            http_client=pooled_http_client(timeout=60.0)
+        ))
 
         # Map search focus to model
         # sonar-pro: Most capable, best for complex queries
@@ -108,7 +118,10 @@ def perplexity_search(query: str, search_focus: str = "internet") -> str:
                 'note': 'Add PERPLEXITY_API_KEY to your environment variables'
             })
 
-        response = perplexity.chat.completions.create(
+        from utils.circuit_breaker import get_breaker
+
+        response = get_breaker('perplexity').call(
+            perplexity.chat.completions.create,
             model=model,
             messages=messages,
             max_tokens=1000,
@@ -170,22 +183,13 @@ def search_knowledge_base(query: str, match_count: int = 5, document_type: str =
         JSON string with matched content
     """
     try:
-        from openai import OpenAI
-        from supabase import create_client
+        from utils.http_clients import create_embedding, get_supabase_client
 
-        # Initialize clients
-        openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
+        # Shared pooled client
+        supabase = get_supabase_client()
 
-        # Generate embedding for query
-        response = openai_client.embeddings.create(
-            model="text-embedding-3-small",
-            input=query
-        )
-        query_embedding = response.data[0].embedding
+        # Generate embedding for query (shared OpenAI client, embeddings breaker)
+        query_embedding = create_embedding(query)
 
         # Search company_documents (V2 schema)
         result = supabase.rpc(
@@ -245,12 +249,9 @@ def analyze_past_content(platform: str = None, limit: int = 10) -> str:
         JSON string with top performing content
     """
     try:
-        from supabase import create_client
+        from utils.http_clients import get_supabase_client
 
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
+        supabase = get_supabase_client()
 
         # Query content_examples (V2 schema)
         query = supabase.table('content_examples').select('*').eq(
@@ -304,22 +305,13 @@ def search_content_examples(query: str, platform: str = None, match_count: int =
         JSON string with matched content examples
     """
     try:
-        from openai import OpenAI
-        from supabase import create_client
+        from utils.http_clients import create_embedding, get_supabase_client
 
-        # Initialize clients
-        openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
+        # Shared pooled client
+        supabase = get_supabase_client()
 
-        # Generate embedding for query
-        response = openai_client.embeddings.create(
-            model="text-embedding-3-small",
-            input=query
-        )
-        query_embedding = response.data[0].embedding
+        # Generate embedding for query (shared OpenAI client, embeddings breaker)
+        query_embedding = create_embedding(query)
 
         # Search content_examples
         result = supabase.rpc(
@@ -377,22 +369,13 @@ def search_research(query: str, min_credibility: int = 5, match_count: int = 5)
         JSON string with matched research
     """
     try:
-        from openai import OpenAI
-        from supabase import create_client
+        from utils.http_clients import create_embedding, get_supabase_client
 
-        # Initialize clients
-        openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
+        # Shared pooled client
+        supabase = get_supabase_client()
 
-        # Generate embedding for query
-        response = openai_client.embeddings.create(
-            model="text-embedding-3-small",
-            input=query
-        )
-        query_embedding = response.data[0].embedding
+        # Generate embedding for query (shared OpenAI client, embeddings breaker)
+        query_embedding = create_embedding(query)
 
         # Search research
         result = supabase.rpc(
@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from typing import List, Dict, Any
 from anthropic import Anthropic
+from utils.model_routing import create_message
 
 def load_all_templates() -> List[Dict[str, Any]]:
     """Load all JSON templates from templates/ directory"""
@@ -86,9 +87,9 @@ Select exactly {max_results} templates, ranked by best match first."""
 
     try:
         # Call Claude for reasoning
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
+        response = create_message(
+            client,
+            'template_match',
             temperature=0.3,  # Lower temp for consistent matching
             messages=[{
                 "role": "user",
@@ -2,16 +2,38 @@
 Circuit Breaker Pattern
 Conservative settings: 3 failures → 120s cooldown
 Prevents cascading failures when API is degraded
+
+In multi-worker mode (shared state backend other than memory) a breaker's
+state/failure_count/last_failure_time live in the shared store under the
+breaker's name, so one worker tripping the breaker stops the others too.
+
+get_breaker(name) returns the process-wide breaker for an external
+dependency (DEPENDENCY_BREAKERS: Tavily, Perplexity, GPTZero, Airtable,
+Ayrshare, OpenAI embeddings, the direct API agents' Anthropic calls). Callers
+catch CircuitBreakerOpen and fall back (skip GPTZero, keyword-only search,
+Supabase-only save) instead of waiting out a timeout on every post during an
+outage. Client errors (4xx other than 429) don't count as failures.
+get_breaker_states() is exposed on /readyz.
+
+Config (env):
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD   Consecutive failures before a dependency breaker opens (default: 3)
+    CIRCUIT_BREAKER_RECOVERY_SECONDS    Seconds open before a test request (default: 120)
 """
+import os
 import time
 import logging
 from functools import wraps
-from typing import Callable, Any, Optional, Dict
+from typing import Callable, Any, Optional, Dict, Tuple
 from enum import Enum
 from threading import Lock
 
+from utils.deadline import DeadlineExceeded
+from utils.shared_state import get_shared_state
+
 logger = logging.getLogger(__name__)
 
+SHARED_NAMESPACE = 'circuit_breakers'
+
 
 class CircuitState(Enum):
     """Circuit breaker states"""
@@ -37,7 +59,8 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 3,
         recovery_timeout: float = 120.0,
-        name: str = "circuit_breaker"
+        name: str = "circuit_breaker",
+        is_failure: Optional[Callable[[Exception], bool]] = None
     ):
         """
         Initialize circuit breaker.
@@ -46,17 +69,151 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening (default: 3)
             recovery_timeout: Seconds to wait before trying again (default: 120)
             name: Name for logging
+            is_failure: Which exceptions count towards opening (default: all)
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.name = name
+        self.is_failure = is_failure or (lambda e: True)
 
-        self.failure_count = 0
-        self.last_failure_time = None
-        self.state = CircuitState.CLOSED
+        # Defaults only; a breaker with the same name in another worker keeps its state
+        self._local = {'state': CircuitState.CLOSED.value, 'failure_count': 0, 'last_failure_time': None}
+        store = get_shared_state()
+        self._shared = store if store.shared else None
 
         self._lock = Lock()
 
+    # ============= STATE (shared across workers in multi-worker mode) =============
+
+    def _record(self) -> Dict[str, Any]:
+        if self._shared is None:
+            return self._local
+        return self._shared.get(SHARED_NAMESPACE, self.name) or self._local
+
+    def _update(self, fn: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        if self._shared is None:
+            self._local = fn(self._local)
+        else:
+            self._local = self._shared.update(SHARED_NAMESPACE, self.name, lambda record: fn(record or self._local))
+
+    @property
+    def state(self) -> CircuitState:
+        return CircuitState(self._record()['state'])
+
+    @state.setter
+    def state(self, value: CircuitState):
+        self._update(lambda record: {**record, 'state': value.value})
+
+    @property
+    def failure_count(self) -> int:
+        return self._record()['failure_count']
+
+    @failure_count.setter
+    def failure_count(self, value: int):
+        self._update(lambda record: {**record, 'failure_count': value})
+
+    @property
+    def last_failure_time(self) -> Optional[float]:
+        return self._record()['last_failure_time']
+
+    @last_failure_time.setter
+    def last_failure_time(self, value: Optional[float]):
+        self._update(lambda record: {**record, 'last_failure_time': value})
+
+    def _record_failure(self) -> Tuple[CircuitState, Dict[str, Any]]:
+        """
+        Count a failure and open the circuit if needed, in one atomic update across workers.
+
+        Returns:
+            (state before the failure, record after it)
+        """
+        now = time.time()
+        previous = {}
+
+        def fail(record):
+            previous['state'] = record['state']
+            failure_count = record['failure_count'] + 1
+            opens = record['state'] == CircuitState.HALF_OPEN.value or failure_count >= self.failure_threshold
+            return {
+                **record,
+                'failure_count': failure_count,
+                'last_failure_time': now,
+                'state': CircuitState.OPEN.value if opens else record['state'],
+            }
+
+        self._update(fail)
+        return CircuitState(previous['state']), self._local
+
+    def record_success(self, context: Optional[Dict[str, Any]] = None):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            record = self._record()
+            if record['state'] == CircuitState.HALF_OPEN.value:
+                logger.info(
+                    f"✅ Circuit breaker '{self.name}' test successful - CLOSING circuit",
+                    extra={
+                        'circuit_breaker': self.name,
+                        'state': 'closed',
+                        'previous_failures': record['failure_count'],
+                        **(context or {})
+                    }
+                )
+            self._update(lambda record: {**record, 'failure_count': 0, 'state': CircuitState.CLOSED.value})
+
+    def record_failure(self, exc: Exception, context: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Record a failed call, for callers that handle errors themselves instead of using call().
+
+        Returns:
+            True if the error counted towards opening (is_failure), False if it was ignored
+        """
+        if not self.is_failure(exc):
+            return False
+
+        with self._lock:
+            previous_state, record = self._record_failure()
+            failure_count = record['failure_count']
+            error = {'error_type': type(exc).__name__, 'error_message': str(exc), **(context or {})}
+
+            if previous_state == CircuitState.HALF_OPEN:
+                # Failed during test - re-open circuit
+                logger.error(
+                    f"❌ Circuit breaker '{self.name}' test failed - RE-OPENING circuit",
+                    extra={
+                        'circuit_breaker': self.name,
+                        'state': 'open',
+                        'failure_count': failure_count,
+                        'recovery_timeout': f"{self.recovery_timeout}s",
+                        **error
+                    }
+                )
+            elif previous_state == CircuitState.CLOSED and record['state'] == CircuitState.OPEN.value:
+                # Reached threshold - open circuit
+                logger.error(
+                    f"🔥 Circuit breaker '{self.name}' OPENING - failure threshold reached",
+                    extra={
+                        'circuit_breaker': self.name,
+                        'state': 'open',
+                        'failure_count': failure_count,
+                        'failure_threshold': self.failure_threshold,
+                        'recovery_timeout': f"{self.recovery_timeout}s",
+                        **error
+                    }
+                )
+            else:
+                # Increment but don't open yet
+                logger.warning(
+                    f"⚠️  Circuit breaker '{self.name}' failure {failure_count}/{self.failure_threshold}",
+                    extra={
+                        'circuit_breaker': self.name,
+                        'state': record['state'],
+                        'failure_count': failure_count,
+                        'failure_threshold': self.failure_threshold,
+                        **error
+                    }
+                )
+        return True
+
     def call(self, func: Callable, *args, context: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
         """
         Call function through circuit breaker (synchronous version).
@@ -111,77 +268,13 @@ class CircuitBreaker:
             result = func(*args, **kwargs)
 
             # Success - reset or close circuit
-            with self._lock:
-                if self.state == CircuitState.HALF_OPEN:
-                    logger.info(
-                        f"✅ Circuit breaker '{self.name}' test successful - CLOSING circuit",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'closed',
-                            'previous_failures': self.failure_count,
-                            **(context or {})
-                        }
-                    )
-
-                self.failure_count = 0
-                self.state = CircuitState.CLOSED
+            self.record_success(context)
 
             return result
 
         except Exception as e:
-            # Failure - increment counter and potentially open circuit
-            with self._lock:
-                self.failure_count += 1
-                self.last_failure_time = time.time()
-
-                if self.state == CircuitState.HALF_OPEN:
-                    # Failed during test - re-open circuit
-                    logger.error(
-                        f"❌ Circuit breaker '{self.name}' test failed - RE-OPENING circuit",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'open',
-                            'failure_count': self.failure_count,
-                            'recovery_timeout': f"{self.recovery_timeout}s",
-                            'error_type': type(e).__name__,
-                            'error_message': str(e),
-                            **(context or {})
-                        }
-                    )
-                    self.state = CircuitState.OPEN
-
-                elif self.failure_count >= self.failure_threshold:
-                    # Reached threshold - open circuit
-                    logger.error(
-                        f"🔥 Circuit breaker '{self.name}' OPENING - failure threshold reached",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'open',
-                            'failure_count': self.failure_count,
-                            'failure_threshold': self.failure_threshold,
-                            'recovery_timeout': f"{self.recovery_timeout}s",
-                            'error_type': type(e).__name__,
-                            'error_message': str(e),
-                            **(context or {})
-                        }
-                    )
-                    self.state = CircuitState.OPEN
-
-                else:
-                    # Increment but don't open yet
-                    logger.warning(
-                        f"⚠️  Circuit breaker '{self.name}' failure {self.failure_count}/{self.failure_threshold}",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'closed',
-                            'failure_count': self.failure_count,
-                            'failure_threshold': self.failure_threshold,
-                            'error_type': type(e).__name__,
-                            'error_message': str(e),
-                            **(context or {})
-                        }
-                    )
-
+            # Outages count towards opening; e.g. a 400 for bad input is not an outage
+            self.record_failure(e, context)
             raise
 
     async def call_async(self, func: Callable, *args, context: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
@@ -238,79 +331,23 @@ class CircuitBreaker:
             result = await func(*args, **kwargs)
 
             # Success - reset or close circuit
-            with self._lock:
-                if self.state == CircuitState.HALF_OPEN:
-                    logger.info(
-                        f"✅ Circuit breaker '{self.name}' test successful - CLOSING circuit",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'closed',
-                            'previous_failures': self.failure_count,
-                            **(context or {})
-                        }
-                    )
-
-                self.failure_count = 0
-                self.state = CircuitState.CLOSED
+            self.record_success(context)
 
             return result
 
         except Exception as e:
-            # Failure - increment counter and potentially open circuit
-            with self._lock:
-                self.failure_count += 1
-                self.last_failure_time = time.time()
-
-                if self.state == CircuitState.HALF_OPEN:
-                    # Failed during test - re-open circuit
-                    logger.error(
-                        f"❌ Circuit breaker '{self.name}' test failed - RE-OPENING circuit",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'open',
-                            'failure_count': self.failure_count,
-                            'recovery_timeout': f"{self.recovery_timeout}s",
-                            'error_type': type(e).__name__,
-                            'error_message': str(e),
-                            **(context or {})
-                        }
-                    )
-                    self.state = CircuitState.OPEN
-
-                elif self.failure_count >= self.failure_threshold:
-                    # Reached threshold - open circuit
-                    logger.error(
-                        f"🔥 Circuit breaker '{self.name}' OPENING - failure threshold reached",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'open',
-                            'failure_count': self.failure_count,
-                            'failure_threshold': self.failure_threshold,
-                            'recovery_timeout': f"{self.recovery_timeout}s",
-                            'error_type': type(e).__name__,
-                            'error_message': str(e),
-                            **(context or {})
-                        }
-                    )
-                    self.state = CircuitState.OPEN
-
-                else:
-                    # Increment but don't open yet
-                    logger.warning(
-                        f"⚠️  Circuit breaker '{self.name}' failure {self.failure_count}/{self.failure_threshold}",
-                        extra={
-                            'circuit_breaker': self.name,
-                            'state': 'closed',
-                            'failure_count': self.failure_count,
-                            'failure_threshold': self.failure_threshold,
-                            'error_type': type(e).__name__,
-                            'error_message': str(e),
-                            **(context or {})
-                        }
-                    )
-
+            # Outages count towards opening; e.g. a 400 for bad input is not an outage
+            self.record_failure(e, context)
             raise
 
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a test request through (0 when calls are allowed)"""
+        with self._lock:
+            record = self._record()
+            if record['state'] != CircuitState.OPEN.value or record['last_failure_time'] is None:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.time() - record['last_failure_time']))
+
     def reset(self):
         """Manually reset circuit breaker to closed state."""
         with self._lock:
@@ -329,14 +366,21 @@ class CircuitBreaker:
     def get_state(self) -> Dict[str, Any]:
         """Get current circuit breaker state for monitoring."""
         with self._lock:
+            record = self._record()
+            last_failure_time = record['last_failure_time']
+            time_since_failure = time.time() - last_failure_time if last_failure_time else None
             return {
                 'name': self.name,
-                'state': self.state.value,
-                'failure_count': self.failure_count,
+                'state': record['state'],
+                'failure_count': record['failure_count'],
                 'failure_threshold': self.failure_threshold,
                 'recovery_timeout': self.recovery_timeout,
-                'last_failure_time': self.last_failure_time,
-                'time_since_failure': time.time() - self.last_failure_time if self.last_failure_time else None
+                'last_failure_time': last_failure_time,
+                'time_since_failure': time_since_failure,
+                'retry_after': (
+                    max(0.0, self.recovery_timeout - time_since_failure)
+                    if record['state'] == CircuitState.OPEN.value and time_since_failure is not None else 0.0
+                )
             }
 
 
@@ -394,3 +438,68 @@ def circuit_breaker(
             return sync_wrapper
 
     return decorator
+
+
+
+# ============= NAMED BREAKERS (one per external dependency) =============
+
+FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '3'))
+RECOVERY_SECONDS = float(os.getenv('CIRCUIT_BREAKER_RECOVERY_SECONDS', '120'))
+
+# Registered up front so /readyz lists them before first use
+DEPENDENCY_BREAKERS = [
+    'tavily',
+    'perplexity',
+    'gptzero',
+    'airtable',
+    'ayrshare',
+    'openai_embeddings',
+]
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = Lock()
+
+
+def is_outage(exc: Exception) -> bool:
+    """Count server errors, timeouts and connection failures; not 4xx client errors (429 counts)"""
+    if isinstance(exc, DeadlineExceeded):
+        return False  # Our post ran out of time; says nothing about the dependency
+    response = getattr(exc, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(exc, 'status_code', None)
+    if isinstance(status, int) and 400 <= status < 500 and status != 429:
+        return False
+    return True
+
+
+def get_breaker(
+    name: str,
+    failure_threshold: Optional[int] = None,
+    recovery_timeout: Optional[float] = None
+) -> CircuitBreaker:
+    """
+    Process-wide circuit breaker for a dependency, created on first use.
+
+    Every caller of a dependency shares its breaker, so failures in one post
+    open it for the rest of the batch (and, in multi-worker mode, for every worker).
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = _breakers[name] = CircuitBreaker(
+                    failure_threshold=failure_threshold or FAILURE_THRESHOLD,
+                    recovery_timeout=recovery_timeout or RECOVERY_SECONDS,
+                    name=name,
+                    is_failure=is_outage
+                )
+    return breaker
+
+
+def get_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """State of every named breaker (dependencies plus any created with get_breaker)"""
+    for name in DEPENDENCY_BREAKERS:
+        get_breaker(name)
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.get_state() for breaker in sorted(breakers, key=lambda b: b.name)}
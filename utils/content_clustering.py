@@ -0,0 +1,253 @@
+"""
+Embedding-Space Clustering for Content Pattern Analysis
+Groups posts by semantic similarity so Claude sees compact cluster summaries
+instead of hundreds of raw previews.
+
+- Vectorized spherical k-means (cosine) over float32 embeddings
+- k-means++ seeding with a fixed seed (same input → same clusters)
+- Per-cluster centroid, engagement stats, platform/content-type mix,
+  and representative posts (closest to centroid + best performer)
+
+Requires numpy (imported by callers inside try/except so analytics keeps
+working without it).
+"""
+import json
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CLUSTERS = 8
+DEFAULT_MAX_ITERATIONS = 50
+DEFAULT_SEED = 42
+
+
+def parse_embedding(value: Any) -> Optional[List[float]]:
+    """
+    Normalize an embedding value from Supabase.
+
+    pgvector columns come back from PostgREST as strings ("[0.1,0.2,...]"),
+    RPCs/JSON columns as lists.
+
+    Returns:
+        List of floats or None if unparseable
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except (json.JSONDecodeError, ValueError):
+            return None
+    if isinstance(value, (list, tuple)) and value:
+        return value
+    return None
+
+
+def embeddings_matrix(posts: List[Dict[str, Any]]) -> tuple:
+    """
+    Build an L2-normalized float32 matrix from posts with valid embeddings.
+
+    Returns:
+        (matrix [n, d], list of posts kept in row order)
+    """
+    vectors = []
+    kept = []
+    dim = None
+    for post in posts:
+        emb = parse_embedding(post.get('embedding'))
+        if emb is None:
+            continue
+        if dim is None:
+            dim = len(emb)
+        if len(emb) != dim:
+            continue
+        vectors.append(emb)
+        kept.append(post)
+
+    if not vectors:
+        return np.zeros((0, 0), dtype=np.float32), []
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms, kept
+
+
+def choose_k(n_posts: int, max_clusters: int = DEFAULT_MAX_CLUSTERS) -> int:
+    """Rule-of-thumb k = sqrt(n/2), clamped to [1, max_clusters]"""
+    if n_posts < 4:
+        return 1
+    return int(min(max_clusters, max(2, round((n_posts / 2) ** 0.5))))
+
+
+def kmeans(
+    matrix: np.ndarray,
+    k: int,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    seed: int = DEFAULT_SEED
+) -> tuple:
+    """
+    Spherical k-means on L2-normalized rows (cosine similarity).
+
+    Args:
+        matrix: [n, d] float32, rows L2-normalized
+        k: Number of clusters
+        max_iterations: Iteration cap
+        seed: RNG seed for k-means++ init
+
+    Returns:
+        (labels [n] int, centroids [k, d] float32, iterations run)
+    """
+    n = matrix.shape[0]
+    k = max(1, min(k, n))
+    rng = np.random.default_rng(seed)
+
+    # k-means++ seeding on cosine distance
+    centroids = np.empty((k, matrix.shape[1]), dtype=np.float32)
+    centroids[0] = matrix[rng.integers(n)]
+    closest = 1.0 - matrix @ centroids[0]
+    for i in range(1, k):
+        weights = np.clip(closest, 0, None) ** 2
+        total = weights.sum()
+        idx = rng.choice(n, p=weights / total) if total > 0 else rng.integers(n)
+        centroids[i] = matrix[idx]
+        closest = np.minimum(closest, 1.0 - matrix @ centroids[i])
+
+    labels = np.full(n, -1, dtype=np.int64)
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        new_labels = np.argmax(matrix @ centroids.T, axis=1)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, matrix)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        empty = norms[:, 0] == 0
+        if empty.any():
+            # Re-seed empty clusters with the points farthest from their centroid
+            similarity = np.sum(matrix * centroids[labels], axis=1)
+            far = np.argsort(similarity)[:int(empty.sum())]
+            sums[empty] = matrix[far]
+            norms[empty] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+
+    return labels, centroids, iterations
+
+
+def _preview(text: Optional[str], limit: int) -> str:
+    return (text or '')[:limit]
+
+
+def summarize_clusters(
+    posts: List[Dict[str, Any]],
+    matrix: np.ndarray,
+    labels: np.ndarray,
+    centroids: np.ndarray,
+    top_post_ids: Optional[set] = None,
+    representatives: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Build compact per-cluster summaries, sorted by average engagement.
+
+    Args:
+        posts: Posts in matrix row order
+        matrix: Normalized embeddings
+        labels: Cluster label per row
+        centroids: Cluster centroids
+        top_post_ids: IDs of top-N% posts (counted per cluster)
+        representatives: Posts closest to centroid to include
+
+    Returns:
+        List of cluster summary dicts (no embeddings - prompt-safe)
+    """
+    top_post_ids = top_post_ids or set()
+    engagement = np.array([float(p.get('engagement_rate') or 0.0) for p in posts], dtype=np.float32)
+    impressions = np.array([float(p.get('impressions') or 0) for p in posts], dtype=np.float32)
+    similarity = np.sum(matrix * centroids[labels], axis=1)
+    total = len(posts)
+
+    summaries = []
+    for cluster_id in range(centroids.shape[0]):
+        rows = np.flatnonzero(labels == cluster_id)
+        if rows.size == 0:
+            continue
+
+        closest = rows[np.argsort(-similarity[rows])][:representatives]
+        best = int(rows[np.argmax(engagement[rows])])
+        rep_rows = list(dict.fromkeys([int(r) for r in closest] + [best]))
+
+        members = [posts[int(r)] for r in rows]
+        summaries.append({
+            'cluster_id': cluster_id,
+            'size': int(rows.size),
+            'share_pct': round(100.0 * rows.size / total, 1),
+            'avg_engagement': round(float(engagement[rows].mean()), 2),
+            'median_engagement': round(float(np.median(engagement[rows])), 2),
+            'max_engagement': round(float(engagement[rows].max()), 2),
+            'avg_impressions': int(impressions[rows].mean()),
+            'top_performers': sum(1 for p in members if p.get('id') in top_post_ids),
+            'cohesion': round(float(similarity[rows].mean()), 3),
+            'platforms': dict(Counter(p.get('platform') or 'unknown' for p in members).most_common(3)),
+            'content_types': dict(Counter(p.get('content_type') or 'unknown' for p in members).most_common(3)),
+            'representative_posts': [
+                {
+                    'hook': _preview(posts[r].get('post_hook'), 200),
+                    'content_preview': _preview(posts[r].get('body_content'), 300),
+                    'engagement_rate': float(engagement[r]),
+                    'best_in_cluster': r == best
+                }
+                for r in rep_rows
+            ]
+        })
+
+    summaries.sort(key=lambda s: s['avg_engagement'], reverse=True)
+    return summaries
+
+
+def cluster_posts(
+    posts: List[Dict[str, Any]],
+    top_post_ids: Optional[set] = None,
+    max_clusters: int = DEFAULT_MAX_CLUSTERS,
+    seed: int = DEFAULT_SEED
+) -> Dict[str, Any]:
+    """
+    Cluster posts by embedding and summarize each cluster.
+
+    Args:
+        posts: Post dicts with 'embedding', 'engagement_rate', hook/body fields
+        top_post_ids: IDs of top-N% posts (flagged in summaries)
+        max_clusters: Upper bound on k
+        seed: RNG seed
+
+    Returns:
+        {
+            "clusters": [summary, ...],
+            "k": 4,
+            "clustered_posts": 120,
+            "skipped_posts": 3,   # missing/invalid embeddings
+            "iterations": 7
+        }
+    """
+    matrix, kept = embeddings_matrix(posts)
+    if not kept:
+        return {'clusters': [], 'k': 0, 'clustered_posts': 0, 'skipped_posts': len(posts), 'iterations': 0}
+
+    k = choose_k(len(kept), max_clusters)
+    labels, centroids, iterations = kmeans(matrix, k, seed=seed)
+    clusters = summarize_clusters(kept, matrix, labels, centroids, top_post_ids)
+
+    logger.info(f"Clustered {len(kept)} posts into {len(clusters)} clusters ({iterations} iterations)")
+
+    return {
+        'clusters': clusters,
+        'k': len(clusters),
+        'clustered_posts': len(kept),
+        'skipped_posts': len(posts) - len(kept),
+        'iterations': iterations
+    }
@@ -0,0 +1,260 @@
+"""
+Deadline Propagation and Hedged Requests
+One remaining-time budget per post instead of independent nested timeouts.
+
+Timeouts used to be fixed at every level (360s per post, 120/60s per API
+iteration, 30/120s per tool, 45/60s per validator), so a slow upstream call
+simply consumed its own budget even when the post had almost none left.
+Now the post opens a deadline and every nested call derives its timeout
+from what remains:
+
+    with deadline(360):                      # batch post
+        ...
+        timeout = timeout_for(60.0)          # min(60, remaining), raises when expired
+
+Deadlines live in a ContextVar, so they follow asyncio tasks and
+asyncio.to_thread() calls, and a nested deadline can only shorten the outer one.
+
+Hedging (tail latency): idempotent calls (embeddings, Tavily search, grading)
+can go through hedged_call(). When the first request hasn't answered after
+the call's observed p95 latency, a duplicate is fired and whichever answers
+first wins. Only ~5% of calls are duplicated, so spend barely moves while the
+slowest calls stop setting the batch's pace. Hedging only starts after
+HEDGE_MIN_SAMPLES latencies have been seen for that call.
+
+Config (env):
+    POST_DEADLINE_SECONDS      Time budget per batch post (default: 360)
+    HEDGING_ENABLED            Fire duplicate requests for slow idempotent calls (default: true)
+    HEDGE_PERCENTILE           Latency percentile after which to hedge (default: 95)
+    HEDGE_MIN_SAMPLES          Latencies observed before hedging starts (default: 20)
+    HEDGE_MIN_DELAY_SECONDS    Never hedge sooner than this (default: 0.5)
+    HEDGE_MAX_WORKERS          Threads for hedged calls (default: 16)
+
+Usage:
+    from utils.deadline import deadline, hedged_call, timeout_for
+
+    response = hedged_call('tavily', tavily.search, query=query)
+"""
+import os
+import time
+import logging
+import threading
+import contextvars
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+POST_DEADLINE_SECONDS = float(os.getenv('POST_DEADLINE_SECONDS', '360'))
+HEDGING_ENABLED = os.getenv('HEDGING_ENABLED', 'true').lower() == 'true'
+HEDGE_PERCENTILE = float(os.getenv('HEDGE_PERCENTILE', '95'))
+HEDGE_MIN_SAMPLES = int(os.getenv('HEDGE_MIN_SAMPLES', '20'))
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv('HEDGE_MIN_DELAY_SECONDS', '0.5'))
+HEDGE_MAX_WORKERS = int(os.getenv('HEDGE_MAX_WORKERS', '16'))
+
+# Latencies kept per call name
+LATENCY_WINDOW = 200
+
+
+class DeadlineExceeded(TimeoutError):
+    """The enclosing deadline has passed; don't start the call"""
+    pass
+
+
+# ============= DEADLINES =============
+
+_deadline: ContextVar[Optional[float]] = ContextVar('deadline', default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Run the block with at most `seconds` left (never extends an outer deadline).
+
+    Yields:
+        The absolute time.monotonic() deadline in effect
+    """
+    outer = _deadline.get()
+    at = time.monotonic() + seconds
+    if outer is not None:
+        at = min(at, outer)
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline (None when no deadline is set)"""
+    at = _deadline.get()
+    if at is None:
+        return None
+    return max(0.0, at - time.monotonic())
+
+
+def timeout_for(default: float) -> float:
+    """
+    Timeout for a nested call: its own default, capped by the remaining budget.
+
+    Raises:
+        DeadlineExceeded: No time left
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded before call started")
+    return min(default, left)
+
+
+# ============= LATENCY TRACKING =============
+
+class LatencyTracker:
+    """Rolling latency samples and hedge counts per call name"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._hedges: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, name: str, pct: float = HEDGE_PERCENTILE) -> Optional[float]:
+        """Latency percentile for a call (None until HEDGE_MIN_SAMPLES are in)"""
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+        if len(samples) < max(1, HEDGE_MIN_SAMPLES):
+            return None
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def count_hedge(self, name: str, won: bool):
+        with self._lock:
+            counts = self._hedges.setdefault(name, {'hedged': 0, 'hedge_won': 0})
+            counts['hedged'] += 1
+            counts['hedge_won'] += int(won)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            samples_by_name = {name: sorted(samples) for name, samples in self._samples.items()}
+            hedges = {name: dict(counts) for name, counts in self._hedges.items()}
+        stats = {}
+        for name, samples in samples_by_name.items():
+            stats[name] = {
+                'samples': len(samples),
+                'p50': round(samples[len(samples) // 2], 3),
+                'p95': round(samples[min(len(samples) - 1, int(0.95 * len(samples)))], 3),
+                **hedges.get(name, {'hedged': 0, 'hedge_won': 0}),
+            }
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._hedges.clear()
+
+
+_latencies = LatencyTracker()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """p50/p95 and hedge counts per hedged call"""
+    return _latencies.stats()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix='hedge')
+        return _executor
+
+
+# ============= HEDGING =============
+
+def hedged_call(
+    name: str,
+    fn: Callable[..., Any],
+    *args,
+    on_discard: Optional[Callable[[Any], None]] = None,
+    **kwargs
+) -> Any:
+    """
+    Call fn(*args, **kwargs); fire a duplicate if it's slower than the p95 for `name`.
+
+    Only for idempotent calls. The first successful answer wins; an error
+    only surfaces when both requests fail. Each request's own latency is
+    recorded (also when it loses) so hedging doesn't skew the percentile.
+
+    Args:
+        name: Latency bucket (e.g. 'tavily', 'openai_embeddings', 'llm:grader')
+        fn: The call
+        on_discard: Called with the losing request's result (e.g. to count its tokens)
+
+    Raises:
+        Whatever the call raises (the primary request's error when both fail)
+    """
+    delay = _latencies.percentile(name) if HEDGING_ENABLED else None
+    if delay is not None:
+        delay = max(delay, HEDGE_MIN_DELAY_SECONDS)
+        left = remaining()
+        if left is not None and left <= delay:
+            delay = None  # The duplicate couldn't answer in time anyway
+
+    if delay is None:
+        started = time.monotonic()
+        result = fn(*args, **kwargs)
+        _latencies.record(name, time.monotonic() - started)
+        return result
+
+    executor = _get_executor()
+
+    def submit():
+        started = time.monotonic()
+        # Each request runs with the caller's context (deadline, batch budget)
+        future = executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+        def record(f):
+            if not f.cancelled() and f.exception() is None:
+                _latencies.record(name, time.monotonic() - started)
+
+        future.add_done_callback(record)
+        return future
+
+    def discard(f):
+        if on_discard is not None and not f.cancelled() and f.exception() is None:
+            on_discard(f.result())
+
+    primary = submit()
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    print(f"   🏇 Hedging {name}: no answer after {delay:.1f}s, firing duplicate request")
+    hedge = submit()
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is not None:
+                continue
+            _latencies.count_hedge(name, won=future is hedge)
+            for loser in pending:
+                loser.add_done_callback(discard)
+            return future.result()
+
+    return primary.result()  # Both failed: raise the primary's error
+
+
+def reset_latency_stats():
+    """Forget observed latencies (tests)"""
+    _latencies.reset()
@@ -0,0 +1,350 @@
+"""
+Near-Duplicate Index for Generated Posts
+Catches repeated hooks/bodies BEFORE they reach Airtable.
+
+Large batches (diversify_topics expanding into 20-50 angles) tend to bring back
+the same hooks and near-identical bodies. This module keeps a MinHash + LSH
+index over `generated_posts` (post_hook + body_content) plus every post saved
+in this process, so each new draft can be checked before create_content_record.
+
+- Loads once from Supabase (lazily, on first check)
+- Updates incrementally as posts are saved (covers the current batch)
+- Pure Python - no numpy/datasketch dependency
+
+Config (env):
+    DEDUP_ENABLED               "false" to disable checks entirely (default: true)
+    DEDUP_SIMILARITY_THRESHOLD  Estimated Jaccard similarity that counts as a duplicate (default: 0.7)
+    DEDUP_ACTION                "warn" (flag in Suggested Edits) or "regenerate" (default: warn)
+    DEDUP_LOAD_LIMIT            Max historical posts loaded from Supabase (default: 2000)
+"""
+import os
+import re
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# MinHash parameters: 64 permutations split into 16 LSH bands of 4 rows.
+# Band collision probability crosses 50% around Jaccard ~0.5, so candidates
+# are recalled well below the default threshold and then verified exactly.
+NUM_PERM = 64
+NUM_BANDS = 16
+ROWS_PER_BAND = NUM_PERM // NUM_BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Hooks shorter than this are too generic to flag on their own
+MIN_HOOK_TOKENS = 5
+
+VALID_ACTIONS = ("warn", "regenerate")
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def _permutations() -> List[Tuple[int, int]]:
+    """Deterministic (a, b) coefficients for the MinHash permutations"""
+    perms = []
+    for i in range(NUM_PERM):
+        digest = hashlib.blake2b(f"dedup-perm-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], "big") % _MERSENNE_PRIME or 1
+        b = int.from_bytes(digest[8:], "big") % _MERSENNE_PRIME
+        perms.append((a, b))
+    return perms
+
+
+_PERMS = _permutations()
+
+
+def get_dedup_threshold() -> float:
+    """Similarity threshold from env (clamped to 0-1)"""
+    try:
+        value = float(os.getenv("DEDUP_SIMILARITY_THRESHOLD", "0.7"))
+    except ValueError:
+        value = 0.7
+    return min(max(value, 0.0), 1.0)
+
+
+def get_dedup_action() -> str:
+    """Action on duplicate: 'warn' or 'regenerate'"""
+    action = os.getenv("DEDUP_ACTION", "warn").strip().lower()
+    return action if action in VALID_ACTIONS else "warn"
+
+
+def dedup_enabled() -> bool:
+    return os.getenv("DEDUP_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens (punctuation/emoji/formatting stripped)"""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    """Word n-gram shingles; short texts fall back to their full token string"""
+    tokens = tokenize(text)
+    if not tokens:
+        return set()
+    if len(tokens) < size:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash_signature(shingle_set: Set[str]) -> Tuple[int, ...]:
+    """Compute a MinHash signature for a set of shingles"""
+    if not shingle_set:
+        return tuple([_MAX_HASH] * NUM_PERM)
+
+    hashed = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+        for s in shingle_set
+    ]
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashed)
+        for a, b in _PERMS
+    )
+
+
+def estimate_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity from two MinHash signatures"""
+    matches = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return matches / NUM_PERM
+
+
+def _band_keys(signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+    return [
+        (band, signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND])
+        for band in range(NUM_BANDS)
+    ]
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index over post hooks and bodies, partitioned by platform.
+
+    Each entry stores two signatures (hook, body). A draft is a duplicate when
+    either its body or its (non-trivial) hook reaches the similarity threshold.
+    """
+
+    def __init__(self, supabase_client=None, load_limit: Optional[int] = None):
+        self._supabase = supabase_client
+        self.load_limit = load_limit or int(os.getenv("DEDUP_LOAD_LIMIT", "2000"))
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        # entry_id -> {'platform', 'hook', 'hook_sig', 'body_sig', 'hook_tokens', 'source'}
+        self._entries: Dict[str, Dict] = {}
+        # (platform, field, band, band_values) -> set(entry_id)
+        self._buckets: Dict[Tuple, Set[str]] = {}
+        self._next_local_id = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def ensure_loaded(self) -> None:
+        """Load historical generated_posts once (no-op after first call)"""
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            try:
+                supabase = self._supabase
+                if supabase is None:
+                    from integrations.supabase_client import get_supabase_client
+                    supabase = get_supabase_client()
+
+                result = supabase.table('generated_posts')\
+                    .select('id, platform, post_hook, body_content')\
+                    .order('created_at', desc=True)\
+                    .limit(self.load_limit)\
+                    .execute()
+
+                for row in result.data or []:
+                    self._add_locked(
+                        body=row.get('body_content') or '',
+                        hook=row.get('post_hook') or '',
+                        platform=row.get('platform') or 'unknown',
+                        entry_id=str(row.get('id')),
+                        source='generated_posts'
+                    )
+
+                print(f"🧬 Dedup index loaded {len(self._entries)} historical posts", flush=True)
+            except Exception as e:
+                # Never block content creation on index load - start empty
+                logger.warning(f"Dedup index load failed, starting empty: {e}")
+                print(f"⚠️ Dedup index load failed ({e}) - continuing with batch-only index")
+            finally:
+                self._loaded = True
+
+    def add(self, body: str, hook: str, platform: str, entry_id: Optional[str] = None) -> str:
+        """Add a freshly generated post to the index (incremental update)"""
+        with self._lock:
+            return self._add_locked(body, hook, platform, entry_id, source='session')
+
+    def _add_locked(
+        self,
+        body: str,
+        hook: str,
+        platform: str,
+        entry_id: Optional[str],
+        source: str
+    ) -> str:
+        if entry_id is None or entry_id == 'None':
+            self._next_local_id += 1
+            entry_id = f"local_{self._next_local_id}"
+
+        platform = (platform or 'unknown').lower()
+        hook_sig = minhash_signature(shingles(hook, size=2))
+        body_sig = minhash_signature(shingles(body, size=3))
+
+        self._entries[entry_id] = {
+            'platform': platform,
+            'hook': (hook or '')[:200],
+            'hook_sig': hook_sig,
+            'body_sig': body_sig,
+            'hook_tokens': len(tokenize(hook)),
+            'source': source
+        }
+
+        for field, sig in (('hook', hook_sig), ('body', body_sig)):
+            for band, values in _band_keys(sig):
+                self._buckets.setdefault((platform, field, band, values), set()).add(entry_id)
+
+        return entry_id
+
+    def find_similar(
+        self,
+        body: str,
+        hook: str,
+        platform: str,
+        threshold: Optional[float] = None
+    ) -> Optional[Dict]:
+        """
+        Find the closest existing post above threshold.
+
+        Args:
+            body: Draft body text
+            hook: Draft hook/first line
+            platform: Platform partition to search
+            threshold: Override for DEDUP_SIMILARITY_THRESHOLD
+
+        Returns:
+            Dict with entry_id, similarity, matched_on ('body'|'hook'), hook, source
+            or None when nothing reaches the threshold
+        """
+        self.ensure_loaded()
+
+        threshold = get_dedup_threshold() if threshold is None else threshold
+        platform = (platform or 'unknown').lower()
+        hook_sig = minhash_signature(shingles(hook, size=2))
+        body_sig = minhash_signature(shingles(body, size=3))
+        check_hook = len(tokenize(hook)) >= MIN_HOOK_TOKENS
+
+        with self._lock:
+            candidates: Dict[str, Set[str]] = {}
+            fields = [('body', body_sig)] + ([('hook', hook_sig)] if check_hook else [])
+            for field, sig in fields:
+                for band, values in _band_keys(sig):
+                    for entry_id in self._buckets.get((platform, field, band, values), ()):
+                        candidates.setdefault(entry_id, set()).add(field)
+
+            best = None
+            for entry_id, fields_hit in candidates.items():
+                entry = self._entries[entry_id]
+                for field in fields_hit:
+                    if field == 'hook' and entry['hook_tokens'] < MIN_HOOK_TOKENS:
+                        continue
+                    stored = entry['body_sig'] if field == 'body' else entry['hook_sig']
+                    sig = body_sig if field == 'body' else hook_sig
+                    similarity = estimate_similarity(sig, stored)
+                    if similarity >= threshold and (best is None or similarity > best['similarity']):
+                        best = {
+                            'entry_id': entry_id,
+                            'similarity': round(similarity, 3),
+                            'matched_on': field,
+                            'hook': entry['hook'],
+                            'source': entry['source']
+                        }
+
+        return best
+
+    def reset(self) -> None:
+        """Drop all entries and force a reload on next check"""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._loaded = False
+
+
+# Global shared index instance
+_dedup_index: Optional[NearDuplicateIndex] = None
+
+
+def get_dedup_index() -> NearDuplicateIndex:
+    """Get or create the shared near-duplicate index"""
+    global _dedup_index
+    if _dedup_index is None:
+        _dedup_index = NearDuplicateIndex()
+    return _dedup_index
+
+
+def check_near_duplicate(body: str, hook: str, platform: str) -> Optional[Dict]:
+    """
+    Check a draft against the shared index before saving.
+
+    Returns:
+        None if unique (or dedup disabled), else match dict with an added
+        'action' key ('warn' or 'regenerate') and 'threshold'
+    """
+    if not dedup_enabled() or not (body or hook):
+        return None
+
+    try:
+        match = get_dedup_index().find_similar(body, hook, platform)
+    except Exception as e:
+        logger.warning(f"Dedup check failed: {e}")
+        return None
+
+    if match:
+        match['action'] = get_dedup_action()
+        match['threshold'] = get_dedup_threshold()
+        print(
+            f"🧬 Near-duplicate detected ({match['matched_on']} similarity "
+            f"{match['similarity']:.2f} ≥ {match['threshold']:.2f}) vs: {match['hook'][:80]}",
+            flush=True
+        )
+    return match
+
+
+def record_post(body: str, hook: str, platform: str, entry_id: Optional[str] = None) -> None:
+    """Add a saved post to the shared index (safe to call if dedup disabled)"""
+    if not dedup_enabled() or not (body or hook):
+        return
+    try:
+        get_dedup_index().add(body, hook, platform, entry_id)
+    except Exception as e:
+        logger.warning(f"Dedup index update failed: {e}")
+
+
+def format_duplicate_warning(match: Dict) -> str:
+    """One-line warning for Suggested Edits"""
+    return (
+        f"🧬 NEAR-DUPLICATE: {int(match['similarity'] * 100)}% {match['matched_on']} overlap "
+        f"with existing post \"{match.get('hook', '')[:100]}\" - rework the angle before publishing"
+    )
+
+
+def regeneration_context(match: Dict) -> str:
+    """Extra context appended to a regeneration request"""
+    return (
+        f"\n\nIMPORTANT - AVOID DUPLICATION: A previous draft was too similar "
+        f"({match['matched_on']} overlap {int(match['similarity'] * 100)}%) to an existing post "
+        f"with hook: \"{match.get('hook', '')}\". Use a different hook, a different opening "
+        f"angle, and different examples."
+    )
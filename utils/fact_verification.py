@@ -0,0 +1,342 @@
+"""
+Fact Verification Engine
+Concurrent claim verification with a shared, TTL-bounded verdict cache.
+
+ContentWorkflow used to verify claims one at a time: a blocking Tavily search
+plus a Claude call per claim, repeated on every revision pass. A draft with 6
+statistics cost 12 serial round trips per validation.
+
+This module:
+- Runs web searches / knowledge-base lookups concurrently under a bounded pool
+- Verifies all searched claims in ONE batched Claude prompt
+- Caches verdicts by normalized claim text across iterations, posts and batches
+
+Failed searches and missing verdicts are never cached (the claim is skipped,
+same as before), so a transient outage doesn't pin a bad verdict.
+
+Config (env):
+    FACT_CACHE_TTL_SECONDS    Verdict lifetime (default: 21600 = 6h)
+    FACT_CACHE_MAX_ENTRIES    Max cached claims (default: 2000)
+    FACT_VERIFY_CONCURRENCY   Max concurrent searches (default: 4)
+"""
+import os
+import re
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.model_routing import create_message
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = float(os.getenv('FACT_CACHE_TTL_SECONDS', '21600'))
+DEFAULT_MAX_ENTRIES = int(os.getenv('FACT_CACHE_MAX_ENTRIES', '2000'))
+DEFAULT_CONCURRENCY = int(os.getenv('FACT_VERIFY_CONCURRENCY', '4'))
+
+_QUOTE_TRANSLATION = str.maketrans({'‘': "'", '’': "'", '“': '"', '”': '"'})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_claim(claim: str) -> str:
+    """
+    Cache key for a claim: lowercase, straight quotes, collapsed whitespace,
+    no surrounding quotes/punctuation.
+    """
+    text = (claim or '').translate(_QUOTE_TRANSLATION).lower()
+    text = _WHITESPACE_RE.sub(' ', text)
+    return text.strip(' "\'.,;:!?')
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a ```json fence if Claude added one"""
+    text = text.strip()
+    if text.startswith('```'):
+        text = text.split('```')[1]
+        if text.startswith('json'):
+            text = text[4:]
+        text = text.strip()
+    return text
+
+
+class FactCache:
+    """
+    Thread-safe LRU cache of claim verdicts with TTL.
+
+    A verdict is {'fact': <verified_facts entry>, 'issue': <issue dict or None>}.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0}
+
+    def get(self, claim: str) -> Optional[Dict[str, Any]]:
+        key = normalize_claim(claim)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] >= self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[1]
+
+    def set(self, claim: str, verdict: Dict[str, Any]):
+        key = normalize_claim(claim)
+        with self._lock:
+            self._entries[key] = (self._clock(), verdict)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.stats['stores'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global shared cache (shared by every workflow instance in the process)
+_fact_cache: Optional[FactCache] = None
+
+
+def get_fact_cache() -> FactCache:
+    """Get or create the shared verdict cache"""
+    global _fact_cache
+    if _fact_cache is None:
+        _fact_cache = FactCache()
+    return _fact_cache
+
+
+def _internal_verdict(claim: str, kb_results: str) -> Dict[str, Any]:
+    if kb_results:
+        return {
+            'fact': {'claim': claim, 'verified': True, 'evidence': kb_results, 'sources': ['Knowledge Base']},
+            'issue': None
+        }
+    return {
+        'fact': {'claim': claim, 'verified': False, 'evidence': 'Not found in knowledge base', 'sources': []},
+        'issue': {
+            'code': 'claim_unverified_internal',
+            'severity': 'high',
+            'message': f"Internal claim not found in knowledge base: '{claim}'",
+            'explanation': 'Case studies, testimonials, and client results must exist in knowledge base. Remove claim or add supporting documentation.',
+            'auto_fixable': False
+        }
+    }
+
+
+def _external_verdict(claim: str, search_results: Dict[str, Any], verification: Dict[str, Any]) -> Dict[str, Any]:
+    sources = [r.get('url', '') for r in search_results.get('results', [])[:2]]
+
+    if verification.get('verified') and not verification.get('contradiction'):
+        return {
+            'fact': {
+                'claim': claim,
+                'verified': True,
+                'evidence': search_results.get('answer', ''),
+                'sources': sources
+            },
+            'issue': None
+        }
+
+    return {
+        'fact': {
+            'claim': claim,
+            'verified': False,
+            'evidence': verification.get('explanation', ''),
+            'contradiction': verification.get('contradiction'),
+            'sources': sources
+        },
+        'issue': {
+            'code': 'claim_unverified',
+            'severity': 'high',
+            'message': f"Factual claim needs verification: '{claim}'",
+            'explanation': verification.get('explanation', 'Could not verify'),
+            'contradiction': verification.get('contradiction'),
+            'auto_fixable': False
+        }
+    }
+
+
+def build_batch_prompt(items: List[Tuple[str, Dict[str, Any]]]) -> str:
+    """One verification prompt covering every (claim, search_results) pair"""
+    sections = []
+    for i, (claim, search_results) in enumerate(items, 1):
+        sections.append(
+            f"CLAIM {i}: {claim}\n\nSEARCH RESULTS {i}:\n"
+            f"{json.dumps(search_results.get('results', [])[:3], indent=2)}"
+        )
+
+    return f"""Verify each claim against its own search results.
+
+{chr(10).join(sections)}
+
+For each claim: does the evidence SUPPORT or CONTRADICT it?
+
+Return ONLY valid JSON with one verdict per claim:
+{{
+  "verdicts": [
+    {{
+      "index": <claim number>,
+      "verified": true/false,
+      "confidence": "high|medium|low",
+      "explanation": "<brief explanation>",
+      "contradiction": "<specific contradiction if found, else null>"
+    }}
+  ]
+}}"""
+
+
+class FactVerifier:
+    """
+    Verifies extracted claims concurrently, reusing cached verdicts.
+
+    Args:
+        anthropic_client: Client used for the batched verification call
+        web_search: Blocking fn(claim) -> Tavily-style result dict
+        kb_search: Async fn(claim) -> knowledge base text ('' if none)
+        cache: Verdict cache (defaults to the shared cache)
+        max_concurrency: Max searches in flight
+    """
+
+    def __init__(
+        self,
+        anthropic_client,
+        web_search: Callable[[str], Dict[str, Any]],
+        kb_search: Callable[[str], Awaitable[str]],
+        cache: Optional[FactCache] = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        self.client = anthropic_client
+        self.web_search = web_search
+        self.kb_search = kb_search
+        self.cache = cache if cache is not None else get_fact_cache()
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def verify(self, claims: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Verify claims from the extraction step.
+
+        Args:
+            claims: [{"claim", "type", "category", "needs_verification"}, ...]
+
+        Returns:
+            (issues, verified_facts) in claim order
+        """
+        pending = []
+        seen = set()
+        for claim_obj in claims:
+            if not claim_obj.get('needs_verification'):
+                continue
+            claim = claim_obj.get('claim')
+            if not claim or normalize_claim(claim) in seen:
+                continue
+            seen.add(normalize_claim(claim))
+            pending.append((claim, claim_obj.get('type', 'general')))
+
+        verdicts: Dict[str, Dict[str, Any]] = {}
+        to_check = []
+        for claim, claim_type in pending:
+            cached = self.cache.get(claim)
+            if cached is not None:
+                verdicts[claim] = cached
+            else:
+                to_check.append((claim, claim_type))
+
+        if to_check:
+            start = time.perf_counter()
+            verdicts.update(await self._verify_uncached(to_check))
+            logger.info(
+                f"Verified {len(to_check)} claims in {time.perf_counter() - start:.2f}s "
+                f"({len(pending) - len(to_check)} cached)"
+            )
+
+        issues = []
+        facts = []
+        for claim, _ in pending:
+            verdict = verdicts.get(claim)
+            if verdict is None:
+                continue
+            facts.append(verdict['fact'])
+            if verdict['issue']:
+                issues.append(verdict['issue'])
+        return issues, facts
+
+    async def _verify_uncached(self, to_check: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def lookup(claim: str, claim_type: str):
+            async with semaphore:
+                try:
+                    if claim_type == 'internal':
+                        return claim, claim_type, await self.kb_search(claim)
+                    return claim, claim_type, await asyncio.to_thread(self.web_search, claim)
+                except Exception as e:
+                    print(f"⚠️ Failed to look up claim '{claim}': {e}")
+                    return claim, claim_type, None
+
+        results = await asyncio.gather(*(lookup(c, t) for c, t in to_check))
+
+        verdicts = {}
+        searched = []
+        for claim, claim_type, result in results:
+            if result is None:
+                continue
+            if claim_type == 'internal':
+                verdicts[claim] = _internal_verdict(claim, result)
+            else:
+                searched.append((claim, result))
+
+        if searched:
+            verifications = await asyncio.to_thread(self._verify_batch, searched)
+            for i, (claim, search_results) in enumerate(searched, 1):
+                verification = verifications.get(i)
+                if verification is not None:
+                    verdicts[claim] = _external_verdict(claim, search_results, verification)
+
+        for claim, verdict in verdicts.items():
+            self.cache.set(claim, verdict)
+        return verdicts
+
+    def _verify_batch(self, searched: List[Tuple[str, Dict[str, Any]]]) -> Dict[int, Dict[str, Any]]:
+        """Single Claude call for all searched claims → {index: verification}"""
+        try:
+            response = create_message(
+                self.client,
+                'fact_verification',
+                max_tokens=min(300 * len(searched), 2400),
+                temperature=0,
+                messages=[{"role": "user", "content": build_batch_prompt(searched)}]
+            )
+            data = json.loads(_strip_code_fence(response.content[0].text))
+        except Exception as e:
+            print(f"⚠️ Batched claim verification failed: {e}")
+            return {}
+
+        verifications = {}
+        for verdict in data.get('verdicts', []):
+            try:
+                index = int(verdict.get('index'))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= index <= len(searched):
+                verifications[index] = verdict
+        return verifications
@@ -0,0 +1,278 @@
+"""
+Connection Lifecycle Manager
+Owns every long-lived outbound client (Anthropic, OpenAI, Supabase, Tavily)
+so connections are pooled, bounded and closed in one place.
+
+The "Post 6+ hang" came from each post creating fresh SDK clients (one per
+agent, one per search call); every client carried its own connection pool
+and the sockets were only released when the garbage collector got to them.
+Batch execution papered over it with sleep(3) + gc.collect() + sleep(1)
+after every post. With one pooled client per service the pool size is fixed,
+idle connections expire, and nothing depends on GC timing.
+
+Leak detection: track_connections(stage) records the process' open sockets
+before and after a stage (post, tool call) and warns when a stage leaves
+more than CONNECTION_LEAK_THRESHOLD new sockets behind.
+
+Config (env):
+    HTTP_MAX_CONNECTIONS            Pool size per client (default: 20)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS  Idle connections kept per client (default: 10)
+    HTTP_KEEPALIVE_EXPIRY           Seconds before an idle connection is closed (default: 30)
+    CONNECTION_LEAK_THRESHOLD       New sockets a stage may leave open before warning (default: 8)
+
+Usage:
+    from utils.http_clients import get_openai_client, track_connections
+
+    with track_connections('post:linkedin'):
+        embedding = get_openai_client().embeddings.create(...)
+"""
+import os
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', '20'))
+HTTP_MAX_KEEPALIVE = int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', '10'))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '30'))
+HTTP_CONNECT_TIMEOUT = 10.0
+EMBEDDING_TIMEOUT = 30.0
+LEAK_THRESHOLD = int(os.getenv('CONNECTION_LEAK_THRESHOLD', '8'))
+
+
+def pooled_http_client(timeout: float = 600.0):
+    """httpx.Client with explicit pool limits (SDKs pass per-request timeouts on top)"""
+    import httpx
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(timeout, connect=HTTP_CONNECT_TIMEOUT),
+    )
+
+
+def _close(client: Any):
+    close = getattr(client, 'close', None)
+    if callable(close):
+        close()
+
+
+class ClientRegistry:
+    """
+    Named, lazily created clients shared across the process.
+
+    get() creates a client once per name (thread-safe) and reuses it after;
+    close()/close_all() release the client's pool and let the next get()
+    build a fresh one.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, Any] = {}
+        self._closers: Dict[str, Callable[[Any], None]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, name: str, factory: Callable[[], Any], closer: Callable[[Any], None] = _close) -> Any:
+        with self._lock:
+            stats = self._stats.setdefault(name, {'created': 0, 'reused': 0, 'closed': 0})
+            client = self._clients.get(name)
+            if client is None:
+                client = factory()
+                self._clients[name] = client
+                self._closers[name] = closer
+                stats['created'] += 1
+                print(f"🔌 [CLIENTS] Created shared {name} client", flush=True)
+                logger.info("shared_client_created", extra={'client': name})
+            else:
+                stats['reused'] += 1
+            return client
+
+    def close(self, name: str) -> bool:
+        with self._lock:
+            client = self._clients.pop(name, None)
+            closer = self._closers.pop(name, _close)
+            if client is None:
+                return False
+            self._stats[name]['closed'] += 1
+        try:
+            closer(client)
+        except Exception as e:
+            logger.warning("shared_client_close_failed", extra={'client': name, 'error': str(e)})
+        return True
+
+    def close_all(self) -> int:
+        with self._lock:
+            names = list(self._clients)
+        closed = sum(1 for name in names if self.close(name))
+        if closed:
+            print(f"🧹 [CLIENTS] Closed {closed} shared client(s)", flush=True)
+        return closed
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                name: {**stats, 'open': name in self._clients}
+                for name, stats in self._stats.items()
+            }
+
+
+registry = ClientRegistry()
+
+
+# ============= SHARED CLIENTS =============
+
+def get_anthropic_client():
+    """Shared Anthropic client on a pooled httpx transport"""
+    def factory():
+        from anthropic import Anthropic
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        return Anthropic(api_key=api_key, http_client=pooled_http_client())
+    return registry.get('anthropic', factory)
+
+
+def get_openai_client():
+    """Shared OpenAI client (embeddings) on a pooled httpx transport"""
+    def factory():
+        from openai import OpenAI
+        return OpenAI(api_key=os.getenv('OPENAI_API_KEY'), http_client=pooled_http_client(timeout=60.0))
+    return registry.get('openai', factory)
+
+
+def get_supabase_client():
+    """Shared Supabase client (one PostgREST session for the process)"""
+    def factory():
+        from supabase import create_client
+        supabase_url = os.getenv('SUPABASE_URL')
+        supabase_key = os.getenv('SUPABASE_KEY')
+        if not supabase_url or not supabase_key:
+            raise ValueError("Missing Supabase credentials. Set SUPABASE_URL and SUPABASE_KEY in .env")
+        return create_client(supabase_url, supabase_key)
+
+    def closer(client):
+        session = getattr(getattr(client, 'postgrest', None), 'session', None)
+        if session is not None:
+            _close(session)
+
+    return registry.get('supabase', factory, closer)
+
+
+def get_tavily_client():
+    """Shared Tavily client"""
+    def factory():
+        from tavily import TavilyClient
+        return TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
+    return registry.get('tavily', factory)
+
+
+def create_embedding(text: str, model: str = "text-embedding-3-small") -> List[float]:
+    """
+    Embed text with the shared OpenAI client through the openai_embeddings breaker.
+    Slow requests are hedged (utils/deadline.py).
+
+    Raises:
+        CircuitBreakerOpen: OpenAI embeddings are failing; skip semantic search
+    """
+    from utils.circuit_breaker import get_breaker
+    from utils.deadline import hedged_call, timeout_for
+    # Idempotent: hedged past the observed p95, timeout capped by the post's deadline
+    response = get_breaker('openai_embeddings').call(
+        hedged_call, 'openai_embeddings', get_openai_client().embeddings.create,
+        model=model, input=text, timeout=timeout_for(EMBEDDING_TIMEOUT)
+    )
+    return response.data[0].embedding
+
+
+def close_all_clients() -> int:
+    """Release every shared client's connections (shutdown, tests)"""
+    return registry.close_all()
+
+
+# ============= LEAK DETECTION =============
+
+def open_socket_count() -> Optional[int]:
+    """Open sockets held by this process (None when the platform can't tell us)"""
+    try:
+        import psutil
+        process = psutil.Process()
+        connections = getattr(process, 'net_connections', process.connections)
+        return len(connections(kind='all'))
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    fd_dir = '/proc/self/fd'
+    if not os.path.isdir(fd_dir):
+        return None
+    count = 0
+    for fd in os.listdir(fd_dir):
+        try:
+            if os.readlink(os.path.join(fd_dir, fd)).startswith('socket:'):
+                count += 1
+        except OSError:
+            continue
+    return count
+
+
+class ConnectionTracker:
+    """Open-socket deltas per stage, with a warning when a stage leaks"""
+
+    def __init__(self, leak_threshold: int = LEAK_THRESHOLD):
+        self.leak_threshold = leak_threshold
+        self.stages: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, stage: str):
+        before = open_socket_count()
+        try:
+            yield
+        finally:
+            after = open_socket_count()
+            if before is not None and after is not None:
+                self._record(stage, before, after)
+
+    def _record(self, stage: str, before: int, after: int):
+        delta = after - before
+        with self._lock:
+            stats = self.stages.setdefault(stage, {'runs': 0, 'net_new_sockets': 0, 'max_open': 0, 'leaks': 0})
+            stats['runs'] += 1
+            stats['net_new_sockets'] += delta
+            stats['max_open'] = max(stats['max_open'], after)
+            leaked = delta > self.leak_threshold
+            if leaked:
+                stats['leaks'] += 1
+        if leaked:
+            print(f"⚠️ [CLIENTS] {stage} left {delta} new sockets open ({after} total)", flush=True)
+            logger.warning("connection_leak", extra={'stage': stage, 'new_sockets': delta, 'open_sockets': after})
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {stage: dict(stats) for stage, stats in self.stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+
+
+tracker = ConnectionTracker()
+
+
+def track_connections(stage: str):
+    """Context manager: record open-socket growth for a stage"""
+    return tracker.track(stage)
+
+
+def get_connection_report() -> Dict[str, Any]:
+    """Open sockets, shared clients and per-stage socket growth"""
+    return {
+        'open_sockets': open_socket_count(),
+        'clients': registry.summary(),
+        'stages': tracker.report(),
+    }
@@ -0,0 +1,433 @@
+"""
+Model Routing Policy
+Single place that decides which model, max_tokens and timeout every
+Anthropic call uses, instead of model IDs hard-coded at each call site.
+
+Routes are keyed by stage (writer, grader, claim_extraction, agent_loop, ...)
+and refined by platform and mode:
+- interactive: a single post requested from Slack (default)
+- batch:       a post inside a batch plan (set automatically while a
+               BatchBudget is active)
+- thinking:    thinking-mode posts (validation + fix loop)
+
+Batches get a latency and token budget. When the in-flight post has used more
+than its pro-rata share of either budget, non-critical stages (claim
+extraction, contrast check, hook ideas, quality checks, ...) are moved to the
+fast model. Critical stages (the post itself, grading, fixes) never downgrade.
+
+Timeouts are sized from max_tokens: each stage has a floor (input processing,
+time to first token) plus MODEL_SECONDS_PER_1K_TOKENS per 1k output tokens,
+so long generations (briefings, drafts, multimodal) aren't cut off and
+retried. They never exceed the SDK's 600s default (MODEL_TIMEOUT_MAX_SECONDS).
+Timeouts are capped by the post's remaining deadline, and grading stages
+(HEDGED_STAGES) are hedged: a duplicate request is fired when the first is
+slower than that stage's p95 (see utils/deadline.py).
+
+Every decision is recorded: downgrades are printed, all decisions go to the
+module logger, and get_routing_stats() / BatchBudget.summary() expose counts
+and token usage for the workflow/batch output. A budget created with a
+BatchStats also aggregates latency and tokens per stage.
+
+Usage:
+    response = create_message(client, 'grader', platform='linkedin',
+                              temperature=0.2, messages=[...])
+
+    route = route_model('agent_loop', platform='twitter', mode='thinking')
+    response = create_message(client, route, system=..., messages=...)
+
+    with use_budget(BatchBudget(total_items=10)):
+        ...  # every routed call inside counts against the batch
+
+    with collect_decisions() as decisions:
+        ...  # decisions lists this run's routing decisions only
+
+Config (env):
+    MODEL_ROUTE_<STAGE>            Override the model for a stage (e.g. MODEL_ROUTE_GRADER)
+    MODEL_FAST                     Model non-critical stages fall back to (default: Haiku 4.5)
+    MODEL_SECONDS_PER_1K_TOKENS    Timeout added per 1k max_tokens on top of a stage's floor (default: 30)
+    MODEL_TIMEOUT_MAX_SECONDS      Upper bound for any routed timeout (default: 600, the SDK default)
+    BATCH_SECONDS_PER_POST         Latency budget per batch post (default: 180)
+    BATCH_TOKENS_PER_POST          Token budget per batch post (default: 120000)
+"""
+import os
+import time
+import logging
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from utils.deadline import hedged_call, timeout_for
+from utils.prompt_cache import CacheUsage, cache_hit_rate, usage_tokens
+from utils.running_stats import BatchStats
+
+logger = logging.getLogger(__name__)
+
+# Model aliases (the only place model IDs should appear)
+SONNET_4_5 = "claude-sonnet-4-5-20250929"
+SONNET_4 = "claude-sonnet-4-20250514"
+SONNET_3_7 = "claude-3-7-sonnet-20250219"
+SONNET_3_5 = "claude-3-5-sonnet-20241022"
+HAIKU_4_5 = "claude-haiku-4-5-20251001"
+
+FAST_MODEL = os.getenv('MODEL_FAST', HAIKU_4_5)
+BATCH_SECONDS_PER_POST = float(os.getenv('BATCH_SECONDS_PER_POST', '180'))
+BATCH_TOKENS_PER_POST = int(os.getenv('BATCH_TOKENS_PER_POST', '120000'))
+# Slow-case output rate (~33 tokens/s) so a full max_tokens generation fits the timeout
+SECONDS_PER_1K_TOKENS = float(os.getenv('MODEL_SECONDS_PER_1K_TOKENS', '30'))
+TIMEOUT_MAX_SECONDS = float(os.getenv('MODEL_TIMEOUT_MAX_SECONDS', '600'))
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Model choice for one call"""
+    stage: str
+    model: str
+    max_tokens: int
+    timeout: float
+    critical: bool = True
+    downgraded: bool = False
+
+    def params(self) -> Dict[str, Any]:
+        """Keyword arguments for client.messages.create"""
+        return {'model': self.model, 'max_tokens': self.max_tokens, 'timeout': self.timeout}
+
+
+def _r(stage: str, model: str, max_tokens: int, timeout: float, critical: bool) -> ModelRoute:
+    return ModelRoute(stage=stage, model=model, max_tokens=max_tokens, timeout=timeout, critical=critical)
+
+
+def output_timeout(max_tokens: int, floor: float) -> float:
+    """Timeout for a call that may generate max_tokens: floor + output time, capped at the SDK default"""
+    return min(TIMEOUT_MAX_SECONDS, floor + max_tokens / 1000 * SECONDS_PER_1K_TOKENS)
+
+
+# Defaults per stage (platform/mode refinements in ROUTE_OVERRIDES).
+# The timeout column is the stage's floor; route_model() adds output time for max_tokens.
+STAGE_ROUTES: Dict[str, ModelRoute] = {
+    # Direct API agents: tool-calling loop that writes the post
+    'agent_loop':         _r('agent_loop', SONNET_4_5, 8000, 60.0, True),
+    # Native tools called from the agent loop
+    'hooks':              _r('hooks', SONNET_4_5, 1000, 30.0, False),
+    'proof':              _r('proof', SONNET_4_5, 2000, 60.0, False),
+    'draft':              _r('draft', SONNET_4_5, 3000, 60.0, True),
+    'condense':           _r('condense', SONNET_4_5, 2500, 60.0, True),
+    'format_check':       _r('format_check', SONNET_4_5, 2000, 30.0, False),
+    'score_iterate':      _r('score_iterate', SONNET_4_5, 1500, 30.0, False),
+    'quality_check':      _r('quality_check', SONNET_4_5, 3000, 120.0, False),
+    'apply_fixes':        _r('apply_fixes', SONNET_4_5, 3000, 60.0, True),
+    'content_extraction': _r('content_extraction', HAIKU_4_5, 2000, 30.0, False),
+    'haiku_post':         _r('haiku_post', HAIKU_4_5, 500, 30.0, True),
+    # ContentWorkflow (writer → validator → reviser)
+    'writer':             _r('writer', SONNET_3_7, 1500, 60.0, True),
+    'reviser':            _r('reviser', SONNET_3_7, 1500, 60.0, True),
+    'grader':             _r('grader', SONNET_4, 800, 30.0, True),
+    'claim_extraction':   _r('claim_extraction', SONNET_4, 500, 20.0, False),
+    'fact_verification':  _r('fact_verification', SONNET_4, 2400, 30.0, False),
+    'contrast_check':     _r('contrast_check', SONNET_4, 800, 20.0, False),
+    # Agentic orchestrators and editors
+    'agentic_loop':       _r('agentic_loop', SONNET_4, 4096, 60.0, True),
+    'agentic_draft':      _r('agentic_draft', SONNET_4, 4000, 60.0, True),
+    'agentic_grade':      _r('agentic_grade', SONNET_4, 800, 30.0, True),
+    'agentic_edit':       _r('agentic_edit', SONNET_4, 500, 30.0, True),
+    'hook_generation':    _r('hook_generation', SONNET_4, 2000, 30.0, False),
+    'proof_injection':    _r('proof_injection', SONNET_4, 4000, 60.0, False),
+    'llm_edit':           _r('llm_edit', SONNET_4, 4000, 60.0, True),
+    'topic_angles':       _r('topic_angles', SONNET_4_5, 2000, 30.0, False),
+    # Slack handlers
+    'cmo_agent':          _r('cmo_agent', SONNET_4_5, 8000, 120.0, True),
+    'cowrite_session':    _r('cowrite_session', SONNET_4_5, 8000, 120.0, True),
+    'cowrite_draft':      _r('cowrite_draft', SONNET_4_5, 2000, 60.0, True),
+    'plan':               _r('plan', SONNET_4, 2000, 60.0, True),
+    'multimodal':         _r('multimodal', SONNET_4, 4096, 60.0, True),
+    'thread_resolution':  _r('thread_resolution', SONNET_4, 500, 20.0, False),
+    'template_match':     _r('template_match', SONNET_4, 1000, 20.0, False),
+    'analytics':          _r('analytics', SONNET_4, 2000, 60.0, True),
+    'analytics_report':   _r('analytics_report', SONNET_3_5, 2000, 60.0, True),
+    'briefing':           _r('briefing', SONNET_3_5, 4000, 60.0, True),
+}
+
+# (stage, platform, mode) -> field overrides; None matches anything.
+# More specific keys (platform + mode) are applied last.
+ROUTE_OVERRIDES: Dict[tuple, Dict[str, Any]] = {
+    ('agent_loop', None, 'thinking'): {'timeout': 90.0},
+    ('agentic_loop', 'email', None): {'max_tokens': 8000},
+    ('agentic_edit', 'email', None): {'max_tokens': 8000},
+    ('cowrite_draft', 'email', None): {'max_tokens': 2500},
+    ('cowrite_draft', 'youtube', None): {'max_tokens': 3000},
+}
+
+# Idempotent stages (no side effects, output only read) that may be hedged
+HEDGED_STAGES = frozenset({'grader', 'agentic_grade', 'quality_check'})
+
+# Active batch budget for the current task (asyncio.to_thread copies it into workers)
+_current_budget: ContextVar[Optional['BatchBudget']] = ContextVar('model_routing_budget', default=None)
+
+# Decisions collected for the current workflow run (see collect_decisions)
+_decision_log: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar('model_routing_decisions', default=None)
+
+_stats_lock = threading.Lock()
+_decisions: deque = deque(maxlen=200)
+_stats = {
+    'decisions': 0, 'downgrades': 0, 'input_tokens': 0, 'output_tokens': 0,
+    'cache_read_input_tokens': 0, 'cache_creation_input_tokens': 0,
+}
+_model_counts: Counter = Counter()
+
+
+class BatchBudget:
+    """
+    Latency and token budget for one batch.
+
+    A batch is behind when the post in flight has used more than its pro-rata
+    share: elapsed > latency_budget * (items_done + 1) / total_items (same for
+    tokens). Thread-safe: routed calls may record usage from worker threads.
+    """
+
+    def __init__(
+        self,
+        total_items: int,
+        latency_budget_s: Optional[float] = None,
+        token_budget: Optional[int] = None,
+        stats: Optional[BatchStats] = None
+    ):
+        self.total_items = max(1, total_items)
+        self.latency_budget_s = latency_budget_s or BATCH_SECONDS_PER_POST * self.total_items
+        self.token_budget = token_budget or BATCH_TOKENS_PER_POST * self.total_items
+        self.started_at = time.monotonic()
+        self.items_done = 0
+        self.tokens_used = 0
+        self.cache = CacheUsage()
+        self.downgrades: Counter = Counter()
+        # Per-stage latency/token aggregates of the batch (the plan's ContextManager stats)
+        self.stats = stats
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def add_tokens(self, tokens: int):
+        with self._lock:
+            self.tokens_used += tokens
+
+    def record_downgrade(self, stage: str):
+        with self._lock:
+            self.downgrades[stage] += 1
+
+    def record_stage(self, stage: str, seconds: float, tokens: int = 0):
+        if self.stats is not None:
+            self.stats.add_stage(stage, seconds, tokens)
+
+    def item_done(self):
+        with self._lock:
+            self.items_done = min(self.items_done + 1, self.total_items)
+
+    def behind_schedule(self) -> Optional[str]:
+        """Return 'latency' or 'tokens' if the batch is over its pro-rata budget"""
+        allowed = min(self.items_done + 1, self.total_items) / self.total_items
+        if self.elapsed() > self.latency_budget_s * allowed:
+            return 'latency'
+        if self.tokens_used > self.token_budget * allowed:
+            return 'tokens'
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            items_done, tokens_used, downgrades = self.items_done, self.tokens_used, dict(self.downgrades)
+        return {
+            'items_done': items_done,
+            'total_items': self.total_items,
+            'elapsed_s': round(self.elapsed(), 1),
+            'latency_budget_s': self.latency_budget_s,
+            'tokens_used': tokens_used,
+            'token_budget': self.token_budget,
+            'prompt_cache': self.cache.summary(),
+            'downgrades': downgrades,
+        }
+
+
+@contextmanager
+def use_budget(budget: Optional[BatchBudget]) -> Iterator[Optional[BatchBudget]]:
+    """Make budget the active batch budget for routed calls in this context"""
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+def current_budget() -> Optional[BatchBudget]:
+    return _current_budget.get()
+
+
+@contextmanager
+def collect_decisions() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collect the routing decisions made in this context (and the tasks/threads it starts).
+
+    Unlike recent_decisions(), concurrent workflows only see their own calls
+    and nothing is lost when the global buffer wraps.
+    """
+    decisions: List[Dict[str, Any]] = []
+    token = _decision_log.set(decisions)
+    try:
+        yield decisions
+    finally:
+        _decision_log.reset(token)
+
+
+def _base_route(stage: str, platform: Optional[str], mode: str) -> ModelRoute:
+    if stage not in STAGE_ROUTES:
+        raise KeyError(f"Unknown model routing stage: {stage}")
+    route = STAGE_ROUTES[stage]
+
+    matches = [
+        (key, fields) for key, fields in ROUTE_OVERRIDES.items()
+        if key[0] == stage
+        and key[1] in (None, platform)
+        and key[2] in (None, mode)
+    ]
+    # Apply wildcard overrides first so platform/mode-specific ones win
+    for _, fields in sorted(matches, key=lambda m: (m[0][1] is not None) + (m[0][2] is not None)):
+        route = replace(route, **fields)
+
+    env_model = os.getenv(f"MODEL_ROUTE_{stage.upper()}")
+    if env_model:
+        route = replace(route, model=env_model)
+    return replace(route, timeout=output_timeout(route.max_tokens, route.timeout))
+
+
+def route_model(stage: str, platform: Optional[str] = None, mode: Optional[str] = None) -> ModelRoute:
+    """
+    Pick model, max_tokens and timeout for a call.
+
+    Args:
+        stage: Key in STAGE_ROUTES
+        platform: linkedin, twitter, email, youtube, instagram (optional)
+        mode: interactive, batch or thinking (default: batch while a
+              BatchBudget is active, else interactive)
+
+    Returns:
+        ModelRoute (downgraded to FAST_MODEL if non-critical and the batch is behind)
+    """
+    budget = current_budget()
+    mode = mode or ('batch' if budget else 'interactive')
+    route = _base_route(stage, platform, mode)
+
+    reason = None
+    if budget and not route.critical and route.model != FAST_MODEL:
+        reason = budget.behind_schedule()
+        if reason:
+            route = replace(route, model=FAST_MODEL, downgraded=True)
+            budget.record_downgrade(stage)
+            print(f"⏬ [ROUTING] {stage} → {FAST_MODEL} (batch over {reason} budget)", flush=True)
+
+    decision = {
+        'stage': stage,
+        'platform': platform,
+        'mode': mode,
+        'model': route.model,
+        'max_tokens': route.max_tokens,
+        'timeout': route.timeout,
+        'downgraded': route.downgraded,
+        'reason': reason,
+        'at': time.time(),
+    }
+    collected = _decision_log.get()
+    if collected is not None:
+        collected.append(decision)
+    with _stats_lock:
+        _decisions.append(decision)
+        _stats['decisions'] += 1
+        _stats['downgrades'] += int(route.downgraded)
+        _model_counts[route.model] += 1
+    logger.info("model_route", extra={'routing': decision})
+    return route
+
+
+def record_usage(response: Any, budget: Optional[BatchBudget] = None) -> int:
+    """Count a response's tokens (incl. prompt cache reads/writes) against the stats and active budget"""
+    counts = usage_tokens(response)
+    if not any(counts.values()):
+        return 0
+    with _stats_lock:
+        for field, value in counts.items():
+            _stats[field] += value
+    budget = budget or current_budget()
+    if budget:
+        # Cached prompt tokens are still processed, so they count toward the budget
+        budget.add_tokens(sum(counts.values()))
+        budget.cache.add_counts(counts)
+    return sum(counts.values())
+
+
+def create_message(
+    client: Any,
+    stage: Union[str, ModelRoute],
+    platform: Optional[str] = None,
+    mode: Optional[str] = None,
+    **kwargs
+):
+    """
+    client.messages.create() through the routing policy.
+
+    Args:
+        client: Anthropic client
+        stage: Stage name, or a ModelRoute already chosen with route_model()
+        platform, mode: Passed to route_model() when stage is a name
+        **kwargs: Remaining messages.create arguments (system, messages, tools, ...).
+                  An explicit max_tokens/timeout wins over the route (for
+                  call sites that size output dynamically). The timeout is
+                  capped by the remaining deadline (utils/deadline.py).
+
+    Returns:
+        The Anthropic response
+    """
+    route = stage if isinstance(stage, ModelRoute) else route_model(stage, platform, mode)
+    params = {**route.params(), **kwargs}
+    if 'timeout' not in kwargs and params['max_tokens'] > route.max_tokens:
+        # Sized above the route: give the extra output time too
+        params['timeout'] = output_timeout(params['max_tokens'] - route.max_tokens, route.timeout)
+    # Never wait past the post's deadline
+    params['timeout'] = timeout_for(params['timeout'])
+    budget = current_budget()
+    started = time.monotonic()
+    if route.stage in HEDGED_STAGES:
+        # Grading is idempotent: a slow grade gets a duplicate request, first answer wins
+        response = hedged_call(f"llm:{route.stage}", client.messages.create,
+                               on_discard=lambda extra: record_usage(extra, budget), **params)
+    else:
+        response = client.messages.create(**params)
+    tokens = record_usage(response)
+    if budget:
+        budget.record_stage(route.stage, time.monotonic() - started, tokens)
+    return response
+
+
+def get_routing_stats() -> Dict[str, Any]:
+    """Decision counts, token usage and the most recent decisions"""
+    with _stats_lock:
+        return {
+            **_stats,
+            'cache_hit_rate': round(cache_hit_rate(
+                _stats['input_tokens'], _stats['cache_read_input_tokens'], _stats['cache_creation_input_tokens']
+            ), 3),
+            'by_model': dict(_model_counts),
+            'recent': list(_decisions)[-20:],
+        }
+
+
+def recent_decisions(since: float = 0.0) -> List[Dict[str, Any]]:
+    """Decisions made at or after a time.time() timestamp"""
+    with _stats_lock:
+        return [d for d in _decisions if d['at'] >= since]
+
+
+def reset_routing_stats():
+    with _stats_lock:
+        _decisions.clear()
+        _model_counts.clear()
+        for key in _stats:
+            _stats[key] = 0
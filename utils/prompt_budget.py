@@ -0,0 +1,265 @@
+"""
+Prompt Budget
+Token cost per stacked-prompt section, per-platform budgets, and rule dedupe.
+
+stack_prompts() sends CLAUDE.md + writing rules + editor standards + the
+platform's create_draft as the system prompt of every agent call, and every
+uncached call pays for all of it before the first token. This module makes the
+size visible and keeps it in check:
+
+- TokenCounter  - tokens per section from the API's count_tokens endpoint,
+                  cached on disk by content hash; offline (or at runtime) it
+                  uses the cached count, else a chars-per-token estimate
+                  calibrated from the cached counts
+- dedupe_rules  - rule bullets repeated across writing rules, editor standards
+                  and create_draft are merged into their first occurrence
+- platform_budget / check_budget - configurable token budget per platform
+
+Run scripts/prompt_budget.py for the per-section report (exits non-zero when
+a platform is over budget).
+
+Config (env):
+    PROMPT_DEDUPE                     Merge repeated rules in stacked prompts (default: true)
+    PROMPT_DEDUPE_THRESHOLD           Share of a rule's words another rule must cover to count as a repeat (default: 0.9)
+    PROMPT_TOKEN_BUDGET               Budget for platforms without their own (default: 12000)
+    PROMPT_TOKEN_BUDGET_<PLATFORM>    Per-platform budget, e.g. PROMPT_TOKEN_BUDGET_LINKEDIN
+    PROMPT_TOKEN_CACHE                Token count cache file (default: .cache/prompt_tokens.json)
+"""
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEDUPE_ENABLED = os.getenv('PROMPT_DEDUPE', 'true').lower() == 'true'
+DEDUPE_THRESHOLD = float(os.getenv('PROMPT_DEDUPE_THRESHOLD', '0.9'))
+DEFAULT_TOKEN_BUDGET = int(os.getenv('PROMPT_TOKEN_BUDGET', '12000'))
+TOKEN_CACHE_PATH = Path(os.getenv(
+    'PROMPT_TOKEN_CACHE', str(Path(__file__).parent.parent / '.cache' / 'prompt_tokens.json')
+))
+
+# Stacked prompt size per platform (deduplicated build, ~10% headroom)
+PLATFORM_TOKEN_BUDGETS = {
+    'linkedin': 15000,
+    'twitter': 12500,
+    'email': 10000,
+    'youtube': 10000,
+    'instagram': 9500,
+}
+
+# Used until the cache holds real counts to calibrate against
+DEFAULT_CHARS_PER_TOKEN = 3.5
+
+# A rule is a list item: "- ...", "* ...", "1. ...", "✅ ...", "❌ ..."
+_RULE_LINE = re.compile(r'^\s*(?:[-*•]|\d+[.)]|[✅❌✓✗⚠])')
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+MIN_RULE_WORDS = 5
+
+
+def platform_budget(platform: str) -> int:
+    """Token budget for a platform's stacked prompt"""
+    override = os.getenv(f'PROMPT_TOKEN_BUDGET_{platform.upper()}')
+    if override:
+        return int(override)
+    return PLATFORM_TOKEN_BUDGETS.get(platform.lower(), DEFAULT_TOKEN_BUDGET)
+
+
+# ============= TOKEN COUNTING =============
+
+class TokenCounter:
+    """
+    Token counts for prompt text, cached on disk by (model, content) hash.
+
+    count() calls the count_tokens endpoint unless offline; a failed call
+    falls back to the estimate so reporting never breaks on the network.
+    """
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        cache_path: Path = TOKEN_CACHE_PATH,
+        offline: bool = False,
+        client_factory: Optional[Callable[[], Any]] = None
+    ):
+        if model is None:
+            from utils.model_routing import route_model
+            model = route_model('agent_loop').model
+        self.model = model
+        self.cache_path = Path(cache_path)
+        self.offline = offline
+        self.client_factory = client_factory
+        self._counts: Optional[Dict[str, Dict[str, int]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model}\n{text}".encode('utf-8')).hexdigest()[:24]
+
+    def _cache(self) -> Dict[str, Dict[str, int]]:
+        if self._counts is None:
+            try:
+                self._counts = json.loads(self.cache_path.read_text())
+            except (OSError, ValueError):
+                self._counts = {}
+        return self._counts
+
+    def chars_per_token(self) -> float:
+        """Calibrated from cached API counts; default until there are any"""
+        samples = [c for c in self._cache().values() if c.get('tokens')]
+        chars = sum(c['chars'] for c in samples)
+        tokens = sum(c['tokens'] for c in samples)
+        return chars / tokens if tokens else DEFAULT_CHARS_PER_TOKEN
+
+    def estimate(self, text: str) -> int:
+        return round(len(text) / self.chars_per_token()) if text else 0
+
+    def count(self, text: str) -> Tuple[int, str]:
+        """(tokens, source) where source is 'api', 'cache' or 'estimate'"""
+        if not text:
+            return 0, 'cache'
+        key = self._key(text)
+        with self._lock:
+            cached = self._cache().get(key)
+        if cached:
+            return cached['tokens'], 'cache'
+        if self.offline:
+            return self.estimate(text), 'estimate'
+        try:
+            tokens = self._count_api(text)
+        except Exception as e:
+            logger.warning("prompt_token_count_failed", extra={'error': str(e)})
+            print(f"⚠️ count_tokens failed ({e}); using estimate", flush=True)
+            self.offline = True
+            return self.estimate(text), 'estimate'
+        with self._lock:
+            self._cache()[key] = {'chars': len(text), 'tokens': tokens}
+            self._dirty = True
+        return tokens, 'api'
+
+    def _count_api(self, text: str) -> int:
+        if self.client_factory is None:
+            from utils.http_clients import get_anthropic_client
+            self.client_factory = get_anthropic_client
+        client = self.client_factory()
+        probe = [{"role": "user", "content": "."}]
+        with_system = client.messages.count_tokens(model=self.model, system=text, messages=probe)
+        baseline_key = f"baseline:{self.model}"
+        baseline = self._cache().get(baseline_key)
+        if baseline is None:
+            baseline = {'chars': 0, 'tokens': 0,
+                        'overhead': client.messages.count_tokens(model=self.model, messages=probe).input_tokens}
+            self._cache()[baseline_key] = baseline
+        return max(0, with_system.input_tokens - baseline['overhead'])
+
+    def save(self):
+        """Persist counts fetched from the API"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps(self._counts, indent=2, sort_keys=True))
+            self._dirty = False
+
+
+_runtime_counter: Optional[TokenCounter] = None
+
+
+def runtime_counter() -> TokenCounter:
+    """Offline counter for request-time checks (never calls the API)"""
+    global _runtime_counter
+    if _runtime_counter is None:
+        _runtime_counter = TokenCounter(offline=True)
+    return _runtime_counter
+
+
+# ============= RULE DEDUPE =============
+
+def _rule_words(line: str) -> Optional[frozenset]:
+    if not _RULE_LINE.match(line):
+        return None
+    words = frozenset(_WORD.findall(line.lower()))
+    return words if len(words) >= MIN_RULE_WORDS else None
+
+
+def dedupe_rules(
+    sections: List[Tuple[str, str]],
+    threshold: float = DEDUPE_THRESHOLD
+) -> Tuple[List[Tuple[str, str]], List[Dict[str, str]]]:
+    """
+    Merge rule lines repeated across sections.
+
+    A rule whose words are (nearly) all covered by a rule in an earlier section
+    is dropped. When the later rule is the more complete one, it replaces the
+    earlier rule in place, so each rule appears once at its first position.
+    Repeats within a section, headings and prose are left alone.
+
+    Args:
+        sections: (name, text) in stacking order
+        threshold: share of a rule's words the other rule must contain
+
+    Returns:
+        (deduplicated sections, merges) where each merge records
+        {'kept_in', 'dropped_from', 'kept', 'dropped'}
+    """
+    lines = [text.split('\n') for _, text in sections]
+    seen: List[Tuple[int, int, frozenset]] = []  # (section, line, words) of rules from earlier sections
+    merges: List[Dict[str, str]] = []
+    removed = set()
+
+    for s, section_lines in enumerate(lines):
+        current = []
+        for i, line in enumerate(section_lines):
+            words = _rule_words(line)
+            if words is None:
+                continue
+            for k, (ps, pi, prior) in enumerate(seen):
+                overlap = len(words & prior)
+                if overlap / len(words) >= threshold:
+                    # Already said earlier
+                    merges.append({'kept_in': sections[ps][0], 'dropped_from': sections[s][0],
+                                   'kept': lines[ps][pi].strip(), 'dropped': line.strip()})
+                    removed.add((s, i))
+                    break
+                if overlap / len(prior) >= threshold:
+                    # Earlier rule is a subset: keep the fuller wording at the earlier position
+                    indent = lines[ps][pi][:len(lines[ps][pi]) - len(lines[ps][pi].lstrip())]
+                    merges.append({'kept_in': sections[ps][0], 'dropped_from': sections[s][0],
+                                   'kept': line.strip(), 'dropped': lines[ps][pi].strip()})
+                    lines[ps][pi] = indent + line.strip()
+                    seen[k] = (ps, pi, words)
+                    removed.add((s, i))
+                    break
+            else:
+                current.append((s, i, words))
+        seen.extend(current)
+
+    deduped = [
+        (name, '\n'.join(line for i, line in enumerate(lines[s]) if (s, i) not in removed))
+        for s, (name, _) in enumerate(sections)
+    ]
+    return deduped, merges
+
+
+# ============= BUDGET =============
+
+def section_tokens(sections: List[Tuple[str, str]], counter: TokenCounter) -> List[Dict[str, Any]]:
+    """Per-section chars and tokens"""
+    report = []
+    for name, text in sections:
+        tokens, source = counter.count(text)
+        report.append({'name': name, 'chars': len(text), 'tokens': tokens, 'source': source})
+    return report
+
+
+def check_budget(platform: str, text: str, counter: Optional[TokenCounter] = None) -> Dict[str, Any]:
+    """Tokens of a stacked prompt against the platform budget"""
+    counter = counter or runtime_counter()
+    tokens, source = counter.count(text)
+    budget = platform_budget(platform)
+    return {'platform': platform, 'tokens': tokens, 'budget': budget,
+            'over_budget': tokens > budget, 'source': source}
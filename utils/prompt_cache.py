@@ -0,0 +1,167 @@
+"""
+Prompt Cache Layout
+Places cache breakpoints for the direct API agents' tool loops and reports
+how much of each request was served from the prompt cache.
+
+Anthropic caches the request prefix in order tools → system → messages, up to
+the last block marked cache_control (max 4 breakpoints). The tool loop uses 3:
+1. Last tool definition  - tool schemas, identical across posts
+2. Stacked system prompt - identical across posts
+3. Last turn of the history - the conversation so far is an exact prefix of
+   the next iteration's request, so iteration N+1 reads everything up to
+   iteration N's tool results from cache and only pays for the new turn
+
+Breakpoints are applied to copies; the stored conversation is never mutated.
+
+Usage:
+    usage = CacheUsage()
+    response = create_message(client, route,
+                              system=cached_system(stacked_system),
+                              tools=cached_tools(tools),
+                              messages=with_history_breakpoint(messages))
+    usage.add(response)
+    record_agent_cache_usage('linkedin', usage)
+"""
+import logging
+import threading
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+def cached_system(text: str) -> List[Dict[str, Any]]:
+    """System prompt as a single cached text block"""
+    return [{"type": "text", "text": text, "cache_control": EPHEMERAL}]
+
+
+def cached_tools(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy of tool schemas with a breakpoint after the last definition"""
+    if not tools:
+        return tools
+    return [*tools[:-1], {**tools[-1], "cache_control": EPHEMERAL}]
+
+
+def with_history_breakpoint(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy of messages with a breakpoint on the last content block of the last turn.
+
+    String content becomes a single text block; tool_result lists get the
+    breakpoint on their final result. Earlier turns are shared, not copied.
+    """
+    if not messages:
+        return messages
+
+    last = messages[-1]
+    content = last.get("content")
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content, "cache_control": EPHEMERAL}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = [*content[:-1], {**content[-1], "cache_control": EPHEMERAL}]
+    else:
+        # SDK content blocks (assistant turns) - leave as is
+        return messages
+
+    return [*messages[:-1], {**last, "content": blocks}]
+
+
+def usage_tokens(response: Any) -> Dict[str, int]:
+    """Input/output/cache token counts from a response (zeros if missing)"""
+    usage = getattr(response, 'usage', None)
+    counts = {}
+    for field in ('input_tokens', 'output_tokens', 'cache_read_input_tokens', 'cache_creation_input_tokens'):
+        value = getattr(usage, field, 0) if usage is not None else 0
+        counts[field] = value if isinstance(value, int) else 0
+    return counts
+
+
+def cache_hit_rate(input_tokens: int, cache_read: int, cache_creation: int) -> float:
+    """Share of prompt tokens read from cache (input_tokens excludes cached tokens)"""
+    total = input_tokens + cache_read + cache_creation
+    return cache_read / total if total else 0.0
+
+
+class CacheUsage:
+    """Token and cache counters for a group of calls (one post, one agent, one batch)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_creation_tokens = 0
+        self.recorded = False
+        self._lock = threading.Lock()
+
+    def add(self, response: Any) -> Dict[str, int]:
+        counts = usage_tokens(response)
+        self.add_counts(counts)
+        return counts
+
+    def add_counts(self, counts: Dict[str, int], calls: int = 1):
+        with self._lock:
+            self.calls += calls
+            self.input_tokens += counts.get('input_tokens', 0)
+            self.output_tokens += counts.get('output_tokens', 0)
+            self.cache_read_tokens += counts.get('cache_read_input_tokens', 0)
+            self.cache_creation_tokens += counts.get('cache_creation_input_tokens', 0)
+
+    def merge(self, other: 'CacheUsage'):
+        self.add_counts({
+            'input_tokens': other.input_tokens,
+            'output_tokens': other.output_tokens,
+            'cache_read_input_tokens': other.cache_read_tokens,
+            'cache_creation_input_tokens': other.cache_creation_tokens,
+        }, calls=other.calls)
+
+    @property
+    def prompt_tokens(self) -> int:
+        return self.input_tokens + self.cache_read_tokens + self.cache_creation_tokens
+
+    @property
+    def hit_rate(self) -> float:
+        return cache_hit_rate(self.input_tokens, self.cache_read_tokens, self.cache_creation_tokens)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'prompt_tokens': self.prompt_tokens,
+            'uncached_input_tokens': self.input_tokens,
+            'cache_read_tokens': self.cache_read_tokens,
+            'cache_creation_tokens': self.cache_creation_tokens,
+            'output_tokens': self.output_tokens,
+            'cache_hit_rate': round(self.hit_rate, 3),
+        }
+
+    def summary_line(self) -> str:
+        return (f"{self.hit_rate:.0%} of {self.prompt_tokens:,} prompt tokens from cache "
+                f"({self.cache_read_tokens:,} read, {self.cache_creation_tokens:,} written, "
+                f"{self.input_tokens:,} uncached) over {self.calls} calls")
+
+
+# Per-agent totals since startup
+_agent_usage: Dict[str, CacheUsage] = {}
+_registry_lock = threading.Lock()
+
+
+def record_agent_cache_usage(agent: str, usage: CacheUsage):
+    """Add one post's cache usage to the agent's running totals (once per usage object)"""
+    if usage.recorded or not usage.calls:
+        return
+    usage.recorded = True
+    with _registry_lock:
+        totals = _agent_usage.setdefault(agent, CacheUsage())
+    totals.merge(usage)
+    logger.info("prompt_cache_usage", extra={'agent': agent, 'cache': usage.summary()})
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Cache usage per agent since startup"""
+    with _registry_lock:
+        return {agent: usage.summary() for agent, usage in _agent_usage.items()}
+
+
+def reset_cache_stats():
+    with _registry_lock:
+        _agent_usage.clear()
@@ -0,0 +1,300 @@
+"""
+RAG Prefetch
+Warms retrieval for planned posts while the user is still reviewing the plan.
+
+create_batch_plan() returns as soon as the outline exists, and the user then
+spends minutes approving it. During that time this module runs the searches
+each post will need anyway:
+
+1. Company documents for the post topic (search_company_documents tool)
+2. Company documents for proof points (inject_proof_points' fixed query)
+3. Content examples for Twitter posts (Haiku fast path)
+4. Optional: web research for plan-mode research todos (RAG_PREFETCH_RESEARCH)
+
+Results live in a per-plan cache. execute_single_post_from_plan() binds the
+plan's cache with use_prefetch(), and the native tools call
+lookup_prefetched() before searching. A lookup matches the exact query or,
+failing that, a prefetched query with the same parameters whose words overlap
+enough (the agent rarely repeats the plan topic verbatim). Searches still in
+flight are awaited briefly instead of being started a second time.
+
+Failed searches are never served from the cache; the tool falls back to a
+live search.
+
+Config (env):
+    RAG_PREFETCH_ENABLED          Start prefetch when a plan is created (default: true)
+    RAG_PREFETCH_RESEARCH         Also prefetch web research (paid Tavily calls) (default: false)
+    RAG_PREFETCH_TTL_SECONDS      How long prefetched results are served (default: 3600)
+    RAG_PREFETCH_MATCH_THRESHOLD  Word overlap for a non-exact query to match (default: 0.6)
+    RAG_PREFETCH_WAIT_SECONDS     Max wait for an in-flight prefetch (default: 10)
+"""
+import os
+import re
+import json
+import time
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_ENABLED = os.getenv('RAG_PREFETCH_ENABLED', 'true').lower() == 'true'
+PREFETCH_RESEARCH = os.getenv('RAG_PREFETCH_RESEARCH', 'false').lower() == 'true'
+PREFETCH_TTL_SECONDS = float(os.getenv('RAG_PREFETCH_TTL_SECONDS', '3600'))
+MATCH_THRESHOLD = float(os.getenv('RAG_PREFETCH_MATCH_THRESHOLD', '0.6'))
+WAIT_SECONDS = float(os.getenv('RAG_PREFETCH_WAIT_SECONDS', '10'))
+
+# Concurrent searches per plan (Supabase/OpenAI embeddings are shared with live posts)
+PREFETCH_CONCURRENCY = 3
+
+# Query inject_proof_points uses for its company-document search
+PROOF_QUERY = "{topic} case study metrics ROI testimonial"
+
+# Platform filter values used by the content-example searches
+PLATFORM_LABELS = {'twitter': 'Twitter', 'x': 'Twitter', 'x/twitter': 'Twitter'}
+
+_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'in', 'is',
+    'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'with', 'why', 'what', 'your',
+}
+
+
+def query_terms(query: str) -> frozenset:
+    """Lowercase content words of a query (order and stopwords ignored)"""
+    return frozenset(w for w in re.findall(r"[a-z0-9']+", (query or '').lower()) if w not in _STOPWORDS)
+
+
+def _overlap(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _is_error(result: Any) -> bool:
+    """Search tools return JSON with an 'error' key instead of raising"""
+    if not isinstance(result, str):
+        return result is None
+    try:
+        data = json.loads(result)
+    except (ValueError, TypeError):
+        return False
+    return isinstance(data, dict) and bool(data.get('error'))
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple:
+    return tuple(sorted(params.items()))
+
+
+class _Entry:
+    __slots__ = ('kind', 'query', 'terms', 'params', 'task', 'created_at')
+
+    def __init__(self, kind: str, query: str, params: Dict[str, Any], task: asyncio.Task):
+        self.kind = kind
+        self.query = query
+        self.terms = query_terms(query)
+        self.params = _params_key(params)
+        self.task = task
+        self.created_at = time.time()
+
+
+class PlanPrefetch:
+    """
+    Prefetched search results for one plan.
+
+    Usage:
+        prefetch = PlanPrefetch(plan_id)
+        prefetch.start('company_documents', search_fn, "AI agents", match_count=3, document_type=None)
+        result = await prefetch.get('company_documents', "AI agent ROI", match_count=3, document_type=None)
+    """
+
+    def __init__(self, plan_id: str, ttl_seconds: float = PREFETCH_TTL_SECONDS):
+        self.plan_id = plan_id
+        self.ttl_seconds = ttl_seconds
+        self.created_at = time.time()
+        self.entries: Dict[Tuple[str, str, Tuple], _Entry] = {}
+        self.stats = {'started': 0, 'hits': 0, 'near_hits': 0, 'waited': 0, 'misses': 0, 'failed': 0}
+        self._semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+    def start(self, kind: str, fn: Callable[..., str], query: str, **params) -> bool:
+        """Schedule fn(query=query, **params) in a worker thread; False if already scheduled"""
+        key = (kind, query.strip().lower(), _params_key(params))
+        if not query.strip() or key in self.entries:
+            return False
+        task = asyncio.get_running_loop().create_task(self._run(fn, query, params))
+        self.entries[key] = _Entry(kind, query, params, task)
+        self.stats['started'] += 1
+        return True
+
+    async def _run(self, fn: Callable[..., str], query: str, params: Dict[str, Any]) -> Optional[str]:
+        async with self._semaphore:
+            try:
+                result = await asyncio.to_thread(fn, query=query, **params)
+            except Exception as e:
+                logger.warning("rag_prefetch_failed", extra={'plan_id': self.plan_id, 'query': query, 'error': str(e)})
+                return None
+        return result
+
+    def _find(self, kind: str, query: str, params: Dict[str, Any]) -> Tuple[Optional[_Entry], bool]:
+        """Exact entry, else the closest same-parameter entry above the threshold"""
+        now = time.time()
+        exact = self.entries.get((kind, query.strip().lower(), _params_key(params)))
+        if exact and now - exact.created_at <= self.ttl_seconds:
+            return exact, True
+
+        terms = query_terms(query)
+        wanted = _params_key(params)
+        best, best_score = None, MATCH_THRESHOLD
+        for entry in self.entries.values():
+            if entry.kind != kind or entry.params != wanted or now - entry.created_at > self.ttl_seconds:
+                continue
+            score = _overlap(terms, entry.terms)
+            if score >= best_score:
+                best, best_score = entry, score
+        return best, False
+
+    async def get(self, kind: str, query: str, wait: float = WAIT_SECONDS, **params) -> Optional[str]:
+        """Prefetched result for this search, or None (caller searches live)"""
+        entry, exact = self._find(kind, query, params)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        if not entry.task.done():
+            self.stats['waited'] += 1
+            try:
+                await asyncio.wait_for(asyncio.shield(entry.task), timeout=wait)
+            except asyncio.TimeoutError:
+                self.stats['misses'] += 1
+                return None
+
+        result = None if entry.task.cancelled() else entry.task.result()
+        if _is_error(result):
+            self.stats['failed'] += 1
+            return None
+
+        self.stats['hits' if exact else 'near_hits'] += 1
+        return result
+
+    def pending(self) -> int:
+        return sum(1 for e in self.entries.values() if not e.task.done())
+
+    def cancel(self):
+        for entry in self.entries.values():
+            if not entry.task.done():
+                entry.task.cancel()
+
+    def summary(self) -> Dict[str, Any]:
+        return {'plan_id': self.plan_id, 'searches': len(self.entries), 'pending': self.pending(), **self.stats}
+
+
+def post_searches(post: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """(kind, query, params) for the searches a planned post's agent will run"""
+    topic = (post.get('topic') or '').strip()
+    if not topic:
+        return []
+    searches = [
+        ('company_documents', topic, {'match_count': 3, 'document_type': None}),
+        ('company_documents', PROOF_QUERY.format(topic=topic), {'match_count': 3, 'document_type': None}),
+    ]
+    label = PLATFORM_LABELS.get((post.get('platform') or '').lower())
+    if label:
+        searches.append(('content_examples', topic, {'platform': label, 'match_count': 5}))
+    return searches
+
+
+def _search_functions() -> Dict[str, Callable[..., str]]:
+    from tools.company_documents import search_company_documents
+    from tools.search_tools import search_content_examples, web_search
+    return {
+        'company_documents': search_company_documents,
+        'content_examples': search_content_examples,
+        'web_search': web_search,
+    }
+
+
+# Active prefetches (plan_id -> PlanPrefetch) and the one bound to the current post
+_plan_prefetches: Dict[str, PlanPrefetch] = {}
+_active: ContextVar[Optional[PlanPrefetch]] = ContextVar('rag_prefetch', default=None)
+
+
+def start_plan_prefetch(
+    plan_id: str,
+    posts: List[Dict[str, Any]] = (),
+    research_queries: List[str] = (),
+    search_functions: Optional[Dict[str, Callable[..., str]]] = None
+) -> Optional[PlanPrefetch]:
+    """
+    Start background searches for a plan. Returns None when disabled or when
+    called outside an event loop (the plan still works, just without prefetch).
+    """
+    if not PREFETCH_ENABLED:
+        return None
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    _prune_expired()
+    functions = search_functions or _search_functions()
+    prefetch = _plan_prefetches.get(plan_id) or PlanPrefetch(plan_id)
+    for post in posts:
+        for kind, query, params in post_searches(post):
+            prefetch.start(kind, functions[kind], query, **params)
+    if PREFETCH_RESEARCH:
+        for query in research_queries:
+            prefetch.start('web_search', functions['web_search'], query, max_results=10)
+
+    if not prefetch.entries:
+        return None
+    _plan_prefetches[plan_id] = prefetch
+    print(f"🔮 Prefetching {len(prefetch.entries)} searches for plan {plan_id} in the background")
+    return prefetch
+
+
+def get_plan_prefetch(plan_id: str) -> Optional[PlanPrefetch]:
+    return _plan_prefetches.get(plan_id)
+
+
+def clear_plan_prefetch(plan_id: str) -> Optional[Dict[str, Any]]:
+    """Drop a finished plan's cache; returns its summary"""
+    prefetch = _plan_prefetches.pop(plan_id, None)
+    if prefetch is None:
+        return None
+    prefetch.cancel()
+    summary = prefetch.summary()
+    logger.info("rag_prefetch_summary", extra=summary)
+    return summary
+
+
+def _prune_expired():
+    now = time.time()
+    for plan_id, prefetch in list(_plan_prefetches.items()):
+        if now - prefetch.created_at > prefetch.ttl_seconds:
+            clear_plan_prefetch(plan_id)
+
+
+@contextmanager
+def use_prefetch(plan_id: str):
+    """Bind a plan's prefetch cache for the tools run inside this block"""
+    token = _active.set(_plan_prefetches.get(plan_id))
+    try:
+        yield _active.get()
+    finally:
+        _active.reset(token)
+
+
+def current_prefetch() -> Optional[PlanPrefetch]:
+    return _active.get()
+
+
+async def lookup_prefetched(kind: str, query: str, **params) -> Optional[str]:
+    """Prefetched result for the bound plan, or None when nothing usable is cached"""
+    prefetch = _active.get()
+    if prefetch is None:
+        return None
+    result = await prefetch.get(kind, query, **params)
+    if result is not None:
+        print(f"   🔮 Prefetched {kind} served for \"{query[:60]}\"")
+    return result
@@ -0,0 +1,147 @@
+"""
+Adaptive Revision Controller
+Decides whether ContentWorkflow should run another full revise → validate pass.
+
+The fixed loop (revise until score >= target or max_iterations) keeps paying
+for full LLM passes after the score has plateaued, and for drafts whose only
+remaining problems are mechanical. This controller:
+- Stops when the last revision gained less than REVISION_MIN_GAIN points
+- Routes drafts whose remaining issues are all regex-fixable (and whose score
+  is within REVISION_LOCAL_FIX_MAX_GAP of target) to HybridEditor's
+  deterministic fixes instead of a full LLM pass. The fixed draft is re-graded
+  (no reviser call); the loop only ends if that new score meets the target
+- Records the LLM calls and estimated latency saved per post
+
+Config (env):
+    REVISION_MIN_GAIN            Minimum score gain per iteration to keep going (default: 3)
+    REVISION_LOCAL_FIX_MAX_GAP   Max points below target for local-only fixes (default: 10)
+"""
+import os
+from typing import Any, Dict, List, Optional
+
+DEFAULT_MIN_GAIN = float(os.getenv('REVISION_MIN_GAIN', '3'))
+DEFAULT_LOCAL_FIX_MAX_GAP = float(os.getenv('REVISION_LOCAL_FIX_MAX_GAP', '10'))
+
+# Issue codes HybridEditor._apply_regex_fixes handles deterministically
+LOCAL_FIX_CODES = {'contrast_direct', 'contrast_masked', 'wall_of_text', 'paragraph_dense'}
+
+# Reviser + claim extraction + contrast check + grader (verification extra)
+LLM_CALLS_PER_ITERATION = 4
+
+# A local-fix pass still re-grades; it only skips the reviser call
+LLM_CALLS_SAVED_PER_LOCAL_FIX = 1
+
+
+def issue_code(issue: Dict[str, Any]) -> Optional[str]:
+    """Validators use 'code' or 'type' for the issue identifier"""
+    return issue.get('code') or issue.get('type')
+
+
+class RevisionController:
+    """
+    Tracks scores across revision passes and decides the next step.
+
+    Usage:
+        controller = RevisionController(target_score, max_iterations)
+        controller.record(grading['score'])
+        while controller.should_revise(iterations):
+            if controller.route(grading) == 'local':
+                ...regex fixes + re-grade...
+                controller.record_local_fix(grading['score'])
+                continue
+            ...full pass...
+            controller.record(grading['score'], seconds)
+    """
+
+    def __init__(
+        self,
+        target_score: int,
+        max_iterations: int,
+        min_gain: float = DEFAULT_MIN_GAIN,
+        local_fix_max_gap: float = DEFAULT_LOCAL_FIX_MAX_GAP
+    ):
+        self.target_score = target_score
+        self.max_iterations = max_iterations
+        self.min_gain = min_gain
+        self.local_fix_max_gap = local_fix_max_gap
+
+        self.scores: List[float] = []
+        self.iteration_seconds: List[float] = []
+        self.local_fixes = 0
+        self.stop_reason: Optional[str] = None
+        self._skipped_iterations = 0
+        self._last_was_local = False
+
+    def record(self, score: float, seconds: Optional[float] = None):
+        """Record a grading score (and the duration of the pass that produced it)"""
+        self.scores.append(score)
+        self._last_was_local = False
+        if seconds is not None:
+            self.iteration_seconds.append(seconds)
+
+    def should_revise(self, iterations: int) -> bool:
+        """
+        Whether another full revision pass is worth running.
+
+        Sets stop_reason when returning False:
+        target_met | local_fix (target met by a re-graded local fix) | max_iterations | plateau
+        """
+        score = self.scores[-1] if self.scores else 0
+        if score >= self.target_score:
+            self.stop_reason = 'local_fix' if self._last_was_local else 'target_met'
+            return False
+        if iterations >= self.max_iterations:
+            self.stop_reason = 'max_iterations'
+            return False
+        # A local fix isn't a revision: a small gain from it doesn't mean the LLM passes plateaued
+        if len(self.scores) >= 2 and not self._last_was_local and self.scores[-1] - self.scores[-2] < self.min_gain:
+            self.stop_reason = 'plateau'
+            self._skipped_iterations = self.max_iterations - iterations
+            return False
+        return True
+
+    def route(self, grading: Dict[str, Any]) -> str:
+        """
+        'local' when every remaining issue is regex-fixable and the score is
+        close to target, else 'full' (LLM revise + grade). At most one local
+        fix per post: if the re-graded draft still misses target, revise fully.
+        """
+        remaining = grading.get('code_issues_remaining', [])
+        if not remaining or self.local_fixes:
+            return 'full'
+        if self.target_score - grading.get('score', 0) > self.local_fix_max_gap:
+            return 'full'
+        if all(issue_code(i) in LOCAL_FIX_CODES for i in remaining):
+            return 'local'
+        return 'full'
+
+    def record_local_fix(self, score: float):
+        """Record the re-graded score of a locally fixed draft (replaces one reviser call)"""
+        self.local_fixes += 1
+        self.scores.append(score)
+        self._last_was_local = True
+
+    def savings(self, fallback_seconds: float = 0.0) -> Dict[str, Any]:
+        """
+        Estimated cost/latency avoided by stopping early.
+
+        Args:
+            fallback_seconds: Per-pass latency estimate when no full revision ran
+                              (e.g. the initial validation time)
+        """
+        if self.iteration_seconds:
+            per_iteration = sum(self.iteration_seconds) / len(self.iteration_seconds)
+        else:
+            per_iteration = fallback_seconds
+
+        return {
+            'stop_reason': self.stop_reason,
+            'scores': self.scores,
+            'local_fixes': self.local_fixes,
+            'iterations_skipped': self._skipped_iterations,
+            'llm_calls_saved': (
+                self._skipped_iterations * LLM_CALLS_PER_ITERATION
+                + self.local_fixes * LLM_CALLS_SAVED_PER_LOCAL_FIX
+            ),
+            'est_latency_saved_s': round(self._skipped_iterations * per_iteration, 2)
+        }
@@ -0,0 +1,210 @@
+"""
+Running Statistics for Batches
+O(1) incremental aggregates instead of recomputing from score lists.
+
+ContextManager.get_stats() used to re-sum the whole score list, take min/max
+and split it in halves for the quality trend on every checkpoint. BatchStats
+keeps everything as running aggregates updated once per event:
+- RunningStats: count / mean / variance (Welford) / min / max / total
+- quality trend: EWMA of scores compared with the batch mean
+- per-platform score breakdowns
+- per-stage latency and token aggregates (LLM stages via the batch's
+  BatchBudget, tools, whole posts)
+
+Both classes round-trip through to_dict()/from_dict() (plain JSON), so batch
+stats can live in shared state and survive a worker restart.
+
+Config (env):
+    BATCH_TREND_ALPHA       EWMA smoothing for the quality trend (default: 0.3)
+    BATCH_TREND_THRESHOLD   Points the EWMA must move from the mean to count as a trend (default: 1.0)
+
+Usage:
+    stats = BatchStats()
+    stats.add_post(21, platform='linkedin', seconds=84.2, tokens=41000)
+    stats.add_stage('grader', seconds=3.1, tokens=2400)
+    stats.summary()['quality_trend']
+"""
+import os
+import math
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+TREND_ALPHA = float(os.getenv('BATCH_TREND_ALPHA', '0.3'))
+TREND_THRESHOLD = float(os.getenv('BATCH_TREND_THRESHOLD', '1.0'))
+RECENT_SCORES = 10
+
+
+class RunningStats:
+    """Count, mean, variance, min, max and total of a stream, O(1) per value (Welford)"""
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max', 'total')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.total = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.total += value
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Combine with another stream's aggregates (Chan et al.)"""
+        if other.count:
+            if not self.count:
+                for field in self.__slots__:
+                    setattr(self, field, getattr(other, field))
+                return self
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.m2 += other.m2 + delta * delta * self.count * other.count / count
+            self.mean += delta * other.count / count
+            self.count = count
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self.total += other.total
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 until there are two values)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def summary(self, digits: int = 2) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': round(self.mean, digits),
+            'stdev': round(self.stdev, digits),
+            'min': self.min,
+            'max': self.max,
+            'total': round(self.total, digits),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'RunningStats':
+        stats = cls()
+        for field in cls.__slots__:
+            if data and field in data:
+                setattr(stats, field, data[field])
+        return stats
+
+
+class BatchStats:
+    """
+    Scores, trend, per-platform and per-stage aggregates for one batch.
+
+    Thread-safe: routed LLM calls record their stage from worker threads.
+    """
+
+    def __init__(self, alpha: float = TREND_ALPHA):
+        self.alpha = alpha
+        self.scores = RunningStats()
+        self.ewma: Optional[float] = None
+        self.recent: deque = deque(maxlen=RECENT_SCORES)
+        self.platforms: Dict[str, RunningStats] = {}
+        self.stages: Dict[str, Dict[str, RunningStats]] = {}
+        self._lock = threading.Lock()
+
+    def add_post(
+        self,
+        score: float,
+        platform: Optional[str] = None,
+        seconds: Optional[float] = None,
+        tokens: Optional[int] = None
+    ):
+        """Record a finished post's score (and its end-to-end latency/tokens as the 'post' stage)"""
+        with self._lock:
+            self.scores.add(score)
+            self.ewma = score if self.ewma is None else self.alpha * score + (1 - self.alpha) * self.ewma
+            self.recent.append(score)
+            if platform:
+                self.platforms.setdefault(platform, RunningStats()).add(score)
+        if seconds is not None:
+            self.add_stage('post', seconds, tokens or 0)
+
+    def add_stage(self, stage: str, seconds: float, tokens: int = 0):
+        """Record one call of a stage (LLM stage, tool:<name>, post)"""
+        with self._lock:
+            aggregates = self.stages.setdefault(stage, {'seconds': RunningStats(), 'tokens': RunningStats()})
+            aggregates['seconds'].add(seconds)
+            aggregates['tokens'].add(tokens)
+
+    def quality_trend(self) -> str:
+        """'improving' / 'declining' when recent scores (EWMA) pull away from the batch mean"""
+        if self.scores.count == 0:
+            return 'N/A'
+        if self.scores.count < 2:
+            return 'too early to tell'
+        if self.ewma > self.scores.mean + TREND_THRESHOLD:
+            return 'improving'
+        if self.ewma < self.scores.mean - TREND_THRESHOLD:
+            return 'declining'
+        return 'stable'
+
+    def recent_scores(self) -> List[float]:
+        return list(self.recent)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'scores': self.scores.summary(),
+                'ewma_score': round(self.ewma, 2) if self.ewma is not None else None,
+                'quality_trend': self.quality_trend(),
+                'recent_scores': list(self.recent),
+                'by_platform': {platform: stats.summary() for platform, stats in self.platforms.items()},
+                'stages': {
+                    stage: {
+                        'calls': aggregates['seconds'].count,
+                        'avg_seconds': round(aggregates['seconds'].mean, 2),
+                        'max_seconds': round(aggregates['seconds'].max or 0.0, 2),
+                        'total_seconds': round(aggregates['seconds'].total, 1),
+                        'avg_tokens': round(aggregates['tokens'].mean),
+                        'total_tokens': int(aggregates['tokens'].total),
+                    }
+                    for stage, aggregates in self.stages.items()
+                },
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'alpha': self.alpha,
+                'scores': self.scores.to_dict(),
+                'ewma': self.ewma,
+                'recent': list(self.recent),
+                'platforms': {platform: stats.to_dict() for platform, stats in self.platforms.items()},
+                'stages': {
+                    stage: {name: stats.to_dict() for name, stats in aggregates.items()}
+                    for stage, aggregates in self.stages.items()
+                },
+            }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'BatchStats':
+        data = data or {}
+        stats = cls(alpha=data.get('alpha', TREND_ALPHA))
+        stats.scores = RunningStats.from_dict(data.get('scores'))
+        stats.ewma = data.get('ewma')
+        stats.recent.extend(data.get('recent', []))
+        stats.platforms = {platform: RunningStats.from_dict(s) for platform, s in data.get('platforms', {}).items()}
+        stats.stages = {
+            stage: {name: RunningStats.from_dict(s) for name, s in aggregates.items()}
+            for stage, aggregates in data.get('stages', {}).items()
+        }
+        return stats
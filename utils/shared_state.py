@@ -0,0 +1,464 @@
+"""
+Shared State
+Cross-worker state for running the FastAPI app with more than one uvicorn worker.
+
+Event dedup, rate limits, circuit breakers and batch plans used to live in
+per-process globals, so a second worker would re-process Slack retries,
+double the rate limit and never see the other worker's plans. They now go
+through a small key/value store with TTLs and atomic read-modify-write:
+
+- MemoryState   - process-local dict (single worker, the default; same behaviour as before)
+- SQLiteState   - one SQLite file shared by the workers on a host (WAL + BEGIN IMMEDIATE
+                  as the cross-process lock)
+- PostgresState - a shared_state table in Postgres/Supabase for workers on several hosts
+
+Claude Agent SDK sessions are live subprocess clients and can't be shared, so
+Slack threads are sticky-routed instead (ThreadRouter): the first worker to
+handle a thread takes a lease on it, and the other workers forward that
+thread's messages to the owner's inbox in the shared store. Leases of workers
+that stop heartbeating are taken over, and their inboxes are drained by the
+survivors.
+
+Config (env):
+    WEB_CONCURRENCY             uvicorn workers (default: 1)
+    SHARED_STATE_BACKEND        memory | sqlite | postgres (default: sqlite with >1 worker, else memory)
+    SHARED_STATE_PATH           SQLite file (default: .cache/shared_state.db)
+    SHARED_STATE_DATABASE_URL   Postgres URL (default: SUPABASE_DB_URL)
+    THREAD_LEASE_SECONDS        How long a worker keeps an idle thread (default: 3600)
+    WORKER_HEARTBEAT_SECONDS    Heartbeat interval; 3 missed beats = worker gone (default: 10)
+"""
+import os
+import json
+import time
+import socket
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))
+SHARED_STATE_BACKEND = os.getenv('SHARED_STATE_BACKEND', 'sqlite' if WEB_CONCURRENCY > 1 else 'memory').lower()
+SHARED_STATE_PATH = os.getenv(
+    'SHARED_STATE_PATH', str(Path(__file__).parent.parent / '.cache' / 'shared_state.db')
+)
+THREAD_LEASE_SECONDS = float(os.getenv('THREAD_LEASE_SECONDS', '3600'))
+WORKER_HEARTBEAT_SECONDS = float(os.getenv('WORKER_HEARTBEAT_SECONDS', '10'))
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SharedState(ABC):
+    """
+    Namespaced key/value store with TTLs. Values are JSON.
+
+    Backends implement _locked(namespace) (exclusive access to a namespace
+    across workers) and the _read/_write/_remove/_scan primitives used inside it.
+    """
+
+    shared = False  # True when other processes see the same data
+    backend = 'base'
+
+    @abstractmethod
+    def _locked(self, namespace: str) -> ContextManager[None]:
+        """Context manager holding exclusive access to the namespace"""
+
+    @abstractmethod
+    def _read(self, namespace: str, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """(JSON value, expires_at) or None"""
+
+    @abstractmethod
+    def _write(self, namespace: str, key: str, value: str, expires_at: Optional[float]):
+        """Insert or replace a row"""
+
+    @abstractmethod
+    def _remove(self, namespace: str, key: str):
+        """Delete a row if present"""
+
+    @abstractmethod
+    def _scan(self, namespace: str) -> List[Tuple[str, str, Optional[float]]]:
+        """All (key, JSON value, expires_at) rows of a namespace, expired ones included"""
+
+    def purge_expired(self) -> int:
+        """Delete expired rows (reads already ignore them)"""
+        return 0
+
+    def close(self):
+        pass
+
+    # ============= PUBLIC API =============
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        with self._locked(namespace):
+            return self._get(namespace, key, default)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        with self._locked(namespace):
+            self._write(namespace, key, json.dumps(value), _expiry(ttl))
+
+    def delete(self, namespace: str, key: str):
+        with self._locked(namespace):
+            self._remove(namespace, key)
+
+    def claim(self, namespace: str, key: str, ttl: Optional[float] = None) -> bool:
+        """
+        Set key if absent (or expired).
+
+        Returns:
+            True for the first caller; False if another caller (any worker) already claimed it
+        """
+        with self._locked(namespace):
+            if self._get(namespace, key, None) is not None:
+                return False
+            self._write(namespace, key, json.dumps(time.time()), _expiry(ttl))
+            return True
+
+    def update(self, namespace: str, key: str, fn: Callable[[Any], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Atomic read-modify-write: store fn(current value or None) and return it.
+
+        fn runs while the namespace is locked, so keep it short and free of I/O.
+        """
+        with self._locked(namespace):
+            value = fn(self._get(namespace, key, None))
+            self._write(namespace, key, json.dumps(value), _expiry(ttl))
+            return value
+
+    def items(self, namespace: str) -> Dict[str, Any]:
+        """All live keys in a namespace"""
+        with self._locked(namespace):
+            now = time.time()
+            return {
+                key: json.loads(value)
+                for key, value, expires_at in self._scan(namespace)
+                if expires_at is None or expires_at > now
+            }
+
+    def take(self, namespace: str, predicate: Optional[Callable[[str, Any], bool]] = None) -> List[Tuple[str, Any]]:
+        """Atomically remove and return live (key, value) pairs matching predicate, in key order"""
+        with self._locked(namespace):
+            now = time.time()
+            taken = []
+            for key, value, expires_at in sorted(self._scan(namespace)):
+                if expires_at is not None and expires_at <= now:
+                    continue
+                value = json.loads(value)
+                if predicate is None or predicate(key, value):
+                    self._remove(namespace, key)
+                    taken.append((key, value))
+            return taken
+
+    def _get(self, namespace: str, key: str, default: Any) -> Any:
+        row = self._read(namespace, key)
+        if row is None:
+            return default
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return default
+        return json.loads(value)
+
+
+def _expiry(ttl: Optional[float]) -> Optional[float]:
+    return time.time() + ttl if ttl is not None else None
+
+
+class MemoryState(SharedState):
+    """Process-local store (single worker)"""
+
+    backend = 'memory'
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, Tuple[str, Optional[float]]]] = {}
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def _locked(self, namespace: str):
+        with self._lock:
+            yield
+
+    def _read(self, namespace, key):
+        return self._data.get(namespace, {}).get(key)
+
+    def _write(self, namespace, key, value, expires_at):
+        self._data.setdefault(namespace, {})[key] = (value, expires_at)
+
+    def _remove(self, namespace, key):
+        self._data.get(namespace, {}).pop(key, None)
+
+    def _scan(self, namespace):
+        return [(key, value, expires_at) for key, (value, expires_at) in self._data.get(namespace, {}).items()]
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [
+                (namespace, key)
+                for namespace, rows in self._data.items()
+                for key, (_, expires_at) in rows.items()
+                if expires_at is not None and expires_at <= now
+            ]
+            for namespace, key in expired:
+                del self._data[namespace][key]
+        return len(expired)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shared_state (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at DOUBLE PRECISION,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class SQLiteState(SharedState):
+    """
+    SQLite file shared by the workers on one host.
+
+    Every locked section is a BEGIN IMMEDIATE transaction, which takes
+    SQLite's write lock on the file - that's the cross-process lock.
+    """
+
+    shared = True
+    backend = 'sqlite'
+
+    def __init__(self, path: str = SHARED_STATE_PATH, timeout: float = 10.0):
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # One connection per process, serialized by our lock; autocommit so BEGIN is explicit
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def _locked(self, namespace: str):
+        with self._lock:
+            self._depth += 1
+            outer = self._depth == 1
+            try:
+                if outer:
+                    self._conn.execute('BEGIN IMMEDIATE')
+                yield
+                if outer:
+                    self._conn.execute('COMMIT')
+            except BaseException:
+                if outer:
+                    self._conn.execute('ROLLBACK')
+                raise
+            finally:
+                self._depth -= 1
+
+    def _read(self, namespace, key):
+        return self._conn.execute(
+            'SELECT value, expires_at FROM shared_state WHERE namespace = ? AND key = ?', (namespace, key)
+        ).fetchone()
+
+    def _write(self, namespace, key, value, expires_at):
+        self._conn.execute(
+            'INSERT INTO shared_state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at',
+            (namespace, key, value, expires_at)
+        )
+
+    def _remove(self, namespace, key):
+        self._conn.execute('DELETE FROM shared_state WHERE namespace = ? AND key = ?', (namespace, key))
+
+    def _scan(self, namespace):
+        return self._conn.execute(
+            'SELECT key, value, expires_at FROM shared_state WHERE namespace = ?', (namespace,)
+        ).fetchall()
+
+    def purge_expired(self) -> int:
+        with self._locked('*'):
+            cursor = self._conn.execute('DELETE FROM shared_state WHERE expires_at <= ?', (time.time(),))
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresState(SharedState):
+    """
+    shared_state table in Postgres/Supabase, for workers on several hosts.
+
+    Locked sections are transactions holding a per-namespace advisory lock.
+    Requires psycopg (v3).
+    """
+
+    shared = True
+    backend = 'postgres'
+
+    def __init__(self, url: Optional[str] = None):
+        import psycopg  # Optional dependency, only needed for this backend
+
+        url = url or os.getenv('SHARED_STATE_DATABASE_URL') or os.getenv('SUPABASE_DB_URL')
+        if not url:
+            raise ValueError("SHARED_STATE_DATABASE_URL (or SUPABASE_DB_URL) is required for the postgres backend")
+        self._conn = psycopg.connect(url, autocommit=True)
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.RLock()
+        self._transaction = None
+
+    @contextmanager
+    def _locked(self, namespace: str):
+        with self._lock:
+            if self._transaction is not None:
+                yield
+                return
+            with self._conn.transaction() as transaction:
+                self._transaction = transaction
+                try:
+                    self._conn.execute('SELECT pg_advisory_xact_lock(hashtext(%s))', (namespace,))
+                    yield
+                finally:
+                    self._transaction = None
+
+    def _read(self, namespace, key):
+        return self._conn.execute(
+            'SELECT value, expires_at FROM shared_state WHERE namespace = %s AND key = %s', (namespace, key)
+        ).fetchone()
+
+    def _write(self, namespace, key, value, expires_at):
+        self._conn.execute(
+            'INSERT INTO shared_state (namespace, key, value, expires_at) VALUES (%s, %s, %s, %s) '
+            'ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at',
+            (namespace, key, value, expires_at)
+        )
+
+    def _remove(self, namespace, key):
+        self._conn.execute('DELETE FROM shared_state WHERE namespace = %s AND key = %s', (namespace, key))
+
+    def _scan(self, namespace):
+        return self._conn.execute(
+            'SELECT key, value, expires_at FROM shared_state WHERE namespace = %s', (namespace,)
+        ).fetchall()
+
+    def purge_expired(self) -> int:
+        with self._locked('*'):
+            return self._conn.execute('DELETE FROM shared_state WHERE expires_at <= %s', (time.time(),)).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ============= STICKY THREAD ROUTING =============
+
+class ThreadRouter:
+    """
+    Routes each Slack thread to the worker holding its Claude SDK session.
+
+    owner(thread) takes or renews the thread's lease; a lease held by a worker
+    that stopped heartbeating is taken over. Messages for a thread owned by
+    another worker go to that worker's inbox (forward) and are picked up by
+    its inbox loop (take_inbox), which also adopts inboxes of dead workers.
+    """
+
+    def __init__(
+        self,
+        state: SharedState,
+        worker_id: str = WORKER_ID,
+        lease_seconds: float = THREAD_LEASE_SECONDS,
+        heartbeat_seconds: float = WORKER_HEARTBEAT_SECONDS
+    ):
+        self.state = state
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self._seq = 0
+
+    def heartbeat(self):
+        self.state.set('workers', self.worker_id, {'pid': os.getpid(), 'seen_at': time.time()},
+                       ttl=self.heartbeat_seconds * 3)
+
+    def live_workers(self) -> List[str]:
+        return sorted(self.state.items('workers'))
+
+    def owner(self, thread_key: str) -> str:
+        """Worker that should handle this thread (this worker unless another live worker holds it)"""
+        if not self.state.shared:
+            return self.worker_id
+
+        live = set(self.live_workers()) | {self.worker_id}
+        previous = []
+
+        def lease(current):
+            previous.append(current)
+            return current if current in live else self.worker_id
+
+        holder = self.state.update('thread_owners', thread_key, lease, ttl=self.lease_seconds)
+        if previous and previous[-1] not in (None, holder):
+            print(f"🧵 Thread {thread_key}: worker {holder} took over from {previous[-1]}")
+        return holder
+
+    def forward(self, owner: str, payload: Dict[str, Any]):
+        """Queue a message for the worker that owns its thread"""
+        self._seq += 1
+        # Keys sort by enqueue time so the owner processes a thread's messages in order
+        key = f"{time.time():017.6f}:{self.worker_id}:{self._seq:06d}"
+        self.state.set('inbox', key, {'owner': owner, 'payload': payload}, ttl=self.lease_seconds)
+
+    def take_inbox(self) -> List[Dict[str, Any]]:
+        """Messages forwarded to this worker, plus any left for workers that are gone"""
+        live = set(self.live_workers()) | {self.worker_id}
+        taken = self.state.take(
+            'inbox', lambda key, item: item['owner'] == self.worker_id or item['owner'] not in live
+        )
+        return [item['payload'] for _, item in taken]
+
+    def release(self):
+        """Shutdown: stop heartbeating and give up this worker's threads"""
+        self.state.delete('workers', self.worker_id)
+        self.state.take('thread_owners', lambda key, owner: owner == self.worker_id)
+
+
+# ============= SINGLETONS =============
+
+_state: Optional[SharedState] = None
+_router: Optional[ThreadRouter] = None
+_singleton_lock = threading.Lock()
+
+
+def create_shared_state(backend: str = SHARED_STATE_BACKEND) -> SharedState:
+    if backend == 'sqlite':
+        return SQLiteState()
+    if backend == 'postgres':
+        return PostgresState()
+    if backend != 'memory':
+        logger.warning(f"Unknown SHARED_STATE_BACKEND '{backend}', using memory")
+    return MemoryState()
+
+
+def get_shared_state() -> SharedState:
+    """The process-wide shared state store (backend chosen by SHARED_STATE_BACKEND)"""
+    global _state
+    if _state is None:
+        with _singleton_lock:
+            if _state is None:
+                _state = create_shared_state()
+                print(f"🗄️  Shared state: {_state.backend} (worker {WORKER_ID}, {WEB_CONCURRENCY} worker(s))")
+    return _state
+
+
+def set_shared_state(state: Optional[SharedState]):
+    """Swap the store (tests, or an app wiring its own backend); resets the router"""
+    global _state, _router
+    _state = state
+    _router = None
+
+
+def get_thread_router() -> ThreadRouter:
+    global _router
+    if _router is None:
+        _router = ThreadRouter(get_shared_state())
+    return _router
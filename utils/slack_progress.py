@@ -0,0 +1,279 @@
+"""
+Slack Progress Publisher
+Non-blocking Slack messages for batch progress and bot replies.
+
+Batch execution used to call the synchronous WebClient.chat_postMessage from
+async code, so every progress line blocked the event loop on Slack's API and
+large batches tripped Slack's rate limits. Callers now enqueue and return
+immediately; a background task drains the queue with AsyncWebClient:
+
+- post(channel, text, thread_ts)   - a normal message (replies, errors, final summaries)
+- status(key, channel, thread_ts, text) - a progress line for one batch. Lines
+  that arrive within SLACK_PROGRESS_COALESCE_SECONDS of each other are merged
+  into a single chat_update of that batch's status message, so a batch keeps
+  one message that is edited rather than 100+ new ones
+- ratelimited responses are retried after Slack's Retry-After delay
+
+Messages are sent in the order they were enqueued. Generation never waits on
+Slack; flush() is available where ordering with later output matters (tests,
+shutdown). Callers holding their own client (the app's WebClient stored on a
+batch plan) pass it as client=; a synchronous slack_sdk WebClient is swapped
+for an AsyncWebClient with the same token, anything else is called as-is
+(sync methods in a worker thread).
+
+Config (env):
+    SLACK_PROGRESS_COALESCE_SECONDS  Burst window merged into one status edit (default: 1.0)
+    SLACK_STATUS_MAX_LINES           Progress lines kept in a status message (default: 50)
+    SLACK_SEND_MAX_RETRIES           Retries per message on ratelimited errors (default: 5)
+"""
+import os
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+COALESCE_SECONDS = float(os.getenv('SLACK_PROGRESS_COALESCE_SECONDS', '1.0'))
+STATUS_MAX_LINES = int(os.getenv('SLACK_STATUS_MAX_LINES', '50'))
+MAX_RETRIES = int(os.getenv('SLACK_SEND_MAX_RETRIES', '5'))
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def _slack_error(exc: Exception) -> Optional[str]:
+    """Slack API error code ('ratelimited', 'channel_not_found', ...) from a SlackApiError"""
+    response = getattr(exc, 'response', None)
+    if response is None:
+        return None
+    try:
+        return response.get('error')
+    except AttributeError:
+        return None
+
+
+def _retry_after(exc: Exception) -> float:
+    headers = getattr(getattr(exc, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After', headers.get('retry-after', DEFAULT_RETRY_AFTER)))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+def _default_client():
+    from slack_sdk.web.async_client import AsyncWebClient
+    return AsyncWebClient(token=os.getenv('SLACK_BOT_TOKEN'))
+
+
+class _StatusMessage:
+    __slots__ = ('client', 'channel', 'thread_ts', 'ts', 'lines', 'header')
+
+    def __init__(self, client: Any, channel: str, thread_ts: Optional[str], header: str):
+        self.client = client
+        self.channel = channel
+        self.thread_ts = thread_ts
+        self.ts: Optional[str] = None
+        self.lines: List[str] = []
+        self.header = header
+
+    def text(self) -> str:
+        hidden = max(0, len(self.lines) - STATUS_MAX_LINES)
+        lines = self.lines[hidden:]
+        if hidden:
+            lines = [f"_… {hidden} earlier updates_"] + lines
+        return "\n".join([self.header] + lines if self.header else lines)
+
+
+class SlackProgressPublisher:
+    """
+    Queue of Slack sends drained by one background task.
+
+    Usage:
+        publisher = get_progress_publisher()
+        publisher.post(channel, "On it...", thread_ts=ts)
+        publisher.status(plan_id, channel, ts, "✅ Post 3/20 complete")
+        await publisher.flush()
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] = _default_client,
+        coalesce_seconds: float = COALESCE_SECONDS,
+        max_retries: int = MAX_RETRIES
+    ):
+        self.client_factory = client_factory
+        self.coalesce_seconds = coalesce_seconds
+        self.max_retries = max_retries
+        self.stats = {'posted': 0, 'updated': 0, 'coalesced': 0, 'ratelimited': 0, 'failed': 0}
+        self._client = None
+        self._async_clients: Dict[str, Any] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._statuses: Dict[str, _StatusMessage] = {}
+        self._lock = threading.Lock()
+
+    # ---------- enqueue (never blocks) ----------
+
+    def post(self, channel: str, text: str, thread_ts: Optional[str] = None, client: Any = None, **kwargs):
+        """Queue a regular message"""
+        self._enqueue(('post', client, {'channel': channel, 'text': text, 'thread_ts': thread_ts, 'mrkdwn': True, **kwargs}))
+
+    def status(self, key: str, channel: str, thread_ts: Optional[str], text: str, header: str = "", client: Any = None):
+        """Queue a progress line for the status message identified by key"""
+        self._enqueue(('status', client, {'key': key, 'channel': channel, 'thread_ts': thread_ts, 'text': text, 'header': header}))
+
+    def _enqueue(self, item):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            other_loop_running = self._loop is not None and self._loop is not loop and self._loop.is_running()
+            if loop is not None and not other_loop_running:
+                self._ensure_worker(loop)
+                self._queue.put_nowait(item)
+                return
+            target = self._loop if self._loop is not None and self._loop.is_running() else None
+
+        if target is not None:
+            # Called from a worker thread while the publisher runs on the main loop
+            target.call_soon_threadsafe(self._queue.put_nowait, item)
+        else:
+            # No event loop anywhere (scripts): nothing to block, send inline
+            asyncio.run(self._send_items([item]))
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop):
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+            self._client = None
+            self._async_clients = {}
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+
+    # ---------- drain ----------
+
+    async def _drain(self):
+        while True:
+            item = await self._queue.get()
+            batch = [item]
+            if item[0] == 'status' and self.coalesce_seconds > 0:
+                # Let a burst of progress lines accumulate into one edit
+                await asyncio.sleep(self.coalesce_seconds)
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._send_items(batch)
+            except Exception as e:
+                logger.warning("slack_progress_send_failed", extra={'error': str(e)})
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _send_items(self, items):
+        """Send in order; consecutive status lines for a key collapse into one edit"""
+        pending_status: List[str] = []
+        for kind, client, payload in items:
+            if kind == 'status':
+                message = self._statuses.get(payload['key'])
+                if message is None:
+                    message = self._statuses[payload['key']] = _StatusMessage(
+                        client, payload['channel'], payload['thread_ts'], payload['header']
+                    )
+                message.lines.append(payload['text'])
+                if payload['key'] in pending_status:
+                    self.stats['coalesced'] += 1
+                else:
+                    pending_status.append(payload['key'])
+            elif kind == 'forget':
+                await self._flush_statuses(pending_status)
+                pending_status = []
+                self._statuses.pop(payload['key'], None)
+            else:
+                await self._flush_statuses(pending_status)
+                pending_status = []
+                await self._call(client, 'chat_postMessage', **payload)
+                self.stats['posted'] += 1
+        await self._flush_statuses(pending_status)
+
+    async def _flush_statuses(self, keys: List[str]):
+        for key in keys:
+            message = self._statuses[key]
+            if message.ts is None:
+                response = await self._call(
+                    message.client, 'chat_postMessage', channel=message.channel, thread_ts=message.thread_ts,
+                    text=message.text(), mrkdwn=True
+                )
+                message.ts = response.get('ts') if response is not None else None
+                self.stats['posted'] += 1
+            else:
+                await self._call(message.client, 'chat_update', channel=message.channel, ts=message.ts, text=message.text())
+                self.stats['updated'] += 1
+
+    def _resolve_client(self, client: Any) -> Any:
+        if client is None:
+            if self._client is None:
+                self._client = self.client_factory()
+            return self._client
+        token = getattr(client, 'token', None)
+        if isinstance(token, str) and type(client).__name__ == 'WebClient':
+            if token not in self._async_clients:
+                from slack_sdk.web.async_client import AsyncWebClient
+                self._async_clients[token] = AsyncWebClient(token=token)
+            return self._async_clients[token]
+        return client
+
+    async def _call(self, client: Any, method: str, **kwargs):
+        fn = getattr(self._resolve_client(client), method)
+        for attempt in range(self.max_retries + 1):
+            try:
+                if asyncio.iscoroutinefunction(fn):
+                    return await fn(**kwargs)
+                # Sync WebClient fallback: keep it off the event loop
+                return await asyncio.to_thread(fn, **kwargs)
+            except Exception as e:
+                error = _slack_error(e)
+                if attempt < self.max_retries and error == 'ratelimited':
+                    self.stats['ratelimited'] += 1
+                    delay = _retry_after(e)
+                    print(f"⏳ Slack rate limited on {method}, retrying in {delay:.0f}s", flush=True)
+                    await asyncio.sleep(delay)
+                    continue
+                self.stats['failed'] += 1
+                print(f"⚠️ Slack {method} failed: {error or e}", flush=True)
+                return None
+
+    # ---------- lifecycle ----------
+
+    async def flush(self, timeout: float = 30.0) -> bool:
+        """Wait until everything queued so far has been sent"""
+        if self._queue is None:
+            return True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def forget(self, key: str):
+        """Drop a finished batch's status message state (after its queued lines are sent)"""
+        self._enqueue(('forget', None, {'key': key}))
+
+    async def close(self, timeout: float = 10.0):
+        await self.flush(timeout)
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+
+_publisher: Optional[SlackProgressPublisher] = None
+
+
+def get_progress_publisher() -> SlackProgressPublisher:
+    """Process-wide publisher (AsyncWebClient with SLACK_BOT_TOKEN)"""
+    global _publisher
+    if _publisher is None:
+        _publisher = SlackProgressPublisher()
+    return _publisher
@@ -0,0 +1,234 @@
+"""
+Tool-Loop Compaction
+Keeps the direct API agents' tool-calling history under a token ceiling.
+
+Every tool result (full drafts, search results, validation JSON) is appended
+to `messages`, so by iteration 10-15 each call resends every earlier draft.
+Once the estimated history size passes TOOL_LOOP_TOKEN_CEILING, the
+compactor rewrites superseded content into short references:
+
+1. Drafts (create_*_draft, inject_proof_points, apply_fixes, ...) - every
+   draft except the newest
+2. Validation results (quality_check, external_validation) - once a newer
+   draft or newer validation exists
+3. Still over the ceiling: any other bulky result outside the latest turn
+4. Long string arguments (e.g. post=...) in earlier assistant tool calls
+
+The newest draft, the latest turn and all tool_use/tool_result ids are kept
+intact, so the agent never loses its current state.
+
+Compaction rewrites earlier turns, which invalidates the prompt cache from the
+first rewritten block. It therefore runs only when the ceiling is crossed and
+compacts everything eligible in one pass, so the next iterations cache again.
+
+Config (env):
+    TOOL_LOOP_TOKEN_CEILING   Estimated message-history tokens before compacting (default: 16000)
+"""
+import os
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_TOKEN_CEILING = int(os.getenv('TOOL_LOOP_TOKEN_CEILING', '16000'))
+
+DRAFT_TOOLS = {
+    'create_human_draft', 'create_caption_draft', 'create_human_script',
+    'inject_proof_points', 'apply_fixes', 'condense_to_limit',
+}
+VALIDATION_TOOLS = {'quality_check', 'external_validation'}
+
+# Results/arguments shorter than this are never worth compacting
+BULKY_MIN_CHARS = 1200
+PREVIEW_CHARS = 160
+CHARS_PER_TOKEN = 4
+
+
+def _field(block: Any, name: str, default: Any = None) -> Any:
+    """Read a content block field from a dict or an SDK object"""
+    if isinstance(block, dict):
+        return block.get(name, default)
+    return getattr(block, name, default)
+
+
+def _block_chars(block: Any) -> int:
+    if isinstance(block, str):
+        return len(block)
+    block_type = _field(block, 'type')
+    if block_type == 'text':
+        return len(_field(block, 'text', '') or '')
+    if block_type == 'tool_use':
+        return len(json.dumps(_field(block, 'input', {}), default=str))
+    if block_type == 'tool_result':
+        content = _field(block, 'content', '')
+        return len(content) if isinstance(content, str) else len(json.dumps(content, default=str))
+    return len(str(block))
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Rough token estimate for a message history (~4 chars per token)"""
+    chars = 0
+    for message in messages:
+        content = message.get('content')
+        if isinstance(content, str):
+            chars += len(content)
+        else:
+            chars += sum(_block_chars(block) for block in content or [])
+    return chars // CHARS_PER_TOKEN
+
+
+def _result_text(block: Dict[str, Any]) -> str:
+    content = block.get('content', '')
+    return content if isinstance(content, str) else json.dumps(content, default=str)
+
+
+def _summary(tool_name: str, text: str, reason: str) -> str:
+    preview = ' '.join(text.split())[:PREVIEW_CHARS]
+    return f"[Compacted {tool_name} result ({len(text):,} chars) - {reason}. Starts: \"{preview}...\"]"
+
+
+def _plain_block(block: Any) -> Any:
+    """SDK content block → plain dict so it can be rewritten"""
+    if isinstance(block, dict):
+        return dict(block)
+    block_type = _field(block, 'type')
+    if block_type == 'text':
+        return {'type': 'text', 'text': _field(block, 'text', '')}
+    if block_type == 'tool_use':
+        return {'type': 'tool_use', 'id': _field(block, 'id'), 'name': _field(block, 'name'),
+                'input': dict(_field(block, 'input', {}) or {})}
+    return block
+
+
+class ToolLoopCompactor:
+    """
+    Compacts a tool-loop message history once it passes a token ceiling.
+
+    Usage:
+        compactor = ToolLoopCompactor()
+        messages = compactor.compact(messages)   # before each API call
+        compactor.stats                          # compactions, tokens saved
+    """
+
+    def __init__(self, token_ceiling: int = DEFAULT_TOKEN_CEILING):
+        self.token_ceiling = token_ceiling
+        self.stats = {'compactions': 0, 'results_compacted': 0, 'tokens_saved': 0}
+        self.last_report: Optional[Dict[str, int]] = None
+
+    def compact(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return messages unchanged if under the ceiling, else a compacted copy"""
+        before = estimate_tokens(messages)
+        if before <= self.token_ceiling:
+            return messages
+
+        compacted = [dict(m) for m in messages]
+        tool_names = self._tool_names(compacted)
+        results = self._tool_results(compacted, tool_names)
+        last_user = max((i for i, m in enumerate(compacted) if m.get('role') == 'user'), default=-1)
+
+        bulky = {
+            (m, b) for m, b, _ in results
+            if len(_result_text(compacted[m]['content'][b])) >= BULKY_MIN_CHARS
+        }
+
+        replace: Dict[Tuple[int, int], str] = {}
+        latest_draft = max((r for r in results if r[2] in DRAFT_TOOLS), default=None)
+        for position in results:
+            msg_idx, block_idx, name = position
+            if (msg_idx, block_idx) not in bulky:
+                continue
+            later = [r for r in results if r > position]
+            if name in DRAFT_TOOLS and position != latest_draft:
+                replace[(msg_idx, block_idx)] = 'superseded by a later draft'
+            elif name in VALIDATION_TOOLS and any(r[2] in DRAFT_TOOLS | VALIDATION_TOOLS for r in later):
+                replace[(msg_idx, block_idx)] = 'superseded by a later draft/validation'
+
+        changed = self._apply(compacted, replace, tool_names)
+
+        if estimate_tokens(compacted) > self.token_ceiling:
+            extra = {
+                (m, b): 'older tool output'
+                for m, b, name in results
+                if (m, b) in bulky and m != last_user
+                and (m, b) not in replace and (m, b, name) != latest_draft
+            }
+            changed += self._apply(compacted, extra, tool_names)
+
+        trimmed = self._trim_tool_inputs(compacted)
+        if not changed and not trimmed:
+            # Nothing left to compact - keep the original so the cached prefix stays valid
+            return messages
+
+        after = estimate_tokens(compacted)
+        self.stats['compactions'] += 1
+        self.stats['results_compacted'] += changed
+        self.stats['tokens_saved'] += max(0, before - after)
+        self.last_report = {'tokens_before': before, 'tokens_after': after, 'results_compacted': changed}
+        return compacted
+
+    @staticmethod
+    def _tool_names(messages: List[Dict[str, Any]]) -> Dict[str, str]:
+        """tool_use_id → tool name from assistant turns"""
+        names = {}
+        for message in messages:
+            if message.get('role') != 'assistant' or isinstance(message.get('content'), str):
+                continue
+            for block in message.get('content') or []:
+                if _field(block, 'type') == 'tool_use':
+                    names[_field(block, 'id')] = _field(block, 'name')
+        return names
+
+    @staticmethod
+    def _tool_results(messages: List[Dict[str, Any]], tool_names: Dict[str, str]) -> List[Tuple[int, int, str]]:
+        """(message index, block index, tool name) for every tool_result, oldest first"""
+        results = []
+        for msg_idx, message in enumerate(messages):
+            content = message.get('content')
+            if message.get('role') != 'user' or not isinstance(content, list):
+                continue
+            for block_idx, block in enumerate(content):
+                if isinstance(block, dict) and block.get('type') == 'tool_result':
+                    results.append((msg_idx, block_idx, tool_names.get(block.get('tool_use_id'), 'tool')))
+        return results
+
+    @staticmethod
+    def _apply(messages: List[Dict[str, Any]], replace: Dict[Tuple[int, int], str], tool_names: Dict[str, str]) -> int:
+        """Replace the given tool results with summaries; returns how many changed"""
+        changed = 0
+        for (msg_idx, block_idx), reason in replace.items():
+            content = list(messages[msg_idx]['content'])
+            block = content[block_idx]
+            if _result_text(block).startswith('[Compacted '):
+                continue
+            name = tool_names.get(block.get('tool_use_id'), 'tool')
+            content[block_idx] = {**block, 'content': _summary(name, _result_text(block), reason)}
+            messages[msg_idx] = {**messages[msg_idx], 'content': content}
+            changed += 1
+        return changed
+
+    @staticmethod
+    def _trim_tool_inputs(messages: List[Dict[str, Any]]) -> int:
+        """Shorten long string arguments in every assistant turn but the last; returns turns changed"""
+        trimmed = 0
+        assistant_turns = [i for i, m in enumerate(messages) if m.get('role') == 'assistant']
+        for msg_idx in assistant_turns[:-1]:
+            content = messages[msg_idx].get('content')
+            if isinstance(content, str):
+                continue
+            rewritten = []
+            changed = False
+            for block in content or []:
+                if _field(block, 'type') == 'tool_use' and any(
+                    isinstance(v, str) and len(v) >= BULKY_MIN_CHARS
+                    for v in (_field(block, 'input', {}) or {}).values()
+                ):
+                    block = _plain_block(block)
+                    block['input'] = {
+                        key: (f"[Compacted argument ({len(value):,} chars)]"
+                              if isinstance(value, str) and len(value) >= BULKY_MIN_CHARS else value)
+                        for key, value in block['input'].items()
+                    }
+                    changed = True
+                rewritten.append(block)
+            if changed:
+                messages[msg_idx] = {**messages[msg_idx], 'content': rewritten}
+                trimmed += 1
+        return trimmed
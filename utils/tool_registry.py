@@ -0,0 +1,244 @@
+"""
+Tool Registry
+Declarative tool definitions and dispatch for the direct API agents.
+
+Each platform's tools are registered once (in its agent module) with:
+- schema       - name / description / input_schema sent to the API
+- handler      - "module:function" of the native implementation, imported on
+                 first call so loading an agent doesn't import its tools
+- args         - tool_input keys passed through, with their defaults
+- timeout      - seconds before the call is abandoned (capped by the post's
+                 remaining deadline, see utils/deadline.py)
+- concurrency  - class that bounds how many calls of that kind run at once
+                 ('search', 'llm', 'validation')
+- cacheable    - identical calls within one agent run reuse the first result
+- thinking_only - only offered in thinking mode (validation/fix tools)
+
+The five agents share one dispatch path: tool_use blocks from a turn run
+concurrently (bounded per concurrency class), results come back in request
+order, cacheable calls are served from the run's cache, and every call is
+timed per platform/tool (get_tool_stats()).
+
+Config (env):
+    TOOL_PARALLEL_DISPATCH   Run a turn's tool calls concurrently (default: true)
+"""
+import os
+import json
+import time
+import asyncio
+import logging
+import importlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.deadline import DeadlineExceeded, timeout_for
+from utils.http_clients import track_connections
+from utils.model_routing import current_budget
+
+logger = logging.getLogger(__name__)
+
+PARALLEL_DISPATCH = os.getenv('TOOL_PARALLEL_DISPATCH', 'true').lower() == 'true'
+
+# Max concurrent calls per class within one turn
+CONCURRENCY_LIMITS = {
+    'search': 4,      # Supabase / web lookups
+    'llm': 2,         # Claude generation calls
+    'validation': 1,  # Editor-in-Chief + GPTZero (rate limited upstream)
+}
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """One tool offered to a direct API agent"""
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    handler: str
+    args: Dict[str, Any] = field(default_factory=dict)
+    timeout: float = 30.0
+    concurrency: str = 'llm'
+    cacheable: bool = False
+    thinking_only: bool = False
+
+    def schema(self) -> Dict[str, Any]:
+        return {"name": self.name, "description": self.description, "input_schema": self.input_schema}
+
+    def kwargs(self, tool_input: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: tool_input.get(key, default) for key, default in self.args.items()}
+
+
+def _cache_key(name: str, tool_input: Dict[str, Any]) -> str:
+    return f"{name}:{json.dumps(tool_input, sort_keys=True, default=str)}"
+
+
+class ToolRegistry:
+    """
+    Tool specs per platform, schema lists cached per mode, and timed execution.
+
+    Usage:
+        registry.register('linkedin', [ToolSpec(...), ...])
+        tools = registry.schemas('linkedin', thinking_mode=False)
+        results = await registry.dispatch('linkedin', tool_use_blocks, run_cache)
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, Dict[str, ToolSpec]] = {}
+        self._schemas: Dict[Tuple[str, bool], List[Dict[str, Any]]] = {}
+        self._handlers: Dict[str, Callable] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, platform: str, specs: List[ToolSpec]):
+        with self._lock:
+            self._specs[platform] = {spec.name: spec for spec in specs}
+            for key in [k for k in self._schemas if k[0] == platform]:
+                del self._schemas[key]
+
+    def get(self, platform: str, name: str) -> Optional[ToolSpec]:
+        return self._specs.get(platform, {}).get(name)
+
+    def schemas(self, platform: str, thinking_mode: bool = False) -> List[Dict[str, Any]]:
+        """Tool schemas for the API, built once per platform/mode (stable for prompt caching)"""
+        key = (platform, thinking_mode)
+        cached = self._schemas.get(key)
+        if cached is None:
+            specs = self._specs.get(platform, {}).values()
+            cached = [spec.schema() for spec in specs if thinking_mode or not spec.thinking_only]
+            with self._lock:
+                self._schemas[key] = cached
+        return cached
+
+    def _handler(self, spec: ToolSpec) -> Callable:
+        handler = self._handlers.get(spec.handler)
+        if handler is None:
+            module_name, func_name = spec.handler.split(':')
+            handler = getattr(importlib.import_module(module_name), func_name)
+            self._handlers[spec.handler] = handler
+        return handler
+
+    # ---------- execution ----------
+
+    async def execute(
+        self,
+        platform: str,
+        name: str,
+        tool_input: Dict[str, Any],
+        cache: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Run one tool; errors come back as JSON strings for the model, never raised"""
+        spec = self.get(platform, name)
+        if spec is None:
+            return json.dumps({"error": f"Unknown tool: {name}"})
+
+        key = _cache_key(name, tool_input) if spec.cacheable and cache is not None else None
+        if key is not None and key in cache:
+            self._record(platform, name, 0.0, cache_hit=True)
+            return cache[key]
+
+        started = time.monotonic()
+        outcome = 'ok'
+        timeout = spec.timeout
+        try:
+            # The tool's own timeout, capped by the post's remaining deadline
+            timeout = timeout_for(spec.timeout)
+            with track_connections(f"tool:{name}"):
+                result = await asyncio.wait_for(self._handler(spec)(**spec.kwargs(tool_input)), timeout=timeout)
+            # Native tools return plain text/JSON strings (not wrapped in {"content": [...]} )
+            if not result:
+                outcome = 'error'
+                return json.dumps({"error": "Tool returned empty result"})
+            if key is not None:
+                cache[key] = result
+            return result
+        except DeadlineExceeded:
+            outcome = 'timeout'
+            logger.error(f"Tool skipped: {name} - post deadline exceeded")
+            return json.dumps({"error": f"Tool skipped: {name} - no time left for this post"})
+        except asyncio.TimeoutError:
+            outcome = 'timeout'
+            logger.error(f"Tool timeout: {name} exceeded {timeout:.0f}s")
+            return json.dumps({"error": f"Tool timeout: {name} exceeded {timeout:.0f}s"})
+        except Exception as e:
+            outcome = 'error'
+            logger.error(f"Tool error: {name} - {e}")
+            import traceback
+            traceback.print_exc()
+            return json.dumps({"error": f"Tool error: {str(e)}"})
+        finally:
+            elapsed = time.monotonic() - started
+            self._record(platform, name, elapsed, outcome=outcome)
+            budget = current_budget()
+            if budget:
+                budget.record_stage(f"tool:{name}", elapsed)
+
+    async def dispatch(
+        self,
+        platform: str,
+        tool_uses: List[Any],
+        cache: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a turn's tool_use blocks and return tool_result blocks in the same order.
+
+        Calls run concurrently, at most CONCURRENCY_LIMITS[class] of a class at once
+        (sequentially when TOOL_PARALLEL_DISPATCH is off).
+        """
+        semaphores = {cls: asyncio.Semaphore(limit) for cls, limit in CONCURRENCY_LIMITS.items()}
+        serial = asyncio.Semaphore(1)
+
+        async def run(block) -> Dict[str, Any]:
+            spec = self.get(platform, block.name)
+            gate = serial if not PARALLEL_DISPATCH else semaphores.get(spec.concurrency if spec else 'llm', serial)
+            async with gate:
+                print(f"      🔧 Executing: {block.name}")
+                started = time.monotonic()
+                result = await self.execute(platform, block.name, block.input, cache)
+                print(f"      ✅ {block.name} completed ({len(str(result))} chars, {time.monotonic() - started:.1f}s)")
+            return {"type": "tool_result", "tool_use_id": block.id, "content": result}
+
+        if len(tool_uses) > 1 and PARALLEL_DISPATCH:
+            print(f"      ⚡ Dispatching {len(tool_uses)} tool calls concurrently")
+        return list(await asyncio.gather(*(run(block) for block in tool_uses)))
+
+    # ---------- timing ----------
+
+    def _record(self, platform: str, name: str, seconds: float, outcome: str = 'ok', cache_hit: bool = False):
+        with self._lock:
+            stats = self._stats.setdefault(f"{platform}.{name}", {
+                'calls': 0, 'cache_hits': 0, 'errors': 0, 'timeouts': 0, 'total_seconds': 0.0, 'max_seconds': 0.0
+            })
+            if cache_hit:
+                stats['cache_hits'] += 1
+                return
+            stats['calls'] += 1
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            if outcome == 'error':
+                stats['errors'] += 1
+            elif outcome == 'timeout':
+                stats['timeouts'] += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                key: {**s, 'avg_seconds': round(s['total_seconds'] / s['calls'], 2) if s['calls'] else 0.0}
+                for key, s in self._stats.items()
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+
+registry = ToolRegistry()
+
+
+def register_tools(platform: str, specs: List[ToolSpec]):
+    """Register a platform's tools on the shared registry"""
+    registry.register(platform, specs)
+
+
+def get_tool_stats() -> Dict[str, Dict[str, float]]:
+    """Per platform/tool call counts, cache hits, failures and latency"""
+    return registry.stats()
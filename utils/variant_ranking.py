@@ -0,0 +1,85 @@
+"""
+Local Variant Ranking
+Scores candidate posts with deterministic validator checks (no LLM) so a
+multi-variant generation call can keep only the best draft.
+
+Score = 100 minus a severity-weighted penalty per validator issue
+(TwitterValidator checks + ForbiddenPatterns). Ties go to the earlier variant.
+
+Also reports what the extra variants bought: score variance across variants
+and the winner's uplift over the average variant (the expected score of a
+single-shot draft), per 100 extra output tokens.
+"""
+from typing import Any, Dict, List, Optional
+
+from validators.twitter_validator import TwitterValidator
+
+SEVERITY_PENALTY = {'critical': 40, 'high': 25, 'medium': 10, 'low': 3}
+
+# Thread-level checks that every single tweet trips equally
+IGNORED_ISSUE_TYPES = {'single_tweet'}
+
+
+def score_variant(text: str, validator: Optional[TwitterValidator] = None) -> Dict[str, Any]:
+    """
+    Score one variant locally.
+
+    Returns:
+        {"text", "score" (0-100), "issues": [issue type, ...]}
+    """
+    validator = validator or TwitterValidator()
+    issues = [
+        i for i in validator.validate(text)
+        if (i.get('type') or i.get('code')) not in IGNORED_ISSUE_TYPES
+    ]
+    penalty = sum(SEVERITY_PENALTY.get(i.get('severity'), 5) for i in issues)
+    return {
+        'text': text,
+        'score': max(0, 100 - penalty),
+        'issues': [i.get('type') or i.get('code') for i in issues]
+    }
+
+
+def rank_variants(variants: List[str]) -> List[Dict[str, Any]]:
+    """Score and sort variants best-first (stable for ties)"""
+    validator = TwitterValidator()
+    scored = [score_variant(v, validator) for v in variants if v and v.strip()]
+    return sorted(scored, key=lambda v: v['score'], reverse=True)
+
+
+def variant_stats(ranked: List[Dict[str, Any]], output_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Variance and quality uplift for a ranked variant set.
+
+    Args:
+        ranked: Output of rank_variants
+        output_tokens: Output tokens spent generating all variants
+
+    Returns:
+        Stats dict (uplift = winner score - mean score)
+    """
+    scores = [v['score'] for v in ranked]
+    if not scores:
+        return {'variants': 0}
+
+    mean = sum(scores) / len(scores)
+    variance = sum((s - mean) ** 2 for s in scores) / len(scores)
+    uplift = scores[0] - mean
+
+    stats = {
+        'variants': len(scores),
+        'scores': scores,
+        'mean_score': round(mean, 1),
+        'variance': round(variance, 1),
+        'winner_score': scores[0],
+        'uplift': round(uplift, 1),
+    }
+
+    if output_tokens:
+        # A single-variant call costs roughly 1/N of the output tokens
+        extra_tokens = output_tokens - output_tokens / len(scores)
+        stats['output_tokens'] = output_tokens
+        stats['extra_tokens'] = int(extra_tokens)
+        stats['uplift_per_100_extra_tokens'] = round(100 * uplift / extra_tokens, 2) if extra_tokens else 0.0
+
+    return stats
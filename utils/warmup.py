@@ -0,0 +1,145 @@
+"""
+Cold Start Helpers
+Deferred-import warm-up and import-time measurement for main_slack.
+
+main_slack imports only what /healthz needs; the Slack handler, agents,
+native tools, analytics and sync modules are imported by the routes that use
+them. That keeps a Replit deploy / autoscale cold start answering /healthz
+quickly, but the first real request then pays for the imports. warm_up()
+moves that cost to a moment of our choosing:
+
+- POST /warmup (or WARMUP_ON_STARTUP=true, in the background after startup)
+- imports WARMUP_MODULES, builds each platform's stacked prompt and tool
+  schemas, and reports seconds per step
+
+parse_importtime() turns `python -X importtime` output into per-module
+timings; scripts/benchmark_startup.py uses it to report (and gate, in CI)
+how long `import main_slack` takes.
+
+Config (env):
+    WARMUP_ON_STARTUP   Warm up in the background after startup (default: false)
+"""
+import os
+import re
+import time
+import logging
+import importlib
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ON_STARTUP = os.getenv('WARMUP_ON_STARTUP', 'false').lower() == 'true'
+
+PLATFORMS = ['linkedin', 'twitter', 'email', 'youtube', 'instagram']
+
+# Imported lazily by routes/tools; warm_up() loads them ahead of traffic
+WARMUP_MODULES = [
+    'slack_bot.handler',
+    'slack_bot.claude_agent_handler',
+    'agents.batch_orchestrator',
+    'agents.linkedin_direct_api_agent',
+    'agents.twitter_direct_api_agent',
+    'agents.email_direct_api_agent',
+    'agents.youtube_direct_api_agent',
+    'agents.instagram_direct_api_agent',
+    'tools.linkedin_native_tools',
+    'tools.twitter_native_tools',
+    'tools.email_native_tools',
+    'tools.youtube_native_tools',
+    'tools.instagram_native_tools',
+    'slack_bot.analytics_handler',
+    'slack_bot.briefing_handler',
+]
+
+
+def warm_up(modules: Optional[List[str]] = None, prompts: bool = True) -> Dict[str, Any]:
+    """
+    Import deferred modules and build cached prompts ahead of the first request.
+
+    Args:
+        modules: Module names to import (default: WARMUP_MODULES)
+        prompts: Also build each platform's stacked prompt and tool schemas
+
+    Returns:
+        {'seconds': total, 'modules': {name: seconds}, 'prompts': {platform: seconds}, 'errors': {name: error}}
+    """
+    started = time.perf_counter()
+    report = {'modules': {}, 'prompts': {}, 'errors': {}}
+
+    for name in modules if modules is not None else WARMUP_MODULES:
+        step = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            report['errors'][name] = f"{type(e).__name__}: {e}"
+            continue
+        report['modules'][name] = round(time.perf_counter() - step, 3)
+
+    if prompts:
+        from integrations.prompt_loader import stack_prompts
+        from utils.tool_registry import registry
+        for platform in PLATFORMS:
+            step = time.perf_counter()
+            try:
+                stack_prompts(platform)
+                registry.schemas(platform, thinking_mode=False)
+                registry.schemas(platform, thinking_mode=True)
+            except Exception as e:
+                report['errors'][f"prompts:{platform}"] = f"{type(e).__name__}: {e}"
+                continue
+            report['prompts'][platform] = round(time.perf_counter() - step, 3)
+
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    print(f"🔥 Warm-up: {len(report['modules'])} modules, {len(report['prompts'])} prompts "
+          f"in {report['seconds']:.2f}s ({len(report['errors'])} errors)", flush=True)
+    if report['errors']:
+        logger.warning("warmup_errors", extra={'errors': report['errors']})
+    return report
+
+
+# ============= IMPORT TIME =============
+
+# "import time:       123 |       4567 |     package.module"
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse `python -X importtime` stderr into per-module timings.
+
+    Returns:
+        One entry per import in output order:
+        {'module', 'self_ms', 'cumulative_ms', 'depth'} (depth 0 = imported directly)
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        entries.append({
+            'module': module,
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+            # importtime indents nested imports by two spaces per level
+            'depth': max(0, (len(indent) - 1) // 2),
+        })
+    return entries
+
+
+def importtime_summary(entries: List[Dict[str, Any]], top: int = 15) -> Dict[str, Any]:
+    """Total import time, slowest modules by self time, and top-level packages by cumulative time"""
+    packages: Dict[str, float] = {}
+    for entry in entries:
+        root = entry['module'].split('.')[0]
+        packages[root] = packages.get(root, 0.0) + entry['self_ms']
+
+    return {
+        'total_ms': round(sum(e['self_ms'] for e in entries), 1),
+        'modules': len(entries),
+        'slowest_modules': sorted(entries, key=lambda e: e['self_ms'], reverse=True)[:top],
+        'packages': sorted(
+            ({'package': name, 'self_ms': round(ms, 1)} for name, ms in packages.items()),
+            key=lambda p: p['self_ms'], reverse=True
+        )[:top],
+    }
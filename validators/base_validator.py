@@ -5,9 +5,14 @@ All platform validators should inherit from this class
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
+from .pattern_library import ForbiddenPatterns
+
 class BaseValidator(ABC):
     """Abstract base class for content validators"""
 
+    # Set by validators.incremental.IncrementalValidator during diff-aware re-validation
+    pattern_cache = None
+
     @abstractmethod
     def validate(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -49,6 +54,17 @@ class BaseValidator(ABC):
         """
         pass
 
+    def check_forbidden_patterns(self, content: str) -> List[Dict[str, Any]]:
+        """
+        Shared forbidden-pattern scan (ForbiddenPatterns.check_content)
+
+        Routed through the pattern cache when one is attached, so unchanged
+        paragraphs keep their previous results.
+        """
+        if self.pattern_cache is not None:
+            return self.pattern_cache.check(content)
+        return ForbiddenPatterns.check_content(content)
+
     def get_validation_summary(self, issues: List[Dict[str, Any]]) -> str:
         """
         Generate human-readable summary of validation issues
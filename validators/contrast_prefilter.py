@@ -0,0 +1,105 @@
+"""
+Local contrast-candidate prefilter
+Gates the LLM semantic-contrast detector in ContentWorkflow.
+
+Every contrast form the detector looks for ("isn't X, it's Y", "rather than X",
+"go beyond X", "less about X, more about Y", ...) needs a negation or
+comparison cue word. Sentences without a cue can't be contrast framing, so:
+- Only sentences containing a cue (plus the sentence after, where the "Y"
+  half usually lives) are sent to the LLM
+- The LLM call is skipped entirely when no sentence has a cue
+
+Cue list covers ForbiddenPatterns.CONTRAST_FRAMING, hybrid_editor's
+direct/masked fixers and linkedin_validator.check_contrast_patterns.
+"""
+import re
+from typing import Dict, List
+
+# Negation / comparison cues that every contrast form depends on
+CONTRAST_CUES = [
+    r"\bnot\b",
+    r"n't\b",
+    r"\bno\s+longer\b",
+    r"\bnever\b",
+    r"\brather\s+than\b",
+    r"\binstead\s+of\b",
+    r"\bas\s+opposed\s+to\b",
+    r"\bbeyond\b",
+    r"\bmore\s+than\b",
+    r"\bless\s+about\b",
+    r"\bmore\s+about\b",
+    r"\bstop\s+\w+ing\b",
+    r"\bforget\b",
+    r"\bno\b",
+]
+
+_CUE_RE = re.compile("|".join(CONTRAST_CUES), re.IGNORECASE)
+
+# Sentence boundaries: terminal punctuation followed by space, or line breaks
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+_STATS = {'checked': 0, 'skipped': 0, 'sentences_total': 0, 'sentences_sent': 0}
+
+
+def split_sentences(content: str) -> List[str]:
+    """Split content into non-empty sentences / lines"""
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(content or '') if s.strip()]
+
+
+def has_contrast_cue(sentence: str) -> bool:
+    return bool(_CUE_RE.search(sentence))
+
+
+def find_contrast_candidates(content: str, follow_on: int = 1) -> List[str]:
+    """
+    Extract the sentences that could hold a contrast pattern.
+
+    Args:
+        content: Draft text
+        follow_on: Sentences after each cue sentence to include (the "Y" half
+                   of "This isn't X. It's Y.")
+
+    Returns:
+        Candidate snippets in document order (empty → no LLM call needed)
+    """
+    sentences = split_sentences(content)
+    keep = set()
+    for i, sentence in enumerate(sentences):
+        if has_contrast_cue(sentence):
+            keep.update(range(i, min(i + follow_on + 1, len(sentences))))
+
+    # Merge consecutive kept sentences into one snippet each
+    candidates = []
+    current: List[str] = []
+    for i, sentence in enumerate(sentences):
+        if i in keep:
+            current.append(sentence)
+        elif current:
+            candidates.append(' '.join(current))
+            current = []
+    if current:
+        candidates.append(' '.join(current))
+
+    _STATS['checked'] += 1
+    _STATS['sentences_total'] += len(sentences)
+    _STATS['sentences_sent'] += len(keep)
+    if not candidates:
+        _STATS['skipped'] += 1
+
+    return candidates
+
+
+def get_prefilter_stats() -> Dict[str, float]:
+    """Skip rate and sentence reduction since process start"""
+    checked = _STATS['checked'] or 1
+    total = _STATS['sentences_total'] or 1
+    return {
+        **_STATS,
+        'skip_rate': round(_STATS['skipped'] / checked, 3),
+        'sentence_reduction': round(1 - _STATS['sentences_sent'] / total, 3),
+    }
+
+
+def reset_prefilter_stats():
+    for key in _STATS:
+        _STATS[key] = 0
@@ -5,7 +5,7 @@ Supports Value, Indirect, and Direct email types from n8n workflow
 import re
 from typing import List, Dict, Any
 from .base_validator import BaseValidator
-from .pattern_library import ForbiddenPatterns, ContentQualityChecks
+from .pattern_library import ContentQualityChecks
 
 class EmailValidator(BaseValidator):
     """Validates email content with subject line optimization and spam checks"""
@@ -85,7 +85,7 @@ class EmailValidator(BaseValidator):
         issues.extend(spam_issues)
 
         # 3. Forbidden AI patterns
-        pattern_issues = ForbiddenPatterns.check_content(body)
+        pattern_issues = self.check_forbidden_patterns(body)
         issues.extend(pattern_issues)
 
         # 4. Email length validation
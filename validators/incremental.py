@@ -0,0 +1,145 @@
+"""
+Diff-aware re-validation for revision loops
+
+Each revision usually rewrites one or two paragraphs, but validate() re-scans
+the whole draft. IncrementalValidator wraps a platform validator and diffs
+each draft against the previous one at paragraph granularity (blank-line
+separated units - the same split TwitterValidator uses for tweets):
+
+- Forbidden-pattern scans (the bulk of the regex work) run only on new or
+  changed paragraphs; results for untouched paragraphs are carried forward
+  with their positions rebased to the new offsets
+- An unchanged draft returns the previous issue list without re-running
+- Structural checks (lengths, headers, alternation, CTA) are cheap and depend
+  on global offsets, so they still run on the full draft
+
+Patterns are matched within a paragraph, so a phrase split across a blank
+line is no longer reported (such matches were false positives anyway).
+
+Usage:
+    validator = IncrementalValidator(LinkedInValidator())
+    issues = validator.validate(draft)      # full pass
+    issues = validator.validate(revised)    # only changed paragraphs re-scanned
+"""
+import re
+import difflib
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base_validator import BaseValidator
+from .pattern_library import ForbiddenPatterns
+
+_UNIT_BREAK_RE = re.compile(r"\n\s*\n")
+
+
+def split_units(content: str) -> List[Tuple[int, str]]:
+    """Split content into (offset, paragraph) units on blank lines"""
+    units = []
+    cursor = 0
+    for match in _UNIT_BREAK_RE.finditer(content or ""):
+        units.append((cursor, content[cursor:match.start()]))
+        cursor = match.end()
+    units.append((cursor, (content or "")[cursor:]))
+    return [(offset, text) for offset, text in units if text.strip()]
+
+
+def diff_units(old_units: List[str], new_units: List[str]) -> Dict[str, int]:
+    """Count unchanged / changed / removed paragraphs between two drafts"""
+    summary = {"unchanged": 0, "changed": 0, "removed": 0}
+    matcher = difflib.SequenceMatcher(None, old_units, new_units, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            summary["unchanged"] += i2 - i1
+        else:
+            summary["changed"] += j2 - j1
+            summary["removed"] += max(0, (i2 - i1) - (j2 - j1))
+    return summary
+
+
+def _rebase(issue: Dict[str, Any], delta: int) -> Dict[str, Any]:
+    """Copy an issue with its position/span shifted by delta characters"""
+    rebased = dict(issue)
+    if isinstance(rebased.get("position"), int):
+        rebased["position"] += delta
+    span = rebased.get("span")
+    if isinstance(span, tuple):
+        rebased["span"] = (span[0] + delta, span[1] + delta)
+    elif isinstance(span, dict):
+        rebased["span"] = {**span, "start": span["start"] + delta, "end": span["end"] + delta}
+    return rebased
+
+
+class UnitPatternCache:
+    """Forbidden-pattern results per paragraph, carried forward between drafts"""
+
+    def __init__(self):
+        self._previous: Dict[str, List[Dict[str, Any]]] = {}
+        self._current: Dict[str, List[Dict[str, Any]]] = {}
+        self.stats = {"units_checked": 0, "units_reused": 0}
+
+    def begin_draft(self):
+        """Start a new draft: last draft's paragraphs become the reuse pool"""
+        if self._current:
+            self._previous = self._current
+        self._current = {}
+
+    def check(self, content: str) -> List[Dict[str, Any]]:
+        issues = []
+        for offset, unit in split_units(content):
+            relative = self._current.get(unit)
+            if relative is None:
+                relative = self._previous.get(unit)
+            if relative is None:
+                relative = ForbiddenPatterns.check_content(unit)
+                self.stats["units_checked"] += 1
+            else:
+                self.stats["units_reused"] += 1
+            self._current[unit] = relative
+            issues.extend(_rebase(issue, offset) for issue in relative)
+        return issues
+
+
+class IncrementalValidator:
+    """
+    Wraps a BaseValidator so repeated validate() calls only re-check what changed.
+
+    Delegates every other attribute (get_grading_rubric, get_writing_rules, ...)
+    to the wrapped validator.
+    """
+
+    def __init__(self, validator: BaseValidator):
+        self.validator = validator
+        self.pattern_cache = UnitPatternCache()
+        self.last_diff: Optional[Dict[str, int]] = None
+        self._last_content: Optional[str] = None
+        self._last_issues: List[Dict[str, Any]] = []
+        self.stats = {"passes": 0, "unchanged_passes": 0}
+
+    def validate(self, content: str) -> List[Dict[str, Any]]:
+        self.stats["passes"] += 1
+
+        if self._last_content is not None:
+            self.last_diff = diff_units(
+                [u for _, u in split_units(self._last_content)],
+                [u for _, u in split_units(content)]
+            )
+
+        if content == self._last_content:
+            self.stats["unchanged_passes"] += 1
+            return [dict(issue) for issue in self._last_issues]
+
+        self.pattern_cache.begin_draft()
+        self.validator.pattern_cache = self.pattern_cache
+        try:
+            issues = self.validator.validate(content)
+        finally:
+            self.validator.pattern_cache = None
+
+        self._last_content = content
+        self._last_issues = issues
+        return [dict(issue) for issue in issues]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, **self.pattern_cache.stats, "last_diff": self.last_diff}
+
+    def __getattr__(self, name):
+        return getattr(self.validator, name)
@@ -7,7 +7,6 @@ from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from .base_validator import BaseValidator
-from .pattern_library import ForbiddenPatterns
 
 
 def char_count(text: str) -> int:
@@ -720,7 +719,7 @@ class LinkedInValidator(BaseValidator):
         # Reset parse cache for fresh content evaluation
         parse_linkedin_post.cache_clear()
 
-        issues.extend(ForbiddenPatterns.check_content(content))
+        issues.extend(self.check_forbidden_patterns(content))
 
         char_limit_issue = check_total_char_limit(content)
         if char_limit_issue:
@@ -0,0 +1,72 @@
+"""Unit tests for the local contrast-candidate prefilter."""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from validators.contrast_prefilter import (
+    find_contrast_candidates,
+    get_prefilter_stats,
+    reset_prefilter_stats,
+    split_sentences,
+)
+
+
+# (draft, contains contrast framing) - positives cover every form listed in the
+# semantic-contrast prompt; negatives mix cue-free drafts and benign cue words.
+LABELED_DRAFTS: List[Tuple[str, bool]] = [
+    ("This isn't about tools—it's about systems. We rebuilt ours in 6 weeks.", True),
+    ("It's not luck, it's process. Our reps follow the same 4 steps.", True),
+    ("They aren't just leads—they're future partners.", True),
+    ("Not just faster, but cheaper. Costs fell 22% in Q3.", True),
+    ("The problem isn't traffic. It's conversion. We fixed checkout first.", True),
+    ("Rather than chasing followers, focus on 50 buyers who read everything.", True),
+    ("Instead of posting daily, consider 2 deep posts per week.", True),
+    ("Don't only focus on the hook, focus on the payoff.", True),
+    ("Go beyond vanity metrics to pipeline created per post.", True),
+    ("More than a CRM, it's your team's memory.", True),
+    ("Less about volume, more about relevance.", True),
+    ("Stop guessing. Start measuring reply rates by segment.", True),
+    ("We cut onboarding from 14 days to 3 by writing a one-page checklist.", False),
+    ("Three numbers run our pipeline review: meetings booked, show rate, and win rate.", False),
+    ("Our best email last month had a 41% open rate and a 9% reply rate.", False),
+    ("Write the hook last. Draft the payoff first, then earn it in line one.", False),
+    ("Here are 5 prompts we use every Monday to plan content for the week.", False),
+    ("Record your sales calls. Pull 3 objections. Turn each into a post.", False),
+    ("I shipped the new pricing page on Tuesday. Demo requests doubled by Friday.", False),
+    ("Pick one channel for 90 days and report results weekly.", False),
+    ("Don't forget to add the UTM link before you schedule the post.", False),
+    ("We had no idea the webinar would fill in 2 days.", False),
+]
+
+
+def test_split_sentences_handles_lines_and_punctuation():
+    assert split_sentences("First one. Second!\nThird line\n\nFourth?") == [
+        "First one.", "Second!", "Third line", "Fourth?"
+    ]
+
+
+def test_cue_free_draft_has_no_candidates():
+    assert find_contrast_candidates("We cut onboarding from 14 days to 3. Then we hired.") == []
+
+
+def test_candidate_includes_following_sentence():
+    draft = "Intro line here. The problem isn't traffic. It's conversion. Unrelated close."
+    assert find_contrast_candidates(draft) == ["The problem isn't traffic. It's conversion."]
+
+
+def test_labeled_fixtures_full_recall_and_skip_rate():
+    reset_prefilter_stats()
+    missed = [draft for draft, label in LABELED_DRAFTS if label and not find_contrast_candidates(draft)]
+    skipped_negatives = [
+        draft for draft, label in LABELED_DRAFTS if not label and not find_contrast_candidates(draft)
+    ]
+
+    stats = get_prefilter_stats()
+    negatives = sum(1 for _, label in LABELED_DRAFTS if not label)
+
+    # No contrast draft may be filtered out (zero lost recall)
+    assert missed == []
+    # Cue-free drafts skip the LLM call; negatives with benign cues still go through
+    assert len(skipped_negatives) == negatives - 2
+    assert stats['checked'] == len(LABELED_DRAFTS)
+    assert stats['skip_rate'] == round((negatives - 2) / len(LABELED_DRAFTS), 3)
@@ -0,0 +1,80 @@
+"""Unit tests for diff-aware re-validation."""
+from __future__ import annotations
+
+from validators.incremental import IncrementalValidator, diff_units, split_units
+from validators.linkedin_validator import LinkedInValidator
+from validators.twitter_validator import TwitterValidator
+
+
+THREAD = [
+    "We cut our sales cycle from 94 days to 41. Here's the exact playbook:",
+    "1/ The truth is most CRMs are graveyards. We rebuilt ours around 4 fields.",
+    "2/ Rather than chasing updates, we built one dashboard. Reps check it at 9am.",
+    "3/ Follow-ups dropped 52% because buyers already had answers.",
+    "Want the dashboard template? Reply 'pipeline' and I'll send it.",
+]
+
+
+def _signature(issues):
+    return sorted(
+        (i.get("type") or i.get("code"), i.get("matched_text"), i.get("position"), str(i.get("span")))
+        for i in issues
+    )
+
+
+def test_split_units_keeps_offsets():
+    content = "First para.\n\nSecond para.\n  \nThird."
+    units = split_units(content)
+
+    assert [u for _, u in units] == ["First para.", "Second para.", "Third."]
+    assert all(content[offset:offset + len(u)] == u for offset, u in units)
+
+
+def test_diff_units_counts_changed_paragraphs():
+    assert diff_units(["a", "b", "c"], ["a", "B", "c"]) == {"unchanged": 2, "changed": 1, "removed": 0}
+
+
+def test_revision_matches_full_validation_and_reuses_paragraphs():
+    first = "\n\n".join(THREAD)
+    revised_thread = list(THREAD)
+    revised_thread[0] = "We cut our sales cycle from 94 days to 41 in one quarter. Playbook:"
+    revised = "\n\n".join(revised_thread)
+
+    incremental = IncrementalValidator(TwitterValidator())
+    incremental.validate(first)
+    issues = incremental.validate(revised)
+
+    assert _signature(issues) == _signature(TwitterValidator().validate(revised))
+    stats = incremental.get_stats()
+    assert stats["units_checked"] == len(THREAD) + 1
+    assert stats["units_reused"] == len(THREAD) - 1
+    assert stats["last_diff"] == {"unchanged": 4, "changed": 1, "removed": 0}
+
+
+def test_carried_forward_positions_are_rebased():
+    incremental = IncrementalValidator(TwitterValidator())
+    incremental.validate("\n\n".join(THREAD))
+    revised = "\n\n".join(["Short hook with 3 numbers: 1, 2, 3."] + THREAD[1:])
+
+    issues = incremental.validate(revised)
+    cliche = next(i for i in issues if i.get("matched_text", "").lower() == "the truth is")
+
+    assert revised[cliche["position"]:cliche["position"] + len("the truth is")].lower() == "the truth is"
+
+
+def test_unchanged_draft_reuses_previous_issues():
+    incremental = IncrementalValidator(TwitterValidator())
+    content = "\n\n".join(THREAD)
+
+    first = incremental.validate(content)
+    second = incremental.validate(content)
+
+    assert _signature(first) == _signature(second)
+    assert incremental.stats["unchanged_passes"] == 1
+
+
+def test_delegates_validator_methods():
+    incremental = IncrementalValidator(LinkedInValidator())
+
+    assert "LINKEDIN GRADING RUBRIC" in incremental.get_grading_rubric()
+    assert incremental.validator.pattern_cache is None
@@ -5,7 +5,7 @@ Validates thread structure, character limits, and engagement patterns
 import re
 from typing import List, Dict, Any
 from .base_validator import BaseValidator
-from .pattern_library import ForbiddenPatterns, ContentQualityChecks
+from .pattern_library import ContentQualityChecks
 
 class TwitterValidator(BaseValidator):
     """Validates Twitter/X content with thread structure and character limits"""
@@ -40,7 +40,7 @@ class TwitterValidator(BaseValidator):
             }]
 
         # 1. Check forbidden patterns (shared library)
-        pattern_issues = ForbiddenPatterns.check_content(content)
+        pattern_issues = self.check_forbidden_patterns(content)
         issues.extend(pattern_issues)
 
         # 2. Check thread length
@@ -2,12 +2,20 @@
 Base workflow pattern for multi-platform content creation
 3-agent pattern: Writer → Validator → Reviser
 """
-from anthropic import Anthropic
 import os
 import json
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import asyncio
+import time
+from tools.example_packs import get_pack_store
+from utils.anthropic_client import get_anthropic_client
+from utils.fact_verification import FactVerifier
+from utils.http_clients import get_tavily_client
+from utils.model_routing import collect_decisions, create_message, route_model
+from utils.revision_controller import RevisionController, issue_code
+from validators.contrast_prefilter import find_contrast_candidates
+from validators.incremental import IncrementalValidator
 
 class ContentWorkflow:
     """Base workflow class for platform-specific content creation"""
@@ -22,9 +30,13 @@ class ContentWorkflow:
             supabase_client: Supabase client instance
         """
         self.platform = platform
-        self.validator = validator_class()
+        # Diff-aware: revisions only re-check paragraphs that changed
+        self.validator = IncrementalValidator(validator_class())
         self.supabase = supabase_client
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.client = get_anthropic_client()
+
+        # Semantic contrast verdicts per candidate snippet from the previous draft
+        self._contrast_results: Dict[str, List[Dict[str, Any]]] = {}
 
     async def execute(
         self,
@@ -47,20 +59,33 @@ class ContentWorkflow:
         Returns:
             Dict with draft, grading, and metadata
         """
+        # Routing decisions are collected per run, so concurrent workflows don't report each other's calls
+        with collect_decisions() as decisions:
+            return await self._execute(brief, brand_context, user_id, max_iterations, target_score, decisions)
+
+    async def _execute(
+        self,
+        brief: str,
+        brand_context: str,
+        user_id: str,
+        max_iterations: int,
+        target_score: int,
+        decisions: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """execute() body; decisions collects this run's routing decisions"""
 
         # Load platform training examples
         examples = self._fetch_platform_examples()
 
-        # Phase 1: Draft (Sonnet 3.7 for quality)
+        # Phase 1: Draft (model per utils/model_routing.py)
         print(f"\n{'='*60}")
         print(f"🎨 [{self.platform.upper()}] WRITER AGENT")
         print(f"{'='*60}")
-        print(f"📝 Model: claude-3-7-sonnet-20250219")
         print(f"📚 Context: Brand voice + {len(examples.split())} words of examples")
         draft = await self._writer_agent(brief, brand_context, examples)
         print(f"✅ Draft created ({len(draft)} chars)")
 
-        # Phase 2: Validate (Hybrid: Code + Sonnet 4.0)
+        # Phase 2: Validate (Hybrid: Code + LLM grader)
         print(f"\n{'='*60}")
         print(f"✅ [{self.platform.upper()}] VALIDATOR AGENT")
         print(f"{'='*60}")
@@ -70,16 +95,31 @@ class ContentWorkflow:
         if grading.get('issues'):
             print(f"⚠️  Issues found: {len(grading['issues'])}")
 
-        # Phase 3: Revise (max iterations)
+        # Phase 3: Revise (adaptive - stops on plateau, local fixes for mechanical issues)
         iterations = 0
         revision_history = []
+        controller = RevisionController(target_score, max_iterations)
+        controller.record(grading['score'])
+        first_pass_seconds = grading.get('stage_timings', {}).get('total', 0.0)
+
+        while controller.should_revise(iterations):
+            if controller.route(grading) == 'local':
+                fixed = self._apply_local_fixes(draft, grading)
+                if fixed is not None:
+                    # The old score graded the unfixed draft - re-grade (no reviser call)
+                    applied = [issue_code(i) for i in grading.get('code_issues_remaining', [])]
+                    draft = fixed
+                    grading = await self._validator_agent(draft)
+                    grading['local_fixes_applied'] = applied
+                    controller.record_local_fix(grading['score'])
+                    print(f"🔧 Local fixes applied - re-graded score: {grading['score']}/100")
+                    continue
 
-        while grading['score'] < target_score and iterations < max_iterations:
             iterations += 1
+            iteration_start = time.perf_counter()
             print(f"\n{'='*60}")
             print(f"🔄 [{self.platform.upper()}] REVISER AGENT - Iteration {iterations}")
             print(f"{'='*60}")
-            print(f"📝 Model: claude-3-7-sonnet-20250219")
             print(f"🎯 Current score: {grading['score']}/100 (target: {target_score})")
             print(f"📋 Feedback: {grading['feedback'][:100]}...")
 
@@ -87,6 +127,7 @@ class ContentWorkflow:
             verified_facts = grading.get('verified_facts', '')
             draft = await self._reviser_agent(draft, grading['feedback'], brand_context, verified_facts)
             grading = await self._validator_agent(draft)
+            controller.record(grading['score'], time.perf_counter() - iteration_start)
             print(f"✅ Revision complete - New score: {grading['score']}/100")
 
             revision_history.append({
@@ -96,19 +137,24 @@ class ContentWorkflow:
                 'feedback': grading.get('feedback', '')
             })
 
+        revision_stats = controller.savings(fallback_seconds=first_pass_seconds)
+        if revision_stats['iterations_skipped']:
+            print(f"⏭️  Stopped early ({revision_stats['stop_reason']}): "
+                  f"~{revision_stats['llm_calls_saved']} LLM calls, "
+                  f"~{revision_stats['est_latency_saved_s']}s saved")
+
         # Final summary
         print(f"\n{'='*60}")
         print(f"✅ [{self.platform.upper()}] WORKFLOW COMPLETE")
         print(f"{'='*60}")
         print(f"📊 Final Score: {grading['score']}/100")
         print(f"🔄 Total Iterations: {iterations}")
-        print(f"📝 Tools Used:")
-        print(f"   - Writer Agent (Sonnet 3.7)")
+        routing = self._routing_summary(decisions)
+        print(f"📝 Models Used:")
+        for stage, stage_routing in routing.items():
+            downgraded = f" ({stage_routing['downgraded']} downgraded)" if stage_routing['downgraded'] else ""
+            print(f"   - {stage}: {', '.join(stage_routing['models'])} × {stage_routing['calls']}{downgraded}")
         print(f"   - Code Validator (deterministic rules)")
-        print(f"   - Factual Accuracy Check (Tavily + Sonnet 4.0)")
-        print(f"   - LLM Validator (Sonnet 4.0)")
-        if iterations > 0:
-            print(f"   - Reviser Agent (Sonnet 3.7) × {iterations}")
         print(f"   - Database Examples (RAG from proven_copy_examples)")
         print(f"{'='*60}\n")
 
@@ -134,9 +180,22 @@ class ContentWorkflow:
             'grading': grading,
             'iterations': iterations,
             'platform': self.platform,
-            'revision_history': revision_history
+            'revision_history': revision_history,
+            'revision_stats': revision_stats,
+            'routing': routing
         }
 
+    def _routing_summary(self, decisions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Per-stage model routing decisions made during this workflow"""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for decision in decisions:
+            stage = summary.setdefault(decision['stage'], {'calls': 0, 'models': [], 'downgraded': 0})
+            stage['calls'] += 1
+            stage['downgraded'] += int(decision['downgraded'])
+            if decision['model'] not in stage['models']:
+                stage['models'].append(decision['model'])
+        return summary
+
     async def _writer_agent(self, brief: str, brand_context: str, examples: str) -> str:
         """
         Writer subagent using Claude Sonnet
@@ -187,9 +246,11 @@ DO NOT add conversational framing before or after the content."""
             }
         ]
 
-        response = self.client.messages.create(
-            model="claude-3-7-sonnet-20250219",  # Upgraded to 3.7
-            max_tokens=1500,
+        route = route_model('writer', platform=self.platform)
+        print(f"📝 Model: {route.model}")
+        response = create_message(
+            self.client,
+            route,
             temperature=0.7,
             system=system_blocks,
             messages=[{"role": "user", "content": brief}]
@@ -208,6 +269,13 @@ DO NOT add conversational framing before or after the content."""
             Grading dict with score, feedback, issues
         """
 
+        # Stage graph:
+        #   code validation → auto-fix ─┬─ factual accuracy ─┬─ LLM grading
+        #                               └─ semantic contrast ─┘
+        # Factual and contrast checks are independent, so they run concurrently.
+        timings: Dict[str, float] = {}
+        validation_start = time.perf_counter()
+
         # Phase 1: Code-based validation (deterministic)
         code_issues = self.validator.validate(content)
         print(f"   ├─ Code validation: {len(code_issues)} issues found")
@@ -223,24 +291,30 @@ DO NOT add conversational framing before or after the content."""
         if auto_fixes > 0:
             print(f"   ├─ Auto-fixed {auto_fixes} issues")
 
-        # Phase 2: Factual accuracy check with web search
-        factual_warnings, verified_facts = await self._check_factual_accuracy(cleaned_content)
+        timings['code_validation'] = round(time.perf_counter() - validation_start, 3)
+
+        # Phase 2: Factual accuracy (web search) + semantic contrast detection, concurrently
+        checks_start = time.perf_counter()
+        (factual_warnings, verified_facts), contrast_warnings = await asyncio.gather(
+            self._timed_stage('factual_accuracy', self._check_factual_accuracy(cleaned_content), timings),
+            self._timed_stage('semantic_contrast', self._check_semantic_contrast(cleaned_content), timings)
+        )
+        timings['pre_grading_checks'] = round(time.perf_counter() - checks_start, 3)
+
         if factual_warnings:
             print(f"   ├─ Factual accuracy: {len(factual_warnings)} claims need verification")
             code_issues.extend(factual_warnings)
         else:
             print(f"   ├─ Factual accuracy: No unverified claims detected")
 
-        # Phase 2.5: Semantic contrast pattern detection (catch ALL forms)
-        contrast_warnings = await self._check_semantic_contrast(cleaned_content)
         if contrast_warnings:
             print(f"   ├─ Contrast patterns: {len(contrast_warnings)} AI patterns detected")
             code_issues.extend(contrast_warnings)
         else:
             print(f"   ├─ Contrast patterns: None detected")
 
-        # Phase 3: Claude strategic validation (Sonnet 4.0 for critical analysis)
-        print(f"   └─ LLM grading (Sonnet 4.0)...")
+        # Phase 3: Claude strategic validation (critical stage - never downgraded)
+        print(f"   └─ LLM grading...")
 
         # Include factual accuracy issues in grading context
         factual_context = ""
@@ -280,9 +354,12 @@ Return ONLY valid JSON (no markdown, no explanations):
 {factual_context}
 Grade this content now."""
 
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",  # Upgraded to Sonnet 4.0 for critical grading
-            max_tokens=800,
+        grading_start = time.perf_counter()
+        response = await asyncio.to_thread(
+            create_message,
+            self.client,
+            'grader',
+            platform=self.platform,
             temperature=0.2,  # Lower temp for more consistent grading
             system=[
                 {
@@ -294,6 +371,8 @@ Grade this content now."""
             messages=[{"role": "user", "content": user_prompt}]
         )
 
+        timings['llm_grading'] = round(time.perf_counter() - grading_start, 3)
+
         # Parse JSON from response
         response_text = response.content[0].text.strip()
 
@@ -323,8 +402,42 @@ Grade this content now."""
         ]
         grading['verified_facts'] = verified_facts
 
+        timings['total'] = round(time.perf_counter() - validation_start, 3)
+        grading['stage_timings'] = timings
+        print(f"   ⏱️  Validation stages: {timings}")
+
         return grading
 
+    def _apply_local_fixes(self, draft: str, grading: Dict[str, Any]) -> Optional[str]:
+        """
+        Fix mechanical issues with HybridEditor's regex fixes and re-run only
+        the deterministic checks (no LLM revise).
+
+        Returns:
+            The fixed draft, or None unless the code checks come back clean on it
+            (caller falls back to a full revision). The caller re-grades it.
+        """
+        from agents.hybrid_editor import HybridEditor
+
+        remaining = grading.get('code_issues_remaining', [])
+        issues = [dict(i, code=issue_code(i)) for i in remaining]
+        fixed = HybridEditor()._apply_regex_fixes(draft, issues)
+        if fixed == draft:
+            return None
+
+        # Only the code checks can be affected by regex edits - they must all pass
+        if self.validator.validate(fixed):
+            return None
+        return fixed
+
+    async def _timed_stage(self, name: str, coro, timings: Dict[str, float]):
+        """Await a validation stage and record its duration in timings[name]"""
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[name] = round(time.perf_counter() - start, 3)
+
     async def _check_factual_accuracy(self, content: str) -> tuple[List[Dict[str, Any]], str]:
         """
         Check factual claims in content using web search
@@ -335,7 +448,6 @@ Grade this content now."""
         Returns:
             Tuple of (issues list, verified facts string)
         """
-        from tavily import TavilyClient
 
         issues = []
         verified_facts_list = []
@@ -377,9 +489,11 @@ If there are NO specific factual claims (just opinions, advice, frameworks), ret
 {{"claims": []}}"""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=500,
+            response = await asyncio.to_thread(
+                create_message,
+                self.client,
+                'claim_extraction',
+                platform=self.platform,
                 temperature=0,
                 messages=[{"role": "user", "content": claim_extraction_prompt}]
             )
@@ -399,124 +513,18 @@ If there are NO specific factual claims (just opinions, advice, frameworks), ret
             if not claims:
                 return [], ""  # No factual claims to verify
 
-            # Verify each claim using appropriate source
-            tavily_client = TavilyClient(api_key=os.getenv('TAVILY_API_KEY'))
-
-            for claim_obj in claims:
-                if not claim_obj.get('needs_verification'):
-                    continue
-
-                claim = claim_obj['claim']
-                claim_type = claim_obj.get('type', 'general')
-                category = claim_obj.get('category', 'statistic')
-
-                # Internal claims: check knowledge base
-                if claim_type == 'internal':
-                    try:
-                        # Search knowledge base via RAG
-                        kb_results = await self._search_knowledge_base(claim)
-
-                        if not kb_results:
-                            # No RAG support for this claim
-                            issues.append({
-                                'code': 'claim_unverified_internal',
-                                'severity': 'high',
-                                'message': f"Internal claim not found in knowledge base: '{claim}'",
-                                'explanation': 'Case studies, testimonials, and client results must exist in knowledge base. Remove claim or add supporting documentation.',
-                                'auto_fixable': False
-                            })
-                            verified_facts_list.append({
-                                'claim': claim,
-                                'verified': False,
-                                'evidence': 'Not found in knowledge base',
-                                'sources': []
-                            })
-                        else:
-                            # Found in knowledge base
-                            verified_facts_list.append({
-                                'claim': claim,
-                                'verified': True,
-                                'evidence': kb_results,
-                                'sources': ['Knowledge Base']
-                            })
-                    except Exception as kb_error:
-                        print(f"⚠️ Knowledge base check failed for '{claim}': {kb_error}")
-                    continue
-
-                # External claims: web search
-                try:
-                    search_results = tavily_client.search(
-                        query=claim,
-                        max_results=3,
-                        include_answer=True
-                    )
-
-                    # Ask Claude to verify the claim against search results
-                    verification_prompt = f"""Verify this claim against search results:
-
-CLAIM: {claim}
-
-SEARCH RESULTS:
-{json.dumps(search_results.get('results', [])[:3], indent=2)}
-
-Does the evidence SUPPORT or CONTRADICT this claim?
-
-Return ONLY valid JSON:
-{{
-  "verified": true/false,
-  "confidence": "high|medium|low",
-  "explanation": "<brief explanation>",
-  "contradiction": "<specific contradiction if found, else null>"
-}}"""
-
-                    verify_response = self.client.messages.create(
-                        model="claude-sonnet-4-20250514",
-                        max_tokens=300,
-                        temperature=0,
-                        messages=[{"role": "user", "content": verification_prompt}]
-                    )
-
-                    verify_text = verify_response.content[0].text.strip()
-                    if verify_text.startswith('```'):
-                        verify_text = verify_text.split('```')[1]
-                        if verify_text.startswith('json'):
-                            verify_text = verify_text[4:]
-                        verify_text = verify_text.strip()
-
-                    verification = json.loads(verify_text)
-
-                    # Store verified facts for reviser
-                    if verification.get('verified'):
-                        verified_facts_list.append({
-                            'claim': claim,
-                            'verified': True,
-                            'evidence': search_results.get('answer', ''),
-                            'sources': [r.get('url', '') for r in search_results.get('results', [])[:2]]
-                        })
-
-                    # Flag unverified or contradicted claims
-                    if not verification.get('verified') or verification.get('contradiction'):
-                        issues.append({
-                            'code': 'claim_unverified',
-                            'severity': 'high',
-                            'message': f"Factual claim needs verification: '{claim}'",
-                            'explanation': verification.get('explanation', 'Could not verify'),
-                            'contradiction': verification.get('contradiction'),
-                            'auto_fixable': False
-                        })
-                        # Also store what we found for reviser
-                        verified_facts_list.append({
-                            'claim': claim,
-                            'verified': False,
-                            'evidence': verification.get('explanation', ''),
-                            'contradiction': verification.get('contradiction'),
-                            'sources': [r.get('url', '') for r in search_results.get('results', [])[:2]]
-                        })
-
-                except Exception as search_error:
-                    print(f"⚠️ Failed to verify claim '{claim}': {search_error}")
-                    # Don't fail the whole validation, just skip this claim
-                    continue
+            # Verify claims concurrently (cached verdicts are reused across passes/posts)
+            tavily_client = get_tavily_client()
+            verifier = FactVerifier(
+                self.client,
+                web_search=lambda claim: tavily_client.search(
+                    query=claim,
+                    max_results=3,
+                    include_answer=True
+                ),
+                kb_search=self._search_knowledge_base
+            )
+            issues, verified_facts_list = await verifier.verify(claims)
 
         except Exception as e:
             print(f"⚠️ Factual accuracy check error: {e}")
@@ -532,7 +540,7 @@ Return ONLY valid JSON:
 
     async def _check_semantic_contrast(self, content: str) -> List[Dict[str, Any]]:
         """
-        Use Sonnet 4.0 to detect ALL forms of contrast patterns semantically.
+        Use Claude to detect ALL forms of contrast patterns semantically.
         Catches variations that regex can't: "go beyond X to Y", "don't only focus on X", etc.
 
         Args:
@@ -543,10 +551,27 @@ Return ONLY valid JSON:
         """
         issues = []
 
-        contrast_detection_prompt = f"""Analyze this content for AI contrast patterns (not X but Y structure).
+        # Only sentences with a negation/comparison cue can be contrast framing
+        candidates = find_contrast_candidates(content)
+        if not candidates:
+            print(f"   ├─ Contrast prefilter: no cue words, skipping LLM check")
+            self._contrast_results = {}
+            return []
 
-CONTENT:
-{content}
+        # Diff-aware: snippets unchanged since the previous draft keep their verdicts
+        results = {c: self._contrast_results[c] for c in candidates if c in self._contrast_results}
+        new_candidates = [c for c in candidates if c not in results]
+        if results:
+            print(f"   ├─ Contrast check: {len(results)} unchanged snippets carried forward, {len(new_candidates)} to check")
+        if not new_candidates:
+            self._contrast_results = results
+            return self._contrast_issues(candidates, results)
+        candidate_text = "\n".join(f"- {c}" for c in new_candidates)
+
+        contrast_detection_prompt = f"""Analyze these sentences from a post for AI contrast patterns (not X but Y structure).
+
+SENTENCES (only those containing negation or comparison words are shown):
+{candidate_text}
 
 **CRITICAL DETECTION TASK:**
 Find ANY sentence that uses contrast structure to make a point. This includes:
@@ -588,9 +613,11 @@ If NO contrast patterns found, return:
 {{"patterns_found": []}}"""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=800,
+            response = await asyncio.to_thread(
+                create_message,
+                self.client,
+                'contrast_check',
+                platform=self.platform,
                 temperature=0,
                 messages=[{"role": "user", "content": contrast_detection_prompt}]
             )
@@ -607,7 +634,28 @@ If NO contrast patterns found, return:
             result = json.loads(response_text)
             patterns = result.get('patterns_found', [])
 
+            # Attribute each pattern to the snippet it came from
+            for snippet in new_candidates:
+                results[snippet] = []
             for pattern in patterns:
+                text = (pattern.get('text') or '').lower()
+                snippet = next((c for c in new_candidates if text and text in c.lower()), new_candidates[0])
+                results[snippet].append(pattern)
+
+            self._contrast_results = results
+            issues = self._contrast_issues(candidates, results)
+
+        except Exception as e:
+            print(f"⚠️ Semantic contrast detection error: {e}")
+            return []  # Don't block on detection failures
+
+        return issues
+
+    def _contrast_issues(self, candidates: List[str], results: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Build contrast issues from per-snippet LLM results, in document order"""
+        issues = []
+        for snippet in candidates:
+            for pattern in results.get(snippet, []):
                 issues.append({
                     'code': 'contrast_semantic',
                     'severity': 'high',
@@ -616,11 +664,6 @@ If NO contrast patterns found, return:
                     'suggested_fix': pattern.get('suggested_fix', 'Rewrite as direct positive assertion'),
                     'auto_fixable': False
                 })
-
-        except Exception as e:
-            print(f"⚠️ Semantic contrast detection error: {e}")
-            return []  # Don't block on detection failures
-
         return issues
 
     async def _search_knowledge_base(self, query: str) -> str:
@@ -729,9 +772,11 @@ FEEDBACK TO ADDRESS:
 WEB-VERIFIED FACTS (use these instead of guessing):
 {verified_facts}"""
 
-        response = self.client.messages.create(
-            model="claude-3-7-sonnet-20250219",  # Upgraded to 3.7
-            max_tokens=1500,
+        route = route_model('reviser', platform=self.platform)
+        print(f"📝 Model: {route.model}")
+        response = create_message(
+            self.client,
+            route,
             temperature=0.5,
             system=system_blocks,
             messages=[{"role": "user", "content": revision_prompt}]
@@ -747,41 +792,51 @@ WEB-VERIFIED FACTS (use these instead of guessing):
             limit: Max number of examples to fetch
 
         Returns:
-            Formatted examples string
+            Formatted examples string (cached pack, byte-stable until the table changes)
         """
         try:
-            # Query platform-specific column
-            column_name = f'{self.platform}_copy'
-
-            response = self.supabase.table('proven_copy_examples')\
-                .select(f'{column_name}, performance_score, hooks_used')\
-                .not_.is_(column_name, 'null')\
-                .order('performance_score', desc=True)\
-                .limit(limit)\
-                .execute()
-
-            if not response.data:
-                return f"No {self.platform} examples available yet. Use best practices for the platform."
-
-            examples = []
-            for item in response.data:
-                hooks = item.get('hooks_used', [])
-                if isinstance(hooks, list):
-                    hooks_str = ', '.join(hooks)
-                else:
-                    hooks_str = str(hooks)
-
-                examples.append(f"""
+            return get_pack_store().get(
+                ('proven_copy', self.platform, limit),
+                'proven_copy_examples',
+                lambda: self._build_platform_examples(limit),
+                self.supabase
+            )
+
+        except Exception as e:
+            print(f"⚠️ Failed to fetch examples: {e}")
+            return f"No {self.platform} examples available. Use platform best practices."
+
+    def _build_platform_examples(self, limit: int) -> str:
+        """Query + format platform examples (raises on failure so errors aren't cached)"""
+        # Query platform-specific column
+        column_name = f'{self.platform}_copy'
+
+        response = self.supabase.table('proven_copy_examples')\
+            .select(f'{column_name}, performance_score, hooks_used')\
+            .not_.is_(column_name, 'null')\
+            .order('performance_score', desc=True)\
+            .order('id')\
+            .limit(limit)\
+            .execute()
+
+        if not response.data:
+            return f"No {self.platform} examples available yet. Use best practices for the platform."
+
+        examples = []
+        for item in response.data:
+            hooks = item.get('hooks_used', [])
+            if isinstance(hooks, list):
+                hooks_str = ', '.join(hooks)
+            else:
+                hooks_str = str(hooks)
+
+            examples.append(f"""
 Example (Score: {item.get('performance_score', 'N/A')}):
 {item[column_name]}
 Hooks Used: {hooks_str}
 ---""")
 
-            return '\n'.join(examples)
-
-        except Exception as e:
-            print(f"⚠️ Failed to fetch examples: {e}")
-            return f"No {self.platform} examples available. Use platform best practices."
+        return '\n'.join(examples)
 
     def _get_platform_rules(self) -> str:
         """